@@ -0,0 +1,282 @@
+"""
+Apply the same edits to all the datapages (`datapages/*.json`) in one pass.
+
+The edits are given as operations on JSON paths, applied in order to each file:
+- `--delete PATH`: remove the property (nothing happens if it does not exist).
+- `--rename PATH NAME`: rename the property, keeping its position in the object.
+- `--set PATH VALUE`: set the property to VALUE, given as JSON (`'"draft"'`, `true`, `'[]'`...).
+  Objects missing on the way are created.
+
+A path is a list of properties separated by dots. `[n]` selects the item n of a list, and `*` or
+`[*]` all the properties of an object or all the items of a list:
+
+    python -m scripts.datapages.bulk_edit --delete anomaliesListText
+    python -m scripts.datapages.bulk_edit --rename "relatedData[*].content" description
+    python -m scripts.datapages.bulk_edit --set descriptionFromSource.title '"About the source"'
+
+The files are edited in parallel by a pool of processes (--jobs, all the cores by default). Each file
+is written to a temporary file next to it, which then replaces it, so an interrupted run never
+leaves a half-written datapage. Files not changed by the edits are not written, so their formatting
+is kept. Changed files are written as JSON.stringify(json, null, 4) does, keeping their final
+newline, if any. With no operations and --format, all the files are written in that format.
+
+Other options:
+- --dry-run: list the files that would change, without writing them.
+- A list of files (default: all the datapages).
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+DATAPAGES_DIR = Path(__file__).parent.parent.parent / "datapages"
+
+# Segments of a path: `name`, `*`, `[n]` and `[*]`
+_SEGMENT = re.compile(r"\[(\*|\d+)\]|([^.\[\]]+)")
+
+# Segment that matches all the properties of an object or all the items of a list
+ALL = "*"
+
+
+def parse_path(path):
+    """Split a JSON path into its segments: property names, list indices (int) and ALL."""
+    segments = []
+    position = 0
+    while position < len(path):
+        if path[position] == "." and segments:
+            position += 1
+        match = _SEGMENT.match(path, position)
+        if match is None:
+            raise ValueError(f"Invalid path {path!r} at position {position}")
+        index, name = match.groups()
+        if index is not None:
+            segments.append(ALL if index == "*" else int(index))
+        else:
+            segments.append(name)
+        position = match.end()
+
+    if not segments:
+        raise ValueError("Empty path")
+    return segments
+
+
+def apply_operations(data, operations):
+    """
+    Apply the operations, as (name, path segments, argument) tuples, to the JSON data in place.
+    Return True if the data changed.
+    """
+    changed = False
+    for name, segments, argument in operations:
+        for parent, key in _targets(data, segments, create=name == "set"):
+            changed |= _OPERATIONS[name](parent, key, argument)
+    return changed
+
+
+def _targets(data, segments, create=False):
+    """
+    Yield the (container, key) pairs matched by the path, for the existing containers. With
+    `create`, missing objects on the way are created for the properties given by name.
+    """
+    containers = [data]
+    for segment in segments[:-1]:
+        children = []
+        for container, key in _keys(containers, segment):
+            if _has(container, key):
+                child = container[key]
+            elif create and isinstance(container, dict):
+                child = container[key] = {}
+            else:
+                continue
+            if isinstance(child, (dict, list)):
+                children.append(child)
+        containers = children
+
+    yield from _keys(containers, segments[-1])
+
+
+def _keys(containers, segment):
+    for container in containers:
+        if segment == ALL:
+            # Last items first, so deleting items does not shift the ones still to come
+            keys = (
+                container
+                if isinstance(container, dict)
+                else range(len(container))[::-1]
+            )
+            yield from ((container, key) for key in list(keys))
+        elif isinstance(container, dict) and isinstance(segment, str):
+            yield container, segment
+        elif isinstance(container, list) and isinstance(segment, int):
+            yield container, segment
+
+
+def _has(container, key):
+    if isinstance(container, dict):
+        return key in container
+    return 0 <= key < len(container)
+
+
+def _delete(container, key, _):
+    if not _has(container, key):
+        return False
+    del container[key]
+    return True
+
+
+def _rename(container, key, name):
+    if not isinstance(container, dict) or key not in container or key == name:
+        return False
+    items = [(name if k == key else k, v) for k, v in container.items() if k != name]
+    container.clear()
+    container.update(items)
+    return True
+
+
+def _set(container, key, value):
+    if isinstance(container, list) and not _has(container, key):
+        return False
+    if _has(container, key) and container[key] == value:
+        return False
+    container[key] = value
+    return True
+
+
+_OPERATIONS = {"delete": _delete, "rename": _rename, "set": _set}
+
+
+def dump_datapage(data, newline=True):
+    """Text of a datapage, as written by JSON.stringify(data, null, 4), with a final newline if `newline`."""
+    return json.dumps(data, indent=4, ensure_ascii=False) + ("\n" if newline else "")
+
+
+def edit_file(path, operations, reformat=False, dry_run=False):
+    """
+    Apply the operations to a datapage file. Return the path and "changed", "unchanged" or the
+    error found (the file is not written then).
+    """
+    try:
+        content = Path(path).read_bytes()
+        text = content.decode("utf-8")
+        data = json.loads(text)
+        changed = apply_operations(data, operations)
+    except (OSError, ValueError, TypeError) as e:
+        return path, f"error: {e}"
+
+    if not changed and not reformat:
+        return path, "unchanged"
+    new_content = dump_datapage(data, text.endswith("\n")).encode("utf-8")
+    if new_content == content:
+        return path, "unchanged"
+    if not dry_run:
+        _write_atomic(Path(path), new_content)
+    return path, "changed"
+
+
+def edit_files(paths, operations, reformat=False, dry_run=False, jobs=None):
+    """Edit the files in a pool of `jobs` processes. Yield the path and result of each file."""
+    paths = list(paths)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(
+            edit_file,
+            paths,
+            [operations] * len(paths),
+            [reformat] * len(paths),
+            [dry_run] * len(paths),
+            chunksize=max(1, len(paths) // (4 * (jobs or os.cpu_count() or 1))),
+        )
+
+
+def _write_atomic(path, content):
+    """Write through a temporary file, so an interrupted run never leaves a truncated datapage."""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+class _Operation(argparse.Action):
+    """Collect the operations of the command line in order, as (name, segments, argument) tuples."""
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        name = self.dest
+        try:
+            segments = parse_path(values[0])
+            if name == "set":
+                argument = json.loads(values[1])
+            elif name == "rename":
+                argument = values[1]
+            else:
+                argument = None
+        except ValueError as e:
+            parser.error(f"{option_string} {' '.join(values)}: {e}")
+
+        if name == "rename" and (segments[-1] == ALL or isinstance(segments[-1], int)):
+            parser.error(f"{option_string} {values[0]}: only properties can be renamed")
+        namespace.operations = (namespace.operations or []) + [
+            (name, segments, argument)
+        ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Apply the same edits to all the datapages."
+    )
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        default=sorted(DATAPAGES_DIR.glob("*.json")),
+        help="datapage files to edit (default: all)",
+    )
+    parser.add_argument(
+        "--delete", nargs=1, action=_Operation, metavar="PATH", help="delete a property"
+    )
+    parser.add_argument(
+        "--rename",
+        nargs=2,
+        action=_Operation,
+        metavar=("PATH", "NAME"),
+        help="rename a property",
+    )
+    parser.add_argument(
+        "--set",
+        nargs=2,
+        action=_Operation,
+        metavar=("PATH", "VALUE"),
+        help="set a property to a JSON value",
+    )
+    parser.add_argument(
+        "--format", action="store_true", help="write also the files not changed"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="only list the files that would change"
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, help="number of processes (default: all cores)"
+    )
+    parser.set_defaults(operations=[])
+    args = parser.parse_args()
+    if not args.operations and not args.format:
+        parser.error("no operations given (use --delete, --rename, --set or --format)")
+
+    start = time.perf_counter()
+    counts = {"changed": 0, "unchanged": 0, "error": 0}
+    for path, result in edit_files(
+        args.paths, args.operations, args.format, args.dry_run, args.jobs
+    ):
+        if result != "unchanged":
+            print(f"{os.path.relpath(path)}: {result}")
+        counts[result.split(":")[0]] += 1
+
+    print(
+        f"{len(args.paths)} datapages in {time.perf_counter() - start:.2f}s: "
+        f"{counts['changed']} {'would change' if args.dry_run else 'changed'}, "
+        f"{counts['unchanged']} unchanged, {counts['error']} errors"
+    )
+    sys.exit(counts["error"] > 0)
@@ -0,0 +1,201 @@
+"""
+Index of the datapages (`datapages/*.json`) by chart id, topic and source.
+
+The catalog keeps, for each datapage, its title, status, the charts it is shown on
+(`showDataPageOnChartIds`), the URLs of its topics (`topicTagsLinks`) and the names of its sources
+(`nameOfSource` and the `sourceName` of each of its `sources`), plus the reverse indexes from each
+chart id, topic URL and source name to the datapages. It is saved in `.datapage_catalog.json`
+next to this script, so lookups do not need to open any datapage.
+
+The catalog is refreshed incrementally: only the datapages whose modification time or size
+changed are read again, and they are parsed only if their content hash changed too. Datapages that
+were deleted are dropped.
+
+    catalog = refresh_catalog()
+    catalog.for_chart(5476)  # ["180340"]
+    catalog.for_topic("https://ourworldindata.org/poverty")
+    catalog.for_source("Global Carbon Project")
+    catalog["180340"]["title"]
+
+Topic URLs are compared without a trailing slash, and source names without case. From the command
+line, the catalog is refreshed and the datapages found are listed:
+
+    python -m scripts.datapages.catalog [--chart ID] [--topic URL] [--source NAME]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+DATAPAGES_DIR = Path(__file__).parent.parent.parent / "datapages"
+CATALOG_PATH = Path(__file__).parent / ".datapage_catalog.json"
+
+# Changed when the content of the catalog changes, so older catalogs are built again
+CATALOG_VERSION = 1
+
+
+class DatapageCatalog:
+    """Datapages by id, with the indexes by chart id, topic URL and source name."""
+
+    def __init__(self, datapages):
+        self.datapages = datapages
+        self.by_chart = {}
+        self.by_topic = {}
+        self.by_source = {}
+        for datapage_id, entry in sorted(datapages.items()):
+            for chart_id in entry["chart_ids"]:
+                self.by_chart.setdefault(str(chart_id), []).append(datapage_id)
+            for topic in entry["topics"]:
+                self.by_topic.setdefault(topic, []).append(datapage_id)
+            for source in {_source_key(source) for source in entry["sources"]}:
+                self.by_source.setdefault(source, []).append(datapage_id)
+
+    def __len__(self):
+        return len(self.datapages)
+
+    def __getitem__(self, datapage_id):
+        return self.datapages[datapage_id]
+
+    def for_chart(self, chart_id):
+        """Ids of the datapages shown on the chart."""
+        return self.by_chart.get(str(chart_id), [])
+
+    def for_topic(self, url):
+        """Ids of the datapages tagged with the topic."""
+        return self.by_topic.get(_topic_key(url), [])
+
+    def for_source(self, name):
+        """Ids of the datapages with data from the source."""
+        return self.by_source.get(_source_key(name), [])
+
+    def to_json(self):
+        return {
+            "version": CATALOG_VERSION,
+            "datapages": self.datapages,
+            "by_chart": self.by_chart,
+            "by_topic": self.by_topic,
+            "by_source": self.by_source,
+        }
+
+
+def load_catalog(path=CATALOG_PATH):
+    """Read the saved catalog, without refreshing it. Return an empty catalog if there is none."""
+    try:
+        saved = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return DatapageCatalog({})
+    if saved.get("version") != CATALOG_VERSION:
+        return DatapageCatalog({})
+
+    catalog = DatapageCatalog.__new__(DatapageCatalog)
+    catalog.datapages = saved["datapages"]
+    catalog.by_chart = saved["by_chart"]
+    catalog.by_topic = saved["by_topic"]
+    catalog.by_source = saved["by_source"]
+    return catalog
+
+
+def refresh_catalog(datapages_dir=DATAPAGES_DIR, path=CATALOG_PATH):
+    """
+    Bring the saved catalog up to date with the datapages, save it if anything changed and return
+    it. Only new and modified datapages are read.
+    """
+    old = load_catalog(path).datapages
+    datapages = {}
+    changed = False
+    for datapage_path in sorted(Path(datapages_dir).glob("*.json")):
+        datapage_id = datapage_path.stem
+        stat = datapage_path.stat()
+        entry = old.get(datapage_id)
+        if entry is not None and (entry["mtime_ns"], entry["size"]) == (
+            stat.st_mtime_ns,
+            stat.st_size,
+        ):
+            datapages[datapage_id] = entry
+            continue
+
+        content = datapage_path.read_bytes()
+        sha1 = hashlib.sha1(content).hexdigest()
+        if entry is None or entry["sha1"] != sha1:
+            entry = {**_index_entry(json.loads(content)), "sha1": sha1}
+        datapages[datapage_id] = {
+            **entry,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+        }
+        changed = True
+
+    catalog = DatapageCatalog(datapages)
+    if changed or datapages.keys() != old.keys() or not Path(path).exists():
+        _write_atomic(
+            Path(path), json.dumps(catalog.to_json(), ensure_ascii=False).encode()
+        )
+    return catalog
+
+
+def _index_entry(datapage):
+    sources = [datapage.get("nameOfSource")] + [
+        source.get("sourceName")
+        for source in datapage.get("sources") or []
+        if isinstance(source, dict)
+    ]
+    return {
+        "title": datapage.get("title"),
+        "status": datapage.get("status"),
+        "chart_ids": list(datapage.get("showDataPageOnChartIds") or []),
+        "topics": list(
+            dict.fromkeys(
+                _topic_key(link["url"])
+                for link in datapage.get("topicTagsLinks") or []
+                if isinstance(link, dict) and link.get("url")
+            )
+        ),
+        "sources": list(dict.fromkeys(source for source in sources if source)),
+    }
+
+
+def _topic_key(url):
+    return url.strip().rstrip("/")
+
+
+def _source_key(name):
+    return " ".join(name.split()).casefold()
+
+
+def _write_atomic(path, content):
+    """Write through a temporary file, so an interrupted run never leaves a truncated catalog."""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Refresh the catalog of datapages and look up datapages in it."
+    )
+    parser.add_argument("--chart", help="datapages shown on this chart id")
+    parser.add_argument("--topic", help="datapages tagged with this topic URL")
+    parser.add_argument("--source", help="datapages with data from this source")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    catalog = refresh_catalog()
+    print(
+        f"{len(catalog)} datapages in the catalog, refreshed in {time.perf_counter() - start:.2f}s"
+    )
+
+    queries = [
+        (args.chart, catalog.for_chart),
+        (args.topic, catalog.for_topic),
+        (args.source, catalog.for_source),
+    ]
+    for value, lookup in queries:
+        if value is not None:
+            for datapage_id in lookup(value):
+                print(f"{datapage_id}: {catalog[datapage_id]['title']}")
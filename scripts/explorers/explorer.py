@@ -0,0 +1,265 @@
+"""
+Parser and in-memory model of the explorer files (`explorers/*.explorer.tsv`).
+
+An explorer file is a list of statements, one per line that is not indented: settings such as
+`explorerTitle` or `selection`, comments and the `graphers`, `table` and `columns` keywords. A
+statement can be followed by an indented block, which is a small table whose first row is the
+header (the views of the explorer in `graphers`, inline data in `table` and the definitions of the
+columns in `columns`).
+
+Blocks are stored column by column. The values of `graphers` blocks and the headers of all blocks
+are interned, since the same dropdown options, slugs and notes are repeated in many views. The
+explorer can be written back with `to_tsv`, which gives the same text that was parsed.
+
+    explorer = read_explorer("explorers/poverty-explorer.explorer.tsv")
+    explorer.settings["explorerTitle"]
+    explorer.graphers.column("ySlugs")
+    explorer.tables["income_consumption_2017"].columns.records()
+
+To check that all the explorers (or the ones given) are parsed and written back without changes:
+
+    python -m scripts.explorers.explorer [explorers/*.explorer.tsv]
+"""
+
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+EXPLORERS_DIR = Path(__file__).parent.parent.parent / "explorers"
+
+# Keywords of the statements followed by a block
+BLOCK_KEYWORDS = {"graphers", "table", "columns"}
+
+
+@dataclass
+class Block:
+    """
+    Indented block of an explorer, stored column by column.
+
+    `columns[j][i]` is the value of the column `j` in the row `i` (the header is not included), or
+    None if the row has fewer cells. `widths[i]` is the number of cells of the row `i`, so rows with
+    trailing tabs and empty lines inside the block are written back as they were.
+    """
+
+    header: List[str]
+    columns: List[List[Optional[str]]]
+    widths: List[int]
+
+    def __len__(self):
+        return len(self.widths)
+
+    def column(self, name: str) -> List[Optional[str]]:
+        """Values of the first column called `name`."""
+        return self.columns[self.header.index(name)]
+
+    def rows(self) -> Iterator[List[str]]:
+        """Cells of each row, without the header."""
+        for i, width in enumerate(self.widths):
+            yield [self.columns[j][i] for j in range(width)]
+
+    def records(self) -> List[Dict[str, str]]:
+        """Rows as dictionaries by column name, ignoring the cells without a name in the header."""
+        names = [(j, name) for j, name in enumerate(self.header) if name]
+        return [
+            {name: self.columns[j][i] or "" for j, name in names}
+            for i in range(len(self.widths))
+        ]
+
+    def lines(self) -> Iterator[str]:
+        """Lines of the block, indented."""
+        yield _indent(self.header)
+        for row in self.rows():
+            yield _indent(row)
+
+
+@dataclass
+class Statement:
+    """Line of the explorer that is not indented, with the block that follows it, if any."""
+
+    keyword: str
+    args: List[str] = field(default_factory=list)
+    block: Optional[Block] = None
+
+    def lines(self) -> Iterator[str]:
+        yield "\t".join([self.keyword] + self.args)
+        if self.block is not None:
+            yield from self.block.lines()
+
+
+@dataclass
+class Table:
+    """Table of an explorer: the `table` statement and the `columns` statement with its slug."""
+
+    slug: Optional[str]
+    url: Optional[str] = None
+    data: Optional[Block] = None
+    columns: Optional[Block] = None
+
+
+@dataclass
+class Explorer:
+    """Explorer file, as the list of its statements in order."""
+
+    statements: List[Statement]
+    final_newline: bool = True
+    path: Optional[Path] = None
+
+    @property
+    def settings(self) -> Dict[str, List[str]]:
+        """Values of the settings of the explorer by name, such as `explorerTitle` or `selection`."""
+        settings = {}
+        for statement in self.statements:
+            if (
+                statement.keyword
+                and not statement.keyword.startswith("#")
+                and statement.keyword not in BLOCK_KEYWORDS
+            ):
+                settings.setdefault(statement.keyword, _strip_empty(statement.args))
+        return settings
+
+    @property
+    def graphers(self) -> Optional[Block]:
+        """Views of the explorer."""
+        for statement in self.statements:
+            if statement.keyword == "graphers":
+                return statement.block
+        return None
+
+    @property
+    def tables(self) -> Dict[Optional[str], Table]:
+        """Tables of the explorer by slug. The table without a slug is stored as None."""
+        tables = {}
+        for statement in self.statements:
+            if statement.keyword == "table":
+                url = _arg(statement.args, 0)
+                slug = _arg(statement.args, 1)
+                table = tables.setdefault(slug, Table(slug))
+                table.url = url
+                table.data = statement.block
+            elif statement.keyword == "columns":
+                slug = _arg(statement.args, 0)
+                tables.setdefault(slug, Table(slug)).columns = statement.block
+        return tables
+
+    def to_tsv(self) -> str:
+        text = "\n".join(
+            line for statement in self.statements for line in statement.lines()
+        )
+        return text + "\n" if self.final_newline else text
+
+
+def read_explorer(path) -> Explorer:
+    """Read an explorer file. `path` can also be the slug of an explorer in the explorers folder."""
+    path = Path(path)
+    if not path.exists() and path.parent == Path("."):
+        path = EXPLORERS_DIR / f"{path.name}.explorer.tsv"
+    with open(path, encoding="utf-8", newline="") as f:
+        explorer = parse_explorer(f.read())
+    explorer.path = path
+    return explorer
+
+
+def write_explorer(explorer: Explorer, path=None):
+    """Write an explorer file, by default to the file it was read from."""
+    with open(path or explorer.path, "w", encoding="utf-8", newline="") as f:
+        f.write(explorer.to_tsv())
+
+
+def parse_explorer(text: str) -> Explorer:
+    """Parse the text of an explorer file."""
+    final_newline = text.endswith("\n")
+    lines = text.split("\n")
+    if final_newline:
+        lines.pop()
+
+    statements = []
+    n_lines = len(lines)
+    i = 0
+    while i < n_lines:
+        cells = lines[i].split("\t")
+        statement = Statement(cells[0], cells[1:])
+        statements.append(statement)
+        i += 1
+        if statement.keyword not in BLOCK_KEYWORDS:
+            continue
+
+        # The block goes on until the first line that is not indented, except empty lines between
+        # indented lines, which are part of the block
+        end = i
+        j = i
+        while j < n_lines:
+            line = lines[j]
+            if line.startswith("\t"):
+                end = j = j + 1
+            elif line == "":
+                j += 1
+            else:
+                break
+
+        if end > i:
+            statement.block = _parse_block(
+                lines[i:end], intern_values=statement.keyword == "graphers"
+            )
+            i = end
+
+    return Explorer(statements, final_newline)
+
+
+def _parse_block(lines, intern_values):
+    header = [sys.intern(cell) for cell in _cells(lines[0])]
+    rows = [_cells(line) for line in lines[1:]]
+    widths = [len(row) for row in rows]
+    # Columns without a name in the header are kept too, so no cell is lost
+    n_columns = max([len(header)] + widths)
+
+    columns = []
+    if rows and min(widths) == n_columns:
+        columns = [list(column) for column in zip(*rows)]
+    else:
+        for j in range(n_columns):
+            columns.append([row[j] if j < len(row) else None for row in rows])
+
+    if intern_values:
+        columns = [
+            [cell if cell is None else sys.intern(cell) for cell in column]
+            for column in columns
+        ]
+
+    return Block(header, columns, widths)
+
+
+def _cells(line):
+    # Empty lines inside a block have no cells. Any other line starts with the indentation tab
+    return line[1:].split("\t") if line else []
+
+
+def _indent(cells):
+    return "\t" + "\t".join(cells) if cells else ""
+
+
+def _strip_empty(args):
+    # Settings edited in a spreadsheet usually have trailing empty cells
+    end = len(args)
+    while end and not args[end - 1]:
+        end -= 1
+    return args[:end]
+
+
+def _arg(args, i):
+    return args[i] if len(args) > i and args[i] else None
+
+
+if __name__ == "__main__":
+    paths = sys.argv[1:] or sorted(EXPLORERS_DIR.glob("*.explorer.tsv"))
+    errors = 0
+    for path in paths:
+        explorer = read_explorer(path)
+        with open(explorer.path, encoding="utf-8", newline="") as f:
+            if explorer.to_tsv() != f.read():
+                print(f"{explorer.path}: not written back as it was read")
+                errors += 1
+    print(
+        f"{len(paths) - errors} of {len(paths)} explorers parsed and written back unchanged"
+    )
+    sys.exit(errors > 0)
@@ -0,0 +1,146 @@
+"""
+Check the explorer files for views that would break after deploy.
+
+For each explorer with a `graphers` block:
+- The `tableSlug` of every view must be the slug of a table of the explorer.
+- Every slug in `ySlugs` and `xSlug` must be defined in the table of the view, either in its
+  `columns` block or in the header of its inline data. Tables that only have a URL are skipped,
+  since their columns are not known without downloading them.
+- Every combination of the controls (dropdowns, radio buttons and checkboxes) must appear only once.
+- Only one view can be the `defaultView`. If the graphers block has a `defaultView` column, one
+  view must be marked in it (explorers without the column show their first view by default).
+
+The explorers are checked in parallel:
+
+    python -m scripts.explorers.lint [explorers/*.explorer.tsv]
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .explorer import EXPLORERS_DIR, read_explorer
+
+# Suffixes of the columns of the graphers block shown as controls in the explorer
+CONTROL_SUFFIXES = (" Dropdown", " Radio", " Checkbox")
+
+
+def lint_explorer(explorer):
+    """Return the list of problems found in an explorer."""
+    graphers = explorer.graphers
+    if graphers is None:
+        return []
+
+    problems = []
+    tables = explorer.tables
+    table_slugs = {slug: _defined_slugs(table) for slug, table in tables.items()}
+    header = graphers.header
+    controls = [j for j, name in enumerate(header) if name.endswith(CONTROL_SUFFIXES)]
+    combinations = {}
+    default_views = 0
+    header_line = _graphers_header_line(explorer)
+
+    for i, row in enumerate(graphers.records()):
+        if not any(row.values()):
+            continue
+        line = header_line + 1 + i
+
+        if row.get("defaultView") == "true":
+            default_views += 1
+
+        table_slug = row.get("tableSlug") or None
+        if table_slug not in tables:
+            if table_slug is not None:
+                problems.append(f"line {line}: table {table_slug!r} is not defined")
+            elif row.get("ySlugs"):
+                problems.append(
+                    f"line {line}: the view has no tableSlug and there is no table without a slug"
+                )
+        elif table_slugs[table_slug] is not None:
+            for column in ("ySlugs", "xSlug"):
+                for slug in row.get(column, "").split():
+                    if slug not in table_slugs[table_slug]:
+                        problems.append(
+                            f"line {line}: {column} {slug!r} is not a column of {_table_name(table_slug)}"
+                        )
+
+        if controls:
+            combination = tuple(graphers.columns[j][i] or "" for j in controls)
+            if combination in combinations:
+                problems.append(
+                    f"line {line}: same {_describe(header, controls, combination)} as line {combinations[combination]}"
+                )
+            else:
+                combinations[combination] = line
+
+    if default_views > 1:
+        problems.append(f"{default_views} views are the defaultView, instead of one")
+    elif default_views == 0 and "defaultView" in header:
+        problems.append("no view is the defaultView")
+
+    return problems
+
+
+def lint_file(path):
+    """Return the path of an explorer file and the problems found in it."""
+    return path, lint_explorer(read_explorer(path))
+
+
+def _defined_slugs(table):
+    """Slugs of the columns of a table, or None if they can't be known from the explorer."""
+    if table.columns is None and table.data is None:
+        return None
+    slugs = set()
+    if table.columns is not None and "slug" in table.columns.header:
+        slugs.update(slug for slug in table.columns.column("slug") if slug)
+    if table.data is not None:
+        slugs.update(table.data.header)
+    return slugs
+
+
+def _graphers_header_line(explorer):
+    """Line number in the file of the header of the graphers block."""
+    line = 1
+    for statement in explorer.statements:
+        if statement.keyword == "graphers":
+            return line + 1
+        line += 1 + (len(statement.block) + 1 if statement.block is not None else 0)
+
+
+def _table_name(table_slug):
+    return "the unnamed table" if table_slug is None else f"table {table_slug!r}"
+
+
+def _describe(header, controls, combination):
+    return ", ".join(
+        f"{header[j]} {value!r}" for j, value in zip(controls, combination)
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check the explorer files.")
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        default=sorted(EXPLORERS_DIR.glob("*.explorer.tsv")),
+        help="explorer files to check (default: all)",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, help="number of processes (default: all cores)"
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    n_problems = 0
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        for path, problems in executor.map(lint_file, args.paths):
+            for problem in problems:
+                print(f"{os.path.relpath(path)}: {problem}")
+            n_problems += len(problems)
+
+    print(
+        f"{len(args.paths)} explorers checked in {time.perf_counter() - start:.2f}s, {n_problems} problems found"
+    )
+    sys.exit(n_problems > 0)
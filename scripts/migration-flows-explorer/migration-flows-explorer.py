@@ -15,17 +15,48 @@ def slug(str):
     return str.replace(" ", "").lower()
 
 
-def substitute_title(row, country_name):
+def expand_for_countries(df, countries):
+    # Repeats all rows of df for each country (country by country), like a cross join.
     # Rows can include placeholders like ${country} and ${country_slug}, which will be replaced with the actual country name here.
-    country_slug = slug(country_name)
-    for key in row.keys():
-        if isinstance(row[key], str):
-            template = Template(row[key])
-            row[key] = template.substitute(
-                country=country_name,
-                country_slug=country_slug,
-            )
-    return row
+    # Each different cell with a placeholder is compiled into a template once, and each column is then substituted in one pass.
+    if len(countries) == 0:
+        return df.iloc[0:0].copy()
+    n_rows = len(df.index)
+    expanded = pd.concat([df] * len(countries), ignore_index=True)
+    row_countries = [country for country in countries for _ in range(n_rows)]
+    country_slugs = [slug(country) for country in countries]
+    row_country_slugs = [country_slug for country_slug in country_slugs for _ in range(n_rows)]
+    for column in df.columns:
+        templates = {
+            cell: Template(cell)
+            for cell in df[column]
+            if isinstance(cell, str) and "$" in cell
+        }
+        if templates:
+            expanded[column] = [
+                templates[cell].substitute(country=country, country_slug=country_slug)
+                if isinstance(cell, str) and cell in templates
+                else cell
+                for (cell, country, country_slug) in zip(
+                    expanded[column], row_countries, row_country_slugs
+                )
+            ]
+    return expanded
+
+
+def probe_datafile(url, chunksize=100_000):
+    # Reads the names of all columns of the data file and the entities in it, in the order they appear.
+    # Only the entity column is parsed, chunk by chunk, so memory doesn't grow with the number of countries in the matrix.
+    column_names = set()
+
+    def is_entity_column(column_name):
+        column_names.add(column_name)
+        return column_name == "entity"
+
+    entities = {}
+    for chunk in pd.read_csv(url, usecols=is_entity_column, chunksize=chunksize):
+        entities.update(dict.fromkeys(chunk["entity"].unique()))
+    return column_names, list(entities)
 
 
 # %%
@@ -34,48 +65,32 @@ with open("migration-flows.template.tsv", "r") as templateFile:
 views_df = pd.read_csv("views-per-country.csv", dtype=str)
 column_defs_df = pd.read_csv("column-defs.tsv", sep="\t", dtype=str)
 
-datafile = pd.read_csv(datafile_url)
-available_entities = datafile["entity"].unique()
+datafile_columns, available_entities = probe_datafile(datafile_url)
 
 print(f"📑 Read {len(views_df.index)} different views")
 print(f"💾 Data file has {len(available_entities)} entities")
 
 # %%
-graphers_list = []
-
-for country in available_entities:
-    for (idx, row) in views_df.iterrows():
-        graphers_list.append(
-            substitute_title(
-                row.copy(),
-                country,
-            ),
-        )
-
-graphers = pd.DataFrame(columns=views_df.columns, data=graphers_list)
+graphers = expand_for_countries(views_df, available_entities)
 
 print(f"📈 Generated {len(graphers.index)} views")
 
 # %%
-columns_list = [
-    {"slug": "year", "name": "Year", "type": "Year"},
-    {"slug": "entity", "name": "Country", "type": "EntityName"}
-]
-
-for country in available_entities:
-    for (idx, row) in column_defs_df.iterrows():
-        columns_list.append(
-            substitute_title(
-                row.copy(),
-                country,
-            ),
-        )
-
-columns = pd.DataFrame(columns=column_defs_df.columns, data=columns_list)
-
-for (idx, row) in columns.iterrows():
-    col_slug = row["slug"]
-    assert col_slug in datafile.columns, f"Column {col_slug} not found in data file"
+default_columns = pd.DataFrame(
+    columns=column_defs_df.columns,
+    data=[
+        {"slug": "year", "name": "Year", "type": "Year"},
+        {"slug": "entity", "name": "Country", "type": "EntityName"}
+    ],
+)
+
+columns = pd.concat(
+    [default_columns, expand_for_countries(column_defs_df, available_entities)],
+    ignore_index=True,
+)
+
+missing_columns = [col_slug for col_slug in columns["slug"] if col_slug not in datafile_columns]
+assert not missing_columns, f"Columns {', '.join(missing_columns)} not found in data file"
 # %%
 graphers_tsv = graphers.to_csv(sep="\t", index=False)
 graphers_tsv_indented = textwrap.indent(graphers_tsv, "\t")
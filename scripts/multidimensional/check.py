@@ -0,0 +1,128 @@
+"""
+Check that the views of the multidimensional indicator configs match their dimensions.
+
+For each config:
+- The slugs of the dimensions, and of the choices of each dimension, must be unique.
+- Every view must have a choice defined for each dimension, and no other dimension. Views that
+  don't are orphaned: they can't be reached from the choices of the config.
+- Every combination of choices must have only one view, and, unless --ignore-missing is given, at
+  least one.
+
+The views are compared with the combinations of choices as sets of tuples (see
+MultidimConfig.view_key), so each view is looked at once, whatever the size of the config:
+
+    python -m scripts.multidimensional.check [--ignore-missing] [multidimensional-indicators/*.yml]
+"""
+
+import argparse
+import itertools
+import os
+import sys
+import time
+
+from .config import MDIM_DIR, load_config
+
+
+def check_config(config, ignore_missing=False):
+    """Return the list of problems found in a config."""
+    problems = []
+    choices = {}
+    for i, dimension in enumerate(config.dimensions):
+        slug = str(dimension.get("slug"))
+        if slug in choices:
+            problems.append(f"dimensions[{i}]: dimension {slug!r} is already defined")
+            continue
+        slugs = [str(choice.get("slug")) for choice in dimension.get("choices") or []]
+        for choice, count in _repeated(slugs):
+            problems.append(
+                f"dimensions[{i}]: choice {choice!r} of {slug!r} is defined {count} times"
+            )
+        if not slugs:
+            problems.append(f"dimensions[{i}]: dimension {slug!r} has no choices")
+        choices[slug] = set(slugs)
+
+    first_views = {}
+    for i, view in enumerate(config.views):
+        view_choices = view.get("dimensions") or {}
+        reasons = [
+            f"dimension {str(slug)!r} is not defined"
+            for slug in view_choices
+            if str(slug) not in choices
+        ]
+        key = config.view_key(view_choices)
+        for slug, choice in zip(config.dimension_slugs, key):
+            if choice is None:
+                reasons.append(f"no choice for {slug!r}")
+            elif choice not in choices[slug]:
+                reasons.append(f"choice {choice!r} of {slug!r} is not defined")
+
+        if reasons:
+            problems.append(f"views[{i}]: orphaned view, {', '.join(reasons)}")
+        elif key in first_views:
+            problems.append(
+                f"views[{i}]: same {_describe(config, key)} as views[{first_views[key]}]"
+            )
+        else:
+            first_views[key] = i
+
+        if not view.get("indicator_path"):
+            problems.append(f"views[{i}]: no indicator_path")
+
+    if not ignore_missing:
+        all_keys = itertools.product(
+            *(sorted(choices[slug]) for slug in config.dimension_slugs)
+        )
+        for key in all_keys:
+            if key not in first_views:
+                problems.append(f"no view for {_describe(config, key)}")
+
+    return problems
+
+
+def check_file(path, ignore_missing=False):
+    """Return the path of a config and the problems found in it."""
+    return path, check_config(load_config(path), ignore_missing)
+
+
+def _repeated(values):
+    counts = {}
+    for value in values:
+        counts[value] = counts.get(value, 0) + 1
+    return [(value, count) for value, count in counts.items() if count > 1]
+
+
+def _describe(config, key):
+    return ", ".join(
+        f"{slug} {choice!r}" for slug, choice in zip(config.dimension_slugs, key)
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Check the multidimensional indicator configs."
+    )
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        default=sorted(MDIM_DIR.glob("*.yml")),
+        help="config files to check (default: all)",
+    )
+    parser.add_argument(
+        "--ignore-missing",
+        action="store_true",
+        help="do not report the combinations of choices without a view",
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    n_problems = 0
+    for path in args.paths:
+        _, problems = check_file(path, args.ignore_missing)
+        for problem in problems:
+            print(f"{os.path.relpath(path)}: {problem}")
+        n_problems += len(problems)
+
+    print(
+        f"{len(args.paths)} configs checked in {time.perf_counter() - start:.2f}s, {n_problems} problems found"
+    )
+    sys.exit(n_problems > 0)
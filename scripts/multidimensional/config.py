@@ -0,0 +1,174 @@
+"""
+Loader of the multidimensional indicator configs (`multidimensional-indicators/*.yml`), with an
+index of their views.
+
+A config has a list of `dimensions`, each with the `choices` (by `slug`) that can be selected, and a
+list of `views`, each with the choice of every dimension (`dimensions`), the indicators to show
+(`indicator_path`) and, optionally, the chart `config`. In the compact form written by generate.py,
+the `config` shared by all the views is given once at the top of the file, and each view only has
+its own settings, which are merged into it when the config is loaded.
+
+Views are indexed by the tuple of their choices, in the order of the dimensions, so finding the
+view of any combination is a single dictionary lookup:
+
+    config = load_config("multidimensional-indicators/poverty.yml")
+    config.view(povertyLine="2.15", metric="share")["indicator_path"]  # {819727: "y"}
+    config.view_index[("2.15", "share")]  # position of the view in config.views
+
+The YAML is parsed with the C parser of PyYAML (libyaml) when it is available. The parsed config is
+also cached in `.mdim_cache/` next to this script, under the SHA-1 of the file and CACHE_VERSION,
+so it is parsed again only when the file or the way it is loaded changes. `load_all` loads all the
+configs:
+
+    python -m scripts.multidimensional.config
+"""
+
+import hashlib
+import os
+import pickle
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+MDIM_DIR = Path(__file__).parent.parent.parent / "multidimensional-indicators"
+CACHE_DIR = Path(__file__).parent / ".mdim_cache"
+
+# Changed when the data kept in the cache changes (like the expansion of the shared config), so the
+# configs cached before are parsed again
+CACHE_VERSION = 1
+
+# End of the names of the cached files, after the name of the config: `-v<CACHE_VERSION>-<SHA-1>`
+_CACHE_SUFFIX = re.compile(r"(-v\d+)?-[0-9a-f]{40}$")
+
+# libyaml is about seven times faster than the pure Python parser
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@dataclass
+class MultidimConfig:
+    """
+    Multidimensional indicator config, as in its YAML file, with the views indexed by their
+    choices. Choices are compared as text, so `povertyLine: 10` and `povertyLine: "10"` are the same.
+    If several views have the same choices, the index has the first one.
+    """
+
+    path: Path
+    data: Dict[str, Any]
+    dimension_slugs: List[str] = field(init=False)
+    view_index: Dict[Tuple[str, ...], int] = field(init=False)
+
+    def __post_init__(self):
+        self.dimension_slugs = [str(d["slug"]) for d in self.dimensions]
+        self.view_index = {}
+        for i, view in enumerate(self.views):
+            self.view_index.setdefault(self.view_key(view.get("dimensions") or {}), i)
+
+    @property
+    def name(self) -> Optional[str]:
+        return self.data.get("name")
+
+    @property
+    def dimensions(self) -> List[Dict[str, Any]]:
+        return self.data.get("dimensions") or []
+
+    @property
+    def views(self) -> List[Dict[str, Any]]:
+        return self.data.get("views") or []
+
+    def view_key(self, choices: Dict[str, Any]) -> Tuple[Optional[str], ...]:
+        """Key of the index for the choices, by dimension slug (None for the dimensions missing)."""
+        return tuple(
+            None if choices.get(slug) is None else str(choices[slug])
+            for slug in self.dimension_slugs
+        )
+
+    def view(self, **choices) -> Optional[Dict[str, Any]]:
+        """View with these choices (one for each dimension), or None if there is none."""
+        i = self.view_index.get(self.view_key(choices))
+        return None if i is None else self.views[i]
+
+
+def load_config(path, cache_dir=CACHE_DIR) -> MultidimConfig:
+    """Load a config from its YAML file, or from the cache if the file did not change."""
+    path = Path(path)
+    content = path.read_bytes()
+    data = None
+    cache_path = None
+    if cache_dir is not None:
+        sha1 = hashlib.sha1(content).hexdigest()
+        cache_path = Path(cache_dir) / f"{path.stem}-v{CACHE_VERSION}-{sha1}.pickle"
+        try:
+            data = pickle.loads(cache_path.read_bytes())
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+
+    if data is None:
+        data = expand_shared_config(yaml.load(content, Loader=Loader))
+        if cache_path is not None:
+            _write_cache(cache_path, data)
+
+    return MultidimConfig(path, data)
+
+
+def expand_shared_config(data):
+    """Config data with the shared `config` of the compact form merged into each view."""
+    shared = data.get("config")
+    if not shared:
+        return data
+    views = [
+        {**view, "config": merge_config(shared, view.get("config") or {})}
+        for view in data.get("views") or []
+    ]
+    return {**{k: v for k, v in data.items() if k != "config"}, "views": views}
+
+
+def merge_config(shared, own):
+    """Chart config with the settings of `own` over the ones of `shared`, merging nested settings."""
+    merged = dict(shared)
+    for key, value in own.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_config(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def load_all(directory=MDIM_DIR, cache_dir=CACHE_DIR) -> Dict[str, MultidimConfig]:
+    """All the configs of the directory, by file name without extension."""
+    return {
+        path.stem: load_config(path, cache_dir)
+        for path in sorted(Path(directory).glob("*.yml"))
+    }
+
+
+def _write_cache(cache_path, data):
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    # Older versions of the same file, or cached with an older CACHE_VERSION, are not needed anymore
+    stem = _CACHE_SUFFIX.sub("", cache_path.stem)
+    for old_path in cache_path.parent.glob("*.pickle"):
+        if _CACHE_SUFFIX.sub("", old_path.stem) == stem:
+            old_path.unlink(missing_ok=True)
+    tmp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp_path, cache_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    paths = sys.argv[1:] or sorted(MDIM_DIR.glob("*.yml"))
+    start = time.perf_counter()
+    configs = [load_config(path) for path in paths]
+    seconds = time.perf_counter() - start
+    for config in configs:
+        print(
+            f"{os.path.relpath(config.path)}: {len(config.dimensions)} dimensions, "
+            f"{len(config.views)} views, {len(config.view_index)} combinations"
+        )
+    print(f"{len(configs)} configs loaded in {seconds * 1000:.1f}ms")
@@ -0,0 +1,307 @@
+"""
+Generate the multidimensional indicator configs (`multidimensional-indicators/*.yml`) from compact
+specs (`specs/*.yml`, next to this script).
+
+A spec has the `name`, `dimensions_title` and `dimensions` of the config, with two shorthands, plus
+the `config` shared by all the views and a table of `indicators`, with a row for each view:
+
+    name: Poverty
+    dimensions_title: by poverty line
+    dimensions:
+      - slug: metric
+        name: Metric
+        choices:
+          - share                      # slug and name are the same
+          - slug: shareVsGdp
+            name: Share of population VS GDP per capita
+    config:
+      hasMapTab: true
+    indicators:
+      # choice of each dimension, in order, then the indicators and the view's own config, if any
+      - [share, 819727]                # a single indicator on the y axis
+      - [all, [819815, 819816]]        # several indicators on the y axis
+      - [shareVsGdp, {819727: y, 539760: x}, {type: ScatterPlot}]
+
+Descriptions of the choices are only written when they are given. The configs are written expanded,
+with the shared config merged into each view, as the existing files are, so they are about as large
+as the configs written by hand: what is smaller is the spec. With --compact, the shared config is
+written once at the top of the file instead, which config.py expands when it loads it. This only
+shrinks the configs whose views have a chart config. Configs are only written if they change:
+
+    python -m scripts.multidimensional.generate [--compact] [specs/*.yml]
+
+To write the spec of an existing config, in either form, as a starting point (the config shared by
+all the views is factored out):
+
+    python -m scripts.multidimensional.generate --from-config multidimensional-indicators/causes-of-death.yml
+
+With --check, nothing is written: each spec is checked to give the same config, in both forms, after
+a round trip through its config and the spec written back from it (spec → config → spec → config).
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+import yaml
+
+from .config import MDIM_DIR, Loader, expand_shared_config, merge_config
+
+SPECS_DIR = Path(__file__).parent / "specs"
+
+Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Keys of the config, in the order they are written
+CONFIG_KEYS = ["name", "dimensions_title", "dimensions", "views"]
+
+
+def expand_spec(spec, compact=False):
+    """Config data of a spec, with the shared config merged into each view unless `compact`."""
+    dimensions = [_expand_dimension(dimension) for dimension in spec["dimensions"]]
+    slugs = [dimension["slug"] for dimension in dimensions]
+    shared = spec.get("config") or {}
+
+    views = []
+    for i, row in enumerate(spec.get("indicators") or []):
+        if len(row) not in (len(slugs) + 1, len(slugs) + 2):
+            raise ValueError(
+                f"indicators[{i}]: expected a choice for each of {', '.join(slugs)}, "
+                f"the indicators and, optionally, the config, got {row!r}"
+            )
+        view = {
+            "dimensions": dict(zip(slugs, row)),
+            "indicator_path": _indicator_path(row[len(slugs)]),
+        }
+        own = row[len(slugs) + 1] if len(row) > len(slugs) + 1 else {}
+        config = own if compact else merge_config(shared, own)
+        if config:
+            view["config"] = config
+        views.append(view)
+
+    data = {key: spec[key] for key in CONFIG_KEYS[:2] if key in spec}
+    data["dimensions"] = dimensions
+    if compact and shared:
+        data["config"] = shared
+    data["views"] = views
+    return data
+
+
+def spec_from_config(data):
+    """
+    Spec of the config data, in the expanded or compact form, with the config shared by all its
+    views factored out.
+    """
+    data = expand_shared_config(data)
+    views = data.get("views") or []
+    configs = [view.get("config") or {} for view in views]
+    shared = dict(configs[0]) if configs else {}
+    for config in configs[1:]:
+        shared = {k: v for k, v in shared.items() if k in config and config[k] == v}
+
+    slugs = [dimension["slug"] for dimension in data["dimensions"]]
+    rows = []
+    for view, config in zip(views, configs):
+        row = [view["dimensions"].get(slug) for slug in slugs]
+        row.append(_compact_indicators(view.get("indicator_path") or {}))
+        own = {k: v for k, v in config.items() if k not in shared}
+        if own:
+            row.append(own)
+        rows.append(row)
+
+    spec = {key: data[key] for key in CONFIG_KEYS[:2] if key in data}
+    spec["dimensions"] = [
+        _compact_dimension(dimension) for dimension in data["dimensions"]
+    ]
+    if shared:
+        spec["config"] = shared
+    spec["indicators"] = rows
+    return spec
+
+
+def round_trip_problems(spec):
+    """
+    Check that the configs written from a spec, in both forms, give back the same config when their
+    spec is written and the config is generated again. Return the list of problems found.
+    """
+    problems = []
+    for compact in (False, True):
+        form = "compact" if compact else "expanded"
+        config = _reload(dump_yaml(expand_spec(spec, compact)))
+        spec_again = _reload(dump_yaml(spec_from_config(config), flow=True))
+        config_again = _reload(dump_yaml(expand_spec(spec_again, compact)))
+        if expand_shared_config(config_again) != expand_shared_config(config):
+            problems.append(f"the {form} config changes after a round trip")
+        if expand_shared_config(config) != expand_spec(spec):
+            problems.append(f"the {form} config is not the expanded config of the spec")
+    return problems
+
+
+def _reload(text):
+    return yaml.load(text, Loader=Loader)
+
+
+def dump_yaml(data, flow=False):
+    """YAML text of the data, keeping the order of its keys. With `flow`, lists of scalars are written inline."""
+    return yaml.dump(
+        data,
+        Dumper=Dumper,
+        sort_keys=False,
+        allow_unicode=True,
+        default_flow_style=None if flow else False,
+        width=1000,
+    )
+
+
+def generate(spec_path, output_dir=MDIM_DIR, compact=False):
+    """Write the config of a spec. Return its path and whether it changed."""
+    spec_path = Path(spec_path)
+    spec = yaml.load(spec_path.read_bytes(), Loader=Loader)
+    content = (
+        f"# Generated from {_relative_to_repository(spec_path)} by "
+        "python -m scripts.multidimensional.generate, edit the spec instead\n"
+        + dump_yaml(expand_spec(spec, compact))
+    )
+    path = Path(output_dir) / spec_path.name
+    if path.exists() and path.read_text(encoding="utf-8") == content:
+        return path, False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path, True
+
+
+def _expand_dimension(dimension):
+    # Same order of keys as the configs written by hand: slug, name, description, choices
+    expanded = {
+        key: dimension[key]
+        for key in ["slug", "name", "description"]
+        if dimension.get(key) is not None
+    }
+    expanded.update(
+        (key, value)
+        for key, value in dimension.items()
+        if key not in expanded and key != "choices" and value is not None
+    )
+    expanded["choices"] = [
+        _expand_choice(choice) for choice in dimension.get("choices") or []
+    ]
+    return expanded
+
+
+def _expand_choice(choice):
+    if not isinstance(choice, dict):
+        return {"slug": choice, "name": choice}
+    expanded = {"slug": choice["slug"], "name": choice.get("name", choice["slug"])}
+    if choice.get("description"):
+        expanded["description"] = choice["description"]
+    return expanded
+
+
+def _compact_dimension(dimension):
+    choices = dimension.get("choices") or []
+    dimension = _expand_dimension({**dimension, "choices": []})
+    dimension["choices"] = [
+        (
+            choice["slug"]
+            if choice.get("name", choice["slug"]) == choice["slug"]
+            and not choice.get("description")
+            else {k: v for k, v in choice.items() if v is not None}
+        )
+        for choice in choices
+    ]
+    return dimension
+
+
+def _indicator_path(indicators):
+    if isinstance(indicators, dict):
+        return dict(indicators)
+    if isinstance(indicators, list):
+        return {indicator: "y" for indicator in indicators}
+    return {indicators: "y"}
+
+
+def _compact_indicators(indicator_path):
+    if any(axis != "y" for axis in indicator_path.values()):
+        return dict(indicator_path)
+    if len(indicator_path) == 1:
+        return next(iter(indicator_path))
+    return list(indicator_path)
+
+
+def _relative_to_repository(path):
+    try:
+        return path.resolve().relative_to(MDIM_DIR.parent).as_posix()
+    except ValueError:
+        return path.name
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Generate the multidimensional indicator configs from their specs."
+    )
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        help="specs to generate (default: all), or configs with --from-config",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="write the config shared by all the views once",
+    )
+    parser.add_argument(
+        "--from-config",
+        action="store_true",
+        help="write the specs of the configs given instead",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="only check that the specs give the same configs after a round trip",
+    )
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        type=Path,
+        help=f"directory of the files written (default: {os.path.relpath(MDIM_DIR)}, "
+        f"or {os.path.relpath(SPECS_DIR)} with --from-config)",
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.from_config:
+        if not args.paths:
+            parser.error("--from-config needs the configs to convert")
+        output_dir = args.output_dir or SPECS_DIR
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for path in map(Path, args.paths):
+            data = yaml.load(path.read_bytes(), Loader=Loader)
+            spec_path = output_dir / path.name
+            spec_path.write_text(
+                dump_yaml(spec_from_config(data), flow=True), encoding="utf-8"
+            )
+            print(f"{os.path.relpath(spec_path)}: written")
+        sys.exit()
+
+    paths = args.paths or sorted(SPECS_DIR.glob("*.yml"))
+    if args.check:
+        n_problems = 0
+        for path in paths:
+            spec = yaml.load(Path(path).read_bytes(), Loader=Loader)
+            for problem in round_trip_problems(spec):
+                print(f"{os.path.relpath(path)}: {problem}")
+                n_problems += 1
+        print(f"{len(paths)} specs checked, {n_problems} problems found")
+        sys.exit(n_problems > 0)
+
+    n_changed = 0
+    for path in paths:
+        config_path, changed = generate(path, args.output_dir or MDIM_DIR, args.compact)
+        if changed:
+            print(f"{os.path.relpath(config_path)}: written")
+        n_changed += changed
+
+    print(
+        f"{len(paths)} configs generated in {time.perf_counter() - start:.2f}s, {n_changed} changed"
+    )
@@ -3,15 +3,21 @@
 NOTE:
 * This script is quite messy, but it probably doesn't need to be used often (or ever again).
 * This script needs to be executed using the ETL virtual environment.
+* Variables are read from the grapher database, unless a local snapshot is given:
+  - To save a snapshot of the variables while reading them from the database:
+    python natural_disasters_explorer.py --export-snapshot variables.sqlite
+  - To create the explorer from the snapshot (without database access, e.g. offline or in CI):
+    python natural_disasters_explorer.py --snapshot variables.sqlite
 
 """
 
+import argparse
 import os
+import sqlite3
+from abc import ABC, abstractmethod
 from pathlib import Path
 
-import MySQLdb
 import pandas as pd
-from dotenv import load_dotenv
 
 # MAIN INPUTS.
 # Version of the latest natural disasters dataset.
@@ -30,10 +36,8 @@ assert OUTPUT_FILE.parent.exists()
 # Path to ETL folder.
 ETL_FOLDER = Path(__file__).parent.parent.parent.parent / "etl"
 
-# Uncomment to load credentials to local grapher.
-# load_dotenv(ETL_FOLDER / ".env")
-# Uncomment to load credentials to live grapher.
-load_dotenv(ETL_FOLDER / ".env.live")
+# Columns of the variables table used to create the explorer.
+VARIABLE_COLUMNS = ["id", "name", "datasetId", "shortName", "catalogPath", "titlePublic", "titleVariant", "descriptionShort"]
 
 # List "combined disaster types" (as they were defined in the garden/grapher steps).
 DISASTER_COMBINATION_TYPES = [
@@ -78,309 +82,235 @@ IMPACT_MAPPING = {
     "Disasters": "reported events",
 }
 
-# Connect to grapher database.
-conn = MySQLdb.connect(
-    db=os.getenv("DB_NAME"),  # type: ignore
-    host=os.getenv("DB_HOST"),  # type: ignore
-    port=int(os.getenv("DB_PORT")),  # type: ignore
-    user=os.getenv("DB_USER"),  # type: ignore
-    password=os.getenv("DB_PASS"),  # type: ignore
-    charset="utf8mb4",
-    autocommit=True,
-)
-
-# Download all natural disasters variables (for the relevant version).
-query = f"""
-SELECT *
-FROM variables
-WHERE catalogPath LIKE 'grapher/emdat/{VERSION}/natural_disasters/%'
+# Timespans of the views, with the prefix of their titles and their footer note (decadal views go first in the explorer).
+TIMESPANS = [
+    ("Decadal average", "Decadal average: ", DECADAL_AVERAGE_NOTE),
+    ("Annual", "", COMMON_NOTE),
+]
+# Suffixes used in the names of variables per capita and of decadal variables.
+PER_CAPITA_SUFFIX = " per 100,000 people"
+DECADAL_SUFFIX = " (decadal)"
 
-"""
-df = pd.read_sql(sql=query, con=conn)
 
-# Select relevant columns.
-df = df[["id", "name", "datasetId", "shortName", "catalogPath", "titlePublic", "titleVariant", "descriptionShort"]]
+def variable_name(impact, disaster, per_capita, timespan):
+    """Return the name of a variable, e.g. "Deaths per 100,000 people - Flood (decadal)"."""
+    name = f"{impact}{PER_CAPITA_SUFFIX if per_capita else ''} - {disaster}"
+    return name + DECADAL_SUFFIX if timespan == "Decadal average" else name
 
-# Select yearly variables.
-df_yearly = df[~df["name"].str.contains("decadal")].reset_index(drop=True)
 
-# Select decadal variables.
-df_decadal = df[df["name"].str.contains("decadal")].reset_index(drop=True)
+def parse_variable_name(name):
+    """Return the (impact, disaster, per_capita, timespan) of a variable name, or None if it has a different format."""
+    timespan = "Annual"
+    if name.endswith(DECADAL_SUFFIX):
+        name = name[: -len(DECADAL_SUFFIX)]
+        timespan = "Decadal average"
+    if " - " not in name:
+        return None
+    impact, disaster = name.split(" - ", 1)
+    per_capita = impact.endswith(PER_CAPITA_SUFFIX)
+    if per_capita:
+        impact = impact[: -len(PER_CAPITA_SUFFIX)]
+    return impact, disaster, per_capita, timespan
 
-# Initialize a list that will gather all relevant data to construct the explorer file.
-data = []
 
-# Add rows of decadal data.
+class VariablesCatalog(ABC):
+    """Source of the variables table of grapher.
 
-# Add a row with all variables showing a specific human impact.
-for impact in HUMAN_IMPACTS:
-    if impact == "Disasters":
-        title = "Decadal average: Annual number of reported natural disasters"
-    else:
-        title = f"Decadal average: Annual number of {IMPACT_MAPPING[impact]} from natural disasters"
-    names = [f"{impact} - {disaster} (decadal)" for disaster in DISASTER_TYPES]
-    selected = df_decadal[df_decadal["name"].isin(names)]
-    data.append(
-        {
-            "yVariableIds": " ".join(selected["id"].astype(str).tolist()),
-            "Disaster Type Dropdown": "All disasters (by type)",
-            "Impact Dropdown": impact,
-            "Timespan Radio": "Decadal average",
-            "Per capita Checkbox": "false",
-            "type": "StackedBar",
-            "note": DECADAL_AVERAGE_NOTE,
-            "title": title,
-            # For this view with multiple (sparse) variables, we need to always show the data, even when there are nans.
-            "missingDataStrategy": "show",
-            "hasMapTab": "false",
-        }
-    )
-# Add a row with all variables showing a specific economic impact.
-for impact in ECONOMIC_IMPACTS:
-    names = [f"{impact} - {disaster} (decadal)" for disaster in DISASTER_TYPES]
-    selected = df_decadal[df_decadal["name"].isin(names)]
-    data.append(
-        {
-            "yVariableIds": " ".join(selected["id"].astype(str).tolist()),
-            "Disaster Type Dropdown": "All disasters (by type)",
-            "Impact Dropdown": impact,
-            "Timespan Radio": "Decadal average",
-            "Per capita Checkbox": "false",
-            "type": "StackedBar",
-            "note": DECADAL_AVERAGE_NOTE,
-            "title": f"Decadal average: {impact} from natural disasters",
-            # For this view with multiple (sparse) variables, we need to always show the data, even when there are nans.
-            "missingDataStrategy": "show",
-            "hasMapTab": "false",
-        }
-    )
-# Add a row with all variables showing a specific impact per 100,000 people.
-for impact in HUMAN_IMPACTS:
-    if impact == "Disasters":
-        title = "Decadal average: Annual rate of reported natural disasters"
-    else:
-        title = f"Decadal average: Annual rate of {IMPACT_MAPPING[impact]} from natural disasters"
-    names = [f"{impact} per 100,000 people - {disaster} (decadal)" for disaster in DISASTER_TYPES]
-    selected = df_decadal[df_decadal["name"].isin(names)]
-    data.append(
-        {
-            "yVariableIds": " ".join(selected["id"].astype(str).tolist()),
-            "Disaster Type Dropdown": "All disasters (by type)",
-            "Impact Dropdown": impact,
-            "Timespan Radio": "Decadal average",
-            "Per capita Checkbox": "true",
-            "type": "StackedBar",
-            "note": DECADAL_AVERAGE_NOTE,
-            "title": title,
-            # For this view with multiple (sparse) variables, we need to always show the data, even when there are nans.
-            "missingDataStrategy": "show",
-            "hasMapTab": "false",
-        }
-    )
-# Add a row for each disaster type and human impact.
-for impact in HUMAN_IMPACTS:
-    for disaster in DISASTER_COMBINATION_TYPES + DISASTER_TYPES:
-        name = f"{impact} - {disaster} (decadal)"
-        selected = df_decadal[(df_decadal["name"] == name)]
-        assert len(selected) == 1
-        if (impact == "Disasters") & (disaster == "All disasters"):
-            title = "Decadal average: Annual number of reported natural disasters"
-        else:
-            title = selected["titlePublic"].item()
-        data.append(
-            {
-                "yVariableIds": selected["id"].item(),
-                "Disaster Type Dropdown": disaster,
-                "Impact Dropdown": impact,
-                "Timespan Radio": "Decadal average",
-                "Per capita Checkbox": "false",
-                "type": "StackedBar",
-                "note": DECADAL_AVERAGE_NOTE,
-                "title": title,
-                "missingDataStrategy": "auto",
-                "hasMapTab": "true",
-            }
-        )
-# Add a row for each disaster type and human impact per 100,000 people.
-for impact in HUMAN_IMPACTS:
-    for disaster in DISASTER_COMBINATION_TYPES + DISASTER_TYPES:
-        name = f"{impact} per 100,000 people - {disaster} (decadal)"
-        selected = df_decadal[(df_decadal["name"] == name)]
-        assert len(selected) == 1
-        if (impact == "Disasters") & (disaster == "All disasters"):
-            title = "Decadal average: Annual rate of reported natural disasters"
-        else:
-            title = selected["titlePublic"].item()
-        data.append(
-            {
-                "yVariableIds": selected["id"].item(),
-                "Disaster Type Dropdown": disaster,
-                "Impact Dropdown": impact,
-                "Timespan Radio": "Decadal average",
-                "Per capita Checkbox": "true",
-                "type": "StackedBar",
-                "note": DECADAL_AVERAGE_NOTE,
-                "title": title,
-                "missingDataStrategy": "auto",
-                "hasMapTab": "true",
-            }
-        )
-# Add a row for each individual disaster type and economic impact per GDP.
-for impact in ECONOMIC_IMPACTS:
-    for disaster in DISASTER_COMBINATION_TYPES + DISASTER_TYPES:
-        name = f"{impact} - {disaster} (decadal)"
-        selected = df_decadal[(df_decadal["name"] == name)]
-        assert len(selected) == 1
-        data.append(
-            {
-                "yVariableIds": selected["id"].item(),
-                "Disaster Type Dropdown": disaster,
-                "Impact Dropdown": impact,
-                "Timespan Radio": "Decadal average",
-                "Per capita Checkbox": "false",
-                "type": "StackedBar",
-                "note": DECADAL_AVERAGE_NOTE,
-                "missingDataStrategy": "auto",
-                "hasMapTab": "true",
-            }
+    Subclasses define how to connect to it. The connection is opened on first use and reused by all later queries.
+
+    """
+
+    # Placeholder of query parameters used by the database driver.
+    placeholder = "%s"
+
+    def __init__(self):
+        self._connection = None
+
+    @abstractmethod
+    def connection(self):
+        """Return the connection to the variables table, opening it on first use."""
+
+    def load_variables(self, version):
+        """Return the natural disasters variables of a given version (only the columns used in the explorer)."""
+        query = f"""
+        SELECT {', '.join(VARIABLE_COLUMNS)}
+        FROM variables
+        WHERE catalogPath LIKE {self.placeholder}
+        """
+        return pd.read_sql(
+            sql=query, con=self.connection(), params=(f"grapher/emdat/{version}/natural_disasters/%",)
         )
 
-# Add rows of yearly data.
-# Add a row with all variables showing a specific impact.
-for impact in HUMAN_IMPACTS:
-    if impact == "Disasters":
-        title = "Annual number of reported natural disasters"
-    else:
-        title = f"Annual number of {IMPACT_MAPPING[impact]} from natural disasters"
-
-    names = [f"{impact} - {disaster}" for disaster in DISASTER_TYPES]
-    selected = df_yearly[df_yearly["name"].isin(names)]
-    data.append(
-        {
-            "yVariableIds": " ".join(selected["id"].astype(str).tolist()),
-            "Disaster Type Dropdown": "All disasters (by type)",
-            "Impact Dropdown": impact,
-            "Timespan Radio": "Annual",
-            "Per capita Checkbox": "false",
-            "type": "StackedBar",
-            "note": COMMON_NOTE,
-            "title": title,
-            # For this view with multiple (sparse) variables, we need to always show the data, even when there are nans.
-            "missingDataStrategy": "show",
-            "hasMapTab": "false",
-        }
-    )
-# Add a row with all variables showing a specific economic impact.
-for impact in ECONOMIC_IMPACTS:
-    names = [f"{impact} - {disaster}" for disaster in DISASTER_TYPES]
-    selected = df_yearly[df_yearly["name"].isin(names)]
-    data.append(
-        {
-            "yVariableIds": " ".join(selected["id"].astype(str).tolist()),
-            "Disaster Type Dropdown": "All disasters (by type)",
-            "Impact Dropdown": impact,
-            "Timespan Radio": "Annual",
-            "Per capita Checkbox": "false",
-            "type": "StackedBar",
-            "note": COMMON_NOTE,
-            "title": f"{impact} from natural disasters",
-            # For this view with multiple (sparse) variables, we need to always show the data, even when there are nans.
-            "missingDataStrategy": "show",
-            "hasMapTab": "false",
-        }
-    )
-# Add a row with all variables showing a specific impact per 100,000 people.
-for impact in HUMAN_IMPACTS:
+
+class MySQLVariablesCatalog(VariablesCatalog):
+    """Variables table of the grapher database."""
+
+    def connection(self):
+        if self._connection is None:
+            # Imported here, so that the explorer can be created from a snapshot without the database dependencies.
+            import MySQLdb
+            from dotenv import load_dotenv
+
+            # Uncomment to load credentials to local grapher.
+            # load_dotenv(ETL_FOLDER / ".env")
+            # Uncomment to load credentials to live grapher.
+            load_dotenv(ETL_FOLDER / ".env.live")
+
+            self._connection = MySQLdb.connect(
+                db=os.getenv("DB_NAME"),  # type: ignore
+                host=os.getenv("DB_HOST"),  # type: ignore
+                port=int(os.getenv("DB_PORT")),  # type: ignore
+                user=os.getenv("DB_USER"),  # type: ignore
+                password=os.getenv("DB_PASS"),  # type: ignore
+                charset="utf8mb4",
+                autocommit=True,
+            )
+        return self._connection
+
+
+class SQLiteVariablesCatalog(VariablesCatalog):
+    """Snapshot of the variables table stored in a local SQLite file."""
+
+    placeholder = "?"
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = Path(path)
+
+    def connection(self):
+        if self._connection is None:
+            if not self.path.exists():
+                raise FileNotFoundError(f"Snapshot of variables not found: {self.path}")
+            self._connection = sqlite3.connect(self.path)
+        return self._connection
+
+    def save_variables(self, df):
+        """Save variables in the snapshot (replacing any previous snapshot)."""
+        self.path.unlink(missing_ok=True)
+        with sqlite3.connect(self.path) as connection:
+            df[VARIABLE_COLUMNS].to_sql("variables", connection, index=False)
+        connection.close()
+
+
+parser = argparse.ArgumentParser(description="Create the tsv file for the natural disasters explorer.")
+parser.add_argument("--snapshot", type=Path, help="read variables from this SQLite snapshot instead of the database")
+parser.add_argument("--export-snapshot", type=Path, help="save the variables read from the database in this snapshot")
+args = parser.parse_args()
+
+# Load all natural disasters variables (for the relevant version).
+if args.snapshot is not None:
+    df = SQLiteVariablesCatalog(args.snapshot).load_variables(VERSION)
+else:
+    df = MySQLVariablesCatalog().load_variables(VERSION)
+    if args.export_snapshot is not None:
+        SQLiteVariablesCatalog(args.export_snapshot).save_variables(df)
+        print(f"Snapshot of {len(df)} variables saved in {args.export_snapshot}")
+
+# Index variables by (impact, disaster type, per capita, timespan), parsed from their names, so that each view can find
+# its variables without scanning the whole table.
+# Each entry keeps the position of the variable in the table, to list the variables of a view in the original order.
+variables = {}
+for position, variable in enumerate(df.to_dict("records")):
+    key = parse_variable_name(variable["name"])
+    if key is not None:
+        variables.setdefault(key, []).append((position, variable))
+
+
+def find_variable(impact, disaster, per_capita, timespan):
+    """Return the variable of a given impact and disaster type, or None if there is none."""
+    found = variables.get((impact, disaster, per_capita, timespan), [])
+    assert len(found) <= 1, f"Duplicated variable: {variable_name(impact, disaster, per_capita, timespan)}"
+    return found[0][1] if found else None
+
+
+def find_variable_ids(impact, disasters, per_capita, timespan):
+    """Return the ids of the variables of a given impact for several disaster types, as a space-separated string."""
+    found = [entry for disaster in disasters for entry in variables.get((impact, disaster, per_capita, timespan), [])]
+    return " ".join(str(variable["id"]) for _, variable in sorted(found, key=lambda entry: entry[0]))
+
+
+def impact_title(impact, per_capita):
+    """Return the title of the views of a human impact from all natural disasters (without timespan prefix)."""
+    measure = "rate" if per_capita else "number"
     if impact == "Disasters":
-        title = "Annual rate of reported natural disasters"
-    else:
-        title = f"Annual rate of {IMPACT_MAPPING[impact]} from natural disasters"
-    names = [f"{impact} per 100,000 people - {disaster}" for disaster in DISASTER_TYPES]
-    selected = df_yearly[df_yearly["name"].isin(names)]
-    data.append(
-        {
-            "yVariableIds": " ".join(selected["id"].astype(str).tolist()),
-            "Disaster Type Dropdown": "All disasters (by type)",
-            "Impact Dropdown": impact,
-            "Timespan Radio": "Annual",
-            "Per capita Checkbox": "true",
-            "type": "StackedBar",
-            "note": COMMON_NOTE,
-            "title": title,
-            # For this view with multiple (sparse) variables, we need to always show the data, even when there are nans.
-            "missingDataStrategy": "show",
-            "hasMapTab": "false",
-        }
-    )
-# Add a row for each disaster type and human impact.
-for impact in HUMAN_IMPACTS:
-    for disaster in DISASTER_COMBINATION_TYPES + DISASTER_TYPES:
-        name = f"{impact} - {disaster}"
-        selected = df_yearly[(df_yearly["name"] == name)]
-        assert len(selected) == 1
-        if (impact == "Disasters") & (disaster == "All disasters"):
-            title = "Annual number of reported natural disasters"
-        else:
-            title = selected["titlePublic"].item()
-        data.append(
-            {
-                "yVariableIds": selected["id"].item(),
-                "Disaster Type Dropdown": disaster,
-                "Impact Dropdown": impact,
-                "Timespan Radio": "Annual",
-                "Per capita Checkbox": "false",
-                "type": "StackedBar",
-                "note": COMMON_NOTE,
-                "title": title,
-                "missingDataStrategy": "auto",
-                "hasMapTab": "true",
-            }
-        )
-# Add a row for each disaster type and human impact per 100,000 people.
-for impact in HUMAN_IMPACTS:
-    for disaster in DISASTER_COMBINATION_TYPES + DISASTER_TYPES:
-        name = f"{impact} per 100,000 people - {disaster}"
-        selected = df_yearly[(df_yearly["name"] == name)]
-        assert len(selected) == 1
-        if (impact == "Disasters") & (disaster == "All disasters"):
-            title = "Annual rate of reported natural disasters"
-        else:
-            title = selected["titlePublic"].item()
-        data.append(
-            {
-                "yVariableIds": selected["id"].item(),
-                "Disaster Type Dropdown": disaster,
-                "Impact Dropdown": impact,
-                "Timespan Radio": "Annual",
-                "Per capita Checkbox": "true",
-                "type": "StackedBar",
-                "note": COMMON_NOTE,
-                "title": title,
-                "missingDataStrategy": "auto",
-                "hasMapTab": "true",
-            }
-        )
-# Add a row for each individual disaster type and economic impact per GDP.
-for impact in ECONOMIC_IMPACTS:
-    for disaster in DISASTER_COMBINATION_TYPES + DISASTER_TYPES:
-        name = f"{impact} - {disaster}"
-        selected = df_yearly[(df_yearly["name"] == name)]
-        if len(selected) == 1:
+        return f"Annual {measure} of reported natural disasters"
+    return f"Annual {measure} of {IMPACT_MAPPING[impact]} from natural disasters"
+
+
+# Initialize a list that will gather all relevant data to construct the explorer file.
+data = []
+
+# Add rows of decadal data, and then rows of yearly data.
+for timespan, title_prefix, note in TIMESPANS:
+    # Add a row with all variables showing a specific human impact, economic impact, and human impact per 100,000 people.
+    for impacts, per_capita in [(HUMAN_IMPACTS, False), (ECONOMIC_IMPACTS, False), (HUMAN_IMPACTS, True)]:
+        for impact in impacts:
+            if impact in ECONOMIC_IMPACTS:
+                title = f"{impact} from natural disasters"
+            else:
+                title = impact_title(impact, per_capita)
+            data.append(
+                {
+                    "yVariableIds": find_variable_ids(impact, DISASTER_TYPES, per_capita, timespan),
+                    "Disaster Type Dropdown": "All disasters (by type)",
+                    "Impact Dropdown": impact,
+                    "Timespan Radio": timespan,
+                    "Per capita Checkbox": "true" if per_capita else "false",
+                    "type": "StackedBar",
+                    "note": note,
+                    "title": title_prefix + title,
+                    # For this view with multiple (sparse) variables, we need to always show the data, even when there are nans.
+                    "missingDataStrategy": "show",
+                    "hasMapTab": "false",
+                }
+            )
+    # Add a row for each disaster type and human impact, and for each disaster type and human impact per 100,000 people.
+    for per_capita in [False, True]:
+        for impact in HUMAN_IMPACTS:
+            for disaster in DISASTER_COMBINATION_TYPES + DISASTER_TYPES:
+                variable = find_variable(impact, disaster, per_capita, timespan)
+                assert variable is not None, f"Not found: {variable_name(impact, disaster, per_capita, timespan)}"
+                if (impact == "Disasters") & (disaster == "All disasters"):
+                    title = title_prefix + impact_title(impact, per_capita)
+                else:
+                    title = variable["titlePublic"]
+                data.append(
+                    {
+                        "yVariableIds": variable["id"],
+                        "Disaster Type Dropdown": disaster,
+                        "Impact Dropdown": impact,
+                        "Timespan Radio": timespan,
+                        "Per capita Checkbox": "true" if per_capita else "false",
+                        "type": "StackedBar",
+                        "note": note,
+                        "title": title,
+                        "missingDataStrategy": "auto",
+                        "hasMapTab": "true",
+                    }
+                )
+    # Add a row for each individual disaster type and economic impact per GDP.
+    for impact in ECONOMIC_IMPACTS:
+        for disaster in DISASTER_COMBINATION_TYPES + DISASTER_TYPES:
+            variable = find_variable(impact, disaster, False, timespan)
+            if variable is None:
+                # Some yearly economic impacts may be missing, but all decadal ones must exist.
+                name = variable_name(impact, disaster, False, timespan)
+                assert timespan == "Annual", f"Not found: {name}"
+                print(f"Not found: {name}")
+                continue
             data.append(
                 {
-                    "yVariableIds": selected["id"].item(),
+                    "yVariableIds": variable["id"],
                     "Disaster Type Dropdown": disaster,
                     "Impact Dropdown": impact,
-                    "Timespan Radio": "Annual",
+                    "Timespan Radio": timespan,
                     "Per capita Checkbox": "false",
                     "type": "StackedBar",
-                    "note": COMMON_NOTE,
+                    "note": note,
                     "missingDataStrategy": "auto",
                     "hasMapTab": "true",
                 }
             )
-        else:
-            print(f"Not found: {name}")
 
 # Prepare header of explorer file.
 df_explorer = pd.DataFrame.from_records(data)
@@ -399,13 +329,12 @@ hideAnnotationFieldsInTitle\ttrue
 minTime\t2000
 graphers
 """
-# Add column names to explorer.
-explorer += "\t" + "\t".join(df_explorer.columns) + "\n"
-
-# Add rows to explorer.
-for i, row in df_explorer.iterrows():
-    explorer += "\t" + "\t".join([str(item) if pd.notna(item) else "" for item in row]) + "\n"
+# Convert all rows of the graphers table into tab-separated lines at once, with empty cells for missing values.
+df_graphers = df_explorer.astype(object).where(df_explorer.notna(), "").astype(str)
+rows = df_graphers.iloc[:, 0].str.cat(df_graphers.iloc[:, 1:], sep="\t")
 
-# Save explorer file.
+# Save explorer file, with the column names and rows of the graphers table indented.
 with open(OUTPUT_FILE, "w") as output_file:
     output_file.write(explorer)
+    output_file.write("\t" + "\t".join(df_explorer.columns) + "\n")
+    output_file.writelines("\t" + row + "\n" for row in rows)
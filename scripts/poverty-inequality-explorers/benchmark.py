@@ -0,0 +1,395 @@
+####################################################################################################
+# BENCHMARK
+####################################################################################################
+"""
+Benchmark of the explorer generators with local fixture sheets, scaled to see how each generator
+behaves when the dimensions of the explorers grow.
+
+The fixtures are the Google sheets in the cache of sheets.py (downloaded if needed, or only the
+snapshots with --offline; EXPLORER_SHEETS_CACHE can point to another folder of fixtures). For each
+scale factor, the rows of the poverty lines and survey types are repeated that many times, with
+distinct values in the columns that identify them (`cents`, `slug_suffix`, `table_name`...), so a
+scale of 10 builds an explorer with 10 times more poverty lines and survey types. The migration
+flows explorer is built from a synthetic migration matrix, with `MIGRATION_ENTITIES` countries
+multiplied by the scale.
+
+Each generator runs in its own process, cell by cell (`# %%`), and each cell is assigned to a stage
+by the markdown heading above it (see profiling.py):
+- sheets: reading the Google sheets (`## Google sheets auxiliar data`).
+- tables: the header and the tables (`## Header`, `## Tables`).
+- graphers: the grapher views and their final adjustments (`## Grapher views`).
+- write: writing the explorer file (`## Explorer generation`).
+Cells before the first heading (imports) are the `setup` stage.
+
+For each stage, the wall time, the peak RSS of the process during the stage and the bytes it
+produced (memory of the DataFrames created in the stage, and the size of the explorer file for the
+write stage) are saved as JSON in `.benchmarks/<commit>.json`, so runs from different commits can
+be compared. The explorers are written to a temporary folder, not to `explorers/`.
+
+python -m scripts.poverty-inequality-explorers.benchmark
+
+Options:
+- --scales N [N ...]: scale factors of the fixtures (default: 1 2 10).
+- --output FILE: JSON file of the results (default: .benchmarks/<commit>.json).
+- --compare FILE: results of another run, to report the stages that got slower.
+- --offline: use only the cached Google sheets (see sheets.py).
+- A list of generators (e.g. `wbpip.pip_poverty_explorer migration-flows`) to run only those.
+"""
+
+import argparse
+import builtins
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import platform
+import re
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from . import sheets
+from .prefetch import GENERATORS, find_sheets, generator_path
+from .profiling import heading_stage, split_cells
+
+BENCHMARK_DIR = Path(__file__).parent / ".benchmarks"
+
+MIGRATION_DIR = Path(__file__).parent.parent / "migration-flows-explorer"
+MIGRATION = "migration-flows"
+
+# Columns that identify each row of the sheets scaled, made distinct in the copies of the rows
+SCALED_SHEETS = {
+    "povlines_abs": ["cents", "dollars_text", "povline_dropdown"],
+    "povlines_rel": ["percent", "slug_suffix", "dropdown", "text"],
+    "povlines_ppp2011": ["cents", "dollars_text", "povline_dropdown"],
+    "povlines_ppp2017": ["cents", "dollars_text", "povline_dropdown"],
+    "povlines_both": ["cents_2011", "cents_2017", "povline_dropdown"],
+    "survey_type": ["table_name", "text", "dropdown_option"],
+}
+
+# Added to the numbers of each copy of a row (e.g. 215 cents becomes 1000215 in the first copy)
+NUMBER_STEP = 1_000_000
+
+# Countries and years of the synthetic migration matrix at scale 1
+MIGRATION_ENTITIES = 200
+MIGRATION_YEARS = [1990, 2000, 2010, 2020]
+
+STAGES = ["setup", "sheets", "tables", "graphers", "write"]
+
+# The migration flows script has no markdown cells: stage of each of its cells, in order. It must be
+# updated when cells are added to or removed from the script (run_cells checks the number of cells)
+MIGRATION_STAGES = ["setup", "setup", "sheets", "graphers", "tables", "write", "write"]
+
+# A stage is reported as slower than the baseline when it takes this many times longer
+SLOWER_RATIO = 1.25
+
+
+def scale_sheet(content, sheet_name, scale):
+    """Return the CSV `content` of a sheet with its rows repeated `scale` times, if it is scaled."""
+    if scale == 1 or sheet_name not in SCALED_SHEETS:
+        return content
+
+    df = pd.read_csv(io.BytesIO(content), dtype=str, keep_default_na=False)
+    copies = [df]
+    for copy in range(1, scale):
+        df_copy = df.copy()
+        for column in SCALED_SHEETS[sheet_name]:
+            if column in df_copy.columns:
+                df_copy[column] = _distinct(df[column], copy)
+        copies.append(df_copy)
+
+    return pd.concat(copies, ignore_index=True).to_csv(index=False).encode()
+
+
+def _distinct(values, copy):
+    """Values of a column for a copy of the rows: numbers are shifted and texts get a suffix."""
+    numbers = pd.to_numeric(values, errors="coerce")
+    if numbers.notna().all() and (numbers == numbers.round()).all():
+        return (numbers.astype("int64") + copy * NUMBER_STEP).astype(str)
+    return values.where(values == "", values + f"_{copy}")
+
+
+def migration_matrix(path, n_entities):
+    """
+    Write a synthetic migration matrix with `n_entities` countries to `path`, with the columns read
+    by the migration flows explorer (`entity`, `year` and the origin and destination of each country).
+    Only `entity` and `year` have values, since the explorer does not read the rest.
+    """
+    entities = [f"Country {i}" for i in range(n_entities)]
+    slugs = [entity.replace(" ", "").lower() for entity in entities]
+    columns = ["entity", "year"] + [
+        f"{slug}_{direction}"
+        for slug in slugs
+        for direction in ("origin", "destination")
+    ]
+    empty = "," * (len(columns) - 2)
+    with open(path, "w", newline="\n") as f:
+        f.write(",".join(columns) + "\n")
+        for entity in entities:
+            for year in MIGRATION_YEARS:
+                f.write(f"{entity},{year}{empty}\n")
+
+
+def run_benchmark(targets, scales):
+    """Run each target at each scale, in a new process each time, and return the results."""
+    generators = [target for target in targets if target != MIGRATION]
+    pairs = find_sheets(generators)
+    base = {pair: sheets.fetch_sheet(*pair) for pair in pairs}
+
+    if "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+    else:
+        context = multiprocessing.get_context()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for scale in scales:
+            fixtures = {
+                pair: scale_sheet(content, pair[1], scale)
+                for pair, content in base.items()
+            }
+            if MIGRATION in targets:
+                matrix = Path(tmp_dir) / f"migration_matrix_{scale}.csv"
+                migration_matrix(matrix, MIGRATION_ENTITIES * scale)
+
+            # One process at a time, so the runs do not compete for the cores
+            with context.Pool(
+                processes=1,
+                initializer=_init_worker,
+                initargs=(fixtures,),
+                maxtasksperchild=1,
+            ) as pool:
+                for target in targets:
+                    overrides = {"outfile": Path(tmp_dir) / f"{target}.explorer.tsv"}
+                    if target == MIGRATION:
+                        overrides["datafile_url"] = str(matrix)
+                    stages = pool.apply(_run_target, (target, overrides))
+                    results.append(
+                        {
+                            "target": target,
+                            "scale": scale,
+                            "seconds": sum(
+                                stage["seconds"] for stage in stages.values()
+                            ),
+                            "peak_rss": max(
+                                stage["peak_rss"] for stage in stages.values()
+                            ),
+                            "output_bytes": stages["write"]["output_bytes"],
+                            "stages": stages,
+                        }
+                    )
+                    print(
+                        f"{target} x{scale}: {results[-1]['seconds']:.2f}s, "
+                        + ", ".join(
+                            f"{name} {stage['seconds']:.2f}s"
+                            for name, stage in stages.items()
+                        )
+                    )
+
+    return results
+
+
+def _init_worker(fixtures):
+    sheets._prefetched.clear()
+    sheets._prefetched.update(fixtures)
+
+
+def _run_target(target, overrides):
+    if target == MIGRATION:
+        os.chdir(MIGRATION_DIR)
+        path = MIGRATION_DIR / "migration-flows-explorer.py"
+        package = None
+        cell_stages = MIGRATION_STAGES
+    else:
+        path = generator_path(target)
+        package = f"{__package__}.{target.rsplit('.', 1)[0]}"
+        cell_stages = None
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        return run_cells(path, package, overrides, cell_stages)
+
+
+def run_cells(path, package, overrides, cell_stages=None):
+    """
+    Run the script in `path` cell by cell, as `python -m` would with `package`, and return the wall
+    time, peak RSS and output bytes of each stage. The variables in `overrides` (e.g. `outfile`)
+    are replaced as soon as the script defines them. Without `cell_stages` (the stage of each cell,
+    in order), the stages are found from the headings of the markdown cells, which can have code too.
+    """
+    namespace = {
+        "__name__": "__main__",
+        "__file__": str(path),
+        "__package__": package,
+        "__builtins__": builtins,
+    }
+    results = {
+        stage: {"seconds": 0.0, "peak_rss": 0, "output_bytes": 0} for stage in STAGES
+    }
+    stage = "setup"
+    produced = {}
+
+    cells = split_cells(Path(path).read_text())
+    if cell_stages is not None and len(cell_stages) != len(cells):
+        raise ValueError(
+            f"{path} has {len(cells)} cells, but {len(cell_stages)} stages are given for them: "
+            "update the stages of its cells (MIGRATION_STAGES) when cells are added or removed"
+        )
+
+    for i, (lineno, is_markdown, cell) in enumerate(cells):
+        if cell_stages is not None:
+            stage = cell_stages[i]
+        elif is_markdown:
+            stage = heading_stage(cell) or stage
+
+        code = compile("\n" * (lineno - 1) + cell, str(path), "exec")
+        frames = {name: id(value) for name, value in _frames(namespace)}
+        _reset_peak_rss()
+        start = time.perf_counter()
+        exec(code, namespace)
+        results[stage]["seconds"] += time.perf_counter() - start
+        results[stage]["peak_rss"] = max(results[stage]["peak_rss"], _peak_rss())
+
+        for name, value in overrides.items():
+            if name in namespace and namespace[name] != value:
+                namespace[name] = value
+        for name, value in _frames(namespace):
+            if frames.get(name) != id(value):
+                produced.setdefault(stage, {})[name] = value
+
+    for stage, frames in produced.items():
+        results[stage]["output_bytes"] = int(
+            sum(frame.memory_usage(deep=True).sum() for frame in frames.values())
+        )
+    outfile = Path(namespace.get("outfile", ""))
+    results["write"]["output_bytes"] = (
+        outfile.stat().st_size if outfile.is_file() else 0
+    )
+
+    return results
+
+
+def _frames(namespace):
+    return [
+        (name, value)
+        for name, value in namespace.items()
+        if isinstance(value, pd.DataFrame)
+    ]
+
+
+def _reset_peak_rss():
+    # Linux only: reset the peak RSS of the process, so each stage has its own
+    with contextlib.suppress(OSError):
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+
+
+def _peak_rss():
+    """Peak resident set size of the process since it started or was last reset, in bytes."""
+    with contextlib.suppress(OSError):
+        status = Path("/proc/self/status").read_text()
+        return int(re.search(r"VmHWM:\s+(\d+) kB", status).group(1)) * 1024
+
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def compare(results, baseline):
+    """Return the (target, scale, stage, seconds before, seconds now) of the stages that got slower."""
+    before = {(run["target"], run["scale"]): run for run in baseline["results"]}
+    slower = []
+    for run in results:
+        old = before.get((run["target"], run["scale"]))
+        if old is None:
+            continue
+        for stage, values in run["stages"].items():
+            old_seconds = old["stages"].get(stage, {}).get("seconds", 0)
+            # Stages of a few milliseconds are not compared, they are mostly noise
+            if (
+                values["seconds"] > 0.05
+                and values["seconds"] > SLOWER_RATIO * old_seconds
+            ):
+                slower.append(
+                    (run["target"], run["scale"], stage, old_seconds, values["seconds"])
+                )
+
+    return slower
+
+
+def _commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the explorer generators with scaled fixture sheets."
+    )
+    parser.add_argument(
+        "targets",
+        nargs="*",
+        default=GENERATORS + [MIGRATION],
+        metavar="GENERATOR",
+        help="generators to run, relative to this folder, or migration-flows (default: all)",
+    )
+    parser.add_argument(
+        "--scales",
+        nargs="+",
+        type=int,
+        default=[1, 2, 10],
+        help="scale factors of the fixtures (default: 1 2 10)",
+    )
+    parser.add_argument("--output", type=Path, help="JSON file of the results")
+    parser.add_argument(
+        "--compare", type=Path, help="JSON file of the results of another run"
+    )
+    parser.add_argument(
+        "--offline", action="store_true", help="use only the cached Google sheets"
+    )
+    args = parser.parse_args()
+    unknown = [
+        target for target in args.targets if target not in GENERATORS + [MIGRATION]
+    ]
+    if unknown:
+        parser.error(f"unknown generators: {', '.join(unknown)}")
+
+    commit = _commit()
+    results = run_benchmark(args.targets, args.scales)
+    output = args.output or BENCHMARK_DIR / f"{commit or 'results'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(
+        json.dumps(
+            {
+                "commit": commit,
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "python": platform.python_version(),
+                "pandas": pd.__version__,
+                "numpy": np.__version__,
+                "results": results,
+            },
+            indent=2,
+        )
+    )
+    print(f"Results saved in {output}")
+
+    if args.compare:
+        slower = compare(results, json.loads(args.compare.read_text()))
+        for target, scale, stage, before, now in slower:
+            print(f"SLOWER {target} x{scale} {stage}: {before:.2f}s -> {now:.2f}s")
+        if slower:
+            sys.exit(1)
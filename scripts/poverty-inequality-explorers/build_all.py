@@ -0,0 +1,189 @@
+####################################################################################################
+# BUILD ALL THE EXPLORERS
+####################################################################################################
+"""
+Build all the poverty and inequality explorers with one command, using all the cores.
+
+All the Google sheets are downloaded first, in parallel (see prefetch.py). Then each generator runs
+in its own worker process. The workers are forked from this process after pandas, the sheets and
+common_parameters.py are loaded, so they do not load or download them again. At the end, the time
+spent on each explorer is reported.
+
+Explorers whose inputs (generator, shared modules, constants they use from common_parameters.py
+and sheets) have not changed since they were last built are skipped, like a `make` target (see
+manifest.py).
+
+Each explorer built is checked with scripts/explorers/lint.py. Explorers with broken views are
+reported as errors and built again in the next run. The size of each explorer and how much of it is
+repeated description paragraphs is reported too (see descriptions.py).
+
+With EXPLORER_PROFILE set, the generators are run cell by cell and the time of each cell is written
+to the trace file (see profiling.py).
+
+python -m scripts.poverty-inequality-explorers.build_all
+
+Options:
+- --jobs N: number of worker processes (default: number of cores).
+- --offline: use only the cached sheets (see sheets.py).
+- --force: build all the explorers, even the ones that are up to date.
+- A list of generators (e.g. `wbpip.pip_poverty_explorer wid.wid_inequality_explorer`) to build only those.
+"""
+
+import argparse
+import multiprocessing
+import os
+import runpy
+import sys
+import time
+import traceback
+
+from ..explorers.lint import lint_file
+
+# common_parameters is loaded here once, so the workers inherit it
+from . import common_parameters, profiling, sheets  # noqa: F401
+from .descriptions import boilerplate_report, format_report
+from .manifest import (
+    find_outfile,
+    inputs_hash,
+    is_up_to_date,
+    load_manifest,
+    record_build,
+    save_manifest,
+)
+from .prefetch import GENERATORS, find_sheets, generator_path
+
+
+def build_all(generators=GENERATORS, jobs=None, force=False):
+    """
+    Run the generators in a process pool and return a dictionary with the seconds taken by each.
+    Generators whose explorer is up to date are skipped, unless `force` is True.
+    Raise RuntimeError at the end if any generator failed.
+    """
+    start = time.perf_counter()
+    n_sheets = sheets.prefetch_sheets(find_sheets(generators))
+    print(f"{n_sheets} sheets loaded in {time.perf_counter() - start:.2f}s")
+
+    manifest = load_manifest()
+    hashes = {
+        generator: inputs_hash(generator, sheets._prefetched)
+        for generator in generators
+    }
+    if not force:
+        up_to_date = [
+            generator
+            for generator in generators
+            if is_up_to_date(manifest, generator, hashes[generator])
+        ]
+        for generator in up_to_date:
+            print(f"{generator}: up to date")
+        generators = [
+            generator for generator in generators if generator not in up_to_date
+        ]
+
+    if not generators:
+        return {}
+
+    # Forked workers inherit the sheets and modules already loaded here. Each process runs only one
+    # generator, so a script cannot leave changes to the shared modules behind for the next one
+    if "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+    else:
+        context = multiprocessing.get_context()
+
+    timings = {}
+    errors = {}
+    with context.Pool(
+        processes=min(jobs or os.cpu_count(), len(generators)),
+        initializer=_init_worker,
+        initargs=(sheets._prefetched,),
+        maxtasksperchild=1,
+    ) as pool:
+        for generator, seconds, error, problems, report in pool.imap_unordered(
+            _run_generator, generators
+        ):
+            timings[generator] = seconds
+            if error is not None:
+                errors[generator] = error
+                print(f"{generator}: FAILED after {seconds:.2f}s\n{error}")
+            elif problems:
+                errors[generator] = problems
+                print(
+                    f"{generator}: {len(problems)} problems found after {seconds:.2f}s"
+                )
+                outfile = find_outfile(generator)
+                for problem in problems:
+                    print(f"  {outfile.name}: {problem}")
+            else:
+                record_build(manifest, generator, hashes[generator])
+                print(f"{generator}: {seconds:.2f}s, {format_report(report)}")
+
+    save_manifest(manifest)
+    print(f"{len(generators)} explorers built in {time.perf_counter() - start:.2f}s")
+    if errors:
+        raise RuntimeError(
+            f"These explorers could not be built or have problems: {', '.join(errors)}"
+        )
+
+    return timings
+
+
+def _init_worker(prefetched):
+    sheets._prefetched.update(prefetched)
+
+
+def _run_generator(generator):
+    start = time.perf_counter()
+    try:
+        if profiling.enabled():
+            # Cell by cell, with a span for each cell in the trace
+            package, _ = f"{__package__}.{generator}".rsplit(".", 1)
+            profiling.run_script(generator_path(generator), package, generator)
+        else:
+            runpy.run_module(f"{__package__}.{generator}", run_name="__main__")
+    except Exception:
+        return (
+            generator,
+            time.perf_counter() - start,
+            traceback.format_exc(),
+            None,
+            None,
+        )
+
+    seconds = time.perf_counter() - start
+    outfile = find_outfile(generator)
+    _, problems = lint_file(outfile)
+    return generator, seconds, None, problems, boilerplate_report(outfile)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Build the poverty and inequality explorers."
+    )
+    parser.add_argument(
+        "generators",
+        nargs="*",
+        default=GENERATORS,
+        metavar="GENERATOR",
+        help="generators to run, relative to this folder (default: all)",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, help="number of worker processes (default: all cores)"
+    )
+    parser.add_argument(
+        "--offline", action="store_true", help="use only the cached Google sheets"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="build also the explorers up to date"
+    )
+    args = parser.parse_args()
+    # Checked here and not with `choices`, which rejects the default list in some Python versions
+    unknown = [
+        generator for generator in args.generators if generator not in GENERATORS
+    ]
+    if unknown:
+        parser.error(f"unknown generators: {', '.join(unknown)}")
+
+    try:
+        build_all(args.generators, jobs=args.jobs, force=args.force)
+    except RuntimeError as e:
+        sys.exit(str(e))
@@ -103,6 +103,20 @@ PROCESSING_DESCRIPTION_PIP_POVERTY = NEW_LINE.join(
 PPP_DESCRIPTION_PIP_2017 = "The data is measured in international-$ at 2017 prices – this adjusts for inflation and for differences in living costs between countries."
 PPP_DESCRIPTION_PIP_2011 = "The data is measured in international-$ at 2011 prices – this adjusts for inflation and for differences in living costs between countries."
 
+# When the "Depending on" footnote is introduced in views that only show income or consumption data,
+# it generates unwanted texts, rewritten with these rules (see rewrites.py)
+# When int-$ are not included (also used for the subtitles of the inequality explorer)
+SUBTITLE_REWRITES_PIP = {
+    "Depending on the country and year, the data relates to income measured after taxes and benefits [per capita](#dod:per-capita).": "The data relates to income measured after taxes and benefits [per capita](#dod:per-capita).",
+    "Depending on the country and year, the data relates to consumption [per capita](#dod:per-capita).": "The data relates to consumption [per capita](#dod:per-capita).",
+}
+NOTE_REWRITES_PIP = {
+    **SUBTITLE_REWRITES_PIP,
+    # When int-$ are included
+    "Depending on the country and year, it relates to income measured after taxes and benefits [per capita](#dod:per-capita).": "It relates to income measured after taxes and benefits [per capita](#dod:per-capita).",
+    "Depending on the country and year, it relates to consumption [per capita](#dod:per-capita).": "It relates to consumption [per capita](#dod:per-capita).",
+}
+
 ####################################################################################################
 # WORLD INEQUALITY DATABASE
 ####################################################################################################
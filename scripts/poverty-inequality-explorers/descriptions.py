@@ -0,0 +1,124 @@
+####################################################################################################
+# DESCRIPTIONS
+####################################################################################################
+"""
+Paragraph pool used by the generators to build the `description` of the columns of the tables.
+
+Most descriptions are the same long paragraphs (PPP, survey type, additional and processing
+descriptions) joined with NEW_LINE, repeated for every poverty line, welfare type and table. The
+pool keeps a single copy of each paragraph and of each description, so the rows of `df_tables`
+share the same string objects instead of holding a new copy of the whole text each.
+
+The size report shows how much of each explorer file is made of description paragraphs already
+written before in the same file:
+
+python -m scripts.poverty-inequality-explorers.descriptions [explorer files]
+
+By default, the report covers the explorers written by all the generators.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .common_parameters import NEW_LINE
+
+
+class ParagraphPool:
+    """Intern the paragraphs of the descriptions and the descriptions built from them."""
+
+    def __init__(self):
+        self._paragraphs = {}
+        self._descriptions = {}
+
+    def __len__(self):
+        return len(self._paragraphs)
+
+    def intern(self, paragraph):
+        """Return the copy of `paragraph` kept in the pool."""
+        return self._paragraphs.setdefault(paragraph, paragraph)
+
+    def join(self, paragraphs):
+        """Join the paragraphs with NEW_LINE, as `NEW_LINE.join(paragraphs)`, reusing descriptions already built."""
+        key = tuple(self.intern(paragraph) for paragraph in paragraphs)
+        description = self._descriptions.get(key)
+        if description is None:
+            description = self._descriptions[key] = NEW_LINE.join(key)
+        return description
+
+    def join_columns(self, paragraphs, index):
+        """
+        Vectorized `join` for a table: each paragraph is a column with one value per row of `index`,
+        or a text shared by all the rows. Each different description is built once.
+        """
+        columns = pd.DataFrame(dict(enumerate(paragraphs)), index=index)
+        codes, combinations = pd.MultiIndex.from_frame(columns).factorize()
+        descriptions = np.empty(len(combinations), dtype=object)
+        descriptions[:] = [self.join(combination) for combination in combinations]
+        return pd.Series(descriptions[codes], index=index)
+
+
+_pool = ParagraphPool()
+
+
+def join_paragraphs(paragraphs):
+    """Build a description from its paragraphs, using the pool shared by the generator."""
+    return _pool.join(paragraphs)
+
+
+def join_paragraph_columns(paragraphs, index):
+    """Build the descriptions of the rows of a table, using the pool shared by the generator."""
+    return _pool.join_columns(paragraphs, index)
+
+
+def boilerplate_report(path):
+    """
+    Return the size of an explorer file, the size of its column descriptions and the size of the
+    description paragraphs that were already written before in the file, in bytes.
+    """
+    # Imported here, so the generators do not depend on scripts/explorers for the report only
+    from ..explorers.explorer import read_explorer
+
+    explorer = read_explorer(path)
+    seen = set()
+    description_bytes = 0
+    repeated_bytes = 0
+    for table in explorer.tables.values():
+        if table.columns is None or "description" not in table.columns.header:
+            continue
+        for description in table.columns.column("description"):
+            if not description:
+                continue
+            description_bytes += len(description.encode())
+            for paragraph in description.split(NEW_LINE):
+                if paragraph in seen:
+                    repeated_bytes += len(paragraph.encode())
+                else:
+                    seen.add(paragraph)
+
+    return {
+        "file": Path(explorer.path).stat().st_size,
+        "descriptions": description_bytes,
+        "repeated": repeated_bytes,
+    }
+
+
+def format_report(report):
+    return (
+        f"{report['file'] / 1e6:.2f} MB, descriptions {report['descriptions'] / 1e6:.2f} MB, "
+        f"repeated paragraphs {report['repeated'] / 1e6:.2f} MB "
+        f"({report['repeated'] / max(report['file'], 1):.0%} of the file)"
+    )
+
+
+if __name__ == "__main__":
+    from .manifest import find_outfile
+    from .prefetch import GENERATORS
+
+    paths = sys.argv[1:] or [
+        outfile for outfile in map(find_outfile, GENERATORS) if outfile.exists()
+    ]
+    for path in paths:
+        print(f"{Path(path).name}: {format_report(boilerplate_report(path))}")
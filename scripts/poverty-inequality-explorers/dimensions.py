@@ -0,0 +1,192 @@
+####################################################################################################
+# DIMENSIONS
+####################################################################################################
+"""
+Declarative alternative to the nested loops of the generators (`for wel ... for eq ... for p ...`).
+
+A spec lists the rows of a table (`df_tables` or `df_graphers`) as templates, grouped in `ForEach`
+blocks that repeat them for each row of the dimension tables read from the Google sheets
+(`welfare`, `equivalence_scales`, `povlines_abs`...). `expand` computes all the combinations with
+pandas cross merges and fills in the templates column by column, so adding a poverty line to the
+sheet adds its rows without running any more Python code per row.
+
+The values of the templates can be:
+- A string, where `{welfare[slug]}` is replaced by the value of the column `slug` of the row of
+  `welfare`, as in an f-string. Strings without fields are used as they are.
+- A list of strings, for the paragraphs of a description (joined with NEW_LINE, see descriptions.py).
+- `Column(dimension, name)`, to use the value of a column of a dimension without converting it into
+  text. `name` can be a template too, like `scale_poverty_gap_index_{welfare[slug]}`.
+- Any other value (like `np.nan`), used as it is.
+
+The rows are in the same order as with the nested loops, and the columns are in the order they
+first appear, with the same dtypes as TableBuilder gives.
+
+So far only lis/lis_expanded_poverty_explorer.py is built with it, over `tables`, `welfare`,
+`equivalence_scales`, `povlines_abs` and `povlines_rel`. The other generators still have their
+loops, and no spec uses `survey_type` yet.
+
+    spec = ForEach(
+        ["welfare", "povlines_abs"],
+        [{"slug": "headcount_ratio_{welfare[slug]}_{povlines_abs[cents]}", "type": "Numeric"}],
+    )
+    df_tables = expand(spec, {"welfare": welfare, "povlines_abs": povlines_abs})
+"""
+
+from dataclasses import dataclass, field
+from string import Formatter
+from typing import Dict, List, Union
+
+import numpy as np
+import pandas as pd
+
+from .descriptions import join_paragraph_columns
+from .profiling import profiled
+from .table_builder import infer_column
+
+
+@dataclass
+class ForEach:
+    """
+    Repeat `items` (rows given as dictionaries and other ForEach blocks) for each combination of the
+    rows of `dimensions`, the first dimension being the outer loop. `assign` adds columns to all the
+    rows of the block, after the columns of the items, like `df_tables["tableSlug"] = ...`.
+    """
+
+    dimensions: List[str]
+    items: List[Union[dict, "ForEach"]]
+    assign: Dict[str, object] = field(default_factory=dict)
+
+
+@dataclass
+class Column:
+    """Value of the column `name` of `dimension`, kept as it is in the sheet."""
+
+    dimension: str
+    name: str
+
+
+@profiled
+def expand(spec, dimensions):
+    """
+    Create the table described by `spec`. `dimensions` is a dictionary with the DataFrame of each
+    dimension used in the spec.
+    """
+    start = pd.DataFrame(index=pd.RangeIndex(1))
+    frames, columns = _expand(spec, start, {}, dimensions, {})
+    frames = [frame for frame in frames if len(frame)]
+    if not frames:
+        return pd.DataFrame(columns=columns)
+
+    df = pd.concat(frames, ignore_index=True)
+    keys = sorted(
+        (column for column in df.columns if column.startswith("_key_")), key=_key_depth
+    )
+    order = np.lexsort([df[key].fillna(0).to_numpy() for key in keys[::-1]])
+    columns = [column for column in columns if any(column in frame for frame in frames)]
+    return pd.DataFrame(
+        {column: infer_column(df[column].iloc[order].tolist()) for column in columns},
+        index=pd.RangeIndex(len(df)),
+        columns=columns,
+    )
+
+
+def _expand(item, frame, keys, dimensions, products):
+    """
+    Return the frames with the rows of `item` for each row of `frame` (the combinations of the outer
+    dimensions) and the names of their columns, in order. `keys` are the positions of the item in
+    the blocks that contain it, used to sort the rows at the end.
+    """
+    if isinstance(item, dict):
+        values = {
+            column: _value(value, frame, dimensions) for column, value in item.items()
+        }
+        values = pd.DataFrame({**keys, **values}, index=frame.index)
+        return [pd.concat([frame, values], axis=1)], list(item)
+
+    depth = len(keys) + sum(column.startswith("_key_") for column in frame.columns)
+    frame = _product(frame, item.dimensions, depth, dimensions, products)
+    depth += len(item.dimensions)
+
+    frames = []
+    columns = []
+    for i, child in enumerate(item.items):
+        child_frames, child_columns = _expand(
+            child, frame, {**keys, f"_key_{depth}": i}, dimensions, products
+        )
+        frames.extend(child_frames)
+        columns.extend(column for column in child_columns if column not in columns)
+
+    if item.assign:
+        block = pd.concat(frames, ignore_index=True)
+        for column, value in item.assign.items():
+            block[column] = _value(value, block, dimensions)
+            if column not in columns:
+                columns.append(column)
+        frames = [block]
+
+    return frames, columns
+
+
+def _product(frame, names, depth, dimensions, products):
+    """
+    Cross merge `frame` with the dimensions `names`. The products are kept in `products`, since the
+    same dimensions are usually repeated for many items of a block (like the poverty lines).
+    """
+    cache_key = (id(frame), tuple(names))
+    if cache_key not in products:
+        product = frame
+        for name in names:
+            table = dimensions[name].reset_index(drop=True)
+            table = table.rename(columns=lambda column: f"{name}[{column}]")
+            table[f"_key_{depth}"] = np.arange(len(table))
+            product = product.merge(table, how="cross")
+            depth += 1
+        # The frame is kept too, so its id is not reused while the product is cached
+        products[cache_key] = (frame, product)
+    return products[cache_key][1]
+
+
+def _value(value, frame, dimensions):
+    if isinstance(value, str):
+        return _render(value, frame)
+    if isinstance(value, list):
+        return join_paragraph_columns(
+            [_render(paragraph, frame) for paragraph in value], frame.index
+        )
+    if isinstance(value, Column):
+        return _column(value, frame)
+    return value
+
+
+def _render(template, frame):
+    """Fill in a template for each row of `frame`. Templates without fields are returned as they are."""
+    parts = []
+    for literal, field_name, _, _ in Formatter().parse(template):
+        if literal:
+            parts.append(literal)
+        if field_name is not None:
+            parts.append(frame[field_name].astype(str))
+
+    if not any(isinstance(part, pd.Series) for part in parts):
+        return "".join(parts)
+
+    result = pd.Series("", index=frame.index, dtype=object)
+    for part in parts:
+        result = result + part
+    return result
+
+
+def _column(column, frame):
+    names = _render(column.name, frame)
+    if isinstance(names, str):
+        return frame[f"{column.dimension}[{names}]"]
+
+    values = pd.Series(np.nan, index=frame.index, dtype=object)
+    for name in names.unique():
+        rows = names == name
+        values[rows] = frame.loc[rows, f"{column.dimension}[{name}]"]
+    return values
+
+
+def _key_depth(key):
+    return int(key[len("_key_") :])
@@ -0,0 +1,94 @@
+####################################################################################################
+# EXPLORER WRITER
+####################################################################################################
+"""
+Writer of the explorer files, used by all the generators.
+
+The header, the graphers table and each table block are written straight to the file while pandas
+converts them into tab-separated text, instead of building the whole text of every table in memory
+and indenting it with `textwrap.indent`. The output is the same as before, byte by byte.
+
+The tables of an explorer are split from df_tables with a single groupby (see `split_table`), instead
+of filtering the whole of df_tables again for each table.
+"""
+
+from .profiling import profiled
+
+
+class ExplorerWriter:
+    """Write the blocks of an explorer file to an open file handle."""
+
+    def __init__(self, f):
+        self.f = f
+
+    def write_header(self, df_header):
+        """Write the header of the explorer (title, subtitle, selection...), one row per setting."""
+        df_header.to_csv(self.f, sep="\t", header=False)
+
+    @profiled
+    def write_graphers(self, df_graphers):
+        """Write the `graphers` block, with one row per view of the explorer."""
+        self.f.write("\ngraphers\n")
+        self._write_indented(df_graphers)
+
+    def write_table(self, df_table, link, slug):
+        """Write the `table` and `columns` blocks of the table `slug`, available in `link`."""
+        self.f.write(f"\ntable\t{link}\t{slug}")
+        self.f.write(f"\ncolumns\t{slug}\n")
+        self._write_indented(df_table)
+
+    @profiled
+    def write_tables(self, df_tables, by, tables):
+        """
+        Write a table for each (slug, link) pair of `tables`, in order, with the rows of df_tables
+        where the column `by` is the slug, without that column.
+        """
+        tables = list(tables)
+        for (slug, link), df_table in zip(
+            tables, split_table(df_tables, by, [slug for slug, _ in tables])
+        ):
+            self.write_table(df_table, link, slug)
+
+    def _write_indented(self, df):
+        indented = _IndentedFile(self.f)
+        df.to_csv(indented, sep="\t", index=False)
+        indented.flush()
+
+
+def split_table(df, by, keys):
+    """
+    Yield the rows of `df` for each key of `keys`, in order, without the columns `by` (a column or a
+    list of columns, with tuples as keys). The rows are grouped once, so the time does not grow with
+    the number of tables. Keys without rows give an empty table with the same columns.
+    """
+    groups = dict(list(df.groupby(by, sort=False)))
+    empty = df.iloc[:0]
+    for key in keys:
+        yield groups.get(key, empty).drop(columns=by)
+
+
+class _IndentedFile:
+    """
+    File-like object that adds a tab at the start of each line written to it, and writes it to `f`.
+    Lines with only whitespace are not indented, as in `textwrap.indent`. Only the last incomplete
+    line is kept in memory, until the rest of it is written.
+    """
+
+    def __init__(self, f):
+        self.f = f
+        self.pending = ""
+
+    def write(self, text):
+        lines = (self.pending + text).splitlines(keepends=True)
+        if lines and lines[-1].splitlines() == [lines[-1]]:
+            self.pending = lines.pop()
+        else:
+            self.pending = ""
+
+        self.f.write("".join("\t" + line if line.strip() else line for line in lines))
+        return len(text)
+
+    def flush(self):
+        if self.pending:
+            self.f.write("\t" + self.pending if self.pending.strip() else self.pending)
+            self.pending = ""
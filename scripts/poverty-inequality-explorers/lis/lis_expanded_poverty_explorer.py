@@ -3,7 +3,6 @@
 # This code creates the tsv file for the expanded poverty explorer from the LIS data, available [here](https://owid.cloud/admin/explorers/preview/lis-expanded-poverty)
 
 
-import textwrap
 from pathlib import Path
 
 import numpy as np
@@ -12,6 +11,9 @@ import numpy as np
 import pandas as pd
 
 from ..common_parameters import *
+from ..dimensions import Column, ForEach, expand
+from ..explorer_writer import ExplorerWriter
+from ..sheets import read_sheet
 
 PARENT_DIR = Path(__file__).parent.parent.parent.parent.absolute()
 outfile = PARENT_DIR / "explorers" / "poverty-lis.explorer.tsv"
@@ -26,28 +28,27 @@ sheet_id = "1UFdwB1iBpP2tEP6GtxCHvW1GGhjsFflh42FWR80rYIg"
 
 # Welfare type sheet
 sheet_name = "welfare"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-welfare = pd.read_csv(url, keep_default_na=False)
+welfare = read_sheet(sheet_id, sheet_name, keep_default_na=False)
 
 # Equivalence scales
 sheet_name = "equivalence_scales"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-equivalence_scales = pd.read_csv(url, keep_default_na=False, dtype={"checkbox": "str"})
+equivalence_scales = read_sheet(
+    sheet_id, sheet_name, keep_default_na=False, dtype={"checkbox": "str"}
+)
 
 # Absolute povlines
 sheet_name = "povlines_abs"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-povlines_abs = pd.read_csv(url, keep_default_na=False, dtype={"dollars_text": "str"})
+povlines_abs = read_sheet(
+    sheet_id, sheet_name, keep_default_na=False, dtype={"dollars_text": "str"}
+)
 
 # Relative povlines
 sheet_name = "povlines_rel"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-povlines_rel = pd.read_csv(url, keep_default_na=False)
+povlines_rel = read_sheet(sheet_id, sheet_name, keep_default_na=False)
 
 # Tables sheet
 sheet_name = "tables"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-tables = pd.read_csv(url, keep_default_na=False)
+tables = read_sheet(sheet_id, sheet_name, keep_default_na=False)
 
 # %% [markdown]
 # ## Header
@@ -93,7 +94,6 @@ sourceLink = SOURCE_LINK_LIS
 colorScaleNumericMinValue = COLOR_SCALE_NUMERIC_MIN_VALUE
 tolerance = TOLERANCE
 colorScaleEqualSizeBins = COLOR_SCALE_EQUAL_SIZEBINS
-new_line = NEW_LINE
 
 yAxisMin = Y_AXIS_MIN
 
@@ -108,414 +108,384 @@ processing_distribution = PROCESSING_DISTRIBUTION_LIS
 ppp_description = PPP_DESCRIPTION_LIS
 relative_poverty_description = RELATIVE_POVERTY_DESCRIPTION_LIS
 
-df_tables = pd.DataFrame()
-j = 0
-
-for tab in range(len(tables)):
-    # Define country as entityName
-    df_tables.loc[j, "name"] = "Country"
-    df_tables.loc[j, "slug"] = "country"
-    df_tables.loc[j, "type"] = "EntityName"
-    j += 1
-
-    # Define year as Year
-    df_tables.loc[j, "name"] = "Year"
-    df_tables.loc[j, "slug"] = "year"
-    df_tables.loc[j, "type"] = "Year"
-    j += 1
-
-    for wel in range(len(welfare)):
-        for eq in range(len(equivalence_scales)):
-            # Headcount ratio (abs)
-            for p in range(len(povlines_abs)):
-                df_tables.loc[j, "name"] = (
-                    f"Share below ${povlines_abs['dollars_text'][p]} a day ({welfare['title'][wel]})"
-                )
-                df_tables.loc[j, "slug"] = (
-                    f"headcount_ratio_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_{povlines_abs['cents'][p]}"
-                )
-                df_tables.loc[j, "description"] = new_line.join(
-                    [
-                        f"% of population living in households with {welfare['welfare_type'][wel]} below ${povlines_abs['dollars_text'][p]} a day.",
-                        welfare["description"][wel],
-                        equivalence_scales["description"][eq],
-                        ppp_description,
-                        notes_title,
-                        processing_description,
-                        processing_poverty,
-                    ]
-                )
-                df_tables.loc[j, "unit"] = "%"
-                df_tables.loc[j, "shortUnit"] = "%"
-                df_tables.loc[j, "type"] = "Numeric"
-                df_tables.loc[j, "colorScaleNumericBins"] = (
-                    "3;10;20;30;40;50;60;70;80;90;100"
-                )
-                df_tables.loc[j, "colorScaleScheme"] = "OrRd"
-                j += 1
-
-            # Headcount (abs)
-            for p in range(len(povlines_abs)):
-                df_tables.loc[j, "name"] = (
-                    f"Number below ${povlines_abs['dollars_text'][p]} a day ({welfare['title'][wel]})"
-                )
-                df_tables.loc[j, "slug"] = (
-                    f"headcount_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_{povlines_abs['cents'][p]}"
-                )
-                df_tables.loc[j, "description"] = new_line.join(
-                    [
-                        f"Number of people living in households with {welfare['welfare_type'][wel]} below ${povlines_abs['dollars_text'][p]} a day.",
-                        welfare["description"][wel],
-                        equivalence_scales["description"][eq],
-                        ppp_description,
-                        notes_title,
-                        processing_description,
-                        processing_poverty,
-                    ]
-                )
-                df_tables.loc[j, "unit"] = np.nan
-                df_tables.loc[j, "shortUnit"] = np.nan
-                df_tables.loc[j, "type"] = "Numeric"
-                df_tables.loc[j, "colorScaleNumericBins"] = (
-                    "100000;300000;1000000;3000000;10000000;30000000;100000000;300000000;1000000000"
-                )
-                df_tables.loc[j, "colorScaleScheme"] = "Reds"
-                j += 1
-
-            # Total shortfall (abs)
-            for p in range(len(povlines_abs)):
-                df_tables.loc[j, "name"] = (
-                    f"Total shortfall - ${povlines_abs['dollars_text'][p]} a day ({welfare['title'][wel]})"
-                )
-                df_tables.loc[j, "slug"] = (
-                    f"total_shortfall_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_{povlines_abs.cents[p]}"
-                )
-                df_tables.loc[j, "description"] = new_line.join(
-                    [
-                        f"The total shortfall from a poverty line of ${povlines_abs['dollars_text'][p]} a day. This is the amount of money that would be theoretically needed to lift the {welfare['welfare_type'][wel]} of all people in poverty up to the poverty line. However this is not a measure of the actual cost of eliminating poverty, since it does not take into account the costs involved in making the necessary transfers nor any changes in behaviour they would bring about.",
-                        welfare["description"][wel],
-                        equivalence_scales["description"][eq],
-                        ppp_description,
-                        notes_title,
-                        processing_description,
-                        processing_poverty,
-                    ]
-                )
-                df_tables.loc[j, "unit"] = "international-$ in 2017 prices"
-                df_tables.loc[j, "shortUnit"] = "$"
-                df_tables.loc[j, "type"] = "Numeric"
-                df_tables.loc[j, "colorScaleNumericBins"] = povlines_abs[
-                    "scale_total_shortfall"
-                ][p]
-                df_tables.loc[j, "colorScaleScheme"] = "Oranges"
-                j += 1
-
-            # Average shortfall ($)
-            for p in range(len(povlines_abs)):
-                df_tables.loc[j, "name"] = (
-                    f"Average shortfall - ${povlines_abs['dollars_text'][p]} a day ({welfare['title'][wel]})"
-                )
-                df_tables.loc[j, "slug"] = (
-                    f"avg_shortfall_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_{povlines_abs['cents'][p]}"
-                )
-                df_tables.loc[j, "description"] = new_line.join(
-                    [
-                        f"The average shortfall from a poverty line of ${povlines_abs['dollars_text'][p]} (averaged across the population in poverty).",
-                        welfare["description"][wel],
-                        equivalence_scales["description"][eq],
-                        ppp_description,
-                        notes_title,
-                        processing_description,
-                        processing_poverty,
-                    ]
-                )
-                df_tables.loc[j, "unit"] = "international-$ in 2017 prices"
-                df_tables.loc[j, "shortUnit"] = "$"
-                df_tables.loc[j, "type"] = "Numeric"
-                df_tables.loc[j, "colorScaleNumericBins"] = povlines_abs[
-                    "scale_avg_shortfall"
-                ][p]
-                df_tables.loc[j, "colorScaleScheme"] = "Purples"
-                j += 1
-
-            # Average shortfall ($): Daily value
-            for p in range(len(povlines_abs)):
-                df_tables.loc[j, "name"] = (
-                    f"Average shortfall - ${povlines_abs['dollars_text'][p]} a day ({welfare['title'][wel]})"
-                )
-                df_tables.loc[j, "slug"] = (
-                    f"avg_shortfall_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_{povlines_abs['cents'][p]}_day"
-                )
-                df_tables.loc[j, "description"] = new_line.join(
-                    [
-                        f"The average shortfall from a poverty line of ${povlines_abs['dollars_text'][p]} (averaged across the population in poverty).",
-                        welfare["description"][wel],
-                        equivalence_scales["description"][eq],
-                        ppp_description,
-                        notes_title,
-                        processing_description,
-                        processing_poverty,
-                    ]
-                )
-                df_tables.loc[j, "unit"] = "international-$ in 2017 prices"
-                df_tables.loc[j, "shortUnit"] = "$"
-                df_tables.loc[j, "type"] = "Numeric"
-                df_tables.loc[j, "colorScaleNumericBins"] = povlines_abs[
-                    "scale_avg_shortfall"
-                ][p]
-                df_tables.loc[j, "colorScaleScheme"] = "Purples"
-                df_tables.loc[j, "transform"] = (
-                    f"multiplyBy avg_shortfall_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_{povlines_abs['cents'][p]} 0.00274"
-                )
-                j += 1
-
-            # Average shortfall (% of poverty line) [this is the income gap ratio]
-            for p in range(len(povlines_abs)):
-                df_tables.loc[j, "name"] = (
-                    f"Income gap ratio - ${povlines_abs['dollars_text'][p]} a day ({welfare['title'][wel]})"
-                )
-                df_tables.loc[j, "slug"] = (
-                    f"income_gap_ratio_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_{povlines_abs['cents'][p]}"
-                )
-                df_tables.loc[j, "description"] = new_line.join(
-                    [
-                        f'The average shortfall from a poverty line of ${povlines_abs.dollars_text[p]} a day (averaged across the population in poverty) expressed as a share of the poverty line. This metric is sometimes called the "income gap ratio". It captures the depth of poverty of those living on less than the poverty line.',
-                        welfare["description"][wel],
-                        equivalence_scales["description"][eq],
-                        ppp_description,
-                        notes_title,
-                        processing_description,
-                        processing_poverty,
-                    ]
-                )
-                df_tables.loc[j, "unit"] = "%"
-                df_tables.loc[j, "shortUnit"] = "%"
-                df_tables.loc[j, "type"] = "Numeric"
-                df_tables.loc[j, "colorScaleNumericBins"] = (
-                    "10;20;30;40;50;60;70;80;90;100"
-                )
-                df_tables.loc[j, "colorScaleScheme"] = "YlOrRd"
-                j += 1
-
-            # Poverty gap index
-            for p in range(len(povlines_abs)):
-                df_tables.loc[j, "name"] = (
-                    f"Poverty gap index - ${povlines_abs['dollars_text'][p]} a day ({welfare['title'][wel]})"
-                )
-                df_tables.loc[j, "slug"] = (
-                    f"poverty_gap_index_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_{povlines_abs['cents'][p]}"
-                )
-                df_tables.loc[j, "description"] = new_line.join(
-                    [
-                        f"The poverty gap index calculated at a poverty line of ${povlines_abs['dollars_text'][p]} a day. The poverty gap index is a measure that reflects both the depth and prevalence of poverty. It is defined as the mean shortfall of the total population from the poverty line counting the non-poor as having zero shortfall and expressed as a percentage of the poverty line. It is worth unpacking that definition a little. For those below the poverty line, the shortfall corresponds to the amount of money required in order to reach the poverty line. For those at or above the poverty line, the shortfall is counted as zero. The average shortfall is then calculated across the total population – both poor and non-poor – and then expressed as a share of the poverty line. Unlike the more commonly-used metric of the headcount ratio, the poverty gap index is thus sensitive not only to whether a person’s income falls below the poverty line or not, but also by how much – i.e. to the depth of poverty they experience.",
-                        welfare["description"][wel],
-                        equivalence_scales["description"][eq],
-                        ppp_description,
-                        notes_title,
-                        processing_description,
-                        processing_poverty,
-                    ]
-                )
-                df_tables.loc[j, "unit"] = "%"
-                df_tables.loc[j, "shortUnit"] = "%"
-                df_tables.loc[j, "type"] = "Numeric"
-                df_tables.loc[j, "colorScaleNumericBins"] = povlines_abs[
-                    f"scale_poverty_gap_index_{welfare['slug'][wel]}"
-                ][p]
-                df_tables.loc[j, "colorScaleScheme"] = "RdPu"
-                j += 1
-
-            # Headcount ratio (rel)
-            for pct in range(len(povlines_rel)):
-                df_tables.loc[j, "name"] = (
-                    f"Share below {povlines_rel['percent'][pct]} of median ({welfare['title'][wel]})"
-                )
-                df_tables.loc[j, "slug"] = (
-                    f"headcount_ratio_{povlines_rel['slug_suffix'][pct]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}"
-                )
-                df_tables.loc[j, "description"] = new_line.join(
-                    [
-                        f"% of population living in households with {welfare['welfare_type'][wel]} below {povlines_rel['percent'][pct]} of the median {welfare['welfare_type'][wel]}.",
-                        relative_poverty_description,
-                        welfare["description"][wel],
-                        equivalence_scales["description"][eq],
-                        notes_title,
-                        processing_description,
-                        processing_poverty,
-                    ]
-                )
-                df_tables.loc[j, "unit"] = "%"
-                df_tables.loc[j, "shortUnit"] = "%"
-                df_tables.loc[j, "type"] = "Numeric"
-                df_tables.loc[j, "colorScaleNumericBins"] = "5;10;15;20;25;30"
-                df_tables.loc[j, "colorScaleScheme"] = "YlOrBr"
-                j += 1
-
-            # Headcount (rel)
-            for pct in range(len(povlines_rel)):
-                df_tables.loc[j, "name"] = (
-                    f"Number below {povlines_rel['percent'][pct]} of median ({welfare['title'][wel]})"
-                )
-                df_tables.loc[j, "slug"] = (
-                    f"headcount_{povlines_rel['slug_suffix'][pct]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}"
-                )
-                df_tables.loc[j, "description"] = new_line.join(
-                    [
-                        f"Number of people living in households with {welfare['welfare_type'][wel]} below {povlines_rel['percent'][pct]} of the median {welfare['welfare_type'][wel]}.",
-                        relative_poverty_description,
-                        welfare["description"][wel],
-                        equivalence_scales["description"][eq],
-                        notes_title,
-                        processing_description,
-                        processing_poverty,
-                    ]
-                )
-                df_tables.loc[j, "unit"] = np.nan
-                df_tables.loc[j, "shortUnit"] = np.nan
-                df_tables.loc[j, "type"] = "Numeric"
-                df_tables.loc[j, "colorScaleNumericBins"] = (
-                    "100000;300000;1000000;3000000;10000000;30000000;100000000;300000000;1000000000"
-                )
-                df_tables.loc[j, "colorScaleScheme"] = "YlOrBr"
-                j += 1
-
-            # Total shortfall (rel)
-            for pct in range(len(povlines_rel)):
-                df_tables.loc[j, "name"] = (
-                    f"Total shortfall - {povlines_rel['percent'][pct]} of median ({welfare['title'][wel]})"
-                )
-                df_tables.loc[j, "slug"] = (
-                    f"total_shortfall_{povlines_rel['slug_suffix'][pct]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}"
-                )
-                df_tables.loc[j, "description"] = new_line.join(
-                    [
-                        f"The total shortfall from a poverty line of {povlines_rel['text'][pct]} {welfare['welfare_type'][wel]}. This is the amount of money that would be theoretically needed to lift the {welfare['welfare_type'][wel]} of all people in poverty up to the poverty line. However this is not a measure of the actual cost of eliminating poverty, since it does not take into account the costs involved in making the necessary transfers nor any changes in behaviour they would bring about.",
-                        relative_poverty_description,
-                        welfare["description"][wel],
-                        equivalence_scales["description"][eq],
-                        notes_title,
-                        processing_description,
-                        processing_poverty,
-                    ]
-                )
-                df_tables.loc[j, "unit"] = np.nan
-                df_tables.loc[j, "shortUnit"] = np.nan
-                df_tables.loc[j, "type"] = "Numeric"
-                df_tables.loc[j, "colorScaleNumericBins"] = povlines_rel[
-                    "scale_total_shortfall"
-                ][pct]
-                df_tables.loc[j, "colorScaleScheme"] = "YlOrBr"
-                j += 1
-
-            # Average shortfall ($)
-            for pct in range(len(povlines_rel)):
-                df_tables.loc[j, "name"] = (
-                    f"Average shortfall - {povlines_rel['percent'][pct]} of median ({welfare['title'][wel]})"
-                )
-                df_tables.loc[j, "slug"] = (
-                    f"avg_shortfall_{povlines_rel['slug_suffix'][pct]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}"
-                )
-                df_tables.loc[j, "description"] = new_line.join(
-                    [
-                        f"The average shortfall from a poverty line of of {povlines_rel['text'][pct]} {welfare['welfare_type'][wel]} (averaged across the population in poverty).",
-                        relative_poverty_description,
-                        welfare["description"][wel],
-                        equivalence_scales["description"][eq],
-                        notes_title,
-                        processing_description,
-                        processing_poverty,
-                    ]
-                )
-                df_tables.loc[j, "unit"] = "international-$ in 2017 prices"
-                df_tables.loc[j, "shortUnit"] = "$"
-                df_tables.loc[j, "type"] = "Numeric"
-                df_tables.loc[j, "colorScaleNumericBins"] = "1000;2000;3000;4000;5000"
-                df_tables.loc[j, "colorScaleScheme"] = "YlOrBr"
-                j += 1
-
-            # Average shortfall ($): Daily value
-            for pct in range(len(povlines_rel)):
-                df_tables.loc[j, "name"] = (
-                    f"Average shortfall - {povlines_rel['percent'][pct]} of median ({welfare['title'][wel]})"
-                )
-                df_tables.loc[j, "slug"] = (
-                    f"avg_shortfall_{povlines_rel['slug_suffix'][pct]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_day"
-                )
-                df_tables.loc[j, "description"] = new_line.join(
-                    [
-                        f"The average shortfall from a poverty line of of {povlines_rel['text'][pct]} {welfare['welfare_type'][wel]} (averaged across the population in poverty).",
-                        relative_poverty_description,
-                        welfare["description"][wel],
-                        equivalence_scales["description"][eq],
-                        notes_title,
-                        processing_description,
-                        processing_poverty,
-                    ]
-                )
-                df_tables.loc[j, "unit"] = "international-$ in 2017 prices"
-                df_tables.loc[j, "shortUnit"] = "$"
-                df_tables.loc[j, "type"] = "Numeric"
-                df_tables.loc[j, "colorScaleNumericBins"] = "1;2;5;10;20;20.0001"
-                df_tables.loc[j, "colorScaleScheme"] = "YlOrBr"
-                df_tables.loc[j, "transform"] = (
-                    f"multiplyBy avg_shortfall_{povlines_rel['slug_suffix'][pct]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]} 0.00274"
-                )
-                j += 1
-
-            # Average shortfall (% of poverty line) [this is the income gap ratio]
-            for pct in range(len(povlines_rel)):
-                df_tables.loc[j, "name"] = (
-                    f"Income gap ratio - {povlines_rel['percent'][pct]} of median ({welfare['title'][wel]})"
-                )
-                df_tables.loc[j, "slug"] = (
-                    f"income_gap_ratio_{povlines_rel['slug_suffix'][pct]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}"
-                )
-                df_tables.loc[j, "description"] = new_line.join(
-                    [
-                        f'The average shortfall from a poverty line of of {povlines_rel.text[pct]} {welfare.welfare_type[wel]} (averaged across the population in poverty) expressed as a share of the poverty line. This metric is sometimes called the "income gap ratio". It captures the depth of poverty of those living on less than the poverty line.',
-                        relative_poverty_description,
-                        welfare["description"][wel],
-                        equivalence_scales["description"][eq],
-                        notes_title,
-                        processing_description,
-                        processing_poverty,
-                    ]
-                )
-                df_tables.loc[j, "unit"] = "%"
-                df_tables.loc[j, "shortUnit"] = "%"
-                df_tables.loc[j, "type"] = "Numeric"
-                df_tables.loc[j, "colorScaleNumericBins"] = "5;10;15;20;25;30;35;40"
-                df_tables.loc[j, "colorScaleScheme"] = "YlOrBr"
-                j += 1
-
-            # Poverty gap index
-            for pct in range(len(povlines_rel)):
-                df_tables.loc[j, "name"] = (
-                    f"Poverty gap index - {povlines_rel['percent'][pct]} of median ({welfare['title'][wel]})"
-                )
-                df_tables.loc[j, "slug"] = (
-                    f"poverty_gap_index_{povlines_rel['slug_suffix'][pct]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}"
-                )
-                df_tables.loc[j, "description"] = new_line.join(
-                    [
-                        f"The poverty gap index calculated at a poverty line of {povlines_rel['text'][pct]} {welfare['welfare_type'][wel]}. The poverty gap index is a measure that reflects both the depth and prevalence of poverty. It is defined as the mean shortfall of the total population from the poverty line counting the non-poor as having zero shortfall and expressed as a percentage of the poverty line. It is worth unpacking that definition a little. For those below the poverty line, the shortfall corresponds to the amount of money required in order to reach the poverty line. For those at or above the poverty line, the shortfall is counted as zero. The average shortfall is then calculated across the total population – both poor and non-poor – and then expressed as a share of the poverty line. Unlike the more commonly-used metric of the headcount ratio, the poverty gap index is thus sensitive not only to whether a person’s income falls below the poverty line or not, but also by how much – i.e. to the depth of poverty they experience.",
-                        relative_poverty_description,
-                        welfare["description"][wel],
-                        equivalence_scales["description"][eq],
-                        notes_title,
-                        processing_description,
-                        processing_poverty,
-                    ]
-                )
-                df_tables.loc[j, "unit"] = "%"
-                df_tables.loc[j, "shortUnit"] = "%"
-                df_tables.loc[j, "type"] = "Numeric"
-                df_tables.loc[j, "colorScaleNumericBins"] = "2;4;6;8;10;12"
-                df_tables.loc[j, "colorScaleScheme"] = "YlOrBr"
-                j += 1
+# The variables are repeated for each table, welfare type, equivalence scale and poverty line
+dimensions = {
+    "tables": tables,
+    "welfare": welfare,
+    "equivalence_scales": equivalence_scales,
+    "povlines_abs": povlines_abs,
+    "povlines_rel": povlines_rel,
+}
 
-    df_tables["tableSlug"] = tables["name"][tab]
+df_tables = expand(
+    ForEach(
+        ["tables"],
+        [
+            # Define country as entityName
+            {"name": "Country", "slug": "country", "type": "EntityName"},
+            # Define year as Year
+            {"name": "Year", "slug": "year", "type": "Year"},
+            ForEach(
+                ["welfare", "equivalence_scales"],
+                [
+                    # Headcount ratio (abs)
+                    ForEach(
+                        ["povlines_abs"],
+                        [
+                            {
+                                "name": "Share below ${povlines_abs[dollars_text]} a day ({welfare[title]})",
+                                "slug": "headcount_ratio_{welfare[slug]}_{equivalence_scales[slug]}_{povlines_abs[cents]}",
+                                "description": [
+                                    "% of population living in households with {welfare[welfare_type]} below ${povlines_abs[dollars_text]} a day.",
+                                    "{welfare[description]}",
+                                    "{equivalence_scales[description]}",
+                                    ppp_description,
+                                    notes_title,
+                                    processing_description,
+                                    processing_poverty,
+                                ],
+                                "unit": "%",
+                                "shortUnit": "%",
+                                "type": "Numeric",
+                                "colorScaleNumericBins": "3;10;20;30;40;50;60;70;80;90;100",
+                                "colorScaleScheme": "OrRd",
+                            },
+                        ],
+                    ),
+                    # Headcount (abs)
+                    ForEach(
+                        ["povlines_abs"],
+                        [
+                            {
+                                "name": "Number below ${povlines_abs[dollars_text]} a day ({welfare[title]})",
+                                "slug": "headcount_{welfare[slug]}_{equivalence_scales[slug]}_{povlines_abs[cents]}",
+                                "description": [
+                                    "Number of people living in households with {welfare[welfare_type]} below ${povlines_abs[dollars_text]} a day.",
+                                    "{welfare[description]}",
+                                    "{equivalence_scales[description]}",
+                                    ppp_description,
+                                    notes_title,
+                                    processing_description,
+                                    processing_poverty,
+                                ],
+                                "unit": np.nan,
+                                "shortUnit": np.nan,
+                                "type": "Numeric",
+                                "colorScaleNumericBins": "100000;300000;1000000;3000000;10000000;30000000;100000000;300000000;1000000000",
+                                "colorScaleScheme": "Reds",
+                            },
+                        ],
+                    ),
+                    # Total shortfall (abs)
+                    ForEach(
+                        ["povlines_abs"],
+                        [
+                            {
+                                "name": "Total shortfall - ${povlines_abs[dollars_text]} a day ({welfare[title]})",
+                                "slug": "total_shortfall_{welfare[slug]}_{equivalence_scales[slug]}_{povlines_abs[cents]}",
+                                "description": [
+                                    "The total shortfall from a poverty line of ${povlines_abs[dollars_text]} a day. This is the amount of money that would be theoretically needed to lift the {welfare[welfare_type]} of all people in poverty up to the poverty line. However this is not a measure of the actual cost of eliminating poverty, since it does not take into account the costs involved in making the necessary transfers nor any changes in behaviour they would bring about.",
+                                    "{welfare[description]}",
+                                    "{equivalence_scales[description]}",
+                                    ppp_description,
+                                    notes_title,
+                                    processing_description,
+                                    processing_poverty,
+                                ],
+                                "unit": "international-$ in 2017 prices",
+                                "shortUnit": "$",
+                                "type": "Numeric",
+                                "colorScaleNumericBins": Column(
+                                    "povlines_abs", "scale_total_shortfall"
+                                ),
+                                "colorScaleScheme": "Oranges",
+                            },
+                        ],
+                    ),
+                    # Average shortfall ($)
+                    ForEach(
+                        ["povlines_abs"],
+                        [
+                            {
+                                "name": "Average shortfall - ${povlines_abs[dollars_text]} a day ({welfare[title]})",
+                                "slug": "avg_shortfall_{welfare[slug]}_{equivalence_scales[slug]}_{povlines_abs[cents]}",
+                                "description": [
+                                    "The average shortfall from a poverty line of ${povlines_abs[dollars_text]} (averaged across the population in poverty).",
+                                    "{welfare[description]}",
+                                    "{equivalence_scales[description]}",
+                                    ppp_description,
+                                    notes_title,
+                                    processing_description,
+                                    processing_poverty,
+                                ],
+                                "unit": "international-$ in 2017 prices",
+                                "shortUnit": "$",
+                                "type": "Numeric",
+                                "colorScaleNumericBins": Column(
+                                    "povlines_abs", "scale_avg_shortfall"
+                                ),
+                                "colorScaleScheme": "Purples",
+                            },
+                        ],
+                    ),
+                    # Average shortfall ($): Daily value
+                    ForEach(
+                        ["povlines_abs"],
+                        [
+                            {
+                                "name": "Average shortfall - ${povlines_abs[dollars_text]} a day ({welfare[title]})",
+                                "slug": "avg_shortfall_{welfare[slug]}_{equivalence_scales[slug]}_{povlines_abs[cents]}_day",
+                                "description": [
+                                    "The average shortfall from a poverty line of ${povlines_abs[dollars_text]} (averaged across the population in poverty).",
+                                    "{welfare[description]}",
+                                    "{equivalence_scales[description]}",
+                                    ppp_description,
+                                    notes_title,
+                                    processing_description,
+                                    processing_poverty,
+                                ],
+                                "unit": "international-$ in 2017 prices",
+                                "shortUnit": "$",
+                                "type": "Numeric",
+                                "colorScaleNumericBins": Column(
+                                    "povlines_abs", "scale_avg_shortfall"
+                                ),
+                                "colorScaleScheme": "Purples",
+                                "transform": "multiplyBy avg_shortfall_{welfare[slug]}_{equivalence_scales[slug]}_{povlines_abs[cents]} 0.00274",
+                            },
+                        ],
+                    ),
+                    # Average shortfall (% of poverty line) [this is the income gap ratio]
+                    ForEach(
+                        ["povlines_abs"],
+                        [
+                            {
+                                "name": "Income gap ratio - ${povlines_abs[dollars_text]} a day ({welfare[title]})",
+                                "slug": "income_gap_ratio_{welfare[slug]}_{equivalence_scales[slug]}_{povlines_abs[cents]}",
+                                "description": [
+                                    'The average shortfall from a poverty line of ${povlines_abs[dollars_text]} a day (averaged across the population in poverty) expressed as a share of the poverty line. This metric is sometimes called the "income gap ratio". It captures the depth of poverty of those living on less than the poverty line.',
+                                    "{welfare[description]}",
+                                    "{equivalence_scales[description]}",
+                                    ppp_description,
+                                    notes_title,
+                                    processing_description,
+                                    processing_poverty,
+                                ],
+                                "unit": "%",
+                                "shortUnit": "%",
+                                "type": "Numeric",
+                                "colorScaleNumericBins": "10;20;30;40;50;60;70;80;90;100",
+                                "colorScaleScheme": "YlOrRd",
+                            },
+                        ],
+                    ),
+                    # Poverty gap index
+                    ForEach(
+                        ["povlines_abs"],
+                        [
+                            {
+                                "name": "Poverty gap index - ${povlines_abs[dollars_text]} a day ({welfare[title]})",
+                                "slug": "poverty_gap_index_{welfare[slug]}_{equivalence_scales[slug]}_{povlines_abs[cents]}",
+                                "description": [
+                                    "The poverty gap index calculated at a poverty line of ${povlines_abs[dollars_text]} a day. The poverty gap index is a measure that reflects both the depth and prevalence of poverty. It is defined as the mean shortfall of the total population from the poverty line counting the non-poor as having zero shortfall and expressed as a percentage of the poverty line. It is worth unpacking that definition a little. For those below the poverty line, the shortfall corresponds to the amount of money required in order to reach the poverty line. For those at or above the poverty line, the shortfall is counted as zero. The average shortfall is then calculated across the total population – both poor and non-poor – and then expressed as a share of the poverty line. Unlike the more commonly-used metric of the headcount ratio, the poverty gap index is thus sensitive not only to whether a person’s income falls below the poverty line or not, but also by how much – i.e. to the depth of poverty they experience.",
+                                    "{welfare[description]}",
+                                    "{equivalence_scales[description]}",
+                                    ppp_description,
+                                    notes_title,
+                                    processing_description,
+                                    processing_poverty,
+                                ],
+                                "unit": "%",
+                                "shortUnit": "%",
+                                "type": "Numeric",
+                                "colorScaleNumericBins": Column(
+                                    "povlines_abs",
+                                    "scale_poverty_gap_index_{welfare[slug]}",
+                                ),
+                                "colorScaleScheme": "RdPu",
+                            },
+                        ],
+                    ),
+                    # Headcount ratio (rel)
+                    ForEach(
+                        ["povlines_rel"],
+                        [
+                            {
+                                "name": "Share below {povlines_rel[percent]} of median ({welfare[title]})",
+                                "slug": "headcount_ratio_{povlines_rel[slug_suffix]}_{welfare[slug]}_{equivalence_scales[slug]}",
+                                "description": [
+                                    "% of population living in households with {welfare[welfare_type]} below {povlines_rel[percent]} of the median {welfare[welfare_type]}.",
+                                    relative_poverty_description,
+                                    "{welfare[description]}",
+                                    "{equivalence_scales[description]}",
+                                    notes_title,
+                                    processing_description,
+                                    processing_poverty,
+                                ],
+                                "unit": "%",
+                                "shortUnit": "%",
+                                "type": "Numeric",
+                                "colorScaleNumericBins": "5;10;15;20;25;30",
+                                "colorScaleScheme": "YlOrBr",
+                            },
+                        ],
+                    ),
+                    # Headcount (rel)
+                    ForEach(
+                        ["povlines_rel"],
+                        [
+                            {
+                                "name": "Number below {povlines_rel[percent]} of median ({welfare[title]})",
+                                "slug": "headcount_{povlines_rel[slug_suffix]}_{welfare[slug]}_{equivalence_scales[slug]}",
+                                "description": [
+                                    "Number of people living in households with {welfare[welfare_type]} below {povlines_rel[percent]} of the median {welfare[welfare_type]}.",
+                                    relative_poverty_description,
+                                    "{welfare[description]}",
+                                    "{equivalence_scales[description]}",
+                                    notes_title,
+                                    processing_description,
+                                    processing_poverty,
+                                ],
+                                "unit": np.nan,
+                                "shortUnit": np.nan,
+                                "type": "Numeric",
+                                "colorScaleNumericBins": "100000;300000;1000000;3000000;10000000;30000000;100000000;300000000;1000000000",
+                                "colorScaleScheme": "YlOrBr",
+                            },
+                        ],
+                    ),
+                    # Total shortfall (rel)
+                    ForEach(
+                        ["povlines_rel"],
+                        [
+                            {
+                                "name": "Total shortfall - {povlines_rel[percent]} of median ({welfare[title]})",
+                                "slug": "total_shortfall_{povlines_rel[slug_suffix]}_{welfare[slug]}_{equivalence_scales[slug]}",
+                                "description": [
+                                    "The total shortfall from a poverty line of {povlines_rel[text]} {welfare[welfare_type]}. This is the amount of money that would be theoretically needed to lift the {welfare[welfare_type]} of all people in poverty up to the poverty line. However this is not a measure of the actual cost of eliminating poverty, since it does not take into account the costs involved in making the necessary transfers nor any changes in behaviour they would bring about.",
+                                    relative_poverty_description,
+                                    "{welfare[description]}",
+                                    "{equivalence_scales[description]}",
+                                    notes_title,
+                                    processing_description,
+                                    processing_poverty,
+                                ],
+                                "unit": np.nan,
+                                "shortUnit": np.nan,
+                                "type": "Numeric",
+                                "colorScaleNumericBins": Column(
+                                    "povlines_rel", "scale_total_shortfall"
+                                ),
+                                "colorScaleScheme": "YlOrBr",
+                            },
+                        ],
+                    ),
+                    # Average shortfall ($)
+                    ForEach(
+                        ["povlines_rel"],
+                        [
+                            {
+                                "name": "Average shortfall - {povlines_rel[percent]} of median ({welfare[title]})",
+                                "slug": "avg_shortfall_{povlines_rel[slug_suffix]}_{welfare[slug]}_{equivalence_scales[slug]}",
+                                "description": [
+                                    "The average shortfall from a poverty line of of {povlines_rel[text]} {welfare[welfare_type]} (averaged across the population in poverty).",
+                                    relative_poverty_description,
+                                    "{welfare[description]}",
+                                    "{equivalence_scales[description]}",
+                                    notes_title,
+                                    processing_description,
+                                    processing_poverty,
+                                ],
+                                "unit": "international-$ in 2017 prices",
+                                "shortUnit": "$",
+                                "type": "Numeric",
+                                "colorScaleNumericBins": "1000;2000;3000;4000;5000",
+                                "colorScaleScheme": "YlOrBr",
+                            },
+                        ],
+                    ),
+                    # Average shortfall ($): Daily value
+                    ForEach(
+                        ["povlines_rel"],
+                        [
+                            {
+                                "name": "Average shortfall - {povlines_rel[percent]} of median ({welfare[title]})",
+                                "slug": "avg_shortfall_{povlines_rel[slug_suffix]}_{welfare[slug]}_{equivalence_scales[slug]}_day",
+                                "description": [
+                                    "The average shortfall from a poverty line of of {povlines_rel[text]} {welfare[welfare_type]} (averaged across the population in poverty).",
+                                    relative_poverty_description,
+                                    "{welfare[description]}",
+                                    "{equivalence_scales[description]}",
+                                    notes_title,
+                                    processing_description,
+                                    processing_poverty,
+                                ],
+                                "unit": "international-$ in 2017 prices",
+                                "shortUnit": "$",
+                                "type": "Numeric",
+                                "colorScaleNumericBins": "1;2;5;10;20;20.0001",
+                                "colorScaleScheme": "YlOrBr",
+                                "transform": "multiplyBy avg_shortfall_{povlines_rel[slug_suffix]}_{welfare[slug]}_{equivalence_scales[slug]} 0.00274",
+                            },
+                        ],
+                    ),
+                    # Average shortfall (% of poverty line) [this is the income gap ratio]
+                    ForEach(
+                        ["povlines_rel"],
+                        [
+                            {
+                                "name": "Income gap ratio - {povlines_rel[percent]} of median ({welfare[title]})",
+                                "slug": "income_gap_ratio_{povlines_rel[slug_suffix]}_{welfare[slug]}_{equivalence_scales[slug]}",
+                                "description": [
+                                    'The average shortfall from a poverty line of of {povlines_rel[text]} {welfare[welfare_type]} (averaged across the population in poverty) expressed as a share of the poverty line. This metric is sometimes called the "income gap ratio". It captures the depth of poverty of those living on less than the poverty line.',
+                                    relative_poverty_description,
+                                    "{welfare[description]}",
+                                    "{equivalence_scales[description]}",
+                                    notes_title,
+                                    processing_description,
+                                    processing_poverty,
+                                ],
+                                "unit": "%",
+                                "shortUnit": "%",
+                                "type": "Numeric",
+                                "colorScaleNumericBins": "5;10;15;20;25;30;35;40",
+                                "colorScaleScheme": "YlOrBr",
+                            },
+                        ],
+                    ),
+                    # Poverty gap index
+                    ForEach(
+                        ["povlines_rel"],
+                        [
+                            {
+                                "name": "Poverty gap index - {povlines_rel[percent]} of median ({welfare[title]})",
+                                "slug": "poverty_gap_index_{povlines_rel[slug_suffix]}_{welfare[slug]}_{equivalence_scales[slug]}",
+                                "description": [
+                                    "The poverty gap index calculated at a poverty line of {povlines_rel[text]} {welfare[welfare_type]}. The poverty gap index is a measure that reflects both the depth and prevalence of poverty. It is defined as the mean shortfall of the total population from the poverty line counting the non-poor as having zero shortfall and expressed as a percentage of the poverty line. It is worth unpacking that definition a little. For those below the poverty line, the shortfall corresponds to the amount of money required in order to reach the poverty line. For those at or above the poverty line, the shortfall is counted as zero. The average shortfall is then calculated across the total population – both poor and non-poor – and then expressed as a share of the poverty line. Unlike the more commonly-used metric of the headcount ratio, the poverty gap index is thus sensitive not only to whether a person’s income falls below the poverty line or not, but also by how much – i.e. to the depth of poverty they experience.",
+                                    relative_poverty_description,
+                                    "{welfare[description]}",
+                                    "{equivalence_scales[description]}",
+                                    notes_title,
+                                    processing_description,
+                                    processing_poverty,
+                                ],
+                                "unit": "%",
+                                "shortUnit": "%",
+                                "type": "Numeric",
+                                "colorScaleNumericBins": "2;4;6;8;10;12",
+                                "colorScaleScheme": "YlOrBr",
+                            },
+                        ],
+                    ),
+                ],
+            ),
+        ],
+    ),
+    dimensions,
+)
 
+# As with the loops this replaces, all the rows are in the last table
+df_tables["tableSlug"] = tables["name"][len(tables) - 1]
 df_tables["sourceName"] = sourceName
 df_tables["dataPublishedBy"] = dataPublishedBy
 df_tables["sourceLink"] = sourceLink
@@ -533,918 +503,658 @@ df_tables["tolerance"] = df_tables["tolerance"].astype("Int64")
 # %%
 # Grapher table generation
 
-df_graphers = pd.DataFrame()
-
-j = 0
-
-for tab in range(len(tables)):
-    for eq in range(len(equivalence_scales)):
-        for wel in range(len(welfare)):
-            # Headcount ratio (abs)
-            for p in range(len(povlines_abs)):
-                df_graphers.loc[j, "title"] = (
-                    f"{povlines_abs['title_share'][p]} ({welfare['title'][wel]})"
-                )
-                df_graphers.loc[j, "ySlugs"] = (
-                    f"headcount_ratio_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_{povlines_abs['cents'][p]}"
-                )
-                df_graphers.loc[j, "Indicator Dropdown"] = "Share in poverty"
-                df_graphers.loc[j, "Poverty line Dropdown"] = (
-                    f"{povlines_abs['povline_dropdown'][p]}"
-                )
-                df_graphers.loc[j, "Income measure Dropdown"] = (
-                    f"{welfare['dropdown_option'][wel]}"
-                )
-                df_graphers.loc[
-                    j,
-                    "Adjust for cost sharing within households (equivalized income) Checkbox",
-                ] = equivalence_scales["checkbox"][eq]
-                df_graphers.loc[j, "subtitle"] = (
-                    f"{povlines_abs['subtitle'][p]} {welfare['subtitle'][wel]} {equivalence_scales['subtitle'][eq]}"
-                )
-                df_graphers.loc[j, "note"] = (
-                    f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices."
-                )
-                df_graphers.loc[j, "type"] = np.nan
-                df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-                df_graphers.loc[j, "hasMapTab"] = "true"
-                df_graphers.loc[j, "tab"] = "map"
-                j += 1
-
-            # Headcount (abs)
-            for p in range(len(povlines_abs)):
-                df_graphers.loc[j, "title"] = (
-                    f"{povlines_abs.title_number[p]} ({welfare['title'][wel]})"
-                )
-                df_graphers.loc[j, "ySlugs"] = (
-                    f"headcount_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_{povlines_abs['cents'][p]}"
-                )
-                df_graphers.loc[j, "Indicator Dropdown"] = "Number in poverty"
-                df_graphers.loc[j, "Poverty line Dropdown"] = (
-                    f"{povlines_abs['povline_dropdown'][p]}"
-                )
-                df_graphers.loc[j, "Income measure Dropdown"] = (
-                    f"{welfare['dropdown_option'][wel]}"
-                )
-                df_graphers.loc[
-                    j,
-                    "Adjust for cost sharing within households (equivalized income) Checkbox",
-                ] = equivalence_scales["checkbox"][eq]
-                df_graphers.loc[j, "subtitle"] = (
-                    f"{povlines_abs['subtitle'][p]} {welfare['subtitle'][wel]} {equivalence_scales['subtitle'][eq]}"
-                )
-                df_graphers.loc[j, "note"] = (
-                    f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices."
-                )
-                df_graphers.loc[j, "type"] = np.nan
-                df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-                df_graphers.loc[j, "hasMapTab"] = "true"
-                df_graphers.loc[j, "tab"] = "map"
-                j += 1
-
-            # Total shortfall (abs)
-            for p in range(len(povlines_abs)):
-                df_graphers.loc[j, "title"] = (
-                    f"{povlines_abs['title_total_shortfall'][p]} ({welfare['title'][wel]})"
-                )
-                df_graphers.loc[j, "ySlugs"] = (
-                    f"total_shortfall_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_{povlines_abs.cents[p]}"
-                )
-                df_graphers.loc[j, "Indicator Dropdown"] = (
-                    "Total shortfall from poverty line"
-                )
-                df_graphers.loc[j, "Poverty line Dropdown"] = (
-                    f"{povlines_abs['povline_dropdown'][p]}"
-                )
-                df_graphers.loc[j, "Income measure Dropdown"] = (
-                    f"{welfare['dropdown_option'][wel]}"
-                )
-                df_graphers.loc[
-                    j,
-                    "Adjust for cost sharing within households (equivalized income) Checkbox",
-                ] = equivalence_scales["checkbox"][eq]
-                df_graphers.loc[j, "subtitle"] = (
-                    f"{povlines_abs['subtitle_total_shortfall'][p]} {welfare['subtitle'][wel]} {equivalence_scales['subtitle'][eq]}"
-                )
-                df_graphers.loc[j, "note"] = (
-                    "This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices. The cost of closing the poverty gap does not take into account costs and inefficiencies from making the necessary transfers."
-                )
-                df_graphers.loc[j, "type"] = np.nan
-                df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-                df_graphers.loc[j, "hasMapTab"] = "true"
-                df_graphers.loc[j, "tab"] = "map"
-                j += 1
-
-            # Average shortfall ($)
-            for p in range(len(povlines_abs)):
-                df_graphers.loc[j, "title"] = (
-                    f"{povlines_abs['title_avg_shortfall'][p]} ({welfare['title'][wel]})"
-                )
-                df_graphers.loc[j, "ySlugs"] = (
-                    f"avg_shortfall_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_{povlines_abs['cents'][p]}_day"
-                )
-                df_graphers.loc[j, "Indicator Dropdown"] = "Average shortfall ($)"
-                df_graphers.loc[j, "Poverty line Dropdown"] = (
-                    f"{povlines_abs['povline_dropdown'][p]}"
-                )
-                df_graphers.loc[j, "Income measure Dropdown"] = (
-                    f"{welfare['dropdown_option'][wel]}"
-                )
-                df_graphers.loc[
-                    j,
-                    "Adjust for cost sharing within households (equivalized income) Checkbox",
-                ] = equivalence_scales["checkbox"][eq]
-                df_graphers.loc[j, "subtitle"] = (
-                    f"{povlines_abs['subtitle_avg_shortfall'][p]} {welfare['subtitle'][wel]} {equivalence_scales['subtitle'][eq]}"
-                )
-                df_graphers.loc[j, "note"] = (
-                    f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries."
-                )
-                df_graphers.loc[j, "type"] = np.nan
-                df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-                df_graphers.loc[j, "hasMapTab"] = "true"
-                df_graphers.loc[j, "tab"] = "map"
-                j += 1
-
-            # Average shortfall (% of poverty line)
-            for p in range(len(povlines_abs)):
-                df_graphers.loc[j, "title"] = (
-                    f"{povlines_abs['title_income_gap_ratio'][p]} ({welfare['title'][wel]})"
-                )
-                df_graphers.loc[j, "ySlugs"] = (
-                    f"income_gap_ratio_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_{povlines_abs['cents'][p]}"
-                )
-                df_graphers.loc[j, "Indicator Dropdown"] = (
-                    "Average shortfall (% of poverty line)"
-                )
-                df_graphers.loc[j, "Poverty line Dropdown"] = (
-                    f"{povlines_abs.povline_dropdown[p]}"
-                )
-                df_graphers.loc[j, "Income measure Dropdown"] = (
-                    f"{welfare['dropdown_option'][wel]}"
-                )
-                df_graphers.loc[
-                    j,
-                    "Adjust for cost sharing within households (equivalized income) Checkbox",
-                ] = equivalence_scales["checkbox"][eq]
-                df_graphers.loc[j, "subtitle"] = (
-                    f"{povlines_abs['subtitle_income_gap_ratio'][p]} {welfare['subtitle'][wel]} {equivalence_scales['subtitle'][eq]}"
-                )
-                df_graphers.loc[j, "note"] = (
-                    f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries."
-                )
-                df_graphers.loc[j, "type"] = np.nan
-                df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-                df_graphers.loc[j, "hasMapTab"] = "true"
-                df_graphers.loc[j, "tab"] = "map"
-                j += 1
-
-            # Poverty gap index
-            for p in range(len(povlines_abs)):
-                df_graphers.loc[j, "title"] = (
-                    f"Poverty gap index at ${povlines_abs['dollars_text'][p]} a day ({welfare['title'][wel]})"
-                )
-                df_graphers.loc[j, "ySlugs"] = (
-                    f"poverty_gap_index_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_{povlines_abs['cents'][p]}"
-                )
-                df_graphers.loc[j, "Indicator Dropdown"] = "Poverty gap index"
-                df_graphers.loc[j, "Poverty line Dropdown"] = (
-                    f"{povlines_abs['povline_dropdown'][p]}"
-                )
-                df_graphers.loc[j, "Income measure Dropdown"] = (
-                    f"{welfare['dropdown_option'][wel]}"
-                )
-                df_graphers.loc[
-                    j,
-                    "Adjust for cost sharing within households (equivalized income) Checkbox",
-                ] = equivalence_scales["checkbox"][eq]
-                df_graphers.loc[j, "subtitle"] = (
-                    f"The poverty gap index is a poverty measure that reflects both the prevalence and the depth of poverty. It is calculated as the share of population in poverty multiplied by the average shortfall from the poverty line (expressed as a % of the poverty line). {welfare['subtitle'][wel]} {equivalence_scales['subtitle'][eq]}"
-                )
-                df_graphers.loc[j, "note"] = (
-                    f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries."
-                )
-                df_graphers.loc[j, "type"] = np.nan
-                df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-                df_graphers.loc[j, "hasMapTab"] = "true"
-                df_graphers.loc[j, "tab"] = "map"
-                j += 1
-
-            # MULTIPLE LINES
-            # Headcount ratio (abs) - Multiple lines
-            df_graphers.loc[j, "title"] = (
-                f"Share of population living below a range of poverty lines ({welfare['title'][wel]})"
-            )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"headcount_ratio_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_100 headcount_ratio_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_200 headcount_ratio_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_500 headcount_ratio_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_1000 headcount_ratio_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_2000 headcount_ratio_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_3000 headcount_ratio_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_4000"
-            )
-            df_graphers.loc[j, "Indicator Dropdown"] = "Share in poverty"
-            df_graphers.loc[j, "Poverty line Dropdown"] = "Multiple lines"
-            df_graphers.loc[j, "Income measure Dropdown"] = (
-                f"{welfare['dropdown_option'][wel]}"
-            )
-            df_graphers.loc[
-                j,
-                "Adjust for cost sharing within households (equivalized income) Checkbox",
-            ] = equivalence_scales["checkbox"][eq]
-            df_graphers.loc[j, "subtitle"] = (
-                f"This data is adjusted for inflation and for differences in living costs between countries. {welfare['subtitle'][wel]} {equivalence_scales['subtitle'][eq]}"
-            )
-            df_graphers.loc[j, "note"] = (
-                f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices."
-            )
-            df_graphers.loc[j, "type"] = np.nan
-            df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-            df_graphers.loc[j, "hasMapTab"] = "false"
-            df_graphers.loc[j, "tab"] = "chart"
-            j += 1
-
-            # Headcount (abs) - Multiple lines
-            df_graphers.loc[j, "title"] = (
-                f"Number of people living below a range of poverty lines ({welfare['title'][wel]})"
-            )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"headcount_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_100 headcount_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_200 headcount_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_500 headcount_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_1000 headcount_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_2000 headcount_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_3000 headcount_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_4000"
-            )
-            df_graphers.loc[j, "Indicator Dropdown"] = "Number in poverty"
-            df_graphers.loc[j, "Poverty line Dropdown"] = "Multiple lines"
-            df_graphers.loc[j, "Income measure Dropdown"] = (
-                f"{welfare['dropdown_option'][wel]}"
-            )
-            df_graphers.loc[
-                j,
-                "Adjust for cost sharing within households (equivalized income) Checkbox",
-            ] = equivalence_scales["checkbox"][eq]
-            df_graphers.loc[j, "subtitle"] = (
-                f"This data is adjusted for inflation and for differences in living costs between countries. {welfare['subtitle'][wel]} {equivalence_scales['subtitle'][eq]}"
-            )
-            df_graphers.loc[j, "note"] = (
-                f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices."
-            )
-            df_graphers.loc[j, "type"] = np.nan
-            df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-            df_graphers.loc[j, "hasMapTab"] = "false"
-            df_graphers.loc[j, "tab"] = "chart"
-            j += 1
-
-            # Total shortfall (abs) - Multiple lines
-
-            df_graphers.loc[j, "title"] = (
-                f"Total shortfall from a range of poverty lines ({welfare['title'][wel]})"
-            )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"total_shortfall_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_100 total_shortfall_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_200 total_shortfall_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_500 total_shortfall_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_1000 total_shortfall_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_2000 total_shortfall_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_3000 total_shortfall_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_4000"
-            )
-            df_graphers.loc[j, "Indicator Dropdown"] = (
-                "Total shortfall from poverty line"
-            )
-            df_graphers.loc[j, "Poverty line Dropdown"] = "Multiple lines"
-            df_graphers.loc[j, "Income measure Dropdown"] = (
-                f"{welfare['dropdown_option'][wel]}"
-            )
-            df_graphers.loc[
-                j,
-                "Adjust for cost sharing within households (equivalized income) Checkbox",
-            ] = equivalence_scales["checkbox"][eq]
-            df_graphers.loc[j, "subtitle"] = (
-                f"This data is adjusted for inflation and for differences in living costs between countries. {welfare['subtitle'][wel]} {equivalence_scales['subtitle'][eq]}"
-            )
-            df_graphers.loc[j, "note"] = (
-                "This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices. The cost of closing the poverty gap does not take into account costs and inefficiencies from making the necessary transfers."
-            )
-            df_graphers.loc[j, "type"] = np.nan
-            df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-            df_graphers.loc[j, "hasMapTab"] = "false"
-            df_graphers.loc[j, "tab"] = "chart"
-            j += 1
-
-            # Average shortfall ($) - Multiple lines
-            df_graphers.loc[j, "title"] = (
-                f"Average shortfall from a range of poverty lines ({welfare['title'][wel]})"
-            )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"avg_shortfall_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_100_day avg_shortfall_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_200_day avg_shortfall_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_500_day avg_shortfall_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_1000_day avg_shortfall_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_2000_day avg_shortfall_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_3000_day avg_shortfall_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_4000_day"
-            )
-            df_graphers.loc[j, "Indicator Dropdown"] = "Average shortfall ($)"
-            df_graphers.loc[j, "Poverty line Dropdown"] = "Multiple lines"
-            df_graphers.loc[j, "Income measure Dropdown"] = (
-                f"{welfare['dropdown_option'][wel]}"
-            )
-            df_graphers.loc[
-                j,
-                "Adjust for cost sharing within households (equivalized income) Checkbox",
-            ] = equivalence_scales["checkbox"][eq]
-            df_graphers.loc[j, "subtitle"] = (
-                f"This data is adjusted for inflation and for differences in living costs between countries. {welfare['subtitle'][wel]} {equivalence_scales['subtitle'][eq]}"
-            )
-            df_graphers.loc[j, "note"] = (
-                f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices."
-            )
-            df_graphers.loc[j, "type"] = np.nan
-            df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-            df_graphers.loc[j, "hasMapTab"] = "false"
-            df_graphers.loc[j, "tab"] = "chart"
-            j += 1
-
-            # Average shortfall (% of poverty line) - Multiple lines
-            df_graphers.loc[j, "title"] = (
-                f"Average shortfall from a range of poverty lines (as a share of the poverty line) ({welfare['title'][wel]})"
-            )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"income_gap_ratio_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_100 income_gap_ratio_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_200 income_gap_ratio_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_500 income_gap_ratio_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_1000 income_gap_ratio_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_2000 income_gap_ratio_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_3000 income_gap_ratio_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_4000"
-            )
-            df_graphers.loc[j, "Indicator Dropdown"] = (
-                "Average shortfall (% of poverty line)"
-            )
-            df_graphers.loc[j, "Poverty line Dropdown"] = "Multiple lines"
-            df_graphers.loc[j, "Income measure Dropdown"] = (
-                f"{welfare['dropdown_option'][wel]}"
-            )
-            df_graphers.loc[
-                j,
-                "Adjust for cost sharing within households (equivalized income) Checkbox",
-            ] = equivalence_scales["checkbox"][eq]
-            df_graphers.loc[j, "subtitle"] = (
-                f"{welfare['subtitle'][wel]} {equivalence_scales['subtitle'][eq]}"
-            )
-            df_graphers.loc[j, "note"] = (
-                f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries."
-            )
-            df_graphers.loc[j, "type"] = np.nan
-            df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-            df_graphers.loc[j, "hasMapTab"] = "false"
-            df_graphers.loc[j, "tab"] = "chart"
-            j += 1
-
-            # Poverty gap index - Multiple lines
-            df_graphers.loc[j, "title"] = (
-                f"Poverty gap index at a range of poverty lines ({welfare['title'][wel]})"
-            )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"poverty_gap_index_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_100 poverty_gap_index_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_200 poverty_gap_index_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_500 poverty_gap_index_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_1000 poverty_gap_index_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_2000 poverty_gap_index_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_3000 poverty_gap_index_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_4000"
-            )
-            df_graphers.loc[j, "Indicator Dropdown"] = "Poverty gap index"
-            df_graphers.loc[j, "Poverty line Dropdown"] = f"Multiple lines"
-            df_graphers.loc[j, "Income measure Dropdown"] = (
-                f"{welfare['dropdown_option'][wel]}"
-            )
-            df_graphers.loc[
-                j,
-                "Adjust for cost sharing within households (equivalized income) Checkbox",
-            ] = equivalence_scales["checkbox"][eq]
-            df_graphers.loc[j, "subtitle"] = (
-                f"{welfare['subtitle'][wel]} {equivalence_scales['subtitle'][eq]}"
-            )
-            df_graphers.loc[j, "note"] = (
-                f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries."
-            )
-            df_graphers.loc[j, "type"] = np.nan
-            df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-            df_graphers.loc[j, "hasMapTab"] = "false"
-            df_graphers.loc[j, "tab"] = "chart"
-            j += 1
-
-            # RELATIVE POVERTY
-            # Headcount ratio (rel)
-            for pct in range(len(povlines_rel)):
-                df_graphers.loc[j, "title"] = (
-                    f"{povlines_rel['title_share'][pct]} ({welfare['title'][wel]})"
-                )
-                df_graphers.loc[j, "ySlugs"] = (
-                    f"headcount_ratio_{povlines_rel['slug_suffix'][pct]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}"
-                )
-                df_graphers.loc[j, "Indicator Dropdown"] = "Share in poverty"
-                df_graphers.loc[j, "Poverty line Dropdown"] = (
-                    f"{povlines_rel['dropdown'][pct]}"
-                )
-                df_graphers.loc[j, "Income measure Dropdown"] = (
-                    f"{welfare['dropdown_option'][wel]}"
-                )
-                df_graphers.loc[
-                    j,
-                    "Adjust for cost sharing within households (equivalized income) Checkbox",
-                ] = equivalence_scales["checkbox"][eq]
-                df_graphers.loc[j, "subtitle"] = (
-                    f"Relative poverty is measured in terms of a poverty line that rises and falls over time with average incomes – in this case set at {povlines_rel['text'][pct]} {welfare['welfare_type'][wel]}. {welfare['subtitle'][wel]} {equivalence_scales['subtitle'][eq]}"
-                )
-                df_graphers.loc[j, "note"] = ""
-                df_graphers.loc[j, "type"] = np.nan
-                df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-                df_graphers.loc[j, "hasMapTab"] = "true"
-                df_graphers.loc[j, "tab"] = "map"
-                j += 1
-
-            # Headcount (rel)
-            for pct in range(len(povlines_rel)):
-                df_graphers.loc[j, "title"] = (
-                    f"{povlines_rel['title_number'][pct]} ({welfare['title'][wel]})"
-                )
-                df_graphers.loc[j, "ySlugs"] = (
-                    f"headcount_{povlines_rel['slug_suffix'][pct]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}"
-                )
-                df_graphers.loc[j, "Indicator Dropdown"] = "Number in poverty"
-                df_graphers.loc[j, "Poverty line Dropdown"] = (
-                    f"{povlines_rel['dropdown'][pct]}"
-                )
-                df_graphers.loc[j, "Income measure Dropdown"] = (
-                    f"{welfare['dropdown_option'][wel]}"
-                )
-                df_graphers.loc[
-                    j,
-                    "Adjust for cost sharing within households (equivalized income) Checkbox",
-                ] = equivalence_scales["checkbox"][eq]
-                df_graphers.loc[j, "subtitle"] = (
-                    f"Relative poverty is measured in terms of a poverty line that rises and falls over time with average incomes – in this case set at {povlines_rel['text'][pct]} {welfare['welfare_type'][wel]}. {welfare['subtitle'][wel]} {equivalence_scales['subtitle'][eq]}"
-                )
-                df_graphers.loc[j, "note"] = ""
-                df_graphers.loc[j, "type"] = np.nan
-                df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-                df_graphers.loc[j, "hasMapTab"] = "true"
-                df_graphers.loc[j, "tab"] = "map"
-                j += 1
-
-            # Total shortfall (rel)
-            for pct in range(len(povlines_rel)):
-                df_graphers.loc[j, "title"] = (
-                    f"Total shortfall from a poverty line of {povlines_rel['text'][pct]} {welfare['welfare_type'][wel]} ({welfare['title'][wel]})"
-                )
-                df_graphers.loc[j, "ySlugs"] = (
-                    f"total_shortfall_{povlines_rel['slug_suffix'][pct]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}"
-                )
-                df_graphers.loc[j, "Indicator Dropdown"] = (
-                    "Total shortfall from poverty line"
-                )
-                df_graphers.loc[j, "Poverty line Dropdown"] = (
-                    f"{povlines_rel['dropdown'][pct]}"
-                )
-                df_graphers.loc[j, "Income measure Dropdown"] = (
-                    f"{welfare['dropdown_option'][wel]}"
-                )
-                df_graphers.loc[
-                    j,
-                    "Adjust for cost sharing within households (equivalized income) Checkbox",
-                ] = equivalence_scales["checkbox"][eq]
-                df_graphers.loc[j, "subtitle"] = (
-                    f"This is the amount of money that would be theoretically needed to lift the incomes of all people in poverty up to {povlines_rel.text[pct]} {welfare['welfare_type'][wel]}. {welfare['subtitle'][wel]} {equivalence_scales['subtitle'][eq]}"
-                )
-                df_graphers.loc[j, "note"] = (
-                    f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries."
-                )
-                df_graphers.loc[j, "type"] = np.nan
-                df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-                df_graphers.loc[j, "hasMapTab"] = "true"
-                df_graphers.loc[j, "tab"] = "map"
-                j += 1
-
-            # Average shortfall ($) (rel)
-            for pct in range(len(povlines_rel)):
-                df_graphers.loc[j, "title"] = (
-                    f"Average shortfall from a poverty line of {povlines_rel['text'][pct]} {welfare['welfare_type'][wel]} ({welfare['title'][wel]})"
-                )
-                df_graphers.loc[j, "ySlugs"] = (
-                    f"avg_shortfall_{povlines_rel['slug_suffix'][pct]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}_day"
-                )
-                df_graphers.loc[j, "Indicator Dropdown"] = "Average shortfall ($)"
-                df_graphers.loc[j, "Poverty line Dropdown"] = (
-                    f"{povlines_rel['dropdown'][pct]}"
-                )
-                df_graphers.loc[j, "Income measure Dropdown"] = (
-                    f"{welfare['dropdown_option'][wel]}"
-                )
-                df_graphers.loc[
-                    j,
-                    "Adjust for cost sharing within households (equivalized income) Checkbox",
-                ] = equivalence_scales["checkbox"][eq]
-                df_graphers.loc[j, "subtitle"] = (
-                    f"This is the amount of money that would be theoretically needed to lift the incomes of all people in poverty up to {povlines_rel['text'][pct]} {welfare['welfare_type'][wel]}, averaged across the population in poverty. {welfare['subtitle'][wel]} {equivalence_scales['subtitle'][eq]}"
-                )
-                df_graphers.loc[j, "note"] = (
-                    f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries."
-                )
-                df_graphers.loc[j, "type"] = np.nan
-                df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-                df_graphers.loc[j, "hasMapTab"] = "true"
-                df_graphers.loc[j, "tab"] = "map"
-                j += 1
-
-            # Average shortfall (% of poverty line) (rel)
-            for pct in range(len(povlines_rel)):
-                df_graphers.loc[j, "title"] = (
-                    f"Average shortfall from a poverty line of {povlines_rel['text'][pct]} {welfare['welfare_type'][wel]} (as a share of the poverty line) ({welfare['title'][wel]})"
-                )
-                df_graphers.loc[j, "ySlugs"] = (
-                    f"income_gap_ratio_{povlines_rel['slug_suffix'][pct]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}"
-                )
-                df_graphers.loc[j, "Indicator Dropdown"] = (
-                    "Average shortfall (% of poverty line)"
-                )
-                df_graphers.loc[j, "Poverty line Dropdown"] = (
-                    f"{povlines_rel['dropdown'][pct]}"
-                )
-                df_graphers.loc[j, "Income measure Dropdown"] = (
-                    f"{welfare['dropdown_option'][wel]}"
-                )
-                df_graphers.loc[
-                    j,
-                    "Adjust for cost sharing within households (equivalized income) Checkbox",
-                ] = equivalence_scales["checkbox"][eq]
-                df_graphers.loc[j, "subtitle"] = (
-                    f'This is the average shortfall expressed as a share of the poverty line, sometimes called the "income gap ratio". It captures the depth of poverty of those living on less than {povlines_rel.text[pct]} {welfare.welfare_type[wel]}. {welfare.subtitle[wel]} {equivalence_scales.note[eq]}'
-                )
-                df_graphers.loc[j, "note"] = (
-                    f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries."
-                )
-                df_graphers.loc[j, "type"] = np.nan
-                df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-                df_graphers.loc[j, "hasMapTab"] = "true"
-                df_graphers.loc[j, "tab"] = "map"
-                j += 1
-
-            # Poverty gap index (rel)
-            for pct in range(len(povlines_rel)):
-                df_graphers.loc[j, "title"] = (
-                    f"Poverty gap index at {povlines_rel['text'][pct]} {welfare['welfare_type'][wel]} ({welfare['title'][wel]})"
-                )
-                df_graphers.loc[j, "ySlugs"] = (
-                    f"poverty_gap_index_{povlines_rel['slug_suffix'][pct]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}"
-                )
-                df_graphers.loc[j, "Indicator Dropdown"] = "Poverty gap index"
-                df_graphers.loc[j, "Poverty line Dropdown"] = (
-                    f"{povlines_rel['dropdown'][pct]}"
-                )
-                df_graphers.loc[j, "Income measure Dropdown"] = (
-                    f"{welfare['dropdown_option'][wel]}"
-                )
-                df_graphers.loc[
-                    j,
-                    "Adjust for cost sharing within households (equivalized income) Checkbox",
-                ] = equivalence_scales["checkbox"][eq]
-                df_graphers.loc[j, "subtitle"] = (
-                    f"The poverty gap index is a poverty measure that reflects both the prevalence and the depth of poverty. It is calculated as the share of population in poverty multiplied by the average shortfall from the poverty line (expressed as a % of the poverty line). {welfare['subtitle'][wel]} {equivalence_scales['subtitle'][eq]}"
-                )
-                df_graphers.loc[j, "note"] = (
-                    f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries."
-                )
-                df_graphers.loc[j, "type"] = np.nan
-                df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-                df_graphers.loc[j, "hasMapTab"] = "true"
-                df_graphers.loc[j, "tab"] = "map"
-                j += 1
-
-        # BEFORE VS. AFTER TAX
-        # Headcount ratio (abs)
-        for p in range(len(povlines_abs)):
-            df_graphers.loc[j, "title"] = (
-                f"{povlines_abs['title_share'][p]} (After vs. before tax)"
-            )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"headcount_ratio_mi_{equivalence_scales['slug'][eq]}_{povlines_abs['cents'][p]} headcount_ratio_dhi_{equivalence_scales['slug'][eq]}_{povlines_abs['cents'][p]}"
-            )
-            df_graphers.loc[j, "Indicator Dropdown"] = "Share in poverty"
-            df_graphers.loc[j, "Poverty line Dropdown"] = (
-                f"{povlines_abs['povline_dropdown'][p]}"
-            )
-            df_graphers.loc[j, "Income measure Dropdown"] = "After tax vs. before tax"
-            df_graphers.loc[
-                j,
-                "Adjust for cost sharing within households (equivalized income) Checkbox",
-            ] = equivalence_scales["checkbox"][eq]
-            df_graphers.loc[j, "subtitle"] = (
-                f"{povlines_abs['subtitle'][p]} {equivalence_scales['subtitle'][eq]}"
-            )
-            df_graphers.loc[j, "note"] = (
-                f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices."
-            )
-            df_graphers.loc[j, "type"] = np.nan
-            df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-            df_graphers.loc[j, "hasMapTab"] = "false"
-            df_graphers.loc[j, "tab"] = "chart"
-            j += 1
-
-        # Headcount (abs)
-        for p in range(len(povlines_abs)):
-            df_graphers.loc[j, "title"] = (
-                f"{povlines_abs.title_number[p]} (After vs. before tax)"
-            )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"headcount_mi_{equivalence_scales['slug'][eq]}_{povlines_abs['cents'][p]} headcount_dhi_{equivalence_scales['slug'][eq]}_{povlines_abs['cents'][p]}"
-            )
-            df_graphers.loc[j, "Indicator Dropdown"] = "Number in poverty"
-            df_graphers.loc[j, "Poverty line Dropdown"] = (
-                f"{povlines_abs['povline_dropdown'][p]}"
-            )
-            df_graphers.loc[j, "Income measure Dropdown"] = "After tax vs. before tax"
-            df_graphers.loc[
-                j,
-                "Adjust for cost sharing within households (equivalized income) Checkbox",
-            ] = equivalence_scales["checkbox"][eq]
-            df_graphers.loc[j, "subtitle"] = (
-                f"{povlines_abs['subtitle'][p]} {equivalence_scales['subtitle'][eq]}"
-            )
-            df_graphers.loc[j, "note"] = (
-                f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices."
-            )
-            df_graphers.loc[j, "type"] = np.nan
-            df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-            df_graphers.loc[j, "hasMapTab"] = "false"
-            df_graphers.loc[j, "tab"] = "chart"
-            j += 1
-
-        # Total shortfall (abs)
-        for p in range(len(povlines_abs)):
-            df_graphers.loc[j, "title"] = (
-                f"{povlines_abs['title_total_shortfall'][p]} (After vs. before tax)"
-            )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"total_shortfall_mi_{equivalence_scales['slug'][eq]}_{povlines_abs.cents[p]} total_shortfall_dhi_{equivalence_scales['slug'][eq]}_{povlines_abs.cents[p]}"
-            )
-            df_graphers.loc[j, "Indicator Dropdown"] = (
-                "Total shortfall from poverty line"
-            )
-            df_graphers.loc[j, "Poverty line Dropdown"] = (
-                f"{povlines_abs['povline_dropdown'][p]}"
-            )
-            df_graphers.loc[j, "Income measure Dropdown"] = "After tax vs. before tax"
-            df_graphers.loc[
-                j,
-                "Adjust for cost sharing within households (equivalized income) Checkbox",
-            ] = equivalence_scales["checkbox"][eq]
-            df_graphers.loc[j, "subtitle"] = (
-                f"{povlines_abs['subtitle_total_shortfall'][p]} {equivalence_scales['subtitle'][eq]}"
-            )
-            df_graphers.loc[j, "note"] = (
-                "This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices. The cost of closing the poverty gap does not take into account costs and inefficiencies from making the necessary transfers."
-            )
-            df_graphers.loc[j, "type"] = np.nan
-            df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-            df_graphers.loc[j, "hasMapTab"] = "false"
-            df_graphers.loc[j, "tab"] = "chart"
-            j += 1
-
-        # Average shortfall ($)
-        for p in range(len(povlines_abs)):
-            df_graphers.loc[j, "title"] = (
-                f"{povlines_abs['title_avg_shortfall'][p]} (After vs. before tax)"
-            )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"avg_shortfall_mi_{equivalence_scales['slug'][eq]}_{povlines_abs['cents'][p]}_day avg_shortfall_dhi_{equivalence_scales['slug'][eq]}_{povlines_abs['cents'][p]}_day"
-            )
-            df_graphers.loc[j, "Indicator Dropdown"] = "Average shortfall ($)"
-            df_graphers.loc[j, "Poverty line Dropdown"] = (
-                f"{povlines_abs['povline_dropdown'][p]}"
-            )
-            df_graphers.loc[j, "Income measure Dropdown"] = "After tax vs. before tax"
-            df_graphers.loc[
-                j,
-                "Adjust for cost sharing within households (equivalized income) Checkbox",
-            ] = equivalence_scales["checkbox"][eq]
-            df_graphers.loc[j, "subtitle"] = (
-                f"{povlines_abs['subtitle_avg_shortfall'][p]} {equivalence_scales['subtitle'][eq]}"
-            )
-            df_graphers.loc[j, "note"] = (
-                f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries."
-            )
-            df_graphers.loc[j, "type"] = np.nan
-            df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-            df_graphers.loc[j, "hasMapTab"] = "false"
-            df_graphers.loc[j, "tab"] = "chart"
-            j += 1
-
-        # Average shortfall (% of poverty line)
-        for p in range(len(povlines_abs)):
-            df_graphers.loc[j, "title"] = (
-                f"{povlines_abs['title_income_gap_ratio'][p]} (After vs. before tax)"
-            )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"income_gap_ratio_mi_{equivalence_scales['slug'][eq]}_{povlines_abs['cents'][p]} income_gap_ratio_dhi_{equivalence_scales['slug'][eq]}_{povlines_abs['cents'][p]}"
-            )
-            df_graphers.loc[j, "Indicator Dropdown"] = (
-                "Average shortfall (% of poverty line)"
-            )
-            df_graphers.loc[j, "Poverty line Dropdown"] = (
-                f"{povlines_abs.povline_dropdown[p]}"
-            )
-            df_graphers.loc[j, "Income measure Dropdown"] = "After tax vs. before tax"
-            df_graphers.loc[
-                j,
-                "Adjust for cost sharing within households (equivalized income) Checkbox",
-            ] = equivalence_scales["checkbox"][eq]
-            df_graphers.loc[j, "subtitle"] = (
-                f"{povlines_abs['subtitle_income_gap_ratio'][p]} {equivalence_scales['subtitle'][eq]}"
-            )
-            df_graphers.loc[j, "note"] = (
-                f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries."
-            )
-            df_graphers.loc[j, "type"] = np.nan
-            df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-            df_graphers.loc[j, "hasMapTab"] = "false"
-            df_graphers.loc[j, "tab"] = "chart"
-            j += 1
-
-        # Poverty gap index
-        for p in range(len(povlines_abs)):
-            df_graphers.loc[j, "title"] = (
-                f"Poverty gap index at ${povlines_abs['dollars_text'][p]} a day (After vs. before tax)"
-            )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"poverty_gap_index_mi_{equivalence_scales['slug'][eq]}_{povlines_abs['cents'][p]} poverty_gap_index_dhi_{equivalence_scales['slug'][eq]}_{povlines_abs['cents'][p]}"
-            )
-            df_graphers.loc[j, "Indicator Dropdown"] = "Poverty gap index"
-            df_graphers.loc[j, "Poverty line Dropdown"] = (
-                f"{povlines_abs['povline_dropdown'][p]}"
-            )
-            df_graphers.loc[j, "Income measure Dropdown"] = "After tax vs. before tax"
-            df_graphers.loc[
-                j,
-                "Adjust for cost sharing within households (equivalized income) Checkbox",
-            ] = equivalence_scales["checkbox"][eq]
-            df_graphers.loc[j, "subtitle"] = (
-                f"The poverty gap index is a poverty measure that reflects both the prevalence and the depth of poverty. It is calculated as the share of population in poverty multiplied by the average shortfall from the poverty line (expressed as a % of the poverty line). {equivalence_scales['subtitle'][eq]}"
-            )
-            df_graphers.loc[j, "note"] = (
-                f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries."
-            )
-            df_graphers.loc[j, "type"] = np.nan
-            df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-            df_graphers.loc[j, "hasMapTab"] = "false"
-            df_graphers.loc[j, "tab"] = "chart"
-            j += 1
-
-        # Headcount ratio (rel)
-        for pct in range(len(povlines_rel)):
-            df_graphers.loc[j, "title"] = (
-                f"{povlines_rel['title_share'][pct]} (After vs. before tax)"
-            )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"headcount_ratio_{povlines_rel['slug_suffix'][pct]}_mi_{equivalence_scales['slug'][eq]} headcount_ratio_{povlines_rel['slug_suffix'][pct]}_dhi_{equivalence_scales['slug'][eq]}"
-            )
-            df_graphers.loc[j, "Indicator Dropdown"] = "Share in poverty"
-            df_graphers.loc[j, "Poverty line Dropdown"] = (
-                f"{povlines_rel['dropdown'][pct]}"
-            )
-            df_graphers.loc[j, "Income measure Dropdown"] = "After tax vs. before tax"
-            df_graphers.loc[
-                j,
-                "Adjust for cost sharing within households (equivalized income) Checkbox",
-            ] = equivalence_scales["checkbox"][eq]
-            df_graphers.loc[j, "subtitle"] = (
-                f"Relative poverty is measured in terms of a poverty line that rises and falls over time with average incomes – in this case set at {povlines_rel['text'][pct]} income. {equivalence_scales['subtitle'][eq]}"
-            )
-            df_graphers.loc[j, "note"] = ""
-            df_graphers.loc[j, "type"] = np.nan
-            df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-            df_graphers.loc[j, "hasMapTab"] = "false"
-            df_graphers.loc[j, "tab"] = "chart"
-            j += 1
-
-        # Headcount (rel)
-        for pct in range(len(povlines_rel)):
-            df_graphers.loc[j, "title"] = (
-                f"{povlines_rel['title_number'][pct]} (After vs. before tax)"
-            )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"headcount_{povlines_rel['slug_suffix'][pct]}_mi_{equivalence_scales['slug'][eq]} headcount_{povlines_rel['slug_suffix'][pct]}_dhi_{equivalence_scales['slug'][eq]}"
-            )
-            df_graphers.loc[j, "Indicator Dropdown"] = "Number in poverty"
-            df_graphers.loc[j, "Poverty line Dropdown"] = (
-                f"{povlines_rel['dropdown'][pct]}"
-            )
-            df_graphers.loc[j, "Income measure Dropdown"] = "After tax vs. before tax"
-            df_graphers.loc[
-                j,
-                "Adjust for cost sharing within households (equivalized income) Checkbox",
-            ] = equivalence_scales["checkbox"][eq]
-            df_graphers.loc[j, "subtitle"] = (
-                f"Relative poverty is measured in terms of a poverty line that rises and falls over time with average incomes – in this case set at {povlines_rel['text'][pct]} income. {equivalence_scales['subtitle'][eq]}"
-            )
-            df_graphers.loc[j, "note"] = ""
-            df_graphers.loc[j, "type"] = np.nan
-            df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-            df_graphers.loc[j, "hasMapTab"] = "false"
-            df_graphers.loc[j, "tab"] = "chart"
-            j += 1
-
-        # Total shortfall (rel)
-        for pct in range(len(povlines_rel)):
-            df_graphers.loc[j, "title"] = (
-                f"Total shortfall from a poverty line of {povlines_rel['text'][pct]} income (After vs. before tax)"
-            )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"total_shortfall_{povlines_rel['slug_suffix'][pct]}_mi_{equivalence_scales['slug'][eq]} total_shortfall_{povlines_rel['slug_suffix'][pct]}_dhi_{equivalence_scales['slug'][eq]}"
-            )
-            df_graphers.loc[j, "Indicator Dropdown"] = (
-                "Total shortfall from poverty line"
-            )
-            df_graphers.loc[j, "Poverty line Dropdown"] = (
-                f"{povlines_rel['dropdown'][pct]}"
-            )
-            df_graphers.loc[j, "Income measure Dropdown"] = "After tax vs. before tax"
-            df_graphers.loc[
-                j,
-                "Adjust for cost sharing within households (equivalized income) Checkbox",
-            ] = equivalence_scales["checkbox"][eq]
-            df_graphers.loc[j, "subtitle"] = (
-                f"This is the amount of money that would be theoretically needed to lift the incomes of all people in poverty up to {povlines_rel.text[pct]} income. {equivalence_scales['subtitle'][eq]}"
-            )
-            df_graphers.loc[j, "note"] = (
-                f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries."
-            )
-            df_graphers.loc[j, "type"] = np.nan
-            df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-            df_graphers.loc[j, "hasMapTab"] = "false"
-            df_graphers.loc[j, "tab"] = "chart"
-            j += 1
-
-        # Average shortfall ($) (rel)
-        for pct in range(len(povlines_rel)):
-            df_graphers.loc[j, "title"] = (
-                f"Average shortfall from a poverty line of {povlines_rel['text'][pct]} income (After vs. before tax)"
-            )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"avg_shortfall_{povlines_rel['slug_suffix'][pct]}_mi_{equivalence_scales['slug'][eq]}_day avg_shortfall_{povlines_rel['slug_suffix'][pct]}_dhi_{equivalence_scales['slug'][eq]}_day"
-            )
-            df_graphers.loc[j, "Indicator Dropdown"] = "Average shortfall ($)"
-            df_graphers.loc[j, "Poverty line Dropdown"] = (
-                f"{povlines_rel['dropdown'][pct]}"
-            )
-            df_graphers.loc[j, "Income measure Dropdown"] = "After tax vs. before tax"
-            df_graphers.loc[
-                j,
-                "Adjust for cost sharing within households (equivalized income) Checkbox",
-            ] = equivalence_scales["checkbox"][eq]
-            df_graphers.loc[j, "subtitle"] = (
-                f"This is the amount of money that would be theoretically needed to lift the incomes of all people in poverty up to {povlines_rel['text'][pct]} income, averaged across the population in poverty. {equivalence_scales['subtitle'][eq]}"
-            )
-            df_graphers.loc[j, "note"] = (
-                f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries."
-            )
-            df_graphers.loc[j, "type"] = np.nan
-            df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-            df_graphers.loc[j, "hasMapTab"] = "false"
-            df_graphers.loc[j, "tab"] = "chart"
-            j += 1
-
-        # Average shortfall (% of poverty line) (rel)
-        for pct in range(len(povlines_rel)):
-            df_graphers.loc[j, "title"] = (
-                f"Average shortfall from a poverty line of {povlines_rel['text'][pct]} income (as a share of the poverty line) (After vs. before tax)"
-            )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"income_gap_ratio_{povlines_rel['slug_suffix'][pct]}_mi_{equivalence_scales['slug'][eq]} income_gap_ratio_{povlines_rel['slug_suffix'][pct]}_dhi_{equivalence_scales['slug'][eq]}"
-            )
-            df_graphers.loc[j, "Indicator Dropdown"] = (
-                "Average shortfall (% of poverty line)"
-            )
-            df_graphers.loc[j, "Poverty line Dropdown"] = (
-                f"{povlines_rel['dropdown'][pct]}"
-            )
-            df_graphers.loc[j, "Income measure Dropdown"] = "After tax vs. before tax"
-            df_graphers.loc[
-                j,
-                "Adjust for cost sharing within households (equivalized income) Checkbox",
-            ] = equivalence_scales["checkbox"][eq]
-            df_graphers.loc[j, "subtitle"] = (
-                f'This is the average shortfall expressed as a share of the poverty line, sometimes called the "income gap ratio". It captures the depth of poverty of those living on less than {povlines_rel.text[pct]} income. {equivalence_scales.note[eq]}'
-            )
-            df_graphers.loc[j, "note"] = (
-                f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries."
-            )
-            df_graphers.loc[j, "type"] = np.nan
-            df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-            df_graphers.loc[j, "hasMapTab"] = "false"
-            df_graphers.loc[j, "tab"] = "chart"
-            j += 1
-
-        # Poverty gap index (rel)
-        for pct in range(len(povlines_rel)):
-            df_graphers.loc[j, "title"] = (
-                f"Poverty gap index at {povlines_rel['text'][pct]} income (After vs. before tax)"
-            )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"poverty_gap_index_{povlines_rel['slug_suffix'][pct]}_mi_{equivalence_scales['slug'][eq]} poverty_gap_index_{povlines_rel['slug_suffix'][pct]}_dhi_{equivalence_scales['slug'][eq]}"
-            )
-            df_graphers.loc[j, "Indicator Dropdown"] = "Poverty gap index"
-            df_graphers.loc[j, "Poverty line Dropdown"] = (
-                f"{povlines_rel['dropdown'][pct]}"
-            )
-            df_graphers.loc[j, "Income measure Dropdown"] = "After tax vs. before tax"
-            df_graphers.loc[
-                j,
-                "Adjust for cost sharing within households (equivalized income) Checkbox",
-            ] = equivalence_scales["checkbox"][eq]
-            df_graphers.loc[j, "subtitle"] = (
-                f"The poverty gap index is a poverty measure that reflects both the prevalence and the depth of poverty. It is calculated as the share of population in poverty multiplied by the average shortfall from the poverty line (expressed as a % of the poverty line). {equivalence_scales['subtitle'][eq]}"
-            )
-            df_graphers.loc[j, "note"] = (
-                f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries."
-            )
-            df_graphers.loc[j, "type"] = np.nan
-            df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-            df_graphers.loc[j, "hasMapTab"] = "false"
-            df_graphers.loc[j, "tab"] = "chart"
-            j += 1
-
-    df_graphers["tableSlug"] = tables["name"][tab]
+df_graphers = expand(
+    ForEach(
+        ["tables"],
+        [
+            ForEach(
+                ["equivalence_scales"],
+                [
+                    ForEach(
+                        ["welfare"],
+                        [
+                            # Headcount ratio (abs)
+                            ForEach(
+                                ["povlines_abs"],
+                                [
+                                    {
+                                        "title": "{povlines_abs[title_share]} ({welfare[title]})",
+                                        "ySlugs": "headcount_ratio_{welfare[slug]}_{equivalence_scales[slug]}_{povlines_abs[cents]}",
+                                        "Indicator Dropdown": "Share in poverty",
+                                        "Poverty line Dropdown": "{povlines_abs[povline_dropdown]}",
+                                        "Income measure Dropdown": "{welfare[dropdown_option]}",
+                                        "Adjust for cost sharing within households (equivalized income) Checkbox": Column(
+                                            "equivalence_scales", "checkbox"
+                                        ),
+                                        "subtitle": "{povlines_abs[subtitle]} {welfare[subtitle]} {equivalence_scales[subtitle]}",
+                                        "note": "This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices.",
+                                        "type": np.nan,
+                                        "selectedFacetStrategy": np.nan,
+                                        "hasMapTab": "true",
+                                        "tab": "map",
+                                    },
+                                ],
+                            ),
+                            # Headcount (abs)
+                            ForEach(
+                                ["povlines_abs"],
+                                [
+                                    {
+                                        "title": "{povlines_abs[title_number]} ({welfare[title]})",
+                                        "ySlugs": "headcount_{welfare[slug]}_{equivalence_scales[slug]}_{povlines_abs[cents]}",
+                                        "Indicator Dropdown": "Number in poverty",
+                                        "Poverty line Dropdown": "{povlines_abs[povline_dropdown]}",
+                                        "Income measure Dropdown": "{welfare[dropdown_option]}",
+                                        "Adjust for cost sharing within households (equivalized income) Checkbox": Column(
+                                            "equivalence_scales", "checkbox"
+                                        ),
+                                        "subtitle": "{povlines_abs[subtitle]} {welfare[subtitle]} {equivalence_scales[subtitle]}",
+                                        "note": "This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices.",
+                                        "type": np.nan,
+                                        "selectedFacetStrategy": np.nan,
+                                        "hasMapTab": "true",
+                                        "tab": "map",
+                                    },
+                                ],
+                            ),
+                            # Total shortfall (abs)
+                            ForEach(
+                                ["povlines_abs"],
+                                [
+                                    {
+                                        "title": "{povlines_abs[title_total_shortfall]} ({welfare[title]})",
+                                        "ySlugs": "total_shortfall_{welfare[slug]}_{equivalence_scales[slug]}_{povlines_abs[cents]}",
+                                        "Indicator Dropdown": "Total shortfall from poverty line",
+                                        "Poverty line Dropdown": "{povlines_abs[povline_dropdown]}",
+                                        "Income measure Dropdown": "{welfare[dropdown_option]}",
+                                        "Adjust for cost sharing within households (equivalized income) Checkbox": Column(
+                                            "equivalence_scales", "checkbox"
+                                        ),
+                                        "subtitle": "{povlines_abs[subtitle_total_shortfall]} {welfare[subtitle]} {equivalence_scales[subtitle]}",
+                                        "note": "This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices. The cost of closing the poverty gap does not take into account costs and inefficiencies from making the necessary transfers.",
+                                        "type": np.nan,
+                                        "selectedFacetStrategy": np.nan,
+                                        "hasMapTab": "true",
+                                        "tab": "map",
+                                    },
+                                ],
+                            ),
+                            # Average shortfall ($)
+                            ForEach(
+                                ["povlines_abs"],
+                                [
+                                    {
+                                        "title": "{povlines_abs[title_avg_shortfall]} ({welfare[title]})",
+                                        "ySlugs": "avg_shortfall_{welfare[slug]}_{equivalence_scales[slug]}_{povlines_abs[cents]}_day",
+                                        "Indicator Dropdown": "Average shortfall ($)",
+                                        "Poverty line Dropdown": "{povlines_abs[povline_dropdown]}",
+                                        "Income measure Dropdown": "{welfare[dropdown_option]}",
+                                        "Adjust for cost sharing within households (equivalized income) Checkbox": Column(
+                                            "equivalence_scales", "checkbox"
+                                        ),
+                                        "subtitle": "{povlines_abs[subtitle_avg_shortfall]} {welfare[subtitle]} {equivalence_scales[subtitle]}",
+                                        "note": "This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries.",
+                                        "type": np.nan,
+                                        "selectedFacetStrategy": np.nan,
+                                        "hasMapTab": "true",
+                                        "tab": "map",
+                                    },
+                                ],
+                            ),
+                            # Average shortfall (% of poverty line)
+                            ForEach(
+                                ["povlines_abs"],
+                                [
+                                    {
+                                        "title": "{povlines_abs[title_income_gap_ratio]} ({welfare[title]})",
+                                        "ySlugs": "income_gap_ratio_{welfare[slug]}_{equivalence_scales[slug]}_{povlines_abs[cents]}",
+                                        "Indicator Dropdown": "Average shortfall (% of poverty line)",
+                                        "Poverty line Dropdown": "{povlines_abs[povline_dropdown]}",
+                                        "Income measure Dropdown": "{welfare[dropdown_option]}",
+                                        "Adjust for cost sharing within households (equivalized income) Checkbox": Column(
+                                            "equivalence_scales", "checkbox"
+                                        ),
+                                        "subtitle": "{povlines_abs[subtitle_income_gap_ratio]} {welfare[subtitle]} {equivalence_scales[subtitle]}",
+                                        "note": "This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries.",
+                                        "type": np.nan,
+                                        "selectedFacetStrategy": np.nan,
+                                        "hasMapTab": "true",
+                                        "tab": "map",
+                                    },
+                                ],
+                            ),
+                            # Poverty gap index
+                            ForEach(
+                                ["povlines_abs"],
+                                [
+                                    {
+                                        "title": "Poverty gap index at ${povlines_abs[dollars_text]} a day ({welfare[title]})",
+                                        "ySlugs": "poverty_gap_index_{welfare[slug]}_{equivalence_scales[slug]}_{povlines_abs[cents]}",
+                                        "Indicator Dropdown": "Poverty gap index",
+                                        "Poverty line Dropdown": "{povlines_abs[povline_dropdown]}",
+                                        "Income measure Dropdown": "{welfare[dropdown_option]}",
+                                        "Adjust for cost sharing within households (equivalized income) Checkbox": Column(
+                                            "equivalence_scales", "checkbox"
+                                        ),
+                                        "subtitle": "The poverty gap index is a poverty measure that reflects both the prevalence and the depth of poverty. It is calculated as the share of population in poverty multiplied by the average shortfall from the poverty line (expressed as a % of the poverty line). {welfare[subtitle]} {equivalence_scales[subtitle]}",
+                                        "note": "This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries.",
+                                        "type": np.nan,
+                                        "selectedFacetStrategy": np.nan,
+                                        "hasMapTab": "true",
+                                        "tab": "map",
+                                    },
+                                ],
+                            ),
+                            # MULTIPLE LINES
+                            # Headcount ratio (abs) - Multiple lines
+                            {
+                                "title": "Share of population living below a range of poverty lines ({welfare[title]})",
+                                "ySlugs": "headcount_ratio_{welfare[slug]}_{equivalence_scales[slug]}_100 headcount_ratio_{welfare[slug]}_{equivalence_scales[slug]}_200 headcount_ratio_{welfare[slug]}_{equivalence_scales[slug]}_500 headcount_ratio_{welfare[slug]}_{equivalence_scales[slug]}_1000 headcount_ratio_{welfare[slug]}_{equivalence_scales[slug]}_2000 headcount_ratio_{welfare[slug]}_{equivalence_scales[slug]}_3000 headcount_ratio_{welfare[slug]}_{equivalence_scales[slug]}_4000",
+                                "Indicator Dropdown": "Share in poverty",
+                                "Poverty line Dropdown": "Multiple lines",
+                                "Income measure Dropdown": "{welfare[dropdown_option]}",
+                                "Adjust for cost sharing within households (equivalized income) Checkbox": Column(
+                                    "equivalence_scales", "checkbox"
+                                ),
+                                "subtitle": "This data is adjusted for inflation and for differences in living costs between countries. {welfare[subtitle]} {equivalence_scales[subtitle]}",
+                                "note": "This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices.",
+                                "type": np.nan,
+                                "selectedFacetStrategy": "entity",
+                                "hasMapTab": "false",
+                                "tab": "chart",
+                            },
+                            # Headcount (abs) - Multiple lines
+                            {
+                                "title": "Number of people living below a range of poverty lines ({welfare[title]})",
+                                "ySlugs": "headcount_{welfare[slug]}_{equivalence_scales[slug]}_100 headcount_{welfare[slug]}_{equivalence_scales[slug]}_200 headcount_{welfare[slug]}_{equivalence_scales[slug]}_500 headcount_{welfare[slug]}_{equivalence_scales[slug]}_1000 headcount_{welfare[slug]}_{equivalence_scales[slug]}_2000 headcount_{welfare[slug]}_{equivalence_scales[slug]}_3000 headcount_{welfare[slug]}_{equivalence_scales[slug]}_4000",
+                                "Indicator Dropdown": "Number in poverty",
+                                "Poverty line Dropdown": "Multiple lines",
+                                "Income measure Dropdown": "{welfare[dropdown_option]}",
+                                "Adjust for cost sharing within households (equivalized income) Checkbox": Column(
+                                    "equivalence_scales", "checkbox"
+                                ),
+                                "subtitle": "This data is adjusted for inflation and for differences in living costs between countries. {welfare[subtitle]} {equivalence_scales[subtitle]}",
+                                "note": "This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices.",
+                                "type": np.nan,
+                                "selectedFacetStrategy": "entity",
+                                "hasMapTab": "false",
+                                "tab": "chart",
+                            },
+                            # Total shortfall (abs) - Multiple lines
+                            {
+                                "title": "Total shortfall from a range of poverty lines ({welfare[title]})",
+                                "ySlugs": "total_shortfall_{welfare[slug]}_{equivalence_scales[slug]}_100 total_shortfall_{welfare[slug]}_{equivalence_scales[slug]}_200 total_shortfall_{welfare[slug]}_{equivalence_scales[slug]}_500 total_shortfall_{welfare[slug]}_{equivalence_scales[slug]}_1000 total_shortfall_{welfare[slug]}_{equivalence_scales[slug]}_2000 total_shortfall_{welfare[slug]}_{equivalence_scales[slug]}_3000 total_shortfall_{welfare[slug]}_{equivalence_scales[slug]}_4000",
+                                "Indicator Dropdown": "Total shortfall from poverty line",
+                                "Poverty line Dropdown": "Multiple lines",
+                                "Income measure Dropdown": "{welfare[dropdown_option]}",
+                                "Adjust for cost sharing within households (equivalized income) Checkbox": Column(
+                                    "equivalence_scales", "checkbox"
+                                ),
+                                "subtitle": "This data is adjusted for inflation and for differences in living costs between countries. {welfare[subtitle]} {equivalence_scales[subtitle]}",
+                                "note": "This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices. The cost of closing the poverty gap does not take into account costs and inefficiencies from making the necessary transfers.",
+                                "type": np.nan,
+                                "selectedFacetStrategy": "entity",
+                                "hasMapTab": "false",
+                                "tab": "chart",
+                            },
+                            # Average shortfall ($) - Multiple lines
+                            {
+                                "title": "Average shortfall from a range of poverty lines ({welfare[title]})",
+                                "ySlugs": "avg_shortfall_{welfare[slug]}_{equivalence_scales[slug]}_100_day avg_shortfall_{welfare[slug]}_{equivalence_scales[slug]}_200_day avg_shortfall_{welfare[slug]}_{equivalence_scales[slug]}_500_day avg_shortfall_{welfare[slug]}_{equivalence_scales[slug]}_1000_day avg_shortfall_{welfare[slug]}_{equivalence_scales[slug]}_2000_day avg_shortfall_{welfare[slug]}_{equivalence_scales[slug]}_3000_day avg_shortfall_{welfare[slug]}_{equivalence_scales[slug]}_4000_day",
+                                "Indicator Dropdown": "Average shortfall ($)",
+                                "Poverty line Dropdown": "Multiple lines",
+                                "Income measure Dropdown": "{welfare[dropdown_option]}",
+                                "Adjust for cost sharing within households (equivalized income) Checkbox": Column(
+                                    "equivalence_scales", "checkbox"
+                                ),
+                                "subtitle": "This data is adjusted for inflation and for differences in living costs between countries. {welfare[subtitle]} {equivalence_scales[subtitle]}",
+                                "note": "This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices.",
+                                "type": np.nan,
+                                "selectedFacetStrategy": "entity",
+                                "hasMapTab": "false",
+                                "tab": "chart",
+                            },
+                            # Average shortfall (% of poverty line) - Multiple lines
+                            {
+                                "title": "Average shortfall from a range of poverty lines (as a share of the poverty line) ({welfare[title]})",
+                                "ySlugs": "income_gap_ratio_{welfare[slug]}_{equivalence_scales[slug]}_100 income_gap_ratio_{welfare[slug]}_{equivalence_scales[slug]}_200 income_gap_ratio_{welfare[slug]}_{equivalence_scales[slug]}_500 income_gap_ratio_{welfare[slug]}_{equivalence_scales[slug]}_1000 income_gap_ratio_{welfare[slug]}_{equivalence_scales[slug]}_2000 income_gap_ratio_{welfare[slug]}_{equivalence_scales[slug]}_3000 income_gap_ratio_{welfare[slug]}_{equivalence_scales[slug]}_4000",
+                                "Indicator Dropdown": "Average shortfall (% of poverty line)",
+                                "Poverty line Dropdown": "Multiple lines",
+                                "Income measure Dropdown": "{welfare[dropdown_option]}",
+                                "Adjust for cost sharing within households (equivalized income) Checkbox": Column(
+                                    "equivalence_scales", "checkbox"
+                                ),
+                                "subtitle": "{welfare[subtitle]} {equivalence_scales[subtitle]}",
+                                "note": "This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries.",
+                                "type": np.nan,
+                                "selectedFacetStrategy": "entity",
+                                "hasMapTab": "false",
+                                "tab": "chart",
+                            },
+                            # Poverty gap index - Multiple lines
+                            {
+                                "title": "Poverty gap index at a range of poverty lines ({welfare[title]})",
+                                "ySlugs": "poverty_gap_index_{welfare[slug]}_{equivalence_scales[slug]}_100 poverty_gap_index_{welfare[slug]}_{equivalence_scales[slug]}_200 poverty_gap_index_{welfare[slug]}_{equivalence_scales[slug]}_500 poverty_gap_index_{welfare[slug]}_{equivalence_scales[slug]}_1000 poverty_gap_index_{welfare[slug]}_{equivalence_scales[slug]}_2000 poverty_gap_index_{welfare[slug]}_{equivalence_scales[slug]}_3000 poverty_gap_index_{welfare[slug]}_{equivalence_scales[slug]}_4000",
+                                "Indicator Dropdown": "Poverty gap index",
+                                "Poverty line Dropdown": "Multiple lines",
+                                "Income measure Dropdown": "{welfare[dropdown_option]}",
+                                "Adjust for cost sharing within households (equivalized income) Checkbox": Column(
+                                    "equivalence_scales", "checkbox"
+                                ),
+                                "subtitle": "{welfare[subtitle]} {equivalence_scales[subtitle]}",
+                                "note": "This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries.",
+                                "type": np.nan,
+                                "selectedFacetStrategy": "entity",
+                                "hasMapTab": "false",
+                                "tab": "chart",
+                            },
+                            # RELATIVE POVERTY
+                            # Headcount ratio (rel)
+                            ForEach(
+                                ["povlines_rel"],
+                                [
+                                    {
+                                        "title": "{povlines_rel[title_share]} ({welfare[title]})",
+                                        "ySlugs": "headcount_ratio_{povlines_rel[slug_suffix]}_{welfare[slug]}_{equivalence_scales[slug]}",
+                                        "Indicator Dropdown": "Share in poverty",
+                                        "Poverty line Dropdown": "{povlines_rel[dropdown]}",
+                                        "Income measure Dropdown": "{welfare[dropdown_option]}",
+                                        "Adjust for cost sharing within households (equivalized income) Checkbox": Column(
+                                            "equivalence_scales", "checkbox"
+                                        ),
+                                        "subtitle": "Relative poverty is measured in terms of a poverty line that rises and falls over time with average incomes – in this case set at {povlines_rel[text]} {welfare[welfare_type]}. {welfare[subtitle]} {equivalence_scales[subtitle]}",
+                                        "note": "",
+                                        "type": np.nan,
+                                        "selectedFacetStrategy": np.nan,
+                                        "hasMapTab": "true",
+                                        "tab": "map",
+                                    },
+                                ],
+                            ),
+                            # Headcount (rel)
+                            ForEach(
+                                ["povlines_rel"],
+                                [
+                                    {
+                                        "title": "{povlines_rel[title_number]} ({welfare[title]})",
+                                        "ySlugs": "headcount_{povlines_rel[slug_suffix]}_{welfare[slug]}_{equivalence_scales[slug]}",
+                                        "Indicator Dropdown": "Number in poverty",
+                                        "Poverty line Dropdown": "{povlines_rel[dropdown]}",
+                                        "Income measure Dropdown": "{welfare[dropdown_option]}",
+                                        "Adjust for cost sharing within households (equivalized income) Checkbox": Column(
+                                            "equivalence_scales", "checkbox"
+                                        ),
+                                        "subtitle": "Relative poverty is measured in terms of a poverty line that rises and falls over time with average incomes – in this case set at {povlines_rel[text]} {welfare[welfare_type]}. {welfare[subtitle]} {equivalence_scales[subtitle]}",
+                                        "note": "",
+                                        "type": np.nan,
+                                        "selectedFacetStrategy": np.nan,
+                                        "hasMapTab": "true",
+                                        "tab": "map",
+                                    },
+                                ],
+                            ),
+                            # Total shortfall (rel)
+                            ForEach(
+                                ["povlines_rel"],
+                                [
+                                    {
+                                        "title": "Total shortfall from a poverty line of {povlines_rel[text]} {welfare[welfare_type]} ({welfare[title]})",
+                                        "ySlugs": "total_shortfall_{povlines_rel[slug_suffix]}_{welfare[slug]}_{equivalence_scales[slug]}",
+                                        "Indicator Dropdown": "Total shortfall from poverty line",
+                                        "Poverty line Dropdown": "{povlines_rel[dropdown]}",
+                                        "Income measure Dropdown": "{welfare[dropdown_option]}",
+                                        "Adjust for cost sharing within households (equivalized income) Checkbox": Column(
+                                            "equivalence_scales", "checkbox"
+                                        ),
+                                        "subtitle": "This is the amount of money that would be theoretically needed to lift the incomes of all people in poverty up to {povlines_rel[text]} {welfare[welfare_type]}. {welfare[subtitle]} {equivalence_scales[subtitle]}",
+                                        "note": "This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries.",
+                                        "type": np.nan,
+                                        "selectedFacetStrategy": np.nan,
+                                        "hasMapTab": "true",
+                                        "tab": "map",
+                                    },
+                                ],
+                            ),
+                            # Average shortfall ($) (rel)
+                            ForEach(
+                                ["povlines_rel"],
+                                [
+                                    {
+                                        "title": "Average shortfall from a poverty line of {povlines_rel[text]} {welfare[welfare_type]} ({welfare[title]})",
+                                        "ySlugs": "avg_shortfall_{povlines_rel[slug_suffix]}_{welfare[slug]}_{equivalence_scales[slug]}_day",
+                                        "Indicator Dropdown": "Average shortfall ($)",
+                                        "Poverty line Dropdown": "{povlines_rel[dropdown]}",
+                                        "Income measure Dropdown": "{welfare[dropdown_option]}",
+                                        "Adjust for cost sharing within households (equivalized income) Checkbox": Column(
+                                            "equivalence_scales", "checkbox"
+                                        ),
+                                        "subtitle": "This is the amount of money that would be theoretically needed to lift the incomes of all people in poverty up to {povlines_rel[text]} {welfare[welfare_type]}, averaged across the population in poverty. {welfare[subtitle]} {equivalence_scales[subtitle]}",
+                                        "note": "This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries.",
+                                        "type": np.nan,
+                                        "selectedFacetStrategy": np.nan,
+                                        "hasMapTab": "true",
+                                        "tab": "map",
+                                    },
+                                ],
+                            ),
+                            # Average shortfall (% of poverty line) (rel)
+                            ForEach(
+                                ["povlines_rel"],
+                                [
+                                    {
+                                        "title": "Average shortfall from a poverty line of {povlines_rel[text]} {welfare[welfare_type]} (as a share of the poverty line) ({welfare[title]})",
+                                        "ySlugs": "income_gap_ratio_{povlines_rel[slug_suffix]}_{welfare[slug]}_{equivalence_scales[slug]}",
+                                        "Indicator Dropdown": "Average shortfall (% of poverty line)",
+                                        "Poverty line Dropdown": "{povlines_rel[dropdown]}",
+                                        "Income measure Dropdown": "{welfare[dropdown_option]}",
+                                        "Adjust for cost sharing within households (equivalized income) Checkbox": Column(
+                                            "equivalence_scales", "checkbox"
+                                        ),
+                                        "subtitle": 'This is the average shortfall expressed as a share of the poverty line, sometimes called the "income gap ratio". It captures the depth of poverty of those living on less than {povlines_rel[text]} {welfare[welfare_type]}. {welfare[subtitle]} {equivalence_scales[note]}',
+                                        "note": "This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries.",
+                                        "type": np.nan,
+                                        "selectedFacetStrategy": np.nan,
+                                        "hasMapTab": "true",
+                                        "tab": "map",
+                                    },
+                                ],
+                            ),
+                            # Poverty gap index (rel)
+                            ForEach(
+                                ["povlines_rel"],
+                                [
+                                    {
+                                        "title": "Poverty gap index at {povlines_rel[text]} {welfare[welfare_type]} ({welfare[title]})",
+                                        "ySlugs": "poverty_gap_index_{povlines_rel[slug_suffix]}_{welfare[slug]}_{equivalence_scales[slug]}",
+                                        "Indicator Dropdown": "Poverty gap index",
+                                        "Poverty line Dropdown": "{povlines_rel[dropdown]}",
+                                        "Income measure Dropdown": "{welfare[dropdown_option]}",
+                                        "Adjust for cost sharing within households (equivalized income) Checkbox": Column(
+                                            "equivalence_scales", "checkbox"
+                                        ),
+                                        "subtitle": "The poverty gap index is a poverty measure that reflects both the prevalence and the depth of poverty. It is calculated as the share of population in poverty multiplied by the average shortfall from the poverty line (expressed as a % of the poverty line). {welfare[subtitle]} {equivalence_scales[subtitle]}",
+                                        "note": "This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries.",
+                                        "type": np.nan,
+                                        "selectedFacetStrategy": np.nan,
+                                        "hasMapTab": "true",
+                                        "tab": "map",
+                                    },
+                                ],
+                            ),
+                        ],
+                    ),
+                    # BEFORE VS. AFTER TAX
+                    # Headcount ratio (abs)
+                    ForEach(
+                        ["povlines_abs"],
+                        [
+                            {
+                                "title": "{povlines_abs[title_share]} (After vs. before tax)",
+                                "ySlugs": "headcount_ratio_mi_{equivalence_scales[slug]}_{povlines_abs[cents]} headcount_ratio_dhi_{equivalence_scales[slug]}_{povlines_abs[cents]}",
+                                "Indicator Dropdown": "Share in poverty",
+                                "Poverty line Dropdown": "{povlines_abs[povline_dropdown]}",
+                                "Income measure Dropdown": "After tax vs. before tax",
+                                "Adjust for cost sharing within households (equivalized income) Checkbox": Column(
+                                    "equivalence_scales", "checkbox"
+                                ),
+                                "subtitle": "{povlines_abs[subtitle]} {equivalence_scales[subtitle]}",
+                                "note": "This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices.",
+                                "type": np.nan,
+                                "selectedFacetStrategy": "entity",
+                                "hasMapTab": "false",
+                                "tab": "chart",
+                            },
+                        ],
+                    ),
+                    # Headcount (abs)
+                    ForEach(
+                        ["povlines_abs"],
+                        [
+                            {
+                                "title": "{povlines_abs[title_number]} (After vs. before tax)",
+                                "ySlugs": "headcount_mi_{equivalence_scales[slug]}_{povlines_abs[cents]} headcount_dhi_{equivalence_scales[slug]}_{povlines_abs[cents]}",
+                                "Indicator Dropdown": "Number in poverty",
+                                "Poverty line Dropdown": "{povlines_abs[povline_dropdown]}",
+                                "Income measure Dropdown": "After tax vs. before tax",
+                                "Adjust for cost sharing within households (equivalized income) Checkbox": Column(
+                                    "equivalence_scales", "checkbox"
+                                ),
+                                "subtitle": "{povlines_abs[subtitle]} {equivalence_scales[subtitle]}",
+                                "note": "This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices.",
+                                "type": np.nan,
+                                "selectedFacetStrategy": "entity",
+                                "hasMapTab": "false",
+                                "tab": "chart",
+                            },
+                        ],
+                    ),
+                    # Total shortfall (abs)
+                    ForEach(
+                        ["povlines_abs"],
+                        [
+                            {
+                                "title": "{povlines_abs[title_total_shortfall]} (After vs. before tax)",
+                                "ySlugs": "total_shortfall_mi_{equivalence_scales[slug]}_{povlines_abs[cents]} total_shortfall_dhi_{equivalence_scales[slug]}_{povlines_abs[cents]}",
+                                "Indicator Dropdown": "Total shortfall from poverty line",
+                                "Poverty line Dropdown": "{povlines_abs[povline_dropdown]}",
+                                "Income measure Dropdown": "After tax vs. before tax",
+                                "Adjust for cost sharing within households (equivalized income) Checkbox": Column(
+                                    "equivalence_scales", "checkbox"
+                                ),
+                                "subtitle": "{povlines_abs[subtitle_total_shortfall]} {equivalence_scales[subtitle]}",
+                                "note": "This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices. The cost of closing the poverty gap does not take into account costs and inefficiencies from making the necessary transfers.",
+                                "type": np.nan,
+                                "selectedFacetStrategy": "entity",
+                                "hasMapTab": "false",
+                                "tab": "chart",
+                            },
+                        ],
+                    ),
+                    # Average shortfall ($)
+                    ForEach(
+                        ["povlines_abs"],
+                        [
+                            {
+                                "title": "{povlines_abs[title_avg_shortfall]} (After vs. before tax)",
+                                "ySlugs": "avg_shortfall_mi_{equivalence_scales[slug]}_{povlines_abs[cents]}_day avg_shortfall_dhi_{equivalence_scales[slug]}_{povlines_abs[cents]}_day",
+                                "Indicator Dropdown": "Average shortfall ($)",
+                                "Poverty line Dropdown": "{povlines_abs[povline_dropdown]}",
+                                "Income measure Dropdown": "After tax vs. before tax",
+                                "Adjust for cost sharing within households (equivalized income) Checkbox": Column(
+                                    "equivalence_scales", "checkbox"
+                                ),
+                                "subtitle": "{povlines_abs[subtitle_avg_shortfall]} {equivalence_scales[subtitle]}",
+                                "note": "This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries.",
+                                "type": np.nan,
+                                "selectedFacetStrategy": "entity",
+                                "hasMapTab": "false",
+                                "tab": "chart",
+                            },
+                        ],
+                    ),
+                    # Average shortfall (% of poverty line)
+                    ForEach(
+                        ["povlines_abs"],
+                        [
+                            {
+                                "title": "{povlines_abs[title_income_gap_ratio]} (After vs. before tax)",
+                                "ySlugs": "income_gap_ratio_mi_{equivalence_scales[slug]}_{povlines_abs[cents]} income_gap_ratio_dhi_{equivalence_scales[slug]}_{povlines_abs[cents]}",
+                                "Indicator Dropdown": "Average shortfall (% of poverty line)",
+                                "Poverty line Dropdown": "{povlines_abs[povline_dropdown]}",
+                                "Income measure Dropdown": "After tax vs. before tax",
+                                "Adjust for cost sharing within households (equivalized income) Checkbox": Column(
+                                    "equivalence_scales", "checkbox"
+                                ),
+                                "subtitle": "{povlines_abs[subtitle_income_gap_ratio]} {equivalence_scales[subtitle]}",
+                                "note": "This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries.",
+                                "type": np.nan,
+                                "selectedFacetStrategy": "entity",
+                                "hasMapTab": "false",
+                                "tab": "chart",
+                            },
+                        ],
+                    ),
+                    # Poverty gap index
+                    ForEach(
+                        ["povlines_abs"],
+                        [
+                            {
+                                "title": "Poverty gap index at ${povlines_abs[dollars_text]} a day (After vs. before tax)",
+                                "ySlugs": "poverty_gap_index_mi_{equivalence_scales[slug]}_{povlines_abs[cents]} poverty_gap_index_dhi_{equivalence_scales[slug]}_{povlines_abs[cents]}",
+                                "Indicator Dropdown": "Poverty gap index",
+                                "Poverty line Dropdown": "{povlines_abs[povline_dropdown]}",
+                                "Income measure Dropdown": "After tax vs. before tax",
+                                "Adjust for cost sharing within households (equivalized income) Checkbox": Column(
+                                    "equivalence_scales", "checkbox"
+                                ),
+                                "subtitle": "The poverty gap index is a poverty measure that reflects both the prevalence and the depth of poverty. It is calculated as the share of population in poverty multiplied by the average shortfall from the poverty line (expressed as a % of the poverty line). {equivalence_scales[subtitle]}",
+                                "note": "This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries.",
+                                "type": np.nan,
+                                "selectedFacetStrategy": "entity",
+                                "hasMapTab": "false",
+                                "tab": "chart",
+                            },
+                        ],
+                    ),
+                    # Headcount ratio (rel)
+                    ForEach(
+                        ["povlines_rel"],
+                        [
+                            {
+                                "title": "{povlines_rel[title_share]} (After vs. before tax)",
+                                "ySlugs": "headcount_ratio_{povlines_rel[slug_suffix]}_mi_{equivalence_scales[slug]} headcount_ratio_{povlines_rel[slug_suffix]}_dhi_{equivalence_scales[slug]}",
+                                "Indicator Dropdown": "Share in poverty",
+                                "Poverty line Dropdown": "{povlines_rel[dropdown]}",
+                                "Income measure Dropdown": "After tax vs. before tax",
+                                "Adjust for cost sharing within households (equivalized income) Checkbox": Column(
+                                    "equivalence_scales", "checkbox"
+                                ),
+                                "subtitle": "Relative poverty is measured in terms of a poverty line that rises and falls over time with average incomes – in this case set at {povlines_rel[text]} income. {equivalence_scales[subtitle]}",
+                                "note": "",
+                                "type": np.nan,
+                                "selectedFacetStrategy": "entity",
+                                "hasMapTab": "false",
+                                "tab": "chart",
+                            },
+                        ],
+                    ),
+                    # Headcount (rel)
+                    ForEach(
+                        ["povlines_rel"],
+                        [
+                            {
+                                "title": "{povlines_rel[title_number]} (After vs. before tax)",
+                                "ySlugs": "headcount_{povlines_rel[slug_suffix]}_mi_{equivalence_scales[slug]} headcount_{povlines_rel[slug_suffix]}_dhi_{equivalence_scales[slug]}",
+                                "Indicator Dropdown": "Number in poverty",
+                                "Poverty line Dropdown": "{povlines_rel[dropdown]}",
+                                "Income measure Dropdown": "After tax vs. before tax",
+                                "Adjust for cost sharing within households (equivalized income) Checkbox": Column(
+                                    "equivalence_scales", "checkbox"
+                                ),
+                                "subtitle": "Relative poverty is measured in terms of a poverty line that rises and falls over time with average incomes – in this case set at {povlines_rel[text]} income. {equivalence_scales[subtitle]}",
+                                "note": "",
+                                "type": np.nan,
+                                "selectedFacetStrategy": "entity",
+                                "hasMapTab": "false",
+                                "tab": "chart",
+                            },
+                        ],
+                    ),
+                    # Total shortfall (rel)
+                    ForEach(
+                        ["povlines_rel"],
+                        [
+                            {
+                                "title": "Total shortfall from a poverty line of {povlines_rel[text]} income (After vs. before tax)",
+                                "ySlugs": "total_shortfall_{povlines_rel[slug_suffix]}_mi_{equivalence_scales[slug]} total_shortfall_{povlines_rel[slug_suffix]}_dhi_{equivalence_scales[slug]}",
+                                "Indicator Dropdown": "Total shortfall from poverty line",
+                                "Poverty line Dropdown": "{povlines_rel[dropdown]}",
+                                "Income measure Dropdown": "After tax vs. before tax",
+                                "Adjust for cost sharing within households (equivalized income) Checkbox": Column(
+                                    "equivalence_scales", "checkbox"
+                                ),
+                                "subtitle": "This is the amount of money that would be theoretically needed to lift the incomes of all people in poverty up to {povlines_rel[text]} income. {equivalence_scales[subtitle]}",
+                                "note": "This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries.",
+                                "type": np.nan,
+                                "selectedFacetStrategy": "entity",
+                                "hasMapTab": "false",
+                                "tab": "chart",
+                            },
+                        ],
+                    ),
+                    # Average shortfall ($) (rel)
+                    ForEach(
+                        ["povlines_rel"],
+                        [
+                            {
+                                "title": "Average shortfall from a poverty line of {povlines_rel[text]} income (After vs. before tax)",
+                                "ySlugs": "avg_shortfall_{povlines_rel[slug_suffix]}_mi_{equivalence_scales[slug]}_day avg_shortfall_{povlines_rel[slug_suffix]}_dhi_{equivalence_scales[slug]}_day",
+                                "Indicator Dropdown": "Average shortfall ($)",
+                                "Poverty line Dropdown": "{povlines_rel[dropdown]}",
+                                "Income measure Dropdown": "After tax vs. before tax",
+                                "Adjust for cost sharing within households (equivalized income) Checkbox": Column(
+                                    "equivalence_scales", "checkbox"
+                                ),
+                                "subtitle": "This is the amount of money that would be theoretically needed to lift the incomes of all people in poverty up to {povlines_rel[text]} income, averaged across the population in poverty. {equivalence_scales[subtitle]}",
+                                "note": "This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries.",
+                                "type": np.nan,
+                                "selectedFacetStrategy": "entity",
+                                "hasMapTab": "false",
+                                "tab": "chart",
+                            },
+                        ],
+                    ),
+                    # Average shortfall (% of poverty line) (rel)
+                    ForEach(
+                        ["povlines_rel"],
+                        [
+                            {
+                                "title": "Average shortfall from a poverty line of {povlines_rel[text]} income (as a share of the poverty line) (After vs. before tax)",
+                                "ySlugs": "income_gap_ratio_{povlines_rel[slug_suffix]}_mi_{equivalence_scales[slug]} income_gap_ratio_{povlines_rel[slug_suffix]}_dhi_{equivalence_scales[slug]}",
+                                "Indicator Dropdown": "Average shortfall (% of poverty line)",
+                                "Poverty line Dropdown": "{povlines_rel[dropdown]}",
+                                "Income measure Dropdown": "After tax vs. before tax",
+                                "Adjust for cost sharing within households (equivalized income) Checkbox": Column(
+                                    "equivalence_scales", "checkbox"
+                                ),
+                                "subtitle": 'This is the average shortfall expressed as a share of the poverty line, sometimes called the "income gap ratio". It captures the depth of poverty of those living on less than {povlines_rel[text]} income. {equivalence_scales[note]}',
+                                "note": "This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries.",
+                                "type": np.nan,
+                                "selectedFacetStrategy": "entity",
+                                "hasMapTab": "false",
+                                "tab": "chart",
+                            },
+                        ],
+                    ),
+                    # Poverty gap index (rel)
+                    ForEach(
+                        ["povlines_rel"],
+                        [
+                            {
+                                "title": "Poverty gap index at {povlines_rel[text]} income (After vs. before tax)",
+                                "ySlugs": "poverty_gap_index_{povlines_rel[slug_suffix]}_mi_{equivalence_scales[slug]} poverty_gap_index_{povlines_rel[slug_suffix]}_dhi_{equivalence_scales[slug]}",
+                                "Indicator Dropdown": "Poverty gap index",
+                                "Poverty line Dropdown": "{povlines_rel[dropdown]}",
+                                "Income measure Dropdown": "After tax vs. before tax",
+                                "Adjust for cost sharing within households (equivalized income) Checkbox": Column(
+                                    "equivalence_scales", "checkbox"
+                                ),
+                                "subtitle": "The poverty gap index is a poverty measure that reflects both the prevalence and the depth of poverty. It is calculated as the share of population in poverty multiplied by the average shortfall from the poverty line (expressed as a % of the poverty line). {equivalence_scales[subtitle]}",
+                                "note": "This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries.",
+                                "type": np.nan,
+                                "selectedFacetStrategy": "entity",
+                                "hasMapTab": "false",
+                                "tab": "chart",
+                            },
+                        ],
+                    ),
+                ],
+            ),
+        ],
+    ),
+    dimensions,
+)
+df_graphers["tableSlug"] = tables["name"][len(tables) - 1]
 
 # %% [markdown]
 # Final adjustments to the graphers table: add `relatedQuestion` link and `defaultView`:
@@ -1480,29 +1190,10 @@ df_graphers.loc[
 # Define list of variables to iterate: table names
 table_list = list(tables["name"].unique())
 
-# Header is converted into a tab-separated text
-header_tsv = df_header.to_csv(sep="\t", header=False)
-
-# Graphers table is converted into a tab-separated text
-graphers_tsv = df_graphers
-graphers_tsv = graphers_tsv.to_csv(sep="\t", index=False)
-
-# This table is indented, to follow explorers' format
-graphers_tsv_indented = textwrap.indent(graphers_tsv, "\t")
-
 # The dataframes are combined, including tables and links to the datasets
 with open(outfile, "w", newline="\n", encoding="utf-8") as f:
-    f.write(header_tsv)
-    f.write("\ngraphers\n" + graphers_tsv_indented)
+    explorer = ExplorerWriter(f)
+    explorer.write_header(df_header)
+    explorer.write_graphers(df_graphers)
 
-    for tab in range(len(tables)):
-        table_tsv = (
-            df_tables[df_tables["tableSlug"] == tables["name"][tab]]
-            .copy()
-            .reset_index(drop=True)
-        )
-        table_tsv = table_tsv.drop(columns=["tableSlug"])
-        table_tsv = table_tsv.to_csv(sep="\t", index=False)
-        table_tsv_indented = textwrap.indent(table_tsv, "\t")
-        f.write("\ntable\t" + tables["link"][tab] + "\t" + tables["name"][tab])
-        f.write("\ncolumns\t" + tables["name"][tab] + "\n" + table_tsv_indented)
+    explorer.write_tables(df_tables, "tableSlug", zip(tables["name"], tables["link"]))
@@ -2,7 +2,6 @@
 # # Incomes Across the Distribution Explorer of the Luxembourg Income Study
 # This code creates the tsv file for the incomes across the distribution explorer from the LIS data, available [here](https://owid.cloud/admin/explorers/preview/lis-incomes-across-distribution)
 
-import textwrap
 from pathlib import Path
 
 import numpy as np
@@ -11,6 +10,10 @@ import numpy as np
 import pandas as pd
 
 from ..common_parameters import *
+from ..descriptions import join_paragraphs
+from ..explorer_writer import ExplorerWriter
+from ..sheets import read_sheet
+from ..table_builder import TableBuilder
 
 PARENT_DIR = Path(__file__).parent.parent.parent.parent.absolute()
 outfile = PARENT_DIR / "explorers" / "incomes-across-distribution-lis.explorer.tsv"
@@ -25,39 +28,34 @@ sheet_id = "1UFdwB1iBpP2tEP6GtxCHvW1GGhjsFflh42FWR80rYIg"
 
 # Welfare type sheet
 sheet_name = "welfare"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-welfare = pd.read_csv(url, keep_default_na=False)
+welfare = read_sheet(sheet_id, sheet_name, keep_default_na=False)
 
 # Equivalence scales
 sheet_name = "equivalence_scales"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-equivalence_scales = pd.read_csv(url, keep_default_na=False, dtype={"checkbox": "str"})
+equivalence_scales = read_sheet(
+    sheet_id, sheet_name, keep_default_na=False, dtype={"checkbox": "str"}
+)
 
 # Tables sheet
 sheet_name = "tables"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-tables = pd.read_csv(url, keep_default_na=False)
+tables = read_sheet(sheet_id, sheet_name, keep_default_na=False)
 
 # Deciles9 sheet (needed to handle thresholds data)
 sheet_name = "deciles9"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-deciles9 = pd.read_csv(url, keep_default_na=False)
+deciles9 = read_sheet(sheet_id, sheet_name, keep_default_na=False)
 
 # Deciles10 sheet (needed to handle average and share data)
 sheet_name = "deciles10"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-deciles10 = pd.read_csv(url, keep_default_na=False)
+deciles10 = read_sheet(sheet_id, sheet_name, keep_default_na=False)
 
 # Top sheet (needed to handle data at the top of the distribution)
 sheet_name = "top_pct"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-top_pct = pd.read_csv(url, keep_default_na=False)
+top_pct = read_sheet(sheet_id, sheet_name, keep_default_na=False)
 
 # Income aggregation sheet (day, month, year)
 sheet_name = "income_aggregation"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-income_aggregation = pd.read_csv(
-    url, keep_default_na=False, dtype={"multiplier": "str"}
+income_aggregation = read_sheet(
+    sheet_id, sheet_name, keep_default_na=False, dtype={"multiplier": "str"}
 )
 
 # %% [markdown]
@@ -104,7 +102,6 @@ sourceLink = SOURCE_LINK_LIS
 colorScaleNumericMinValue = COLOR_SCALE_NUMERIC_MIN_VALUE
 tolerance = TOLERANCE
 colorScaleEqualSizeBins = COLOR_SCALE_EQUAL_SIZEBINS
-new_line = NEW_LINE
 
 yAxisMin = Y_AXIS_MIN
 
@@ -118,282 +115,266 @@ processing_distribution = PROCESSING_DISTRIBUTION_LIS
 
 ppp_description = PPP_DESCRIPTION_LIS
 
-df_tables = pd.DataFrame()
-j = 0
+df_tables = TableBuilder()
 
 for tab in range(len(tables)):
     # Define country as entityName
-    df_tables.loc[j, "name"] = "Country"
-    df_tables.loc[j, "slug"] = "country"
-    df_tables.loc[j, "type"] = "EntityName"
-    j += 1
+    df_tables.append(
+        {
+            "name": "Country",
+            "slug": "country",
+            "type": "EntityName",
+        }
+    )
 
     # Define year as Year
-    df_tables.loc[j, "name"] = "Year"
-    df_tables.loc[j, "slug"] = "year"
-    df_tables.loc[j, "type"] = "Year"
-    j += 1
+    df_tables.append(
+        {
+            "name": "Year",
+            "slug": "year",
+            "type": "Year",
+        }
+    )
 
     for wel in range(len(welfare)):
         for eq in range(len(equivalence_scales)):
             # I need the original variables to not break the aggregations
             # Mean
-            df_tables.loc[j, "name"] = (
-                f"Mean {welfare['welfare_type'][wel]} ({welfare['title'][wel]})"
-            )
-            df_tables.loc[j, "slug"] = (
-                f"mean_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}"
-            )
-            df_tables.loc[j, "description"] = new_line.join(
-                [
-                    f"Mean {welfare['welfare_type'][wel]}.",
-                    welfare["description"][wel],
-                    equivalence_scales["description"][eq],
-                    ppp_description,
-                    notes_title,
-                    processing_description,
-                    processing_gini_mean_median,
-                ]
+            df_tables.append(
+                {
+                    "name": f"Mean {welfare['welfare_type'][wel]} ({welfare['title'][wel]})",
+                    "slug": f"mean_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}",
+                    "description": join_paragraphs(
+                        [
+                            f"Mean {welfare['welfare_type'][wel]}.",
+                            welfare["description"][wel],
+                            equivalence_scales["description"][eq],
+                            ppp_description,
+                            notes_title,
+                            processing_description,
+                            processing_gini_mean_median,
+                        ]
+                    ),
+                    "unit": "international-$ in 2017 prices",
+                    "shortUnit": "$",
+                    "type": "Numeric",
+                    "colorScaleNumericBins": welfare["scale_mean"][wel],
+                    "colorScaleScheme": "BuGn",
+                }
             )
-            df_tables.loc[j, "unit"] = "international-$ in 2017 prices"
-            df_tables.loc[j, "shortUnit"] = "$"
-            df_tables.loc[j, "type"] = "Numeric"
-            df_tables.loc[j, "colorScaleNumericBins"] = welfare["scale_mean"][wel]
-            df_tables.loc[j, "colorScaleScheme"] = "BuGn"
-            j += 1
 
             # Median
-            df_tables.loc[j, "name"] = (
-                f"Median {welfare['welfare_type'][wel]} ({welfare['title'][wel]})"
-            )
-            df_tables.loc[j, "slug"] = (
-                f"median_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}"
-            )
-            df_tables.loc[j, "description"] = new_line.join(
-                [
-                    f"The level of {welfare['welfare_type'][wel]} below which half of the population falls.",
-                    welfare["description"][wel],
-                    equivalence_scales["description"][eq],
-                    ppp_description,
-                    notes_title,
-                    processing_description,
-                    processing_gini_mean_median,
-                ]
+            df_tables.append(
+                {
+                    "name": f"Median {welfare['welfare_type'][wel]} ({welfare['title'][wel]})",
+                    "slug": f"median_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}",
+                    "description": join_paragraphs(
+                        [
+                            f"The level of {welfare['welfare_type'][wel]} below which half of the population falls.",
+                            welfare["description"][wel],
+                            equivalence_scales["description"][eq],
+                            ppp_description,
+                            notes_title,
+                            processing_description,
+                            processing_gini_mean_median,
+                        ]
+                    ),
+                    "unit": "international-$ in 2017 prices",
+                    "shortUnit": "$",
+                    "type": "Numeric",
+                    "colorScaleNumericBins": welfare["scale_median"][wel],
+                    "colorScaleScheme": "Blues",
+                }
             )
-            df_tables.loc[j, "unit"] = "international-$ in 2017 prices"
-            df_tables.loc[j, "shortUnit"] = "$"
-            df_tables.loc[j, "type"] = "Numeric"
-            df_tables.loc[j, "colorScaleNumericBins"] = welfare["scale_median"][wel]
-            df_tables.loc[j, "colorScaleScheme"] = "Blues"
-            j += 1
 
             # Thresholds - Deciles
             for dec9 in range(len(deciles9)):
-                df_tables.loc[j, "name"] = (
-                    f"{deciles9['ordinal'][dec9].capitalize()} ({welfare['title'][wel]})"
+                df_tables.append(
+                    {
+                        "name": f"{deciles9['ordinal'][dec9].capitalize()} ({welfare['title'][wel]})",
+                        "slug": f"thr_{deciles9['lis_notation'][dec9]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}",
+                        "description": join_paragraphs(
+                            [
+                                f"The level of {welfare['welfare_type'][wel]} below which {deciles9['decile'][dec9]}0% of the population falls.",
+                                welfare["description"][wel],
+                                equivalence_scales["description"][eq],
+                                ppp_description,
+                                notes_title,
+                                processing_description,
+                                processing_distribution,
+                            ]
+                        ),
+                        "unit": "international-$ in 2017 prices",
+                        "shortUnit": "$",
+                        "type": "Numeric",
+                        # "colorScaleNumericBins": deciles9['scale_thr'][dec9],
+                        "colorScaleScheme": "Purples",
+                    }
                 )
-                df_tables.loc[j, "slug"] = (
-                    f"thr_{deciles9['lis_notation'][dec9]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}"
-                )
-                df_tables.loc[j, "description"] = new_line.join(
-                    [
-                        f"The level of {welfare['welfare_type'][wel]} below which {deciles9['decile'][dec9]}0% of the population falls.",
-                        welfare["description"][wel],
-                        equivalence_scales["description"][eq],
-                        ppp_description,
-                        notes_title,
-                        processing_description,
-                        processing_distribution,
-                    ]
-                )
-                df_tables.loc[j, "unit"] = "international-$ in 2017 prices"
-                df_tables.loc[j, "shortUnit"] = "$"
-                df_tables.loc[j, "type"] = "Numeric"
-                # df_tables.loc[j, "colorScaleNumericBins"] = deciles9["scale_thr"][dec9]
-                df_tables.loc[j, "colorScaleScheme"] = "Purples"
-                j += 1
 
             # Averages - Deciles
             for dec10 in range(len(deciles10)):
-                df_tables.loc[j, "name"] = (
-                    f"{deciles10['ordinal'][dec10].capitalize()} ({welfare['title'][wel]})"
-                )
-                df_tables.loc[j, "slug"] = (
-                    f"avg_{deciles10['lis_notation'][dec10]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}"
+                df_tables.append(
+                    {
+                        "name": f"{deciles10['ordinal'][dec10].capitalize()} ({welfare['title'][wel]})",
+                        "slug": f"avg_{deciles10['lis_notation'][dec10]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}",
+                        "description": join_paragraphs(
+                            [
+                                f"The mean {welfare['welfare_type'][wel]} within the {deciles10['ordinal'][dec10]} (tenth of the population).",
+                                welfare["description"][wel],
+                                equivalence_scales["description"][eq],
+                                ppp_description,
+                                notes_title,
+                                processing_description,
+                                processing_distribution,
+                            ]
+                        ),
+                        "unit": "international-$ in 2017 prices",
+                        "shortUnit": "$",
+                        "type": "Numeric",
+                        # "colorScaleNumericBins": deciles10['scale_avg'][dec10],
+                        "colorScaleScheme": "Greens",
+                    }
                 )
-                df_tables.loc[j, "description"] = new_line.join(
-                    [
-                        f"The mean {welfare['welfare_type'][wel]} within the {deciles10['ordinal'][dec10]} (tenth of the population).",
-                        welfare["description"][wel],
-                        equivalence_scales["description"][eq],
-                        ppp_description,
-                        notes_title,
-                        processing_description,
-                        processing_distribution,
-                    ]
-                )
-                df_tables.loc[j, "unit"] = "international-$ in 2017 prices"
-                df_tables.loc[j, "shortUnit"] = "$"
-                df_tables.loc[j, "type"] = "Numeric"
-                # df_tables.loc[j, "colorScaleNumericBins"] = deciles10["scale_avg"][
-                #     dec10
-                # ]
-                df_tables.loc[j, "colorScaleScheme"] = "Greens"
-                j += 1
 
             # Shares - Deciles
             for dec10 in range(len(deciles10)):
-                df_tables.loc[j, "name"] = (
-                    f"{deciles10['ordinal'][dec10].capitalize()} ({welfare['title'][wel]})"
-                )
-                df_tables.loc[j, "slug"] = (
-                    f"share_{deciles10['lis_notation'][dec10]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}"
+                df_tables.append(
+                    {
+                        "name": f"{deciles10['ordinal'][dec10].capitalize()} ({welfare['title'][wel]})",
+                        "slug": f"share_{deciles10['lis_notation'][dec10]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}",
+                        "description": join_paragraphs(
+                            [
+                                f"The share of {welfare['welfare_type'][wel]} received by the {deciles10['ordinal'][dec10]} (tenth of the population).",
+                                welfare["description"][wel],
+                                equivalence_scales["description"][eq],
+                                notes_title,
+                                processing_description,
+                                processing_distribution,
+                            ]
+                        ),
+                        "unit": "%",
+                        "shortUnit": "%",
+                        "type": "Numeric",
+                        "colorScaleNumericBins": deciles10[
+                            f"scale_share_{welfare['slug'][wel]}"
+                        ][dec10],
+                        "colorScaleScheme": "OrRd",
+                    }
                 )
-                df_tables.loc[j, "description"] = new_line.join(
-                    [
-                        f"The share of {welfare['welfare_type'][wel]} received by the {deciles10['ordinal'][dec10]} (tenth of the population).",
-                        welfare["description"][wel],
-                        equivalence_scales["description"][eq],
-                        notes_title,
-                        processing_description,
-                        processing_distribution,
-                    ]
-                )
-                df_tables.loc[j, "unit"] = "%"
-                df_tables.loc[j, "shortUnit"] = "%"
-                df_tables.loc[j, "type"] = "Numeric"
-                df_tables.loc[j, "colorScaleNumericBins"] = deciles10[
-                    f"scale_share_{welfare['slug'][wel]}"
-                ][dec10]
-                df_tables.loc[j, "colorScaleScheme"] = "OrRd"
-                j += 1
 
             # Income aggregations
             for agg in range(len(income_aggregation)):
                 # Mean
-                df_tables.loc[j, "name"] = (
-                    f"Mean {welfare['welfare_type'][wel]} ({welfare['title'][wel]})"
-                )
-                df_tables.loc[j, "slug"] = (
-                    f"mean_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]}"
+                df_tables.append(
+                    {
+                        "name": f"Mean {welfare['welfare_type'][wel]} ({welfare['title'][wel]})",
+                        "slug": f"mean_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]}",
+                        "description": join_paragraphs(
+                            [
+                                f"Mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]}.",
+                                welfare["description"][wel],
+                                equivalence_scales["description"][eq],
+                                ppp_description,
+                                notes_title,
+                                processing_description,
+                                processing_gini_mean_median,
+                            ]
+                        ),
+                        "unit": "international-$ in 2017 prices",
+                        "shortUnit": "$",
+                        "type": "Numeric",
+                        "colorScaleNumericBins": income_aggregation["scale"][agg],
+                        "colorScaleScheme": "BuGn",
+                        "transform": f"multiplyBy mean_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]} {income_aggregation['multiplier'][agg]}",
+                    }
                 )
-                df_tables.loc[j, "description"] = new_line.join(
-                    [
-                        f"Mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]}.",
-                        welfare["description"][wel],
-                        equivalence_scales["description"][eq],
-                        ppp_description,
-                        notes_title,
-                        processing_description,
-                        processing_gini_mean_median,
-                    ]
-                )
-                df_tables.loc[j, "unit"] = "international-$ in 2017 prices"
-                df_tables.loc[j, "shortUnit"] = "$"
-                df_tables.loc[j, "type"] = "Numeric"
-                df_tables.loc[j, "colorScaleNumericBins"] = income_aggregation["scale"][
-                    agg
-                ]
-                df_tables.loc[j, "colorScaleScheme"] = "BuGn"
-                df_tables.loc[j, "transform"] = (
-                    f"multiplyBy mean_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]} {income_aggregation['multiplier'][agg]}"
-                )
-                j += 1
 
                 # Median
-                df_tables.loc[j, "name"] = (
-                    f"Median {welfare['welfare_type'][wel]} ({welfare['title'][wel]})"
-                )
-                df_tables.loc[j, "slug"] = (
-                    f"median_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]}"
+                df_tables.append(
+                    {
+                        "name": f"Median {welfare['welfare_type'][wel]} ({welfare['title'][wel]})",
+                        "slug": f"median_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]}",
+                        "description": join_paragraphs(
+                            [
+                                f"The level of {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} below which half of the population falls.",
+                                welfare["description"][wel],
+                                equivalence_scales["description"][eq],
+                                ppp_description,
+                                notes_title,
+                                processing_description,
+                                processing_gini_mean_median,
+                            ]
+                        ),
+                        "unit": "international-$ in 2017 prices",
+                        "shortUnit": "$",
+                        "type": "Numeric",
+                        "colorScaleNumericBins": income_aggregation["scale"][agg],
+                        "colorScaleScheme": "Blues",
+                        "transform": f"multiplyBy median_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]} {income_aggregation['multiplier'][agg]}",
+                    }
                 )
-                df_tables.loc[j, "description"] = new_line.join(
-                    [
-                        f"The level of {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} below which half of the population falls.",
-                        welfare["description"][wel],
-                        equivalence_scales["description"][eq],
-                        ppp_description,
-                        notes_title,
-                        processing_description,
-                        processing_gini_mean_median,
-                    ]
-                )
-                df_tables.loc[j, "unit"] = "international-$ in 2017 prices"
-                df_tables.loc[j, "shortUnit"] = "$"
-                df_tables.loc[j, "type"] = "Numeric"
-                df_tables.loc[j, "colorScaleNumericBins"] = income_aggregation["scale"][
-                    agg
-                ]
-                df_tables.loc[j, "colorScaleScheme"] = "Blues"
-                df_tables.loc[j, "transform"] = (
-                    f"multiplyBy median_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]} {income_aggregation['multiplier'][agg]}"
-                )
-                j += 1
 
                 # Thresholds - Deciles
                 for dec9 in range(len(deciles9)):
-                    df_tables.loc[j, "name"] = (
-                        f"{deciles9['ordinal'][dec9].capitalize()} ({welfare['title'][wel]})"
-                    )
-                    df_tables.loc[j, "slug"] = (
-                        f"thr_{deciles9['lis_notation'][dec9]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]}"
-                    )
-                    df_tables.loc[j, "description"] = new_line.join(
-                        [
-                            f"The level of {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} below which {deciles9['decile'][dec9]}0% of the population falls.",
-                            welfare["description"][wel],
-                            equivalence_scales["description"][eq],
-                            ppp_description,
-                            notes_title,
-                            processing_description,
-                            processing_distribution,
-                        ]
+                    df_tables.append(
+                        {
+                            "name": f"{deciles9['ordinal'][dec9].capitalize()} ({welfare['title'][wel]})",
+                            "slug": f"thr_{deciles9['lis_notation'][dec9]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]}",
+                            "description": join_paragraphs(
+                                [
+                                    f"The level of {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} below which {deciles9['decile'][dec9]}0% of the population falls.",
+                                    welfare["description"][wel],
+                                    equivalence_scales["description"][eq],
+                                    ppp_description,
+                                    notes_title,
+                                    processing_description,
+                                    processing_distribution,
+                                ]
+                            ),
+                            "unit": "international-$ in 2017 prices",
+                            "shortUnit": "$",
+                            "type": "Numeric",
+                            "colorScaleNumericBins": deciles9[
+                                f"scale_thr_{welfare['slug'][wel]}_{income_aggregation['aggregation'][agg]}"
+                            ][dec9],
+                            "colorScaleScheme": "Purples",
+                            "transform": f"multiplyBy thr_{deciles9['lis_notation'][dec9]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]} {income_aggregation['multiplier'][agg]}",
+                        }
                     )
-                    df_tables.loc[j, "unit"] = "international-$ in 2017 prices"
-                    df_tables.loc[j, "shortUnit"] = "$"
-                    df_tables.loc[j, "type"] = "Numeric"
-                    df_tables.loc[j, "colorScaleNumericBins"] = deciles9[
-                        f"scale_thr_{welfare['slug'][wel]}_{income_aggregation['aggregation'][agg]}"
-                    ][dec9]
-                    df_tables.loc[j, "colorScaleScheme"] = "Purples"
-                    df_tables.loc[j, "transform"] = (
-                        f"multiplyBy thr_{deciles9['lis_notation'][dec9]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]} {income_aggregation['multiplier'][agg]}"
-                    )
-                    j += 1
 
                 # Averages - Deciles
                 for dec10 in range(len(deciles10)):
-                    df_tables.loc[j, "name"] = (
-                        f"{deciles10['ordinal'][dec10].capitalize()} ({welfare['title'][wel]})"
-                    )
-                    df_tables.loc[j, "slug"] = (
-                        f"avg_{deciles10['lis_notation'][dec10]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]}"
-                    )
-                    df_tables.loc[j, "description"] = new_line.join(
-                        [
-                            f"The mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} within the {deciles10['ordinal'][dec10]} (tenth of the population).",
-                            welfare["description"][wel],
-                            equivalence_scales["description"][eq],
-                            ppp_description,
-                            notes_title,
-                            processing_description,
-                            processing_distribution,
-                        ]
+                    df_tables.append(
+                        {
+                            "name": f"{deciles10['ordinal'][dec10].capitalize()} ({welfare['title'][wel]})",
+                            "slug": f"avg_{deciles10['lis_notation'][dec10]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]}",
+                            "description": join_paragraphs(
+                                [
+                                    f"The mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} within the {deciles10['ordinal'][dec10]} (tenth of the population).",
+                                    welfare["description"][wel],
+                                    equivalence_scales["description"][eq],
+                                    ppp_description,
+                                    notes_title,
+                                    processing_description,
+                                    processing_distribution,
+                                ]
+                            ),
+                            "unit": "international-$ in 2017 prices",
+                            "shortUnit": "$",
+                            "type": "Numeric",
+                            "colorScaleNumericBins": deciles10[
+                                f"scale_avg_{welfare['slug'][wel]}_{income_aggregation['aggregation'][agg]}"
+                            ][dec10],
+                            "colorScaleScheme": "Greens",
+                            "transform": f"multiplyBy avg_{deciles10['lis_notation'][dec10]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]} {income_aggregation['multiplier'][agg]}",
+                        }
                     )
-                    df_tables.loc[j, "unit"] = "international-$ in 2017 prices"
-                    df_tables.loc[j, "shortUnit"] = "$"
-                    df_tables.loc[j, "type"] = "Numeric"
-                    df_tables.loc[j, "colorScaleNumericBins"] = deciles10[
-                        f"scale_avg_{welfare['slug'][wel]}_{income_aggregation['aggregation'][agg]}"
-                    ][dec10]
-                    df_tables.loc[j, "colorScaleScheme"] = "Greens"
-                    df_tables.loc[j, "transform"] = (
-                        f"multiplyBy avg_{deciles10['lis_notation'][dec10]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]} {income_aggregation['multiplier'][agg]}"
-                    )
-                    j += 1
 
     df_tables["tableSlug"] = tables["name"][tab]
 
+df_tables = df_tables.to_frame()
+
 df_tables["sourceName"] = sourceName
 df_tables["dataPublishedBy"] = dataPublishedBy
 df_tables["sourceLink"] = sourceLink
@@ -411,411 +392,326 @@ df_tables["tolerance"] = df_tables["tolerance"].astype("Int64")
 # %%
 # Grapher table generation
 
-df_graphers = pd.DataFrame()
+df_graphers = TableBuilder()
 
-j = 0
 
 for tab in range(len(tables)):
     for agg in range(len(income_aggregation)):
         for eq in range(len(equivalence_scales)):
             for wel in range(len(welfare)):
                 # Mean
-                df_graphers.loc[j, "title"] = (
-                    f"Mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} ({welfare['title'][wel]})"
-                )
-                df_graphers.loc[j, "ySlugs"] = (
-                    f"mean_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]}"
-                )
-                df_graphers.loc[j, "Indicator Dropdown"] = "Mean income"
-                df_graphers.loc[j, "Decile Dropdown"] = np.nan
-                df_graphers.loc[j, "Income measure Dropdown"] = (
-                    f"{welfare['dropdown_option'][wel]}"
-                )
-                df_graphers.loc[j, "Period Radio"] = (
-                    f"{income_aggregation['aggregation'][agg].capitalize()}"
-                )
-                df_graphers.loc[
-                    j,
-                    "Adjust for cost sharing within households (equivalized income) Checkbox",
-                ] = equivalence_scales["checkbox"][eq]
-                df_graphers.loc[j, "subtitle"] = (
-                    f"This data is adjusted for inflation and for differences in living costs between countries. {welfare['subtitle'][wel]}"
-                )
-                df_graphers.loc[j, "note"] = (
-                    f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices. {equivalence_scales['note'][eq]}"
+                df_graphers.append(
+                    {
+                        "title": f"Mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} ({welfare['title'][wel]})",
+                        "ySlugs": f"mean_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]}",
+                        "Indicator Dropdown": "Mean income",
+                        "Decile Dropdown": np.nan,
+                        "Income measure Dropdown": f"{welfare['dropdown_option'][wel]}",
+                        "Period Radio": f"{income_aggregation['aggregation'][agg].capitalize()}",
+                        "Adjust for cost sharing within households (equivalized income) Checkbox": equivalence_scales[
+                            "checkbox"
+                        ][
+                            eq
+                        ],
+                        "subtitle": f"This data is adjusted for inflation and for differences in living costs between countries. {welfare['subtitle'][wel]}",
+                        "note": f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices. {equivalence_scales['note'][eq]}",
+                        "selectedFacetStrategy": np.nan,
+                        "hasMapTab": "true",
+                        "tab": "map",
+                        "yScaleToggle": "true",
+                    }
                 )
-                df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-                df_graphers.loc[j, "hasMapTab"] = "true"
-                df_graphers.loc[j, "tab"] = "map"
-                df_graphers.loc[j, "yScaleToggle"] = "true"
-                j += 1
 
                 # Median
-                df_graphers.loc[j, "title"] = (
-                    f"Median {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} ({welfare['title'][wel]})"
+                df_graphers.append(
+                    {
+                        "title": f"Median {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} ({welfare['title'][wel]})",
+                        "ySlugs": f"median_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]}",
+                        "Indicator Dropdown": "Median income",
+                        "Decile Dropdown": np.nan,
+                        "Income measure Dropdown": f"{welfare['dropdown_option'][wel]}",
+                        "Period Radio": f"{income_aggregation['aggregation'][agg].capitalize()}",
+                        "Adjust for cost sharing within households (equivalized income) Checkbox": equivalence_scales[
+                            "checkbox"
+                        ][
+                            eq
+                        ],
+                        "subtitle": f"This data is adjusted for inflation and for differences in living costs between countries. {welfare['subtitle'][wel]}",
+                        "note": f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices. {equivalence_scales['note'][eq]}",
+                        "selectedFacetStrategy": np.nan,
+                        "hasMapTab": "true",
+                        "tab": "map",
+                        "yScaleToggle": "true",
+                    }
                 )
-                df_graphers.loc[j, "ySlugs"] = (
-                    f"median_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]}"
-                )
-                df_graphers.loc[j, "Indicator Dropdown"] = "Median income"
-                df_graphers.loc[j, "Decile Dropdown"] = np.nan
-                df_graphers.loc[j, "Income measure Dropdown"] = (
-                    f"{welfare['dropdown_option'][wel]}"
-                )
-                df_graphers.loc[j, "Period Radio"] = (
-                    f"{income_aggregation['aggregation'][agg].capitalize()}"
-                )
-                df_graphers.loc[
-                    j,
-                    "Adjust for cost sharing within households (equivalized income) Checkbox",
-                ] = equivalence_scales["checkbox"][eq]
-                df_graphers.loc[j, "subtitle"] = (
-                    f"This data is adjusted for inflation and for differences in living costs between countries. {welfare['subtitle'][wel]}"
-                )
-                df_graphers.loc[j, "note"] = (
-                    f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices. {equivalence_scales['note'][eq]}"
-                )
-                df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-                df_graphers.loc[j, "hasMapTab"] = "true"
-                df_graphers.loc[j, "tab"] = "map"
-                df_graphers.loc[j, "yScaleToggle"] = "true"
-                j += 1
 
                 # Thresholds - Deciles
                 for dec9 in range(len(deciles9)):
-                    df_graphers.loc[j, "title"] = (
-                        f"Threshold {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} marking the {deciles9['ordinal'][dec9]} ({welfare['title'][wel]})"
-                    )
-                    df_graphers.loc[j, "ySlugs"] = (
-                        f"thr_{deciles9['lis_notation'][dec9]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]}"
-                    )
-                    df_graphers.loc[j, "Indicator Dropdown"] = "Decile thresholds"
-                    df_graphers.loc[j, "Decile Dropdown"] = deciles9["dropdown"][dec9]
-                    df_graphers.loc[j, "Income measure Dropdown"] = (
-                        f"{welfare['dropdown_option'][wel]}"
+                    df_graphers.append(
+                        {
+                            "title": f"Threshold {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} marking the {deciles9['ordinal'][dec9]} ({welfare['title'][wel]})",
+                            "ySlugs": f"thr_{deciles9['lis_notation'][dec9]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]}",
+                            "Indicator Dropdown": "Decile thresholds",
+                            "Decile Dropdown": deciles9["dropdown"][dec9],
+                            "Income measure Dropdown": f"{welfare['dropdown_option'][wel]}",
+                            "Period Radio": f"{income_aggregation['aggregation'][agg].capitalize()}",
+                            "Adjust for cost sharing within households (equivalized income) Checkbox": equivalence_scales[
+                                "checkbox"
+                            ][
+                                eq
+                            ],
+                            "subtitle": f"The level of {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} below which {deciles9['decile'][dec9]}0% of the population falls. {welfare['subtitle'][wel]}",
+                            "note": f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries. {equivalence_scales['note'][eq]}",
+                            "selectedFacetStrategy": np.nan,
+                            "hasMapTab": "true",
+                            "tab": "map",
+                            "yScaleToggle": "true",
+                        }
                     )
-                    df_graphers.loc[j, "Period Radio"] = (
-                        f"{income_aggregation['aggregation'][agg].capitalize()}"
-                    )
-                    df_graphers.loc[
-                        j,
-                        "Adjust for cost sharing within households (equivalized income) Checkbox",
-                    ] = equivalence_scales["checkbox"][eq]
-                    df_graphers.loc[j, "subtitle"] = (
-                        f"The level of {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} below which {deciles9['decile'][dec9]}0% of the population falls. {welfare['subtitle'][wel]}"
-                    )
-                    df_graphers.loc[j, "note"] = (
-                        f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries. {equivalence_scales['note'][eq]}"
-                    )
-                    df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-                    df_graphers.loc[j, "hasMapTab"] = "true"
-                    df_graphers.loc[j, "tab"] = "map"
-                    df_graphers.loc[j, "yScaleToggle"] = "true"
-                    j += 1
 
                 # Averages - Deciles
                 for dec10 in range(len(deciles10)):
-                    df_graphers.loc[j, "title"] = (
-                        f"Mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} within the {deciles10['ordinal'][dec10]} ({welfare['title'][wel]})"
-                    )
-                    df_graphers.loc[j, "ySlugs"] = (
-                        f"avg_{deciles10['lis_notation'][dec10]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]}"
-                    )
-                    df_graphers.loc[j, "Indicator Dropdown"] = "Mean income, by decile"
-                    df_graphers.loc[j, "Decile Dropdown"] = deciles10["dropdown"][dec10]
-                    df_graphers.loc[j, "Income measure Dropdown"] = (
-                        f"{welfare['dropdown_option'][wel]}"
-                    )
-                    df_graphers.loc[j, "Period Radio"] = (
-                        f"{income_aggregation['aggregation'][agg].capitalize()}"
-                    )
-                    df_graphers.loc[
-                        j,
-                        "Adjust for cost sharing within households (equivalized income) Checkbox",
-                    ] = equivalence_scales["checkbox"][eq]
-                    df_graphers.loc[j, "subtitle"] = (
-                        f"The mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} within the {deciles10['ordinal'][dec10]} (tenth of the population). {welfare['subtitle'][wel]}"
+                    df_graphers.append(
+                        {
+                            "title": f"Mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} within the {deciles10['ordinal'][dec10]} ({welfare['title'][wel]})",
+                            "ySlugs": f"avg_{deciles10['lis_notation'][dec10]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]}",
+                            "Indicator Dropdown": "Mean income, by decile",
+                            "Decile Dropdown": deciles10["dropdown"][dec10],
+                            "Income measure Dropdown": f"{welfare['dropdown_option'][wel]}",
+                            "Period Radio": f"{income_aggregation['aggregation'][agg].capitalize()}",
+                            "Adjust for cost sharing within households (equivalized income) Checkbox": equivalence_scales[
+                                "checkbox"
+                            ][
+                                eq
+                            ],
+                            "subtitle": f"The mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} within the {deciles10['ordinal'][dec10]} (tenth of the population). {welfare['subtitle'][wel]}",
+                            "note": f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries. {equivalence_scales['note'][eq]}",
+                            "selectedFacetStrategy": np.nan,
+                            "hasMapTab": "true",
+                            "tab": "map",
+                            "yScaleToggle": "true",
+                        }
                     )
-                    df_graphers.loc[j, "note"] = (
-                        f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries. {equivalence_scales['note'][eq]}"
-                    )
-                    df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-                    df_graphers.loc[j, "hasMapTab"] = "true"
-                    df_graphers.loc[j, "tab"] = "map"
-                    df_graphers.loc[j, "yScaleToggle"] = "true"
-                    j += 1
 
                 # Thresholds - Multiple deciles
-                df_graphers.loc[j, "title"] = (
-                    f"Threshold {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} for each decile ({welfare['title'][wel]})"
-                )
-                df_graphers.loc[j, "ySlugs"] = (
-                    f"thr_p10_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} thr_p20_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} thr_p30_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} thr_p40_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} thr_p50_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} thr_p60_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} thr_p70_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} thr_p80_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} thr_p90_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]}"
-                )
-                df_graphers.loc[j, "Indicator Dropdown"] = "Decile thresholds"
-                df_graphers.loc[j, "Decile Dropdown"] = "All deciles"
-                df_graphers.loc[j, "Income measure Dropdown"] = (
-                    f"{welfare['dropdown_option'][wel]}"
-                )
-                df_graphers.loc[j, "Period Radio"] = (
-                    f"{income_aggregation['aggregation'][agg].capitalize()}"
+                df_graphers.append(
+                    {
+                        "title": f"Threshold {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} for each decile ({welfare['title'][wel]})",
+                        "ySlugs": f"thr_p10_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} thr_p20_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} thr_p30_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} thr_p40_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} thr_p50_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} thr_p60_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} thr_p70_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} thr_p80_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} thr_p90_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]}",
+                        "Indicator Dropdown": "Decile thresholds",
+                        "Decile Dropdown": "All deciles",
+                        "Income measure Dropdown": f"{welfare['dropdown_option'][wel]}",
+                        "Period Radio": f"{income_aggregation['aggregation'][agg].capitalize()}",
+                        "Adjust for cost sharing within households (equivalized income) Checkbox": equivalence_scales[
+                            "checkbox"
+                        ][
+                            eq
+                        ],
+                        "hideRelativeToggle": "false",
+                        "subtitle": f"The level of income per {income_aggregation['aggregation'][agg]} below which 10%, 20%, 30%, etc. of the population falls. {welfare['subtitle'][wel]}",
+                        "note": f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries. {equivalence_scales['note'][eq]}",
+                        "selectedFacetStrategy": "entity",
+                        "hasMapTab": "false",
+                        "tab": "chart",
+                        "yScaleToggle": "true",
+                    }
                 )
-                df_graphers.loc[
-                    j,
-                    "Adjust for cost sharing within households (equivalized income) Checkbox",
-                ] = equivalence_scales["checkbox"][eq]
-                df_graphers.loc[j, "hideRelativeToggle"] = "false"
-                df_graphers.loc[j, "subtitle"] = (
-                    f"The level of income per {income_aggregation['aggregation'][agg]} below which 10%, 20%, 30%, etc. of the population falls. {welfare['subtitle'][wel]}"
-                )
-                df_graphers.loc[j, "note"] = (
-                    f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries. {equivalence_scales['note'][eq]}"
-                )
-                df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-                df_graphers.loc[j, "hasMapTab"] = "false"
-                df_graphers.loc[j, "tab"] = "chart"
-                df_graphers.loc[j, "yScaleToggle"] = "true"
-                j += 1
 
                 # Averages - Multiple deciles
-                df_graphers.loc[j, "title"] = (
-                    f"Mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} within each decile ({welfare['title'][wel]})"
-                )
-                df_graphers.loc[j, "ySlugs"] = (
-                    f"avg_p10_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} avg_p20_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} avg_p30_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} avg_p40_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} avg_p50_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} avg_p60_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} avg_p70_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} avg_p80_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} avg_p90_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} avg_p100_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]}"
+                df_graphers.append(
+                    {
+                        "title": f"Mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} within each decile ({welfare['title'][wel]})",
+                        "ySlugs": f"avg_p10_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} avg_p20_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} avg_p30_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} avg_p40_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} avg_p50_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} avg_p60_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} avg_p70_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} avg_p80_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} avg_p90_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} avg_p100_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]}",
+                        "Indicator Dropdown": "Mean income, by decile",
+                        "Decile Dropdown": "All deciles",
+                        "Income measure Dropdown": f"{welfare['dropdown_option'][wel]}",
+                        "Period Radio": f"{income_aggregation['aggregation'][agg].capitalize()}",
+                        "Adjust for cost sharing within households (equivalized income) Checkbox": equivalence_scales[
+                            "checkbox"
+                        ][
+                            eq
+                        ],
+                        "hideRelativeToggle": "false",
+                        "subtitle": f"The mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} within each decile (tenth of the population). {welfare['subtitle'][wel]}",
+                        "note": f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries. {equivalence_scales['note'][eq]}",
+                        "selectedFacetStrategy": "entity",
+                        "hasMapTab": "false",
+                        "tab": "chart",
+                        "yScaleToggle": "true",
+                    }
                 )
-                df_graphers.loc[j, "Indicator Dropdown"] = "Mean income, by decile"
-                df_graphers.loc[j, "Decile Dropdown"] = "All deciles"
-                df_graphers.loc[j, "Income measure Dropdown"] = (
-                    f"{welfare['dropdown_option'][wel]}"
-                )
-                df_graphers.loc[j, "Period Radio"] = (
-                    f"{income_aggregation['aggregation'][agg].capitalize()}"
-                )
-                df_graphers.loc[
-                    j,
-                    "Adjust for cost sharing within households (equivalized income) Checkbox",
-                ] = equivalence_scales["checkbox"][eq]
-                df_graphers.loc[j, "hideRelativeToggle"] = "false"
-                df_graphers.loc[j, "subtitle"] = (
-                    f"The mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} within each decile (tenth of the population). {welfare['subtitle'][wel]}"
-                )
-                df_graphers.loc[j, "note"] = (
-                    f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries. {equivalence_scales['note'][eq]}"
-                )
-                df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-                df_graphers.loc[j, "hasMapTab"] = "false"
-                df_graphers.loc[j, "tab"] = "chart"
-                df_graphers.loc[j, "yScaleToggle"] = "true"
-                j += 1
 
             # BEFORE VS. AFTER TAX
             # Mean
-            df_graphers.loc[j, "title"] = (
-                f"Mean income per {income_aggregation['aggregation'][agg]} (after tax vs. before tax)"
-            )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"mean_mi_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} mean_dhi_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]}"
-            )
-            df_graphers.loc[j, "Indicator Dropdown"] = "Mean income"
-            df_graphers.loc[j, "Decile Dropdown"] = np.nan
-            df_graphers.loc[j, "Income measure Dropdown"] = "After tax vs. before tax"
-            df_graphers.loc[j, "Period Radio"] = (
-                f"{income_aggregation['aggregation'][agg].capitalize()}"
-            )
-            df_graphers.loc[
-                j,
-                "Adjust for cost sharing within households (equivalized income) Checkbox",
-            ] = equivalence_scales["checkbox"][eq]
-            df_graphers.loc[j, "subtitle"] = (
-                f"This data is adjusted for inflation and for differences in living costs between countries."
+            df_graphers.append(
+                {
+                    "title": f"Mean income per {income_aggregation['aggregation'][agg]} (after tax vs. before tax)",
+                    "ySlugs": f"mean_mi_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} mean_dhi_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]}",
+                    "Indicator Dropdown": "Mean income",
+                    "Decile Dropdown": np.nan,
+                    "Income measure Dropdown": "After tax vs. before tax",
+                    "Period Radio": f"{income_aggregation['aggregation'][agg].capitalize()}",
+                    "Adjust for cost sharing within households (equivalized income) Checkbox": equivalence_scales[
+                        "checkbox"
+                    ][
+                        eq
+                    ],
+                    "subtitle": f"This data is adjusted for inflation and for differences in living costs between countries.",
+                    "note": f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices. {equivalence_scales['note'][eq]}",
+                    "selectedFacetStrategy": "entity",
+                    "hasMapTab": "false",
+                    "tab": "chart",
+                    "yScaleToggle": "true",
+                }
             )
-            df_graphers.loc[j, "note"] = (
-                f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices. {equivalence_scales['note'][eq]}"
-            )
-            df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-            df_graphers.loc[j, "hasMapTab"] = "false"
-            df_graphers.loc[j, "tab"] = "chart"
-            df_graphers.loc[j, "yScaleToggle"] = "true"
-            j += 1
 
             # Median
-            df_graphers.loc[j, "title"] = (
-                f"Median income per {income_aggregation['aggregation'][agg]} (after tax vs. before tax)"
-            )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"median_mi_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} median_dhi_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]}"
-            )
-            df_graphers.loc[j, "Indicator Dropdown"] = "Median income"
-            df_graphers.loc[j, "Decile Dropdown"] = np.nan
-            df_graphers.loc[j, "Income measure Dropdown"] = "After tax vs. before tax"
-            df_graphers.loc[j, "Period Radio"] = (
-                f"{income_aggregation['aggregation'][agg].capitalize()}"
-            )
-            df_graphers.loc[
-                j,
-                "Adjust for cost sharing within households (equivalized income) Checkbox",
-            ] = equivalence_scales["checkbox"][eq]
-            df_graphers.loc[j, "subtitle"] = (
-                f"This data is adjusted for inflation and for differences in living costs between countries."
+            df_graphers.append(
+                {
+                    "title": f"Median income per {income_aggregation['aggregation'][agg]} (after tax vs. before tax)",
+                    "ySlugs": f"median_mi_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} median_dhi_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]}",
+                    "Indicator Dropdown": "Median income",
+                    "Decile Dropdown": np.nan,
+                    "Income measure Dropdown": "After tax vs. before tax",
+                    "Period Radio": f"{income_aggregation['aggregation'][agg].capitalize()}",
+                    "Adjust for cost sharing within households (equivalized income) Checkbox": equivalence_scales[
+                        "checkbox"
+                    ][
+                        eq
+                    ],
+                    "subtitle": f"This data is adjusted for inflation and for differences in living costs between countries.",
+                    "note": f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices. {equivalence_scales['note'][eq]}",
+                    "selectedFacetStrategy": "entity",
+                    "hasMapTab": "false",
+                    "tab": "chart",
+                    "yScaleToggle": "true",
+                }
             )
-            df_graphers.loc[j, "note"] = (
-                f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices. {equivalence_scales['note'][eq]}"
-            )
-            df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-            df_graphers.loc[j, "hasMapTab"] = "false"
-            df_graphers.loc[j, "tab"] = "chart"
-            df_graphers.loc[j, "yScaleToggle"] = "true"
-            j += 1
 
             # Thresholds - Deciles
             for dec9 in range(len(deciles9)):
-                df_graphers.loc[j, "title"] = (
-                    f"Threshold income per {income_aggregation['aggregation'][agg]} marking the {deciles9['ordinal'][dec9]} (after tax vs. before tax)"
-                )
-                df_graphers.loc[j, "ySlugs"] = (
-                    f"thr_{deciles9['lis_notation'][dec9]}_mi_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} thr_{deciles9['lis_notation'][dec9]}_dhi_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]}"
-                )
-                df_graphers.loc[j, "Indicator Dropdown"] = "Decile thresholds"
-                df_graphers.loc[j, "Decile Dropdown"] = deciles9["dropdown"][dec9]
-                df_graphers.loc[j, "Income measure Dropdown"] = (
-                    "After tax vs. before tax"
+                df_graphers.append(
+                    {
+                        "title": f"Threshold income per {income_aggregation['aggregation'][agg]} marking the {deciles9['ordinal'][dec9]} (after tax vs. before tax)",
+                        "ySlugs": f"thr_{deciles9['lis_notation'][dec9]}_mi_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} thr_{deciles9['lis_notation'][dec9]}_dhi_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]}",
+                        "Indicator Dropdown": "Decile thresholds",
+                        "Decile Dropdown": deciles9["dropdown"][dec9],
+                        "Income measure Dropdown": "After tax vs. before tax",
+                        "Period Radio": f"{income_aggregation['aggregation'][agg].capitalize()}",
+                        "Adjust for cost sharing within households (equivalized income) Checkbox": equivalence_scales[
+                            "checkbox"
+                        ][
+                            eq
+                        ],
+                        "subtitle": f"The level of income per {income_aggregation['aggregation'][agg]} below which {deciles9['decile'][dec9]}0% of the population falls.",
+                        "note": f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries. {equivalence_scales['note'][eq]}",
+                        "selectedFacetStrategy": "entity",
+                        "hasMapTab": "false",
+                        "tab": "chart",
+                        "yScaleToggle": "true",
+                    }
                 )
-                df_graphers.loc[j, "Period Radio"] = (
-                    f"{income_aggregation['aggregation'][agg].capitalize()}"
-                )
-                df_graphers.loc[
-                    j,
-                    "Adjust for cost sharing within households (equivalized income) Checkbox",
-                ] = equivalence_scales["checkbox"][eq]
-                df_graphers.loc[j, "subtitle"] = (
-                    f"The level of income per {income_aggregation['aggregation'][agg]} below which {deciles9['decile'][dec9]}0% of the population falls."
-                )
-                df_graphers.loc[j, "note"] = (
-                    f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries. {equivalence_scales['note'][eq]}"
-                )
-                df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-                df_graphers.loc[j, "hasMapTab"] = "false"
-                df_graphers.loc[j, "tab"] = "chart"
-                df_graphers.loc[j, "yScaleToggle"] = "true"
-                j += 1
 
             # Averages - Deciles
             for dec10 in range(len(deciles10)):
-                df_graphers.loc[j, "title"] = (
-                    f"Mean income per {income_aggregation['aggregation'][agg]} within the {deciles10['ordinal'][dec10]} (after tax vs. before tax)"
-                )
-                df_graphers.loc[j, "ySlugs"] = (
-                    f"avg_{deciles10['lis_notation'][dec10]}_mi_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} avg_{deciles10['lis_notation'][dec10]}_dhi_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]}"
-                )
-                df_graphers.loc[j, "Indicator Dropdown"] = "Mean income, by decile"
-                df_graphers.loc[j, "Decile Dropdown"] = deciles10["dropdown"][dec10]
-                df_graphers.loc[j, "Income measure Dropdown"] = (
-                    "After tax vs. before tax"
-                )
-                df_graphers.loc[j, "Period Radio"] = (
-                    f"{income_aggregation['aggregation'][agg].capitalize()}"
-                )
-                df_graphers.loc[
-                    j,
-                    "Adjust for cost sharing within households (equivalized income) Checkbox",
-                ] = equivalence_scales["checkbox"][eq]
-                df_graphers.loc[j, "subtitle"] = (
-                    f"The mean income per {income_aggregation['aggregation'][agg]} within the {deciles10['ordinal'][dec10]} (tenth of the population)."
+                df_graphers.append(
+                    {
+                        "title": f"Mean income per {income_aggregation['aggregation'][agg]} within the {deciles10['ordinal'][dec10]} (after tax vs. before tax)",
+                        "ySlugs": f"avg_{deciles10['lis_notation'][dec10]}_mi_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]} avg_{deciles10['lis_notation'][dec10]}_dhi_{equivalence_scales['slug'][eq]}{income_aggregation['slug_suffix'][agg]}",
+                        "Indicator Dropdown": "Mean income, by decile",
+                        "Decile Dropdown": deciles10["dropdown"][dec10],
+                        "Income measure Dropdown": "After tax vs. before tax",
+                        "Period Radio": f"{income_aggregation['aggregation'][agg].capitalize()}",
+                        "Adjust for cost sharing within households (equivalized income) Checkbox": equivalence_scales[
+                            "checkbox"
+                        ][
+                            eq
+                        ],
+                        "subtitle": f"The mean income per {income_aggregation['aggregation'][agg]} within the {deciles10['ordinal'][dec10]} (tenth of the population).",
+                        "note": f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries. {equivalence_scales['note'][eq]}",
+                        "selectedFacetStrategy": "entity",
+                        "hasMapTab": "false",
+                        "tab": "chart",
+                        "yScaleToggle": "true",
+                    }
                 )
-                df_graphers.loc[j, "note"] = (
-                    f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries. {equivalence_scales['note'][eq]}"
-                )
-                df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-                df_graphers.loc[j, "hasMapTab"] = "false"
-                df_graphers.loc[j, "tab"] = "chart"
-                df_graphers.loc[j, "yScaleToggle"] = "true"
-                j += 1
 
     # This is an adaptation of the code to make both before and after tax graphs and share graphs
     for eq in range(len(equivalence_scales)):
         for wel in range(len(welfare)):
             # Shares - Deciles
             for dec10 in range(len(deciles10)):
-                df_graphers.loc[j, "title"] = (
-                    f"{welfare['welfare_type'][wel].capitalize()} share of the {deciles10['ordinal'][dec10]} ({welfare['title'][wel]})"
-                )
-                df_graphers.loc[j, "ySlugs"] = (
-                    f"share_{deciles10['lis_notation'][dec10]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}"
-                )
-                df_graphers.loc[j, "Indicator Dropdown"] = "Decile shares"
-                df_graphers.loc[j, "Decile Dropdown"] = deciles10["dropdown"][dec10]
-                df_graphers.loc[j, "Income measure Dropdown"] = (
-                    f"{welfare['dropdown_option'][wel]}"
-                )
-                df_graphers.loc[j, "Period Radio"] = np.nan
-                df_graphers.loc[
-                    j,
-                    "Adjust for cost sharing within households (equivalized income) Checkbox",
-                ] = equivalence_scales["checkbox"][eq]
-                df_graphers.loc[j, "subtitle"] = (
-                    f"The share of {welfare['welfare_type'][wel]} received by the {deciles10['ordinal'][dec10]} (tenth of the population). {welfare['subtitle'][wel]}"
+                df_graphers.append(
+                    {
+                        "title": f"{welfare['welfare_type'][wel].capitalize()} share of the {deciles10['ordinal'][dec10]} ({welfare['title'][wel]})",
+                        "ySlugs": f"share_{deciles10['lis_notation'][dec10]}_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}",
+                        "Indicator Dropdown": "Decile shares",
+                        "Decile Dropdown": deciles10["dropdown"][dec10],
+                        "Income measure Dropdown": f"{welfare['dropdown_option'][wel]}",
+                        "Period Radio": np.nan,
+                        "Adjust for cost sharing within households (equivalized income) Checkbox": equivalence_scales[
+                            "checkbox"
+                        ][
+                            eq
+                        ],
+                        "subtitle": f"The share of {welfare['welfare_type'][wel]} received by the {deciles10['ordinal'][dec10]} (tenth of the population). {welfare['subtitle'][wel]}",
+                        "note": equivalence_scales["note"][eq],
+                        "selectedFacetStrategy": np.nan,
+                        "hasMapTab": "true",
+                        "tab": "map",
+                    }
                 )
-                df_graphers.loc[j, "note"] = equivalence_scales["note"][eq]
-                df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-                df_graphers.loc[j, "hasMapTab"] = "true"
-                df_graphers.loc[j, "tab"] = "map"
-                j += 1
 
             # Shares - Multiple deciles
-            df_graphers.loc[j, "title"] = (
-                f"{welfare['welfare_type'][wel].capitalize()} share for each decile ({welfare['title'][wel]})"
-            )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"share_p10_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]} share_p20_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]} share_p30_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]} share_p40_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]} share_p50_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]} share_p60_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]} share_p70_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]} share_p80_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]} share_p90_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]} share_p100_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}"
-            )
-            df_graphers.loc[j, "Indicator Dropdown"] = "Decile shares"
-            df_graphers.loc[j, "Decile Dropdown"] = "All deciles"
-            df_graphers.loc[j, "Income measure Dropdown"] = (
-                f"{welfare['dropdown_option'][wel]}"
-            )
-            df_graphers.loc[j, "Period Radio"] = np.nan
-            df_graphers.loc[
-                j,
-                "Adjust for cost sharing within households (equivalized income) Checkbox",
-            ] = equivalence_scales["checkbox"][eq]
-            df_graphers.loc[j, "subtitle"] = (
-                f"The share of {welfare['welfare_type'][wel]} received by each decile (tenth of the population). {welfare['subtitle'][wel]}"
+            df_graphers.append(
+                {
+                    "title": f"{welfare['welfare_type'][wel].capitalize()} share for each decile ({welfare['title'][wel]})",
+                    "ySlugs": f"share_p10_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]} share_p20_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]} share_p30_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]} share_p40_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]} share_p50_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]} share_p60_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]} share_p70_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]} share_p80_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]} share_p90_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]} share_p100_{welfare['slug'][wel]}_{equivalence_scales['slug'][eq]}",
+                    "Indicator Dropdown": "Decile shares",
+                    "Decile Dropdown": "All deciles",
+                    "Income measure Dropdown": f"{welfare['dropdown_option'][wel]}",
+                    "Period Radio": np.nan,
+                    "Adjust for cost sharing within households (equivalized income) Checkbox": equivalence_scales[
+                        "checkbox"
+                    ][
+                        eq
+                    ],
+                    "subtitle": f"The share of {welfare['welfare_type'][wel]} received by each decile (tenth of the population). {welfare['subtitle'][wel]}",
+                    "note": equivalence_scales["note"][eq],
+                    "selectedFacetStrategy": "entity",
+                    "hasMapTab": "false",
+                    "tab": "chart",
+                }
             )
-            df_graphers.loc[j, "note"] = equivalence_scales["note"][eq]
-            df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-            df_graphers.loc[j, "hasMapTab"] = "false"
-            df_graphers.loc[j, "tab"] = "chart"
-            j += 1
 
         # BEFORE VS. AFTER TAX
         # Shares - Deciles
         for dec10 in range(len(deciles10)):
-            df_graphers.loc[j, "title"] = (
-                f"Income share of the {deciles10['ordinal'][dec10]} (after tax vs. before tax)"
+            df_graphers.append(
+                {
+                    "title": f"Income share of the {deciles10['ordinal'][dec10]} (after tax vs. before tax)",
+                    "ySlugs": f"share_{deciles10['lis_notation'][dec10]}_mi_{equivalence_scales['slug'][eq]} share_{deciles10['lis_notation'][dec10]}_dhi_{equivalence_scales['slug'][eq]}",
+                    "Indicator Dropdown": "Decile shares",
+                    "Decile Dropdown": deciles10["dropdown"][dec10],
+                    "Income measure Dropdown": "After tax vs. before tax",
+                    "Period Radio": np.nan,
+                    "Adjust for cost sharing within households (equivalized income) Checkbox": equivalence_scales[
+                        "checkbox"
+                    ][
+                        eq
+                    ],
+                    "subtitle": f"The share of income received by the {deciles10['ordinal'][dec10]} (tenth of the population).",
+                    "note": equivalence_scales["note"][eq],
+                    "selectedFacetStrategy": "entity",
+                    "hasMapTab": "false",
+                    "tab": "chart",
+                }
             )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"share_{deciles10['lis_notation'][dec10]}_mi_{equivalence_scales['slug'][eq]} share_{deciles10['lis_notation'][dec10]}_dhi_{equivalence_scales['slug'][eq]}"
-            )
-            df_graphers.loc[j, "Indicator Dropdown"] = "Decile shares"
-            df_graphers.loc[j, "Decile Dropdown"] = deciles10["dropdown"][dec10]
-            df_graphers.loc[j, "Income measure Dropdown"] = "After tax vs. before tax"
-            df_graphers.loc[j, "Period Radio"] = np.nan
-            df_graphers.loc[
-                j,
-                "Adjust for cost sharing within households (equivalized income) Checkbox",
-            ] = equivalence_scales["checkbox"][eq]
-            df_graphers.loc[j, "subtitle"] = (
-                f"The share of income received by the {deciles10['ordinal'][dec10]} (tenth of the population)."
-            )
-            df_graphers.loc[j, "note"] = equivalence_scales["note"][eq]
-            df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-            df_graphers.loc[j, "hasMapTab"] = "false"
-            df_graphers.loc[j, "tab"] = "chart"
-            j += 1
 
     df_graphers["tableSlug"] = tables["name"][tab]
 
+df_graphers = df_graphers.to_frame()
+
 # %% [markdown]
 # Final adjustments to the graphers table: add `relatedQuestion` link and `defaultView`:
 
@@ -918,29 +814,10 @@ df_graphers = df_graphers.drop(columns=["metric_dropdown_aux", "decile_dropdown_
 # Define list of variables to iterate: table names
 table_list = list(tables["name"].unique())
 
-# Header is converted into a tab-separated text
-header_tsv = df_header.to_csv(sep="\t", header=False)
-
-# Graphers table is converted into a tab-separated text
-graphers_tsv = df_graphers
-graphers_tsv = graphers_tsv.to_csv(sep="\t", index=False)
-
-# This table is indented, to follow explorers' format
-graphers_tsv_indented = textwrap.indent(graphers_tsv, "\t")
-
 # The dataframes are combined, including tables and links to the datasets
 with open(outfile, "w", newline="\n", encoding="utf-8") as f:
-    f.write(header_tsv)
-    f.write("\ngraphers\n" + graphers_tsv_indented)
-
-    for tab in range(len(tables)):
-        table_tsv = (
-            df_tables[df_tables["tableSlug"] == tables["name"][tab]]
-            .copy()
-            .reset_index(drop=True)
-        )
-        table_tsv = table_tsv.drop(columns=["tableSlug"])
-        table_tsv = table_tsv.to_csv(sep="\t", index=False)
-        table_tsv_indented = textwrap.indent(table_tsv, "\t")
-        f.write("\ntable\t" + tables["link"][tab] + "\t" + tables["name"][tab])
-        f.write("\ncolumns\t" + tables["name"][tab] + "\n" + table_tsv_indented)
+    explorer = ExplorerWriter(f)
+    explorer.write_header(df_header)
+    explorer.write_graphers(df_graphers)
+
+    explorer.write_tables(df_tables, "tableSlug", zip(tables["name"], tables["link"]))
@@ -0,0 +1,181 @@
+####################################################################################################
+# BUILD MANIFEST
+####################################################################################################
+"""
+Content-hash manifest used by build_all.py to skip the explorers whose inputs have not changed.
+
+For each explorer file, the manifest records a hash of everything the generator depends on:
+- the source of the generator and of the modules that shape its output (table_builder.py,
+  explorer_writer.py, descriptions.py, dimensions.py, spells.py and rewrites.py),
+- the values of the constants from common_parameters.py used by the generator or by the shared
+  modules (so updating the WID constants does not rebuild the PIP explorers, but updating NEW_LINE,
+  used by descriptions.py, rebuilds all of them),
+- the content of the Google sheets read by the generator.
+
+It also records the hash of the explorer file written, so an explorer edited or deleted by hand is
+built again. The manifest is stored in `.build_manifest.json`, in this folder.
+
+To check that changing any constant used by the shared modules makes all the explorers stale:
+
+python -m scripts.poverty-inequality-explorers.manifest
+"""
+
+import ast
+import hashlib
+import json
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+from . import common_parameters
+from .prefetch import find_sheets, generator_path
+
+MANIFEST_PATH = Path(__file__).parent / ".build_manifest.json"
+PARENT_DIR = Path(__file__).parent.parent.parent.absolute()
+
+# Shared modules that change the explorer files when they change
+OUTPUT_MODULES = [
+    "table_builder.py",
+    "explorer_writer.py",
+    "descriptions.py",
+    "dimensions.py",
+    "spells.py",
+    "rewrites.py",
+]
+
+
+def load_manifest():
+    """Return the manifest as a dictionary by explorer file, empty if it does not exist."""
+    if not MANIFEST_PATH.exists():
+        return {}
+    return json.loads(MANIFEST_PATH.read_text())
+
+
+def save_manifest(manifest):
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+
+
+def find_outfile(generator):
+    """Return the explorer file written by a generator, from its `outfile = ...` assignment."""
+    tree = ast.parse(generator_path(generator).read_text())
+    for statement in tree.body:
+        if (
+            isinstance(statement, ast.Assign)
+            and isinstance(statement.targets[0], ast.Name)
+            and statement.targets[0].id == "outfile"
+        ):
+            for node in ast.walk(statement.value):
+                if isinstance(node, ast.Constant) and str(node.value).endswith(".tsv"):
+                    return PARENT_DIR / "explorers" / node.value
+
+    raise ValueError(f"Could not find the explorer file written by {generator}")
+
+
+def inputs_hash(generator, sheet_contents):
+    """
+    Hash of the inputs of a generator. `sheet_contents` is a dictionary with the content of the
+    sheets by (sheet_id, sheet_name), as downloaded by `sheets.prefetch_sheets`.
+    """
+    source = generator_path(generator).read_text()
+    module_sources = [
+        (Path(__file__).parent / module).read_text() for module in OUTPUT_MODULES
+    ]
+    names = set().union(*(_used_names(text) for text in [source] + module_sources))
+    constants = {
+        name: repr(getattr(common_parameters, name))
+        for name in sorted(names)
+        if name.isupper() and hasattr(common_parameters, name)
+    }
+
+    digest = hashlib.sha256()
+    digest.update(source.encode())
+    for module_source in module_sources:
+        digest.update(module_source.encode())
+    digest.update(json.dumps(constants, sort_keys=True).encode())
+    for pair in find_sheets([generator]):
+        digest.update(json.dumps(pair).encode())
+        digest.update(hashlib.sha256(sheet_contents[pair]).digest())
+
+    return digest.hexdigest()
+
+
+def _used_names(source):
+    """Names used or imported in a source, including the attributes (`common_parameters.NAME`)."""
+    names = set()
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Name):
+            names.add(node.id)
+        elif isinstance(node, ast.Attribute):
+            names.add(node.attr)
+        elif isinstance(node, ast.ImportFrom):
+            names.update(alias.name for alias in node.names)
+    return names
+
+
+def file_hash(path):
+    """Hash of a file, or None if it does not exist."""
+    if not path.exists():
+        return None
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def is_up_to_date(manifest, generator, generator_inputs_hash):
+    """True if the explorer of a generator was built from the same inputs and was not changed since."""
+    outfile = find_outfile(generator)
+    entry = manifest.get(outfile.name)
+    return (
+        entry is not None
+        and entry["generator"] == generator
+        and entry["inputs"] == generator_inputs_hash
+        and entry["output"] == file_hash(outfile)
+    )
+
+
+def record_build(manifest, generator, generator_inputs_hash):
+    """Record in the manifest the explorer just written by a generator."""
+    outfile = find_outfile(generator)
+    manifest[outfile.name] = {
+        "generator": generator,
+        "inputs": generator_inputs_hash,
+        "output": file_hash(outfile),
+    }
+
+
+if __name__ == "__main__":
+    from .prefetch import GENERATORS
+
+    # The check does not need the sheets, only that their content is the same for both hashes
+    sheet_contents = defaultdict(bytes)
+    module_names = set().union(
+        *(
+            _used_names((Path(__file__).parent / module).read_text())
+            for module in OUTPUT_MODULES
+        )
+    )
+    shared_constants = sorted(
+        name
+        for name in module_names
+        if name.isupper() and hasattr(common_parameters, name)
+    )
+
+    hashes = {g: inputs_hash(g, sheet_contents) for g in GENERATORS}
+    not_stale = []
+    for name in shared_constants:
+        value = getattr(common_parameters, name)
+        setattr(common_parameters, name, (value, "changed"))
+        try:
+            not_stale += [
+                (name, g)
+                for g in GENERATORS
+                if inputs_hash(g, sheet_contents) == hashes[g]
+            ]
+        finally:
+            setattr(common_parameters, name, value)
+
+    for name, generator in not_stale:
+        print(f"{generator} is not rebuilt when {name} changes")
+    print(
+        f"{len(shared_constants)} constants of the shared modules checked "
+        f"({', '.join(shared_constants)}), {len(not_stale)} problems found"
+    )
+    sys.exit(len(not_stale) > 0)
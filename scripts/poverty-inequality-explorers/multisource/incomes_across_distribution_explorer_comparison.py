@@ -2,7 +2,6 @@
 # # Incomes Across the Distribution Explorer - Source Comparison
 # This code creates the tsv file for the incomes across the distribution comparison explorer, available [here](https://owid.cloud/admin/explorers/preview/incomes-across-distribution-comparison)
 
-import textwrap
 from pathlib import Path
 
 import numpy as np
@@ -11,6 +10,10 @@ import numpy as np
 import pandas as pd
 
 from ..common_parameters import *
+from ..descriptions import join_paragraphs
+from ..explorer_writer import ExplorerWriter
+from ..sheets import read_sheet
+from ..table_builder import TableBuilder
 
 PARENT_DIR = Path(__file__).parent.parent.parent.parent.absolute()
 outfile = (
@@ -28,14 +31,15 @@ sheet_id = "1wcFsNZCEn_6SJ05BFkXKLUyvCrnigfR8eeemGKgAYsI"
 
 # Merged sheet (this contains PIP, WID and LIS dataset information together in one file)
 sheet_name = "merged_tables"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-merged_tables = pd.read_csv(url, keep_default_na=False)
+merged_tables = read_sheet(sheet_id, sheet_name, keep_default_na=False)
 
 # Source checkbox covers all the possible combinations to get for the multi-source selector
 sheet_name = "source_checkbox"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-source_checkbox = pd.read_csv(
-    url, keep_default_na=False, dtype={"pip": "str", "wid": "str", "lis": "str"}
+source_checkbox = read_sheet(
+    sheet_id,
+    sheet_name,
+    keep_default_na=False,
+    dtype={"pip": "str", "wid": "str", "lis": "str"},
 )
 
 # Only get the combinations where all the sources are available (pre and post tax)
@@ -56,16 +60,20 @@ source_checkbox = source_checkbox[
 
 # Deciles9 sheet (needed to handle thresholds data)
 sheet_name = "deciles9"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-deciles9 = pd.read_csv(
-    url, keep_default_na=False, dtype={"dropdown": "str", "decile": "str"}
+deciles9 = read_sheet(
+    sheet_id,
+    sheet_name,
+    keep_default_na=False,
+    dtype={"dropdown": "str", "decile": "str"},
 )
 
 # Deciles10 sheet (needed to handle average and share data)
 sheet_name = "deciles10"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-deciles10 = pd.read_csv(
-    url, keep_default_na=False, dtype={"dropdown": "str", "decile": "str"}
+deciles10 = read_sheet(
+    sheet_id,
+    sheet_name,
+    keep_default_na=False,
+    dtype={"dropdown": "str", "decile": "str"},
 )
 
 # LUXEMBOURG INCOME STUDY
@@ -74,34 +82,28 @@ sheet_id = "1UFdwB1iBpP2tEP6GtxCHvW1GGhjsFflh42FWR80rYIg"
 
 # Welfare type sheet
 sheet_name = "welfare"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-lis_welfare = pd.read_csv(url, keep_default_na=False)
+lis_welfare = read_sheet(sheet_id, sheet_name, keep_default_na=False)
 
 # Equivalence scales
 sheet_name = "equivalence_scales"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-lis_equivalence_scales = pd.read_csv(url, keep_default_na=False)
+lis_equivalence_scales = read_sheet(sheet_id, sheet_name, keep_default_na=False)
 
 # Relative poverty sheet
 sheet_name = "povlines_rel"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-lis_povlines_rel = pd.read_csv(url)
+lis_povlines_rel = read_sheet(sheet_id, sheet_name)
 
 # Deciles9 sheet (needed to handle thresholds data)
 sheet_name = "deciles9"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-lis_deciles9 = pd.read_csv(url, keep_default_na=False)
+lis_deciles9 = read_sheet(sheet_id, sheet_name, keep_default_na=False)
 
 # Deciles10 sheet (needed to handle average and share data)
 sheet_name = "deciles10"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-lis_deciles10 = pd.read_csv(url, keep_default_na=False)
+lis_deciles10 = read_sheet(sheet_id, sheet_name, keep_default_na=False)
 
 # Income aggregation sheet (day, month, year)
 sheet_name = "income_aggregation"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-lis_income_aggregation = pd.read_csv(
-    url, keep_default_na=False, dtype={"multiplier": "str"}
+lis_income_aggregation = read_sheet(
+    sheet_id, sheet_name, keep_default_na=False, dtype={"multiplier": "str"}
 )
 
 # WORLD INEQUALITY DATABASE
@@ -110,24 +112,20 @@ sheet_id = "18T5IGnpyJwb8KL9USYvME6IaLEcYIo26ioHCpkDnwRQ"
 
 # Welfare type sheet
 sheet_name = "welfare"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-wid_welfare = pd.read_csv(url, keep_default_na=False)
+wid_welfare = read_sheet(sheet_id, sheet_name, keep_default_na=False)
 
 # Deciles9 sheet (needed to handle thresholds data)
 sheet_name = "deciles9"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-wid_deciles9 = pd.read_csv(url, keep_default_na=False)
+wid_deciles9 = read_sheet(sheet_id, sheet_name, keep_default_na=False)
 
 # Deciles10 sheet (needed to handle average and share data)
 sheet_name = "deciles10"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-wid_deciles10 = pd.read_csv(url, keep_default_na=False)
+wid_deciles10 = read_sheet(sheet_id, sheet_name, keep_default_na=False)
 
 # Income aggregation sheet (day, month, year)
 sheet_name = "income_aggregation"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-wid_income_aggregation = pd.read_csv(
-    url, keep_default_na=False, dtype={"multiplier": "str"}
+wid_income_aggregation = read_sheet(
+    sheet_id, sheet_name, keep_default_na=False, dtype={"multiplier": "str"}
 )
 
 # WORLD BANK POVERTY AND INEQUALITY PLATFORM
@@ -136,24 +134,24 @@ sheet_id = "17KJ9YcvfdmO_7-Sv2Ij0vmzAQI6rXSIqHfJtgFHN-a8"
 
 # Survey type sheet
 sheet_name = "table"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-pip_tables = pd.read_csv(url)
+pip_tables = read_sheet(sheet_id, sheet_name)
 
 # Settings for 10 deciles variables (share, avg) sheet
 sheet_name = "deciles10"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-pip_deciles10 = pd.read_csv(url, dtype={"dropdown": "str", "decile": "str"})
+pip_deciles10 = read_sheet(
+    sheet_id, sheet_name, dtype={"dropdown": "str", "decile": "str"}
+)
 
 # Settings for 9 deciles variables (thr) sheet
 sheet_name = "deciles9"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-pip_deciles9 = pd.read_csv(url, dtype={"dropdown": "str", "decile": "str"})
+pip_deciles9 = read_sheet(
+    sheet_id, sheet_name, dtype={"dropdown": "str", "decile": "str"}
+)
 
 # Income aggregation sheet (day, month, year)
 sheet_name = "income_aggregation"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-pip_income_aggregation = pd.read_csv(
-    url, keep_default_na=False, dtype={"multiplier": "str"}
+pip_income_aggregation = read_sheet(
+    sheet_id, sheet_name, keep_default_na=False, dtype={"multiplier": "str"}
 )
 
 # %% [markdown]
@@ -203,7 +201,6 @@ colorScaleNumericMinValue = COLOR_SCALE_NUMERIC_MIN_VALUE
 tolerance = TOLERANCE
 colorScaleEqualSizeBins = COLOR_SCALE_EQUAL_SIZEBINS
 tableSlug = "poverty_inequality"
-new_line = NEW_LINE
 
 additional_description = ADDITIONAL_DESCRIPTION_PIP_COMPARISON
 
@@ -213,235 +210,237 @@ processing_description = PROCESSING_DESCRIPTION_PIP_INCOMES_ACROSS_DISTRIBUTION
 ppp_description = PPP_DESCRIPTION_PIP_2017
 
 # Table generation
-df_tables_pip = pd.DataFrame()
-j = 0
+df_tables_pip = TableBuilder()
 
 for tab in range(len(pip_tables)):
     # Define country as entityName
-    df_tables_pip.loc[j, "name"] = "Country"
-    df_tables_pip.loc[j, "slug"] = "country"
-    df_tables_pip.loc[j, "type"] = "EntityName"
-    j += 1
+    df_tables_pip.append(
+        {
+            "name": "Country",
+            "slug": "country",
+            "type": "EntityName",
+        }
+    )
 
     # Define year as Year
-    df_tables_pip.loc[j, "name"] = "Year"
-    df_tables_pip.loc[j, "slug"] = "year"
-    df_tables_pip.loc[j, "type"] = "Year"
-    j += 1
+    df_tables_pip.append(
+        {
+            "name": "Year",
+            "slug": "year",
+            "type": "Year",
+        }
+    )
 
     # I need the original variables to not break the aggregations
     # mean
-    df_tables_pip.loc[j, "name"] = f"Mean {pip_tables.text[tab]} (PIP data)"
-    df_tables_pip.loc[j, "slug"] = "mean"
-    df_tables_pip.loc[j, "description"] = new_line.join(
-        [
-            f"Mean {pip_tables.text[tab]}.",
-            additional_description,
-            ppp_description,
-            notes_title,
-            processing_description,
-        ]
+    df_tables_pip.append(
+        {
+            "name": f"Mean {pip_tables.text[tab]} (PIP data)",
+            "slug": "mean",
+            "description": join_paragraphs(
+                [
+                    f"Mean {pip_tables.text[tab]}.",
+                    additional_description,
+                    ppp_description,
+                    notes_title,
+                    processing_description,
+                ]
+            ),
+            "unit": "international-$ in 2017 prices",
+            "shortUnit": "$",
+            "type": "Numeric",
+            "colorScaleNumericBins": "1;2;5;10;20;50;100;100.0001",
+            "colorScaleScheme": "BuGn",
+        }
     )
-    df_tables_pip.loc[j, "unit"] = "international-$ in 2017 prices"
-    df_tables_pip.loc[j, "shortUnit"] = "$"
-    df_tables_pip.loc[j, "type"] = "Numeric"
-    df_tables_pip.loc[j, "colorScaleNumericBins"] = "1;2;5;10;20;50;100;100.0001"
-    df_tables_pip.loc[j, "colorScaleScheme"] = "BuGn"
-    j += 1
 
     # median
-    df_tables_pip.loc[j, "name"] = f"Median {pip_tables.text[tab]} (PIP data)"
-    df_tables_pip.loc[j, "slug"] = "median"
-    df_tables_pip.loc[j, "description"] = new_line.join(
-        [
-            f"The level of {pip_tables.text[tab]} per day below which half of the population falls.",
-            additional_description,
-            ppp_description,
-            notes_title,
-            processing_description,
-        ]
+    df_tables_pip.append(
+        {
+            "name": f"Median {pip_tables.text[tab]} (PIP data)",
+            "slug": "median",
+            "description": join_paragraphs(
+                [
+                    f"The level of {pip_tables.text[tab]} per day below which half of the population falls.",
+                    additional_description,
+                    ppp_description,
+                    notes_title,
+                    processing_description,
+                ]
+            ),
+            "unit": "international-$ in 2017 prices",
+            "shortUnit": "$",
+            "type": "Numeric",
+            "colorScaleNumericBins": "1;2;5;10;20;50;100;100.0001",
+            "colorScaleScheme": "Blues",
+        }
     )
-    df_tables_pip.loc[j, "unit"] = "international-$ in 2017 prices"
-    df_tables_pip.loc[j, "shortUnit"] = "$"
-    df_tables_pip.loc[j, "type"] = "Numeric"
-    df_tables_pip.loc[j, "colorScaleNumericBins"] = "1;2;5;10;20;50;100;100.0001"
-    df_tables_pip.loc[j, "colorScaleScheme"] = "Blues"
-    j += 1
 
     for dec9 in range(len(pip_deciles9)):
         # thresholds
-        df_tables_pip.loc[j, "name"] = (
-            f"{pip_deciles9.ordinal[dec9].capitalize()} (PIP data)"
-        )
-        df_tables_pip.loc[j, "slug"] = f"decile{pip_deciles9.decile[dec9]}_thr"
-        df_tables_pip.loc[j, "description"] = new_line.join(
-            [
-                f"The level of {pip_tables.text[tab]} per day below which {pip_deciles9.decile[dec9]}0% of the population falls.",
-                additional_description,
-                ppp_description,
-                notes_title,
-                processing_description,
-            ]
+        df_tables_pip.append(
+            {
+                "name": f"{pip_deciles9.ordinal[dec9].capitalize()} (PIP data)",
+                "slug": f"decile{pip_deciles9.decile[dec9]}_thr",
+                "description": join_paragraphs(
+                    [
+                        f"The level of {pip_tables.text[tab]} per day below which {pip_deciles9.decile[dec9]}0% of the population falls.",
+                        additional_description,
+                        ppp_description,
+                        notes_title,
+                        processing_description,
+                    ]
+                ),
+                "unit": "international-$ in 2017 prices",
+                "shortUnit": "$",
+                "type": "Numeric",
+                "colorScaleNumericBins": "1;2;5;10;20;50;100;100.0001",
+                "colorScaleScheme": "Purples",
+            }
         )
-        df_tables_pip.loc[j, "unit"] = "international-$ in 2017 prices"
-        df_tables_pip.loc[j, "shortUnit"] = "$"
-        df_tables_pip.loc[j, "type"] = "Numeric"
-        df_tables_pip.loc[j, "colorScaleNumericBins"] = "1;2;5;10;20;50;100;100.0001"
-        df_tables_pip.loc[j, "colorScaleScheme"] = "Purples"
-        j += 1
 
     for dec10 in range(len(pip_deciles10)):
         # averages
-        df_tables_pip.loc[j, "name"] = (
-            f"{pip_deciles10.ordinal[dec10].capitalize()} (PIP data)"
-        )
-        df_tables_pip.loc[j, "slug"] = f"decile{pip_deciles10.decile[dec10]}_avg"
-        df_tables_pip.loc[j, "description"] = new_line.join(
-            [
-                f"The mean {pip_tables.text[tab]} per day within the {pip_deciles10.ordinal[dec10]} (tenth of the population).",
-                additional_description,
-                ppp_description,
-                notes_title,
-                processing_description,
-            ]
+        df_tables_pip.append(
+            {
+                "name": f"{pip_deciles10.ordinal[dec10].capitalize()} (PIP data)",
+                "slug": f"decile{pip_deciles10.decile[dec10]}_avg",
+                "description": join_paragraphs(
+                    [
+                        f"The mean {pip_tables.text[tab]} per day within the {pip_deciles10.ordinal[dec10]} (tenth of the population).",
+                        additional_description,
+                        ppp_description,
+                        notes_title,
+                        processing_description,
+                    ]
+                ),
+                "unit": "international-$ in 2017 prices",
+                "shortUnit": "$",
+                "type": "Numeric",
+                "colorScaleNumericBins": "1;2;5;10;20;50;100;100.0001",
+                "colorScaleScheme": "Greens",
+            }
         )
-        df_tables_pip.loc[j, "unit"] = "international-$ in 2017 prices"
-        df_tables_pip.loc[j, "shortUnit"] = "$"
-        df_tables_pip.loc[j, "type"] = "Numeric"
-        df_tables_pip.loc[j, "colorScaleNumericBins"] = "1;2;5;10;20;50;100;100.0001"
-        df_tables_pip.loc[j, "colorScaleScheme"] = "Greens"
-        j += 1
 
     for dec10 in range(len(pip_deciles10)):
         # shares
-        df_tables_pip.loc[j, "name"] = (
-            f"{pip_deciles10.ordinal[dec10].capitalize()} (PIP data)"
-        )
-        df_tables_pip.loc[j, "slug"] = f"decile{pip_deciles10.decile[dec10]}_share"
-        df_tables_pip.loc[j, "description"] = new_line.join(
-            [
-                f"The share of {pip_tables.text[tab]} received by the {pip_deciles10.ordinal[dec10]} (tenth of the population).",
-                additional_description,
-                notes_title,
-                processing_description,
-            ]
+        df_tables_pip.append(
+            {
+                "name": f"{pip_deciles10.ordinal[dec10].capitalize()} (PIP data)",
+                "slug": f"decile{pip_deciles10.decile[dec10]}_share",
+                "description": join_paragraphs(
+                    [
+                        f"The share of {pip_tables.text[tab]} received by the {pip_deciles10.ordinal[dec10]} (tenth of the population).",
+                        additional_description,
+                        notes_title,
+                        processing_description,
+                    ]
+                ),
+                "unit": "%",
+                "shortUnit": "%",
+                "type": "Numeric",
+                "colorScaleNumericBins": pip_deciles10.scale_share[dec10],
+                "colorScaleScheme": "OrRd",
+            }
         )
-        df_tables_pip.loc[j, "unit"] = "%"
-        df_tables_pip.loc[j, "shortUnit"] = "%"
-        df_tables_pip.loc[j, "type"] = "Numeric"
-        df_tables_pip.loc[j, "colorScaleNumericBins"] = pip_deciles10.scale_share[dec10]
-        df_tables_pip.loc[j, "colorScaleScheme"] = "OrRd"
-        j += 1
 
     # Daily, monthly, annual aggregations
     for agg in range(len(pip_income_aggregation)):
         # mean
-        df_tables_pip.loc[j, "name"] = f"Mean {pip_tables.text[tab]} (PIP data)"
-        df_tables_pip.loc[j, "slug"] = f"mean{pip_income_aggregation.slug_suffix[agg]}"
-        df_tables_pip.loc[j, "description"] = new_line.join(
-            [
-                f"The mean level of {pip_tables.text[tab]} per {pip_income_aggregation.aggregation[agg]}.",
-                additional_description,
-                ppp_description,
-                notes_title,
-                processing_description,
-            ]
-        )
-        df_tables_pip.loc[j, "unit"] = "international-$ in 2017 prices"
-        df_tables_pip.loc[j, "shortUnit"] = "$"
-        df_tables_pip.loc[j, "type"] = "Numeric"
-        df_tables_pip.loc[j, "colorScaleNumericBins"] = pip_income_aggregation.scale[
-            agg
-        ]
-        df_tables_pip.loc[j, "colorScaleScheme"] = "BuGn"
-        df_tables_pip.loc[j, "transform"] = (
-            f"multiplyBy mean {pip_income_aggregation.multiplier[agg]}"
+        df_tables_pip.append(
+            {
+                "name": f"Mean {pip_tables.text[tab]} (PIP data)",
+                "slug": f"mean{pip_income_aggregation.slug_suffix[agg]}",
+                "description": join_paragraphs(
+                    [
+                        f"The mean level of {pip_tables.text[tab]} per {pip_income_aggregation.aggregation[agg]}.",
+                        additional_description,
+                        ppp_description,
+                        notes_title,
+                        processing_description,
+                    ]
+                ),
+                "unit": "international-$ in 2017 prices",
+                "shortUnit": "$",
+                "type": "Numeric",
+                "colorScaleNumericBins": pip_income_aggregation.scale[agg],
+                "colorScaleScheme": "BuGn",
+                "transform": f"multiplyBy mean {pip_income_aggregation.multiplier[agg]}",
+            }
         )
-        j += 1
 
         # median
-        df_tables_pip.loc[j, "name"] = f"Median {pip_tables.text[tab]} (PIP data)"
-        df_tables_pip.loc[j, "slug"] = (
-            f"median{pip_income_aggregation.slug_suffix[agg]}"
-        )
-        df_tables_pip.loc[j, "description"] = new_line.join(
-            [
-                f"The level of {pip_tables.text[tab]} per {pip_income_aggregation.aggregation[agg]} below which half of the population falls.",
-                additional_description,
-                ppp_description,
-                notes_title,
-                processing_description,
-            ]
-        )
-        df_tables_pip.loc[j, "unit"] = "international-$ in 2017 prices"
-        df_tables_pip.loc[j, "shortUnit"] = "$"
-        df_tables_pip.loc[j, "type"] = "Numeric"
-        df_tables_pip.loc[j, "colorScaleNumericBins"] = pip_income_aggregation.scale[
-            agg
-        ]
-        df_tables_pip.loc[j, "colorScaleScheme"] = "Blues"
-        df_tables_pip.loc[j, "transform"] = (
-            f"multiplyBy median {pip_income_aggregation.multiplier[agg]}"
+        df_tables_pip.append(
+            {
+                "name": f"Median {pip_tables.text[tab]} (PIP data)",
+                "slug": f"median{pip_income_aggregation.slug_suffix[agg]}",
+                "description": join_paragraphs(
+                    [
+                        f"The level of {pip_tables.text[tab]} per {pip_income_aggregation.aggregation[agg]} below which half of the population falls.",
+                        additional_description,
+                        ppp_description,
+                        notes_title,
+                        processing_description,
+                    ]
+                ),
+                "unit": "international-$ in 2017 prices",
+                "shortUnit": "$",
+                "type": "Numeric",
+                "colorScaleNumericBins": pip_income_aggregation.scale[agg],
+                "colorScaleScheme": "Blues",
+                "transform": f"multiplyBy median {pip_income_aggregation.multiplier[agg]}",
+            }
         )
-        j += 1
 
         for dec9 in range(len(pip_deciles9)):
             # thresholds
-            df_tables_pip.loc[j, "name"] = (
-                f"{pip_deciles9.ordinal[dec9].capitalize()} (PIP data)"
-            )
-            df_tables_pip.loc[j, "slug"] = (
-                f"decile{pip_deciles9.decile[dec9]}_thr{pip_income_aggregation.slug_suffix[agg]}"
-            )
-            df_tables_pip.loc[j, "description"] = new_line.join(
-                [
-                    f"The level of {pip_tables.text[tab]} per {pip_income_aggregation.aggregation[agg]} below which {pip_deciles9.decile[dec9]}0% of the population falls.",
-                    additional_description,
-                    ppp_description,
-                    notes_title,
-                    processing_description,
-                ]
-            )
-            df_tables_pip.loc[j, "unit"] = "international-$ in 2017 prices"
-            df_tables_pip.loc[j, "shortUnit"] = "$"
-            df_tables_pip.loc[j, "type"] = "Numeric"
-            df_tables_pip.loc[j, "colorScaleNumericBins"] = (
-                pip_income_aggregation.scale[agg]
-            )
-            df_tables_pip.loc[j, "colorScaleScheme"] = "Purples"
-            df_tables_pip.loc[j, "transform"] = (
-                f"multiplyBy decile{pip_deciles9.decile[dec9]}_thr {pip_income_aggregation.multiplier[agg]}"
+            df_tables_pip.append(
+                {
+                    "name": f"{pip_deciles9.ordinal[dec9].capitalize()} (PIP data)",
+                    "slug": f"decile{pip_deciles9.decile[dec9]}_thr{pip_income_aggregation.slug_suffix[agg]}",
+                    "description": join_paragraphs(
+                        [
+                            f"The level of {pip_tables.text[tab]} per {pip_income_aggregation.aggregation[agg]} below which {pip_deciles9.decile[dec9]}0% of the population falls.",
+                            additional_description,
+                            ppp_description,
+                            notes_title,
+                            processing_description,
+                        ]
+                    ),
+                    "unit": "international-$ in 2017 prices",
+                    "shortUnit": "$",
+                    "type": "Numeric",
+                    "colorScaleNumericBins": pip_income_aggregation.scale[agg],
+                    "colorScaleScheme": "Purples",
+                    "transform": f"multiplyBy decile{pip_deciles9.decile[dec9]}_thr {pip_income_aggregation.multiplier[agg]}",
+                }
             )
-            j += 1
 
         for dec10 in range(len(pip_deciles10)):
             # averages
-            df_tables_pip.loc[j, "name"] = (
-                f"{pip_deciles10.ordinal[dec10].capitalize()} (PIP data)"
-            )
-            df_tables_pip.loc[j, "slug"] = (
-                f"decile{pip_deciles10.decile[dec10]}_avg{pip_income_aggregation.slug_suffix[agg]}"
-            )
-            df_tables_pip.loc[j, "description"] = new_line.join(
-                [
-                    f"The mean {pip_tables.text[tab]} per {pip_income_aggregation.aggregation[agg]} within the {pip_deciles10.ordinal[dec10]} (tenth of the population).",
-                    additional_description,
-                    ppp_description,
-                    notes_title,
-                    processing_description,
-                ]
-            )
-            df_tables_pip.loc[j, "unit"] = "international-$ in 2017 prices"
-            df_tables_pip.loc[j, "shortUnit"] = "$"
-            df_tables_pip.loc[j, "type"] = "Numeric"
-            df_tables_pip.loc[j, "colorScaleNumericBins"] = (
-                pip_income_aggregation.scale[agg]
-            )
-            df_tables_pip.loc[j, "colorScaleScheme"] = "Greens"
-            df_tables_pip.loc[j, "transform"] = (
-                f"multiplyBy decile{pip_deciles10.decile[dec10]}_avg {pip_income_aggregation.multiplier[agg]}"
+            df_tables_pip.append(
+                {
+                    "name": f"{pip_deciles10.ordinal[dec10].capitalize()} (PIP data)",
+                    "slug": f"decile{pip_deciles10.decile[dec10]}_avg{pip_income_aggregation.slug_suffix[agg]}",
+                    "description": join_paragraphs(
+                        [
+                            f"The mean {pip_tables.text[tab]} per {pip_income_aggregation.aggregation[agg]} within the {pip_deciles10.ordinal[dec10]} (tenth of the population).",
+                            additional_description,
+                            ppp_description,
+                            notes_title,
+                            processing_description,
+                        ]
+                    ),
+                    "unit": "international-$ in 2017 prices",
+                    "shortUnit": "$",
+                    "type": "Numeric",
+                    "colorScaleNumericBins": pip_income_aggregation.scale[agg],
+                    "colorScaleScheme": "Greens",
+                    "transform": f"multiplyBy decile{pip_deciles10.decile[dec10]}_avg {pip_income_aggregation.multiplier[agg]}",
+                }
             )
-            j += 1
+
+df_tables_pip = df_tables_pip.to_frame()
 
 df_tables_pip["tableSlug"] = tableSlug
 df_tables_pip["sourceName"] = sourceName
@@ -463,13 +462,11 @@ sourceLink = SOURCE_LINK_WID
 colorScaleNumericMinValue = COLOR_SCALE_NUMERIC_MIN_VALUE
 tolerance = TOLERANCE
 colorScaleEqualSizeBins = COLOR_SCALE_EQUAL_SIZEBINS
-new_line = NEW_LINE
 
 additional_description = ADDITIONAL_DESCRIPTION_WID
 ppp_description = PPP_DESCRIPTION_WID
 
-df_tables_wid = pd.DataFrame()
-j = 0
+df_tables_wid = TableBuilder()
 
 for tab in range(len(merged_tables)):
     for wel in range(len(wid_welfare)):
@@ -481,237 +478,208 @@ for tab in range(len(merged_tables)):
 
         # I need the original variables to not break the aggregations
         # Mean
-        df_tables_wid.loc[j, "name"] = (
-            f"Mean {wid_welfare['welfare_type'][wel]} (WID data)"
-        )
-        df_tables_wid.loc[j, "slug"] = f"p0p100_avg_{wid_welfare['slug'][wel]}"
-        df_tables_wid.loc[j, "description"] = new_line.join(
-            [
-                f"Mean {wid_welfare['welfare_type'][wel]}",
-                wid_welfare["description"][wel],
-                ppp_description,
-                additional_description,
-            ]
+        df_tables_wid.append(
+            {
+                "name": f"Mean {wid_welfare['welfare_type'][wel]} (WID data)",
+                "slug": f"p0p100_avg_{wid_welfare['slug'][wel]}",
+                "description": join_paragraphs(
+                    [
+                        f"Mean {wid_welfare['welfare_type'][wel]}",
+                        wid_welfare["description"][wel],
+                        ppp_description,
+                        additional_description,
+                    ]
+                ),
+                "unit": f"international-$ in {PPP_YEAR_WID} prices",
+                "shortUnit": "$",
+                "type": "Numeric",
+                # "colorScaleNumericBins": wid_welfare['scale_mean'][wel],
+                "colorScaleScheme": "BuGn",
+            }
         )
-        df_tables_wid.loc[j, "unit"] = f"international-$ in {PPP_YEAR_WID} prices"
-        df_tables_wid.loc[j, "shortUnit"] = "$"
-        df_tables_wid.loc[j, "type"] = "Numeric"
-        # df_tables_wid.loc[j, "colorScaleNumericBins"] = wid_welfare["scale_mean"][wel]
-        df_tables_wid.loc[j, "colorScaleScheme"] = "BuGn"
-        j += 1
 
         # Median
-        df_tables_wid.loc[j, "name"] = (
-            f"Median {wid_welfare['welfare_type'][wel]} (WID data)"
-        )
-        df_tables_wid.loc[j, "slug"] = f"median_{wid_welfare['slug'][wel]}"
-        df_tables_wid.loc[j, "description"] = new_line.join(
-            [
-                f"This is the level of {wid_welfare['welfare_type'][wel]} below which half of the population falls.",
-                wid_welfare["description"][wel],
-                ppp_description,
-                additional_description,
-            ]
+        df_tables_wid.append(
+            {
+                "name": f"Median {wid_welfare['welfare_type'][wel]} (WID data)",
+                "slug": f"median_{wid_welfare['slug'][wel]}",
+                "description": join_paragraphs(
+                    [
+                        f"This is the level of {wid_welfare['welfare_type'][wel]} below which half of the population falls.",
+                        wid_welfare["description"][wel],
+                        ppp_description,
+                        additional_description,
+                    ]
+                ),
+                "unit": f"international-$ in {PPP_YEAR_WID} prices",
+                "shortUnit": "$",
+                "type": "Numeric",
+                # "colorScaleNumericBins": wid_welfare['scale_median'][wel],
+                "colorScaleScheme": "Blues",
+            }
         )
-        df_tables_wid.loc[j, "unit"] = f"international-$ in {PPP_YEAR_WID} prices"
-        df_tables_wid.loc[j, "shortUnit"] = "$"
-        df_tables_wid.loc[j, "type"] = "Numeric"
-        # df_tables_wid.loc[j, "colorScaleNumericBins"] = wid_welfare["scale_median"][wel]
-        df_tables_wid.loc[j, "colorScaleScheme"] = "Blues"
-        j += 1
 
         # Thresholds - Deciles
         for dec9 in range(len(wid_deciles9)):
-            df_tables_wid.loc[j, "name"] = (
-                f"{wid_deciles9['ordinal'][dec9].capitalize()} (WID data)"
-            )
-            df_tables_wid.loc[j, "slug"] = (
-                f"{wid_deciles9['wid_notation'][dec9]}_thr_{wid_welfare['slug'][wel]}"
-            )
-            df_tables_wid.loc[j, "description"] = new_line.join(
-                [
-                    f"The level of {wid_welfare['welfare_type'][wel]} below which {wid_deciles9['decile'][dec9]}0% of the population falls.",
-                    wid_welfare["description"][wel],
-                    ppp_description,
-                    additional_description,
-                ]
+            df_tables_wid.append(
+                {
+                    "name": f"{wid_deciles9['ordinal'][dec9].capitalize()} (WID data)",
+                    "slug": f"{wid_deciles9['wid_notation'][dec9]}_thr_{wid_welfare['slug'][wel]}",
+                    "description": join_paragraphs(
+                        [
+                            f"The level of {wid_welfare['welfare_type'][wel]} below which {wid_deciles9['decile'][dec9]}0% of the population falls.",
+                            wid_welfare["description"][wel],
+                            ppp_description,
+                            additional_description,
+                        ]
+                    ),
+                    "unit": f"international-$ in {PPP_YEAR_WID} prices",
+                    "shortUnit": "$",
+                    "type": "Numeric",
+                    # "colorScaleNumericBins": wid_deciles9['scale_thr'][dec9],
+                    "colorScaleScheme": "Purples",
+                }
             )
-            df_tables_wid.loc[j, "unit"] = f"international-$ in {PPP_YEAR_WID} prices"
-            df_tables_wid.loc[j, "shortUnit"] = "$"
-            df_tables_wid.loc[j, "type"] = "Numeric"
-            # df_tables_wid.loc[j, "colorScaleNumericBins"] = wid_deciles9["scale_thr"][
-            #     dec9
-            # ]
-            df_tables_wid.loc[j, "colorScaleScheme"] = "Purples"
-            j += 1
 
         # Averages - Deciles
         for dec10 in range(len(wid_deciles10)):
-            df_tables_wid.loc[j, "name"] = (
-                f"{wid_deciles10['ordinal'][dec10].capitalize()} (WID data)"
-            )
-            df_tables_wid.loc[j, "slug"] = (
-                f"{wid_deciles10['wid_notation'][dec10]}_avg_{wid_welfare['slug'][wel]}"
-            )
-            df_tables_wid.loc[j, "description"] = new_line.join(
-                [
-                    f"The mean {wid_welfare['welfare_type'][wel]} within the {wid_deciles10['ordinal'][dec10]} (tenth of the population).",
-                    wid_welfare["description"][wel],
-                    ppp_description,
-                    additional_description,
-                ]
+            df_tables_wid.append(
+                {
+                    "name": f"{wid_deciles10['ordinal'][dec10].capitalize()} (WID data)",
+                    "slug": f"{wid_deciles10['wid_notation'][dec10]}_avg_{wid_welfare['slug'][wel]}",
+                    "description": join_paragraphs(
+                        [
+                            f"The mean {wid_welfare['welfare_type'][wel]} within the {wid_deciles10['ordinal'][dec10]} (tenth of the population).",
+                            wid_welfare["description"][wel],
+                            ppp_description,
+                            additional_description,
+                        ]
+                    ),
+                    "unit": f"international-$ in {PPP_YEAR_WID} prices",
+                    "shortUnit": "$",
+                    "type": "Numeric",
+                    # "colorScaleNumericBins": wid_deciles10['scale_avg'][dec10],
+                    "colorScaleScheme": "Greens",
+                }
             )
-            df_tables_wid.loc[j, "unit"] = f"international-$ in {PPP_YEAR_WID} prices"
-            df_tables_wid.loc[j, "shortUnit"] = "$"
-            df_tables_wid.loc[j, "type"] = "Numeric"
-            # df_tables_wid.loc[j, "colorScaleNumericBins"] = wid_deciles10["scale_avg"][
-            #     dec10
-            # ]
-            df_tables_wid.loc[j, "colorScaleScheme"] = "Greens"
-            j += 1
 
         # Shares - Deciles
         for dec10 in range(len(wid_deciles10)):
-            df_tables_wid.loc[j, "name"] = (
-                f"{wid_deciles10['ordinal'][dec10].capitalize()} (WID data)"
-            )
-            df_tables_wid.loc[j, "slug"] = (
-                f"{wid_deciles10['wid_notation'][dec10]}_share_{wid_welfare['slug'][wel]}"
-            )
-            df_tables_wid.loc[j, "description"] = new_line.join(
-                [
-                    f"The share of {wid_welfare['welfare_type'][wel]} received by the {wid_deciles10['ordinal'][dec10]} (tenth of the population).",
-                    wid_welfare["description"][wel],
-                    additional_description,
-                ]
+            df_tables_wid.append(
+                {
+                    "name": f"{wid_deciles10['ordinal'][dec10].capitalize()} (WID data)",
+                    "slug": f"{wid_deciles10['wid_notation'][dec10]}_share_{wid_welfare['slug'][wel]}",
+                    "description": join_paragraphs(
+                        [
+                            f"The share of {wid_welfare['welfare_type'][wel]} received by the {wid_deciles10['ordinal'][dec10]} (tenth of the population).",
+                            wid_welfare["description"][wel],
+                            additional_description,
+                        ]
+                    ),
+                    "unit": "%",
+                    "shortUnit": "%",
+                    "type": "Numeric",
+                    # "colorScaleNumericBins": wid_deciles10['scale_share'][dec10],
+                    "colorScaleScheme": "OrRd",
+                }
             )
-            df_tables_wid.loc[j, "unit"] = "%"
-            df_tables_wid.loc[j, "shortUnit"] = "%"
-            df_tables_wid.loc[j, "type"] = "Numeric"
-            # df_tables_wid.loc[j, "colorScaleNumericBins"] = wid_deciles10[
-            #     "scale_share"
-            # ][dec10]
-            df_tables_wid.loc[j, "colorScaleScheme"] = "OrRd"
-            j += 1
 
         # Daily, monthly, annual aggregations
         for agg in range(len(wid_income_aggregation)):
             # Mean
-            df_tables_wid.loc[j, "name"] = (
-                f"Mean {wid_welfare['welfare_type'][wel]} (WID data)"
-            )
-            df_tables_wid.loc[j, "slug"] = (
-                f"p0p100_avg_{wid_welfare['slug'][wel]}{wid_income_aggregation['slug_suffix'][agg]}"
-            )
-            df_tables_wid.loc[j, "description"] = new_line.join(
-                [
-                    f"Mean {wid_welfare['welfare_type'][wel]}.",
-                    wid_welfare["description"][wel],
-                    ppp_description,
-                    additional_description,
-                ]
-            )
-            df_tables_wid.loc[j, "unit"] = f"international-$ in {PPP_YEAR_WID} prices"
-            df_tables_wid.loc[j, "shortUnit"] = "$"
-            df_tables_wid.loc[j, "type"] = "Numeric"
-            # df_tables_wid.loc[j, "colorScaleNumericBins"] = wid_welfare["scale_mean"][
-            #     wel
-            # ]
-            df_tables_wid.loc[j, "colorScaleScheme"] = "BuGn"
-            df_tables_wid.loc[j, "transform"] = (
-                f"multiplyBy p0p100_avg_{wid_welfare['slug'][wel]} {wid_income_aggregation['multiplier'][agg]}"
+            df_tables_wid.append(
+                {
+                    "name": f"Mean {wid_welfare['welfare_type'][wel]} (WID data)",
+                    "slug": f"p0p100_avg_{wid_welfare['slug'][wel]}{wid_income_aggregation['slug_suffix'][agg]}",
+                    "description": join_paragraphs(
+                        [
+                            f"Mean {wid_welfare['welfare_type'][wel]}.",
+                            wid_welfare["description"][wel],
+                            ppp_description,
+                            additional_description,
+                        ]
+                    ),
+                    "unit": f"international-$ in {PPP_YEAR_WID} prices",
+                    "shortUnit": "$",
+                    "type": "Numeric",
+                    # "colorScaleNumericBins": wid_welfare['scale_mean'][wel],
+                    "colorScaleScheme": "BuGn",
+                    "transform": f"multiplyBy p0p100_avg_{wid_welfare['slug'][wel]} {wid_income_aggregation['multiplier'][agg]}",
+                }
             )
-            j += 1
 
             # Median
-            df_tables_wid.loc[j, "name"] = (
-                f"Median {wid_welfare['welfare_type'][wel]} (WID data)"
-            )
-            df_tables_wid.loc[j, "slug"] = (
-                f"median_{wid_welfare['slug'][wel]}{wid_income_aggregation['slug_suffix'][agg]}"
-            )
-            df_tables_wid.loc[j, "description"] = new_line.join(
-                [
-                    f"This is the level of {wid_welfare['welfare_type'][wel]} below which 50% of the population falls.",
-                    wid_welfare["description"][wel],
-                    ppp_description,
-                    additional_description,
-                ]
-            )
-            df_tables_wid.loc[j, "unit"] = f"international-$ in {PPP_YEAR_WID} prices"
-            df_tables_wid.loc[j, "shortUnit"] = "$"
-            df_tables_wid.loc[j, "type"] = "Numeric"
-            # df_tables_wid.loc[j, "colorScaleNumericBins"] = wid_welfare["scale_median"][
-            #     wel
-            # ]
-            df_tables_wid.loc[j, "colorScaleScheme"] = "Blues"
-            df_tables_wid.loc[j, "transform"] = (
-                f"multiplyBy median_{wid_welfare['slug'][wel]} {wid_income_aggregation['multiplier'][agg]}"
+            df_tables_wid.append(
+                {
+                    "name": f"Median {wid_welfare['welfare_type'][wel]} (WID data)",
+                    "slug": f"median_{wid_welfare['slug'][wel]}{wid_income_aggregation['slug_suffix'][agg]}",
+                    "description": join_paragraphs(
+                        [
+                            f"This is the level of {wid_welfare['welfare_type'][wel]} below which 50% of the population falls.",
+                            wid_welfare["description"][wel],
+                            ppp_description,
+                            additional_description,
+                        ]
+                    ),
+                    "unit": f"international-$ in {PPP_YEAR_WID} prices",
+                    "shortUnit": "$",
+                    "type": "Numeric",
+                    # "colorScaleNumericBins": wid_welfare['scale_median'][wel],
+                    "colorScaleScheme": "Blues",
+                    "transform": f"multiplyBy median_{wid_welfare['slug'][wel]} {wid_income_aggregation['multiplier'][agg]}",
+                }
             )
-            j += 1
 
             # Thresholds - Deciles
             for dec9 in range(len(wid_deciles9)):
-                df_tables_wid.loc[j, "name"] = (
-                    f"{wid_deciles9['ordinal'][dec9].capitalize()} (WID data)"
-                )
-                df_tables_wid.loc[j, "slug"] = (
-                    f"{wid_deciles9['wid_notation'][dec9]}_thr_{wid_welfare['slug'][wel]}{wid_income_aggregation['slug_suffix'][agg]}"
-                )
-                df_tables_wid.loc[j, "description"] = new_line.join(
-                    [
-                        f"The level of {wid_welfare['welfare_type'][wel]} below which {wid_deciles9['decile'][dec9]}0% of the population falls.",
-                        wid_welfare["description"][wel],
-                        ppp_description,
-                        additional_description,
-                    ]
-                )
-                df_tables_wid.loc[j, "unit"] = (
-                    f"international-$ in {PPP_YEAR_WID} prices"
-                )
-                df_tables_wid.loc[j, "shortUnit"] = "$"
-                df_tables_wid.loc[j, "type"] = "Numeric"
-                # df_tables_wid.loc[j, "colorScaleNumericBins"] = wid_deciles9[
-                #     "scale_thr"
-                # ][dec9]
-                df_tables_wid.loc[j, "colorScaleScheme"] = "Purples"
-                df_tables_wid.loc[j, "transform"] = (
-                    f"multiplyBy {wid_deciles9['wid_notation'][dec9]}_thr_{wid_welfare['slug'][wel]} {wid_income_aggregation['multiplier'][agg]}"
+                df_tables_wid.append(
+                    {
+                        "name": f"{wid_deciles9['ordinal'][dec9].capitalize()} (WID data)",
+                        "slug": f"{wid_deciles9['wid_notation'][dec9]}_thr_{wid_welfare['slug'][wel]}{wid_income_aggregation['slug_suffix'][agg]}",
+                        "description": join_paragraphs(
+                            [
+                                f"The level of {wid_welfare['welfare_type'][wel]} below which {wid_deciles9['decile'][dec9]}0% of the population falls.",
+                                wid_welfare["description"][wel],
+                                ppp_description,
+                                additional_description,
+                            ]
+                        ),
+                        "unit": f"international-$ in {PPP_YEAR_WID} prices",
+                        "shortUnit": "$",
+                        "type": "Numeric",
+                        # "colorScaleNumericBins": wid_deciles9['scale_thr'][dec9],
+                        "colorScaleScheme": "Purples",
+                        "transform": f"multiplyBy {wid_deciles9['wid_notation'][dec9]}_thr_{wid_welfare['slug'][wel]} {wid_income_aggregation['multiplier'][agg]}",
+                    }
                 )
-                j += 1
 
             # Averages - Deciles
             for dec10 in range(len(wid_deciles10)):
-                df_tables_wid.loc[j, "name"] = (
-                    f"{wid_deciles10['ordinal'][dec10].capitalize()} (WID data)"
+                df_tables_wid.append(
+                    {
+                        "name": f"{wid_deciles10['ordinal'][dec10].capitalize()} (WID data)",
+                        "slug": f"{wid_deciles10['wid_notation'][dec10]}_avg_{wid_welfare['slug'][wel]}{wid_income_aggregation['slug_suffix'][agg]}",
+                        "description": join_paragraphs(
+                            [
+                                f"The mean {wid_welfare['welfare_type'][wel]} within the {wid_deciles10['ordinal'][dec10]} (tenth of the population).",
+                                wid_welfare["description"][wel],
+                                ppp_description,
+                                additional_description,
+                            ]
+                        ),
+                        "unit": f"international-$ in {PPP_YEAR_WID} prices",
+                        "shortUnit": "$",
+                        "type": "Numeric",
+                        # "colorScaleNumericBins": wid_deciles10['scale_avg'][dec10],
+                        "colorScaleScheme": "Greens",
+                        "transform": f"multiplyBy {wid_deciles10['wid_notation'][dec10]}_avg_{wid_welfare['slug'][wel]} {wid_income_aggregation['multiplier'][agg]}",
+                    }
                 )
-                df_tables_wid.loc[j, "slug"] = (
-                    f"{wid_deciles10['wid_notation'][dec10]}_avg_{wid_welfare['slug'][wel]}{wid_income_aggregation['slug_suffix'][agg]}"
-                )
-                df_tables_wid.loc[j, "description"] = new_line.join(
-                    [
-                        f"The mean {wid_welfare['welfare_type'][wel]} within the {wid_deciles10['ordinal'][dec10]} (tenth of the population).",
-                        wid_welfare["description"][wel],
-                        ppp_description,
-                        additional_description,
-                    ]
-                )
-                df_tables_wid.loc[j, "unit"] = (
-                    f"international-$ in {PPP_YEAR_WID} prices"
-                )
-                df_tables_wid.loc[j, "shortUnit"] = "$"
-                df_tables_wid.loc[j, "type"] = "Numeric"
-                # df_tables_wid.loc[j, "colorScaleNumericBins"] = wid_deciles10[
-                #     "scale_avg"
-                # ][dec10]
-                df_tables_wid.loc[j, "colorScaleScheme"] = "Greens"
-                df_tables_wid.loc[j, "transform"] = (
-                    f"multiplyBy {wid_deciles10['wid_notation'][dec10]}_avg_{wid_welfare['slug'][wel]} {wid_income_aggregation['multiplier'][agg]}"
-                )
-                j += 1
 
     df_tables_wid["tableSlug"] = merged_tables["name"][tab]
 
+df_tables_wid = df_tables_wid.to_frame()
+
 df_tables_wid["sourceName"] = sourceName
 df_tables_wid["dataPublishedBy"] = dataPublishedBy
 df_tables_wid["sourceLink"] = sourceLink
@@ -728,7 +696,6 @@ sourceLink = SOURCE_LINK_LIS
 colorScaleNumericMinValue = COLOR_SCALE_NUMERIC_MIN_VALUE
 tolerance = TOLERANCE
 colorScaleEqualSizeBins = COLOR_SCALE_EQUAL_SIZEBINS
-new_line = NEW_LINE
 
 notes_title = NOTES_TITLE_LIS
 
@@ -740,289 +707,251 @@ processing_distribution = PROCESSING_DISTRIBUTION_LIS
 
 ppp_description = PPP_DESCRIPTION_LIS
 
-df_tables_lis = pd.DataFrame()
-j = 0
+df_tables_lis = TableBuilder()
 
 for tab in range(len(merged_tables)):
     for wel in range(len(lis_welfare)):
         for eq in range(len(lis_equivalence_scales)):
             # I need the original variables to not break the aggregations
             # Mean
-            df_tables_lis.loc[j, "name"] = (
-                f"Mean {lis_welfare['welfare_type'][wel]} (LIS data)"
-            )
-            df_tables_lis.loc[j, "slug"] = (
-                f"mean_{lis_welfare['slug'][wel]}_{lis_equivalence_scales['slug'][eq]}"
-            )
-            df_tables_lis.loc[j, "description"] = new_line.join(
-                [
-                    f"Mean {lis_welfare['welfare_type'][wel]}.",
-                    lis_welfare["description"][wel],
-                    lis_equivalence_scales["description"][eq],
-                    ppp_description,
-                    notes_title,
-                    processing_description,
-                    processing_gini_mean_median,
-                ]
+            df_tables_lis.append(
+                {
+                    "name": f"Mean {lis_welfare['welfare_type'][wel]} (LIS data)",
+                    "slug": f"mean_{lis_welfare['slug'][wel]}_{lis_equivalence_scales['slug'][eq]}",
+                    "description": join_paragraphs(
+                        [
+                            f"Mean {lis_welfare['welfare_type'][wel]}.",
+                            lis_welfare["description"][wel],
+                            lis_equivalence_scales["description"][eq],
+                            ppp_description,
+                            notes_title,
+                            processing_description,
+                            processing_gini_mean_median,
+                        ]
+                    ),
+                    "unit": "international-$ in 2017 prices",
+                    "shortUnit": "$",
+                    "type": "Numeric",
+                    "colorScaleNumericBins": lis_welfare["scale_mean"][wel],
+                    "colorScaleScheme": "BuGn",
+                    "equivalized": lis_equivalence_scales["text"][eq],
+                }
             )
-            df_tables_lis.loc[j, "unit"] = "international-$ in 2017 prices"
-            df_tables_lis.loc[j, "shortUnit"] = "$"
-            df_tables_lis.loc[j, "type"] = "Numeric"
-            df_tables_lis.loc[j, "colorScaleNumericBins"] = lis_welfare["scale_mean"][
-                wel
-            ]
-            df_tables_lis.loc[j, "colorScaleScheme"] = "BuGn"
-            df_tables_lis.loc[j, "equivalized"] = lis_equivalence_scales["text"][eq]
-            j += 1
 
             # Median
-            df_tables_lis.loc[j, "name"] = (
-                f"Median {lis_welfare['welfare_type'][wel]} (LIS data)"
-            )
-            df_tables_lis.loc[j, "slug"] = (
-                f"median_{lis_welfare['slug'][wel]}_{lis_equivalence_scales['slug'][eq]}"
-            )
-            df_tables_lis.loc[j, "description"] = new_line.join(
-                [
-                    f"The level of {lis_welfare['welfare_type'][wel]} below which half of the population falls.",
-                    lis_welfare["description"][wel],
-                    lis_equivalence_scales["description"][eq],
-                    ppp_description,
-                    notes_title,
-                    processing_description,
-                    processing_gini_mean_median,
-                ]
+            df_tables_lis.append(
+                {
+                    "name": f"Median {lis_welfare['welfare_type'][wel]} (LIS data)",
+                    "slug": f"median_{lis_welfare['slug'][wel]}_{lis_equivalence_scales['slug'][eq]}",
+                    "description": join_paragraphs(
+                        [
+                            f"The level of {lis_welfare['welfare_type'][wel]} below which half of the population falls.",
+                            lis_welfare["description"][wel],
+                            lis_equivalence_scales["description"][eq],
+                            ppp_description,
+                            notes_title,
+                            processing_description,
+                            processing_gini_mean_median,
+                        ]
+                    ),
+                    "unit": "international-$ in 2017 prices",
+                    "shortUnit": "$",
+                    "type": "Numeric",
+                    "colorScaleNumericBins": lis_welfare["scale_median"][wel],
+                    "colorScaleScheme": "Blues",
+                    "equivalized": lis_equivalence_scales["text"][eq],
+                }
             )
-            df_tables_lis.loc[j, "unit"] = "international-$ in 2017 prices"
-            df_tables_lis.loc[j, "shortUnit"] = "$"
-            df_tables_lis.loc[j, "type"] = "Numeric"
-            df_tables_lis.loc[j, "colorScaleNumericBins"] = lis_welfare["scale_median"][
-                wel
-            ]
-            df_tables_lis.loc[j, "colorScaleScheme"] = "Blues"
-            df_tables_lis.loc[j, "equivalized"] = lis_equivalence_scales["text"][eq]
-            j += 1
 
             # Thresholds - Deciles
             for dec9 in range(len(lis_deciles9)):
-                df_tables_lis.loc[j, "name"] = (
-                    f"{lis_deciles9['ordinal'][dec9].capitalize()} (LIS data)"
-                )
-                df_tables_lis.loc[j, "slug"] = (
-                    f"thr_{lis_deciles9['lis_notation'][dec9]}_{lis_welfare['slug'][wel]}_{lis_equivalence_scales['slug'][eq]}"
-                )
-                df_tables_lis.loc[j, "description"] = new_line.join(
-                    [
-                        f"The level of {lis_welfare['welfare_type'][wel]} below which {lis_deciles9['decile'][dec9]}0% of the population falls.",
-                        lis_welfare["description"][wel],
-                        lis_equivalence_scales["description"][eq],
-                        ppp_description,
-                        notes_title,
-                        processing_description,
-                        processing_distribution,
-                    ]
+                df_tables_lis.append(
+                    {
+                        "name": f"{lis_deciles9['ordinal'][dec9].capitalize()} (LIS data)",
+                        "slug": f"thr_{lis_deciles9['lis_notation'][dec9]}_{lis_welfare['slug'][wel]}_{lis_equivalence_scales['slug'][eq]}",
+                        "description": join_paragraphs(
+                            [
+                                f"The level of {lis_welfare['welfare_type'][wel]} below which {lis_deciles9['decile'][dec9]}0% of the population falls.",
+                                lis_welfare["description"][wel],
+                                lis_equivalence_scales["description"][eq],
+                                ppp_description,
+                                notes_title,
+                                processing_description,
+                                processing_distribution,
+                            ]
+                        ),
+                        "unit": "international-$ in 2017 prices",
+                        "shortUnit": "$",
+                        "type": "Numeric",
+                        # "colorScaleNumericBins": lis_deciles9['scale_thr'][dec9],
+                        "colorScaleScheme": "Purples",
+                        "equivalized": lis_equivalence_scales["text"][eq],
+                    }
                 )
-                df_tables_lis.loc[j, "unit"] = "international-$ in 2017 prices"
-                df_tables_lis.loc[j, "shortUnit"] = "$"
-                df_tables_lis.loc[j, "type"] = "Numeric"
-                # df_tables_lis.loc[j, "colorScaleNumericBins"] = lis_deciles9[
-                #     "scale_thr"
-                # ][dec9]
-                df_tables_lis.loc[j, "colorScaleScheme"] = "Purples"
-                df_tables_lis.loc[j, "equivalized"] = lis_equivalence_scales["text"][eq]
-                j += 1
 
             # Averages - Deciles
             for dec10 in range(len(lis_deciles10)):
-                df_tables_lis.loc[j, "name"] = (
-                    f"{lis_deciles10['ordinal'][dec10].capitalize()} (LIS data)"
-                )
-                df_tables_lis.loc[j, "slug"] = (
-                    f"avg_{lis_deciles10['lis_notation'][dec10]}_{lis_welfare['slug'][wel]}_{lis_equivalence_scales['slug'][eq]}"
+                df_tables_lis.append(
+                    {
+                        "name": f"{lis_deciles10['ordinal'][dec10].capitalize()} (LIS data)",
+                        "slug": f"avg_{lis_deciles10['lis_notation'][dec10]}_{lis_welfare['slug'][wel]}_{lis_equivalence_scales['slug'][eq]}",
+                        "description": join_paragraphs(
+                            [
+                                f"The mean {lis_welfare['welfare_type'][wel]} within the {lis_deciles10['ordinal'][dec10]} (tenth of the population).",
+                                lis_welfare["description"][wel],
+                                lis_equivalence_scales["description"][eq],
+                                ppp_description,
+                                notes_title,
+                                processing_description,
+                                processing_distribution,
+                            ]
+                        ),
+                        "unit": "international-$ in 2017 prices",
+                        "shortUnit": "$",
+                        "type": "Numeric",
+                        # "colorScaleNumericBins": lis_deciles10['scale_avg'][dec10],
+                        "colorScaleScheme": "Greens",
+                        "equivalized": lis_equivalence_scales["text"][eq],
+                    }
                 )
-                df_tables_lis.loc[j, "description"] = new_line.join(
-                    [
-                        f"The mean {lis_welfare['welfare_type'][wel]} within the {lis_deciles10['ordinal'][dec10]} (tenth of the population).",
-                        lis_welfare["description"][wel],
-                        lis_equivalence_scales["description"][eq],
-                        ppp_description,
-                        notes_title,
-                        processing_description,
-                        processing_distribution,
-                    ]
-                )
-                df_tables_lis.loc[j, "unit"] = "international-$ in 2017 prices"
-                df_tables_lis.loc[j, "shortUnit"] = "$"
-                df_tables_lis.loc[j, "type"] = "Numeric"
-                # df_tables_lis.loc[j, "colorScaleNumericBins"] = lis_deciles10[
-                #     "scale_avg"
-                # ][dec10]
-                df_tables_lis.loc[j, "colorScaleScheme"] = "Greens"
-                df_tables_lis.loc[j, "equivalized"] = lis_equivalence_scales["text"][eq]
-                j += 1
 
             # Shares - Deciles
             for dec10 in range(len(lis_deciles10)):
-                df_tables_lis.loc[j, "name"] = (
-                    f"{lis_deciles10['ordinal'][dec10].capitalize()} (LIS data)"
-                )
-                df_tables_lis.loc[j, "slug"] = (
-                    f"share_{lis_deciles10['lis_notation'][dec10]}_{lis_welfare['slug'][wel]}_{lis_equivalence_scales['slug'][eq]}"
+                df_tables_lis.append(
+                    {
+                        "name": f"{lis_deciles10['ordinal'][dec10].capitalize()} (LIS data)",
+                        "slug": f"share_{lis_deciles10['lis_notation'][dec10]}_{lis_welfare['slug'][wel]}_{lis_equivalence_scales['slug'][eq]}",
+                        "description": join_paragraphs(
+                            [
+                                f"The share of {lis_welfare['welfare_type'][wel]} received by the {lis_deciles10['ordinal'][dec10]} (tenth of the population).",
+                                lis_welfare["description"][wel],
+                                lis_equivalence_scales["description"][eq],
+                                notes_title,
+                                processing_description,
+                                processing_distribution,
+                            ]
+                        ),
+                        "unit": "%",
+                        "shortUnit": "%",
+                        "type": "Numeric",
+                        # "colorScaleNumericBins": lis_deciles10['scale_share'][dec10],
+                        "colorScaleScheme": "OrRd",
+                        "equivalized": lis_equivalence_scales["text"][eq],
+                    }
                 )
-                df_tables_lis.loc[j, "description"] = new_line.join(
-                    [
-                        f"The share of {lis_welfare['welfare_type'][wel]} received by the {lis_deciles10['ordinal'][dec10]} (tenth of the population).",
-                        lis_welfare["description"][wel],
-                        lis_equivalence_scales["description"][eq],
-                        notes_title,
-                        processing_description,
-                        processing_distribution,
-                    ]
-                )
-                df_tables_lis.loc[j, "unit"] = "%"
-                df_tables_lis.loc[j, "shortUnit"] = "%"
-                df_tables_lis.loc[j, "type"] = "Numeric"
-                # df_tables_lis.loc[j, "colorScaleNumericBins"] = lis_deciles10[
-                #     "scale_share"
-                # ][dec10]
-                df_tables_lis.loc[j, "colorScaleScheme"] = "OrRd"
-                df_tables_lis.loc[j, "equivalized"] = lis_equivalence_scales["text"][eq]
-                j += 1
 
             # Daily, monthly, annual aggregations
             for agg in range(len(lis_income_aggregation)):
                 # Mean
-                df_tables_lis.loc[j, "name"] = (
-                    f"Mean {lis_welfare['welfare_type'][wel]} (LIS data)"
-                )
-                df_tables_lis.loc[j, "slug"] = (
-                    f"mean_{lis_welfare['slug'][wel]}_{lis_equivalence_scales['slug'][eq]}{lis_income_aggregation['slug_suffix'][agg]}"
+                df_tables_lis.append(
+                    {
+                        "name": f"Mean {lis_welfare['welfare_type'][wel]} (LIS data)",
+                        "slug": f"mean_{lis_welfare['slug'][wel]}_{lis_equivalence_scales['slug'][eq]}{lis_income_aggregation['slug_suffix'][agg]}",
+                        "description": join_paragraphs(
+                            [
+                                f"Mean {lis_welfare['welfare_type'][wel]}.",
+                                lis_welfare["description"][wel],
+                                lis_equivalence_scales["description"][eq],
+                                ppp_description,
+                                notes_title,
+                                processing_description,
+                                processing_gini_mean_median,
+                            ]
+                        ),
+                        "unit": "international-$ in 2017 prices",
+                        "shortUnit": "$",
+                        "type": "Numeric",
+                        # "colorScaleNumericBins": lis_welfare['scale_mean'][wel],
+                        "colorScaleScheme": "BuGn",
+                        "transform": f"multiplyBy mean_{lis_welfare['slug'][wel]}_{lis_equivalence_scales['slug'][eq]} {lis_income_aggregation['multiplier'][agg]}",
+                        "equivalized": lis_equivalence_scales["text"][eq],
+                    }
                 )
-                df_tables_lis.loc[j, "description"] = new_line.join(
-                    [
-                        f"Mean {lis_welfare['welfare_type'][wel]}.",
-                        lis_welfare["description"][wel],
-                        lis_equivalence_scales["description"][eq],
-                        ppp_description,
-                        notes_title,
-                        processing_description,
-                        processing_gini_mean_median,
-                    ]
-                )
-                df_tables_lis.loc[j, "unit"] = "international-$ in 2017 prices"
-                df_tables_lis.loc[j, "shortUnit"] = "$"
-                df_tables_lis.loc[j, "type"] = "Numeric"
-                # df_tables_lis.loc[j, "colorScaleNumericBins"] = lis_welfare[
-                #     "scale_mean"
-                # ][wel]
-                df_tables_lis.loc[j, "colorScaleScheme"] = "BuGn"
-                df_tables_lis.loc[j, "transform"] = (
-                    f"multiplyBy mean_{lis_welfare['slug'][wel]}_{lis_equivalence_scales['slug'][eq]} {lis_income_aggregation['multiplier'][agg]}"
-                )
-                df_tables_lis.loc[j, "equivalized"] = lis_equivalence_scales["text"][eq]
-                j += 1
 
                 # Median
-                df_tables_lis.loc[j, "name"] = (
-                    f"Median {lis_welfare['welfare_type'][wel]} (LIS data)"
-                )
-                df_tables_lis.loc[j, "slug"] = (
-                    f"median_{lis_welfare['slug'][wel]}_{lis_equivalence_scales['slug'][eq]}{lis_income_aggregation['slug_suffix'][agg]}"
+                df_tables_lis.append(
+                    {
+                        "name": f"Median {lis_welfare['welfare_type'][wel]} (LIS data)",
+                        "slug": f"median_{lis_welfare['slug'][wel]}_{lis_equivalence_scales['slug'][eq]}{lis_income_aggregation['slug_suffix'][agg]}",
+                        "description": join_paragraphs(
+                            [
+                                f"The level of {lis_welfare['welfare_type'][wel]} below which half of the population falls.",
+                                lis_welfare["description"][wel],
+                                lis_equivalence_scales["description"][eq],
+                                ppp_description,
+                                notes_title,
+                                processing_description,
+                                processing_gini_mean_median,
+                            ]
+                        ),
+                        "unit": "international-$ in 2017 prices",
+                        "shortUnit": "$",
+                        "type": "Numeric",
+                        # "colorScaleNumericBins": lis_welfare['scale_median'][wel],
+                        "colorScaleScheme": "Blues",
+                        "transform": f"multiplyBy median_{lis_welfare['slug'][wel]}_{lis_equivalence_scales['slug'][eq]} {lis_income_aggregation['multiplier'][agg]}",
+                        "equivalized": lis_equivalence_scales["text"][eq],
+                    }
                 )
-                df_tables_lis.loc[j, "description"] = new_line.join(
-                    [
-                        f"The level of {lis_welfare['welfare_type'][wel]} below which half of the population falls.",
-                        lis_welfare["description"][wel],
-                        lis_equivalence_scales["description"][eq],
-                        ppp_description,
-                        notes_title,
-                        processing_description,
-                        processing_gini_mean_median,
-                    ]
-                )
-                df_tables_lis.loc[j, "unit"] = "international-$ in 2017 prices"
-                df_tables_lis.loc[j, "shortUnit"] = "$"
-                df_tables_lis.loc[j, "type"] = "Numeric"
-                # df_tables_lis.loc[j, "colorScaleNumericBins"] = lis_welfare[
-                #     "scale_median"
-                # ][wel]
-                df_tables_lis.loc[j, "colorScaleScheme"] = "Blues"
-                df_tables_lis.loc[j, "transform"] = (
-                    f"multiplyBy median_{lis_welfare['slug'][wel]}_{lis_equivalence_scales['slug'][eq]} {lis_income_aggregation['multiplier'][agg]}"
-                )
-                df_tables_lis.loc[j, "equivalized"] = lis_equivalence_scales["text"][eq]
-                j += 1
 
                 # Thresholds - Deciles
                 for dec9 in range(len(lis_deciles9)):
-                    df_tables_lis.loc[j, "name"] = (
-                        f"{lis_deciles9['ordinal'][dec9].capitalize()} (LIS data)"
-                    )
-                    df_tables_lis.loc[j, "slug"] = (
-                        f"thr_{lis_deciles9['lis_notation'][dec9]}_{lis_welfare['slug'][wel]}_{lis_equivalence_scales['slug'][eq]}{lis_income_aggregation['slug_suffix'][agg]}"
-                    )
-                    df_tables_lis.loc[j, "description"] = new_line.join(
-                        [
-                            f"The level of {lis_welfare['welfare_type'][wel]} below which {lis_deciles9['decile'][dec9]}0% of the population falls.",
-                            lis_welfare["description"][wel],
-                            lis_equivalence_scales["description"][eq],
-                            ppp_description,
-                            notes_title,
-                            processing_description,
-                            processing_distribution,
-                        ]
+                    df_tables_lis.append(
+                        {
+                            "name": f"{lis_deciles9['ordinal'][dec9].capitalize()} (LIS data)",
+                            "slug": f"thr_{lis_deciles9['lis_notation'][dec9]}_{lis_welfare['slug'][wel]}_{lis_equivalence_scales['slug'][eq]}{lis_income_aggregation['slug_suffix'][agg]}",
+                            "description": join_paragraphs(
+                                [
+                                    f"The level of {lis_welfare['welfare_type'][wel]} below which {lis_deciles9['decile'][dec9]}0% of the population falls.",
+                                    lis_welfare["description"][wel],
+                                    lis_equivalence_scales["description"][eq],
+                                    ppp_description,
+                                    notes_title,
+                                    processing_description,
+                                    processing_distribution,
+                                ]
+                            ),
+                            "unit": "international-$ in 2017 prices",
+                            "shortUnit": "$",
+                            "type": "Numeric",
+                            # "colorScaleNumericBins": lis_deciles9['scale_thr'][dec9],
+                            "colorScaleScheme": "Purples",
+                            "transform": f"multiplyBy thr_{lis_deciles9['lis_notation'][dec9]}_{lis_welfare['slug'][wel]}_{lis_equivalence_scales['slug'][eq]} {lis_income_aggregation['multiplier'][agg]}",
+                            "equivalized": lis_equivalence_scales["text"][eq],
+                        }
                     )
-                    df_tables_lis.loc[j, "unit"] = "international-$ in 2017 prices"
-                    df_tables_lis.loc[j, "shortUnit"] = "$"
-                    df_tables_lis.loc[j, "type"] = "Numeric"
-                    # df_tables_lis.loc[j, "colorScaleNumericBins"] = lis_deciles9[
-                    #     "scale_thr"
-                    # ][dec9]
-                    df_tables_lis.loc[j, "colorScaleScheme"] = "Purples"
-                    df_tables_lis.loc[j, "transform"] = (
-                        f"multiplyBy thr_{lis_deciles9['lis_notation'][dec9]}_{lis_welfare['slug'][wel]}_{lis_equivalence_scales['slug'][eq]} {lis_income_aggregation['multiplier'][agg]}"
-                    )
-                    df_tables_lis.loc[j, "equivalized"] = lis_equivalence_scales[
-                        "text"
-                    ][eq]
-                    j += 1
 
                 # Averages - Deciles
                 for dec10 in range(len(lis_deciles10)):
-                    df_tables_lis.loc[j, "name"] = (
-                        f"{lis_deciles10['ordinal'][dec10].capitalize()} (LIS data)"
-                    )
-                    df_tables_lis.loc[j, "slug"] = (
-                        f"avg_{lis_deciles10['lis_notation'][dec10]}_{lis_welfare['slug'][wel]}_{lis_equivalence_scales['slug'][eq]}{lis_income_aggregation['slug_suffix'][agg]}"
+                    df_tables_lis.append(
+                        {
+                            "name": f"{lis_deciles10['ordinal'][dec10].capitalize()} (LIS data)",
+                            "slug": f"avg_{lis_deciles10['lis_notation'][dec10]}_{lis_welfare['slug'][wel]}_{lis_equivalence_scales['slug'][eq]}{lis_income_aggregation['slug_suffix'][agg]}",
+                            "description": join_paragraphs(
+                                [
+                                    f"The mean {lis_welfare['welfare_type'][wel]} within the {lis_deciles10['ordinal'][dec10]} (tenth of the population).",
+                                    lis_welfare["description"][wel],
+                                    lis_equivalence_scales["description"][eq],
+                                    ppp_description,
+                                    notes_title,
+                                    processing_description,
+                                    processing_distribution,
+                                ]
+                            ),
+                            "unit": "international-$ in 2017 prices",
+                            "shortUnit": "$",
+                            "type": "Numeric",
+                            # "colorScaleNumericBins": lis_deciles10['scale_avg'][dec10],
+                            "colorScaleScheme": "Greens",
+                            "transform": f"multiplyBy avg_{lis_deciles10['lis_notation'][dec10]}_{lis_welfare['slug'][wel]}_{lis_equivalence_scales['slug'][eq]} {lis_income_aggregation['multiplier'][agg]}",
+                            "equivalized": lis_equivalence_scales["text"][eq],
+                        }
                     )
-                    df_tables_lis.loc[j, "description"] = new_line.join(
-                        [
-                            f"The mean {lis_welfare['welfare_type'][wel]} within the {lis_deciles10['ordinal'][dec10]} (tenth of the population).",
-                            lis_welfare["description"][wel],
-                            lis_equivalence_scales["description"][eq],
-                            ppp_description,
-                            notes_title,
-                            processing_description,
-                            processing_distribution,
-                        ]
-                    )
-                    df_tables_lis.loc[j, "unit"] = "international-$ in 2017 prices"
-                    df_tables_lis.loc[j, "shortUnit"] = "$"
-                    df_tables_lis.loc[j, "type"] = "Numeric"
-                    # df_tables_lis.loc[j, "colorScaleNumericBins"] = lis_deciles10[
-                    #     "scale_avg"
-                    # ][dec10]
-                    df_tables_lis.loc[j, "colorScaleScheme"] = "Greens"
-                    df_tables_lis.loc[j, "transform"] = (
-                        f"multiplyBy avg_{lis_deciles10['lis_notation'][dec10]}_{lis_welfare['slug'][wel]}_{lis_equivalence_scales['slug'][eq]} {lis_income_aggregation['multiplier'][agg]}"
-                    )
-                    df_tables_lis.loc[j, "equivalized"] = lis_equivalence_scales[
-                        "text"
-                    ][eq]
-                    j += 1
 
     df_tables_lis["tableSlug"] = merged_tables["name"][tab]
 
+df_tables_lis = df_tables_lis.to_frame()
+
 df_tables_lis["sourceName"] = sourceName
 df_tables_lis["dataPublishedBy"] = dataPublishedBy
 df_tables_lis["sourceLink"] = sourceLink
@@ -1055,137 +984,129 @@ selectedFacetStrategy = "entity"
 hasMapTab = "false"
 tab_parameter = "chart"
 
-df_graphers = pd.DataFrame()
+df_graphers = TableBuilder()
 
-j = 0
 
 for tab in range(len(merged_tables)):
     for view in range(len(source_checkbox)):
         for agg in range(len(lis_income_aggregation)):
             # Mean
-            df_graphers.loc[j, "title"] = (
-                f"Mean income per {lis_income_aggregation['aggregation'][agg]} ({source_checkbox['type_title'][view]})"
-            )
-            df_graphers.loc[j, "ySlugs"] = source_checkbox["mean"][view].replace(
-                "{agg}", lis_income_aggregation["slug_suffix"][agg]
+            df_graphers.append(
+                {
+                    "title": f"Mean income per {lis_income_aggregation['aggregation'][agg]} ({source_checkbox['type_title'][view]})",
+                    "ySlugs": source_checkbox["mean"][view].replace(
+                        "{agg}", lis_income_aggregation["slug_suffix"][agg]
+                    ),
+                    "Indicator Dropdown": "Mean income or consumption",
+                    "Decile Dropdown": np.nan,
+                    "Income measure Dropdown": source_checkbox["type_title"][
+                        view
+                    ].capitalize(),
+                    "Period Radio": lis_income_aggregation["aggregation"][
+                        agg
+                    ].capitalize(),
+                    "hideRelativeToggle": "false",
+                    "subtitle": f"{source_checkbox['note'][view]}",
+                    "note": f"{source_checkbox['note_ppp'][view]}",
+                    "yScaleToggle": "true",
+                }
             )
-            df_graphers.loc[j, "Indicator Dropdown"] = "Mean income or consumption"
-            df_graphers.loc[j, "Decile Dropdown"] = np.nan
-            df_graphers.loc[j, "Income measure Dropdown"] = source_checkbox[
-                "type_title"
-            ][view].capitalize()
-            df_graphers.loc[j, "Period Radio"] = lis_income_aggregation["aggregation"][
-                agg
-            ].capitalize()
-            df_graphers.loc[j, "hideRelativeToggle"] = "false"
-            df_graphers.loc[j, "subtitle"] = f"{source_checkbox['note'][view]}"
-            df_graphers.loc[j, "note"] = f"{source_checkbox['note_ppp'][view]}"
-            df_graphers.loc[j, "yScaleToggle"] = "true"
-            j += 1
 
             # Median
-            df_graphers.loc[j, "title"] = (
-                f"Median income per {lis_income_aggregation['aggregation'][agg]} ({source_checkbox['type_title'][view]})"
+            df_graphers.append(
+                {
+                    "title": f"Median income per {lis_income_aggregation['aggregation'][agg]} ({source_checkbox['type_title'][view]})",
+                    "ySlugs": source_checkbox["median"][view].replace(
+                        "{agg}", lis_income_aggregation["slug_suffix"][agg]
+                    ),
+                    "Indicator Dropdown": "Median income or consumption",
+                    "Decile Dropdown": np.nan,
+                    "Income measure Dropdown": source_checkbox["type_title"][
+                        view
+                    ].capitalize(),
+                    "Period Radio": lis_income_aggregation["aggregation"][
+                        agg
+                    ].capitalize(),
+                    "hideRelativeToggle": "false",
+                    "subtitle": f"{source_checkbox['note'][view]}",
+                    "note": f"{source_checkbox['note_ppp'][view]}",
+                    "yScaleToggle": "true",
+                }
             )
-            df_graphers.loc[j, "ySlugs"] = source_checkbox["median"][view].replace(
-                "{agg}", lis_income_aggregation["slug_suffix"][agg]
-            )
-            df_graphers.loc[j, "Indicator Dropdown"] = "Median income or consumption"
-            df_graphers.loc[j, "Decile Dropdown"] = np.nan
-            df_graphers.loc[j, "Income measure Dropdown"] = source_checkbox[
-                "type_title"
-            ][view].capitalize()
-            df_graphers.loc[j, "Period Radio"] = lis_income_aggregation["aggregation"][
-                agg
-            ].capitalize()
-            df_graphers.loc[j, "hideRelativeToggle"] = "false"
-            df_graphers.loc[j, "subtitle"] = f"{source_checkbox['note'][view]}"
-            df_graphers.loc[j, "note"] = f"{source_checkbox['note_ppp'][view]}"
-            df_graphers.loc[j, "yScaleToggle"] = "true"
-            j += 1
 
             # Thresholds - Deciles
             for dec9 in range(len(deciles9)):
-                df_graphers.loc[j, "title"] = (
-                    f"Threshold income marking the {deciles9['ordinal'][dec9]} ({source_checkbox['type_title'][view]})"
-                )
-                df_graphers.loc[j, "ySlugs"] = (
-                    source_checkbox["thr"][view]
-                    .replace("{agg}", lis_income_aggregation["slug_suffix"][agg])
-                    .replace("{dec9_pip}", deciles9["decile"][dec9])
-                    .replace("{dec9_wid}", deciles9["wid_notation"][dec9])
-                    .replace("{dec9_lis}", deciles9["lis_notation"][dec9])
+                df_graphers.append(
+                    {
+                        "title": f"Threshold income marking the {deciles9['ordinal'][dec9]} ({source_checkbox['type_title'][view]})",
+                        "ySlugs": source_checkbox["thr"][view]
+                        .replace("{agg}", lis_income_aggregation["slug_suffix"][agg])
+                        .replace("{dec9_pip}", deciles9["decile"][dec9])
+                        .replace("{dec9_wid}", deciles9["wid_notation"][dec9])
+                        .replace("{dec9_lis}", deciles9["lis_notation"][dec9]),
+                        "Indicator Dropdown": "Decile thresholds",
+                        "Decile Dropdown": deciles9["dropdown"][dec9],
+                        "Income measure Dropdown": source_checkbox["type_title"][
+                            view
+                        ].capitalize(),
+                        "Period Radio": lis_income_aggregation["aggregation"][
+                            agg
+                        ].capitalize(),
+                        "hideRelativeToggle": "false",
+                        "subtitle": f"The level of income per {lis_income_aggregation['aggregation'][agg]} below which {deciles9['decile'][dec9]}0% of the population falls. {source_checkbox['note'][view]}",
+                        "note": f"{source_checkbox['note_ppp'][view]}",
+                        "yScaleToggle": "true",
+                    }
                 )
-                df_graphers.loc[j, "Indicator Dropdown"] = "Decile thresholds"
-                df_graphers.loc[j, "Decile Dropdown"] = deciles9["dropdown"][dec9]
-                df_graphers.loc[j, "Income measure Dropdown"] = source_checkbox[
-                    "type_title"
-                ][view].capitalize()
-                df_graphers.loc[j, "Period Radio"] = lis_income_aggregation[
-                    "aggregation"
-                ][agg].capitalize()
-                df_graphers.loc[j, "hideRelativeToggle"] = "false"
-                df_graphers.loc[j, "subtitle"] = (
-                    f"The level of income per {lis_income_aggregation['aggregation'][agg]} below which {deciles9['decile'][dec9]}0% of the population falls. {source_checkbox['note'][view]}"
-                )
-                df_graphers.loc[j, "note"] = f"{source_checkbox['note_ppp'][view]}"
-                df_graphers.loc[j, "yScaleToggle"] = "true"
-                j += 1
 
             # Averages - Deciles
             for dec10 in range(len(deciles10)):
-                df_graphers.loc[j, "title"] = (
-                    f"Mean income within the {deciles10['ordinal'][dec10]} ({source_checkbox['type_title'][view]})"
+                df_graphers.append(
+                    {
+                        "title": f"Mean income within the {deciles10['ordinal'][dec10]} ({source_checkbox['type_title'][view]})",
+                        "ySlugs": source_checkbox["avg"][view]
+                        .replace("{agg}", lis_income_aggregation["slug_suffix"][agg])
+                        .replace("{dec10_pip}", deciles10["decile"][dec10])
+                        .replace("{dec10_wid}", deciles10["wid_notation"][dec10])
+                        .replace("{dec10_lis}", deciles10["lis_notation"][dec10]),
+                        "Indicator Dropdown": "Mean income or consumption, by decile",
+                        "Decile Dropdown": deciles10["dropdown"][dec10],
+                        "Income measure Dropdown": source_checkbox["type_title"][
+                            view
+                        ].capitalize(),
+                        "Period Radio": lis_income_aggregation["aggregation"][
+                            agg
+                        ].capitalize(),
+                        "hideRelativeToggle": "false",
+                        "subtitle": f"The mean income per {lis_income_aggregation['aggregation'][agg]} within the {deciles10['ordinal'][dec10]} (tenth of the population). {source_checkbox['note'][view]}",
+                        "note": f"{source_checkbox['note_ppp'][view]}",
+                        "yScaleToggle": "true",
+                    }
                 )
-                df_graphers.loc[j, "ySlugs"] = (
-                    source_checkbox["avg"][view]
-                    .replace("{agg}", lis_income_aggregation["slug_suffix"][agg])
-                    .replace("{dec10_pip}", deciles10["decile"][dec10])
-                    .replace("{dec10_wid}", deciles10["wid_notation"][dec10])
-                    .replace("{dec10_lis}", deciles10["lis_notation"][dec10])
-                )
-                df_graphers.loc[j, "Indicator Dropdown"] = (
-                    "Mean income or consumption, by decile"
-                )
-                df_graphers.loc[j, "Decile Dropdown"] = deciles10["dropdown"][dec10]
-                df_graphers.loc[j, "Income measure Dropdown"] = source_checkbox[
-                    "type_title"
-                ][view].capitalize()
-                df_graphers.loc[j, "Period Radio"] = lis_income_aggregation[
-                    "aggregation"
-                ][agg].capitalize()
-                df_graphers.loc[j, "hideRelativeToggle"] = "false"
-                df_graphers.loc[j, "subtitle"] = (
-                    f"The mean income per {lis_income_aggregation['aggregation'][agg]} within the {deciles10['ordinal'][dec10]} (tenth of the population). {source_checkbox['note'][view]}"
-                )
-                df_graphers.loc[j, "note"] = f"{source_checkbox['note_ppp'][view]}"
-                df_graphers.loc[j, "yScaleToggle"] = "true"
-                j += 1
 
         # Shares - Deciles
         for dec10 in range(len(deciles10)):
-            df_graphers.loc[j, "title"] = (
-                f"Income share of the {deciles10['ordinal'][dec10]} ({source_checkbox['type_title'][view]})"
-            )
-            df_graphers.loc[j, "ySlugs"] = (
-                source_checkbox["share"][view]
-                .replace("{dec10_pip}", deciles10["decile"][dec10])
-                .replace("{dec10_wid}", deciles10["wid_notation"][dec10])
-                .replace("{dec10_lis}", deciles10["lis_notation"][dec10])
-            )
-            df_graphers.loc[j, "Indicator Dropdown"] = "Decile shares"
-            df_graphers.loc[j, "Decile Dropdown"] = deciles10["dropdown"][dec10]
-            df_graphers.loc[j, "Income measure Dropdown"] = source_checkbox[
-                "type_title"
-            ][view].capitalize()
-            df_graphers.loc[j, "subtitle"] = (
-                f"The share of income received by the {deciles10['ordinal'][dec10]}. {source_checkbox['note'][view]}"
+            df_graphers.append(
+                {
+                    "title": f"Income share of the {deciles10['ordinal'][dec10]} ({source_checkbox['type_title'][view]})",
+                    "ySlugs": source_checkbox["share"][view]
+                    .replace("{dec10_pip}", deciles10["decile"][dec10])
+                    .replace("{dec10_wid}", deciles10["wid_notation"][dec10])
+                    .replace("{dec10_lis}", deciles10["lis_notation"][dec10]),
+                    "Indicator Dropdown": "Decile shares",
+                    "Decile Dropdown": deciles10["dropdown"][dec10],
+                    "Income measure Dropdown": source_checkbox["type_title"][
+                        view
+                    ].capitalize(),
+                    "subtitle": f"The share of income received by the {deciles10['ordinal'][dec10]}. {source_checkbox['note'][view]}",
+                    "note": np.nan,
+                }
             )
-            df_graphers.loc[j, "note"] = np.nan
-            j += 1
 
     df_graphers["tableSlug"] = merged_tables["name"][tab]
 
+df_graphers = df_graphers.to_frame()
+
 # Add yAxisMin and other columns
 df_graphers["yAxisMin"] = yAxisMin
 df_graphers["selectedFacetStrategy"] = selectedFacetStrategy
@@ -1273,32 +1194,17 @@ df_graphers = df_graphers.drop(columns=["metric_dropdown_aux", "decile_dropdown_
 # Define list of variables to iterate: table names (from table dataframe)
 table_list = list(df_tables["tableSlug"].unique())
 
-# Header is converted into a tab-separated text
-header_tsv = df_header.to_csv(sep="\t", header=False)
-
-# Graphers table is converted into a tab-separated text
-graphers_tsv = df_graphers
-graphers_tsv = graphers_tsv.to_csv(sep="\t", index=False)
-
-# This table is indented, to follow explorers' format
-graphers_tsv_indented = textwrap.indent(graphers_tsv, "\t")
-
 # The dataframes are combined, including tables and links to the datasets
 with open(outfile, "w", newline="\n", encoding="utf-8") as f:
-    f.write(header_tsv)
-    f.write("\ngraphers\n" + graphers_tsv_indented)
+    explorer = ExplorerWriter(f)
+    explorer.write_header(df_header)
+    explorer.write_graphers(df_graphers)
 
-    for tab in table_list:
-        table_tsv = (
-            df_tables[df_tables["tableSlug"] == tab].copy().reset_index(drop=True)
-        )
-        table_tsv = table_tsv.drop(columns=["tableSlug"])
-        table_tsv = table_tsv.to_csv(sep="\t", index=False)
-        table_tsv_indented = textwrap.indent(table_tsv, "\t")
-        f.write(
-            "\ntable\t"
-            + merged_tables.loc[merged_tables["name"] == tab, "link"].item()
-            + "\t"
-            + tab
-        )
-        f.write("\ncolumns\t" + tab + "\n" + table_tsv_indented)
+    explorer.write_tables(
+        df_tables,
+        "tableSlug",
+        [
+            (tab, merged_tables.loc[merged_tables["name"] == tab, "link"].item())
+            for tab in table_list
+        ],
+    )
@@ -2,7 +2,6 @@
 # # Source-switching Inequality Data Explorer
 # This code creates the tsv file for the main inequality explorer in the inequality topic page, available [here](https://owid.cloud/admin/explorers/preview/inequality)
 
-import textwrap
 from pathlib import Path
 
 import numpy as np
@@ -11,6 +10,10 @@ import numpy as np
 import pandas as pd
 
 from ..common_parameters import *
+from ..descriptions import join_paragraphs
+from ..explorer_writer import ExplorerWriter
+from ..sheets import read_sheet
+from ..table_builder import TableBuilder
 
 PARENT_DIR = Path(__file__).parent.parent.parent.parent.absolute()
 outfile = PARENT_DIR / "explorers" / "inequality.explorer.tsv"
@@ -26,8 +29,7 @@ sheet_id = "1wcFsNZCEn_6SJ05BFkXKLUyvCrnigfR8eeemGKgAYsI"
 
 # All the tables sheet (this contains PIP, WID and LIS dataset information)
 sheet_name = "all_the_tables"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-all_the_tables = pd.read_csv(url, keep_default_na=False)
+all_the_tables = read_sheet(sheet_id, sheet_name, keep_default_na=False)
 
 # NOTE: We decided to drop LIS from the main inequality explorer
 
@@ -37,13 +39,11 @@ sheet_id = "18T5IGnpyJwb8KL9USYvME6IaLEcYIo26ioHCpkDnwRQ"
 
 # Welfare type sheet
 sheet_name = "welfare"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-wid_welfare = pd.read_csv(url, keep_default_na=False)
+wid_welfare = read_sheet(sheet_id, sheet_name, keep_default_na=False)
 
 # Tables sheet
 sheet_name = "tables"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-wid_tables = pd.read_csv(url, keep_default_na=False)
+wid_tables = read_sheet(sheet_id, sheet_name, keep_default_na=False)
 
 # WORLD BANK POVERTY AND INEQUALITY PLATFORM
 # Read Google sheets
@@ -51,13 +51,11 @@ sheet_id = "17KJ9YcvfdmO_7-Sv2Ij0vmzAQI6rXSIqHfJtgFHN-a8"
 
 # Relative poverty sheet
 sheet_name = "povlines_rel"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-pip_povlines_rel = pd.read_csv(url)
+pip_povlines_rel = read_sheet(sheet_id, sheet_name)
 
 # Survey type sheet
 sheet_name = "table"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-pip_tables = pd.read_csv(url)
+pip_tables = read_sheet(sheet_id, sheet_name)
 
 # %% [markdown]
 # ## Header
@@ -104,7 +102,6 @@ dataPublishedBy = DATA_PUBLISHED_BY_PIP
 sourceLink = SOURCE_LINK_PIP
 tolerance = TOLERANCE
 colorScaleEqualSizeBins = COLOR_SCALE_EQUAL_SIZEBINS
-new_line = NEW_LINE
 
 additional_description = ADDITIONAL_DESCRIPTION_PIP_COMPARISON
 
@@ -115,136 +112,152 @@ ppp_description = PPP_DESCRIPTION_PIP_2017
 relative_poverty_description = RELATIVE_POVERTY_DESCRIPTION_PIP
 
 # Table generation
-df_tables_pip = pd.DataFrame()
-j = 0
+df_tables_pip = TableBuilder()
 
 for survey in range(len(pip_tables)):
     # Define country as entityName
-    df_tables_pip.loc[j, "name"] = "Country"
-    df_tables_pip.loc[j, "slug"] = "country"
-    df_tables_pip.loc[j, "type"] = "EntityName"
-    df_tables_pip.loc[j, "tableSlug"] = pip_tables["table_name"][survey]
-    j += 1
+    df_tables_pip.append(
+        {
+            "name": "Country",
+            "slug": "country",
+            "type": "EntityName",
+            "tableSlug": pip_tables["table_name"][survey],
+        }
+    )
 
     # Define year as Year
-    df_tables_pip.loc[j, "name"] = "Year"
-    df_tables_pip.loc[j, "slug"] = "year"
-    df_tables_pip.loc[j, "type"] = "Year"
-    df_tables_pip.loc[j, "tableSlug"] = pip_tables["table_name"][survey]
-    j += 1
+    df_tables_pip.append(
+        {
+            "name": "Year",
+            "slug": "year",
+            "type": "Year",
+            "tableSlug": pip_tables["table_name"][survey],
+        }
+    )
 
     # Gini coefficient
-    df_tables_pip.loc[j, "name"] = f"Gini coefficient (World Bank PIP)"
-    df_tables_pip.loc[j, "slug"] = f"gini"
-    df_tables_pip.loc[j, "description"] = new_line.join(
-        [
-            "The Gini coefficient measures inequality on a scale from 0 to 1. Higher values indicate higher inequality.",
-            additional_description,
-            notes_title,
-            processing_description,
-        ]
-    )
-    df_tables_pip.loc[j, "unit"] = np.nan
-    df_tables_pip.loc[j, "shortUnit"] = np.nan
-    df_tables_pip.loc[j, "type"] = "Numeric"
-    df_tables_pip.loc[j, "colorScaleNumericBins"] = (
-        "0.25;0.3;0.35;0.4;0.45;0.5;0.55;0.6"
+    df_tables_pip.append(
+        {
+            "name": f"Gini coefficient (World Bank PIP)",
+            "slug": f"gini",
+            "description": join_paragraphs(
+                [
+                    "The Gini coefficient measures inequality on a scale from 0 to 1. Higher values indicate higher inequality.",
+                    additional_description,
+                    notes_title,
+                    processing_description,
+                ]
+            ),
+            "unit": np.nan,
+            "shortUnit": np.nan,
+            "type": "Numeric",
+            "colorScaleNumericBins": "0.25;0.3;0.35;0.4;0.45;0.5;0.55;0.6",
+            "colorScaleNumericMinValue": 1,
+            "colorScaleEqualSizeBins": "true",
+            "colorScaleScheme": "Oranges",
+            "tableSlug": pip_tables["table_name"][survey],
+        }
     )
-    df_tables_pip.loc[j, "colorScaleNumericMinValue"] = 1
-    df_tables_pip.loc[j, "colorScaleEqualSizeBins"] = "true"
-    df_tables_pip.loc[j, "colorScaleScheme"] = "Oranges"
-    df_tables_pip.loc[j, "tableSlug"] = pip_tables["table_name"][survey]
-    j += 1
 
     # Share of the top 10%
-    df_tables_pip.loc[j, "name"] = (
-        f"{pip_tables.text[survey].capitalize()} share of the richest 10% (World Bank PIP)"
+    df_tables_pip.append(
+        {
+            "name": f"{pip_tables.text[survey].capitalize()} share of the richest 10% (World Bank PIP)",
+            "slug": f"decile10_share",
+            "description": join_paragraphs(
+                [
+                    "The share of after tax income or consumption received by the richest 10% of the population.",
+                    additional_description,
+                    notes_title,
+                    processing_description,
+                ]
+            ),
+            "unit": "%",
+            "shortUnit": "%",
+            "type": "Numeric",
+            "colorScaleNumericBins": "20;25;30;35;40;45;50",
+            "colorScaleNumericMinValue": 100,
+            "colorScaleEqualSizeBins": "true",
+            "colorScaleScheme": "OrRd",
+            "tableSlug": pip_tables["table_name"][survey],
+        }
     )
-    df_tables_pip.loc[j, "slug"] = f"decile10_share"
-    df_tables_pip.loc[j, "description"] = new_line.join(
-        [
-            "The share of after tax income or consumption received by the richest 10% of the population.",
-            additional_description,
-            notes_title,
-            processing_description,
-        ]
-    )
-    df_tables_pip.loc[j, "unit"] = "%"
-    df_tables_pip.loc[j, "shortUnit"] = "%"
-    df_tables_pip.loc[j, "type"] = "Numeric"
-    df_tables_pip.loc[j, "colorScaleNumericBins"] = "20;25;30;35;40;45;50"
-    df_tables_pip.loc[j, "colorScaleNumericMinValue"] = 100
-    df_tables_pip.loc[j, "colorScaleEqualSizeBins"] = "true"
-    df_tables_pip.loc[j, "colorScaleScheme"] = "OrRd"
-    df_tables_pip.loc[j, "tableSlug"] = pip_tables["table_name"][survey]
-    j += 1
 
     # Share of the bottom 50%
-    df_tables_pip.loc[j, "name"] = (
-        f"{pip_tables.text[survey].capitalize()} share of the poorest 50% (World Bank PIP)"
+    df_tables_pip.append(
+        {
+            "name": f"{pip_tables.text[survey].capitalize()} share of the poorest 50% (World Bank PIP)",
+            "slug": f"bottom50_share",
+            "description": join_paragraphs(
+                [
+                    "The share of after tax income or consumption received by the poorest 50% of the population.",
+                    additional_description,
+                    notes_title,
+                    processing_description,
+                ]
+            ),
+            "unit": "%",
+            "shortUnit": "%",
+            "type": "Numeric",
+            "colorScaleNumericBins": "15;20;25;30;35",
+            "colorScaleNumericMinValue": 100,
+            "colorScaleEqualSizeBins": "true",
+            "colorScaleScheme": "Blues",
+            "tableSlug": pip_tables["table_name"][survey],
+        }
     )
-    df_tables_pip.loc[j, "slug"] = f"bottom50_share"
-    df_tables_pip.loc[j, "description"] = new_line.join(
-        [
-            "The share of after tax income or consumption received by the poorest 50% of the population.",
-            additional_description,
-            notes_title,
-            processing_description,
-        ]
-    )
-    df_tables_pip.loc[j, "unit"] = "%"
-    df_tables_pip.loc[j, "shortUnit"] = "%"
-    df_tables_pip.loc[j, "type"] = "Numeric"
-    df_tables_pip.loc[j, "colorScaleNumericBins"] = "15;20;25;30;35"
-    df_tables_pip.loc[j, "colorScaleNumericMinValue"] = 100
-    df_tables_pip.loc[j, "colorScaleEqualSizeBins"] = "true"
-    df_tables_pip.loc[j, "colorScaleScheme"] = "Blues"
-    df_tables_pip.loc[j, "tableSlug"] = pip_tables["table_name"][survey]
-    j += 1
 
     # Palma ratio
-    df_tables_pip.loc[j, "name"] = f"Palma ratio (World Bank PIP)"
-    df_tables_pip.loc[j, "slug"] = f"palma_ratio"
-    df_tables_pip.loc[j, "description"] = new_line.join(
-        [
-            "The Palma ratio is a measure of inequality that divides the share received by the richest 10% by the share of the poorest 40%. Higher values indicate higher inequality.",
-            additional_description,
-            notes_title,
-            processing_description,
-        ]
+    df_tables_pip.append(
+        {
+            "name": f"Palma ratio (World Bank PIP)",
+            "slug": f"palma_ratio",
+            "description": join_paragraphs(
+                [
+                    "The Palma ratio is a measure of inequality that divides the share received by the richest 10% by the share of the poorest 40%. Higher values indicate higher inequality.",
+                    additional_description,
+                    notes_title,
+                    processing_description,
+                ]
+            ),
+            "unit": np.nan,
+            "shortUnit": np.nan,
+            "type": "Numeric",
+            "colorScaleNumericBins": "0.5;1;1.5;2;2.5;3;3.5;4;4.5;5;5.5",
+            "colorScaleNumericMinValue": 0,
+            "colorScaleEqualSizeBins": "true",
+            "colorScaleScheme": "YlOrBr",
+            "tableSlug": pip_tables["table_name"][survey],
+        }
     )
-    df_tables_pip.loc[j, "unit"] = np.nan
-    df_tables_pip.loc[j, "shortUnit"] = np.nan
-    df_tables_pip.loc[j, "type"] = "Numeric"
-    df_tables_pip.loc[j, "colorScaleNumericBins"] = "0.5;1;1.5;2;2.5;3;3.5;4;4.5;5;5.5"
-    df_tables_pip.loc[j, "colorScaleNumericMinValue"] = 0
-    df_tables_pip.loc[j, "colorScaleEqualSizeBins"] = "true"
-    df_tables_pip.loc[j, "colorScaleScheme"] = "YlOrBr"
-    df_tables_pip.loc[j, "tableSlug"] = pip_tables["table_name"][survey]
-    j += 1
 
     # Headcount ratio (rel)
-    df_tables_pip.loc[j, "name"] = f"Share in relative poverty (World Bank PIP)"
-    df_tables_pip.loc[j, "slug"] = f"headcount_ratio_50_median"
-    df_tables_pip.loc[j, "description"] = new_line.join(
-        [
-            "The share of population with after tax income or consumption below 50% of the median. Relative poverty reflects the extent of inequality within the bottom of the distribution.",
-            relative_poverty_description,
-            additional_description,
-            notes_title,
-            "Measures of relative poverty are not directly available in the World Bank PIP data. To calculate this metric we take the median income or consumption for the country and year, calculate a relative poverty line – in this case 50% of the median – and then run a specific query on the PIP API to return the share of population below that line.",
-            processing_description,
-        ]
+    df_tables_pip.append(
+        {
+            "name": f"Share in relative poverty (World Bank PIP)",
+            "slug": f"headcount_ratio_50_median",
+            "description": join_paragraphs(
+                [
+                    "The share of population with after tax income or consumption below 50% of the median. Relative poverty reflects the extent of inequality within the bottom of the distribution.",
+                    relative_poverty_description,
+                    additional_description,
+                    notes_title,
+                    "Measures of relative poverty are not directly available in the World Bank PIP data. To calculate this metric we take the median income or consumption for the country and year, calculate a relative poverty line – in this case 50% of the median – and then run a specific query on the PIP API to return the share of population below that line.",
+                    processing_description,
+                ]
+            ),
+            "unit": "%",
+            "shortUnit": "%",
+            "type": "Numeric",
+            "colorScaleNumericBins": "3;6;9;12;15;18;21;24;27",
+            "colorScaleNumericMinValue": 0,
+            "colorScaleEqualSizeBins": "true",
+            "colorScaleScheme": "YlOrBr",
+            "tableSlug": pip_tables["table_name"][survey],
+        }
     )
-    df_tables_pip.loc[j, "unit"] = "%"
-    df_tables_pip.loc[j, "shortUnit"] = "%"
-    df_tables_pip.loc[j, "type"] = "Numeric"
-    df_tables_pip.loc[j, "colorScaleNumericBins"] = "3;6;9;12;15;18;21;24;27"
-    df_tables_pip.loc[j, "colorScaleNumericMinValue"] = 0
-    df_tables_pip.loc[j, "colorScaleEqualSizeBins"] = "true"
-    df_tables_pip.loc[j, "colorScaleScheme"] = "YlOrBr"
-    df_tables_pip.loc[j, "tableSlug"] = pip_tables["table_name"][survey]
-    j += 1
+
+df_tables_pip = df_tables_pip.to_frame()
 
 df_tables_pip["sourceName"] = sourceName
 df_tables_pip["dataPublishedBy"] = dataPublishedBy
@@ -261,160 +274,168 @@ sourceName = SOURCE_NAME_WID
 dataPublishedBy = DATA_PUBLISHED_BY_WID
 sourceLink = SOURCE_LINK_WID
 tolerance = TOLERANCE
-new_line = NEW_LINE
 
 additional_description = ADDITIONAL_DESCRIPTION_WID
 ppp_description = PPP_DESCRIPTION_WID
 
-df_tables_wid = pd.DataFrame()
-j = 0
+df_tables_wid = TableBuilder()
 
 for tab in range(len(wid_tables)):
     # Define country as entityName
-    df_tables_wid.loc[j, "name"] = "Country"
-    df_tables_wid.loc[j, "slug"] = "country"
-    df_tables_wid.loc[j, "type"] = "EntityName"
-    j += 1
+    df_tables_wid.append(
+        {
+            "name": "Country",
+            "slug": "country",
+            "type": "EntityName",
+        }
+    )
 
     # Define year as Year
-    df_tables_wid.loc[j, "name"] = "Year"
-    df_tables_wid.loc[j, "slug"] = "year"
-    df_tables_wid.loc[j, "type"] = "Year"
-    j += 1
+    df_tables_wid.append(
+        {
+            "name": "Year",
+            "slug": "year",
+            "type": "Year",
+        }
+    )
 
     for wel in range(len(wid_welfare)):
         # Gini coefficient
-        df_tables_wid.loc[j, "name"] = (
-            f"Gini coefficient {wid_welfare['title'][wel]} (World Inequality Database)"
+        df_tables_wid.append(
+            {
+                "name": f"Gini coefficient {wid_welfare['title'][wel]} (World Inequality Database)",
+                "slug": f"p0p100_gini_{wid_welfare['slug'][wel]}",
+                "description": join_paragraphs(
+                    [
+                        "The Gini coefficient measures inequality on a scale from 0 to 1. Higher values indicate higher inequality.",
+                        wid_welfare["description"][wel],
+                        additional_description,
+                    ]
+                ),
+                "unit": np.nan,
+                "shortUnit": np.nan,
+                "type": "Numeric",
+                "colorScaleNumericBins": wid_welfare["scale_gini"][wel],
+                "colorScaleNumericMinValue": 1,
+                "colorScaleEqualSizeBins": "true",
+                "colorScaleScheme": "Oranges",
+            }
         )
-        df_tables_wid.loc[j, "slug"] = f"p0p100_gini_{wid_welfare['slug'][wel]}"
-        df_tables_wid.loc[j, "description"] = new_line.join(
-            [
-                "The Gini coefficient measures inequality on a scale from 0 to 1. Higher values indicate higher inequality.",
-                wid_welfare["description"][wel],
-                additional_description,
-            ]
-        )
-        df_tables_wid.loc[j, "unit"] = np.nan
-        df_tables_wid.loc[j, "shortUnit"] = np.nan
-        df_tables_wid.loc[j, "type"] = "Numeric"
-        df_tables_wid.loc[j, "colorScaleNumericBins"] = wid_welfare["scale_gini"][wel]
-        df_tables_wid.loc[j, "colorScaleNumericMinValue"] = 1
-        df_tables_wid.loc[j, "colorScaleEqualSizeBins"] = "true"
-        df_tables_wid.loc[j, "colorScaleScheme"] = "Oranges"
-        j += 1
 
         # Share of the top 10%
-        df_tables_wid.loc[j, "name"] = (
-            f"{wid_welfare['welfare_type'][wel].capitalize()} share of the richest 10% {wid_welfare['title'][wel]} (World Inequality Database)"
-        )
-        df_tables_wid.loc[j, "slug"] = f"p90p100_share_{wid_welfare['slug'][wel]}"
-        df_tables_wid.loc[j, "description"] = new_line.join(
-            [
-                f"The share of {wid_welfare['welfare_type'][wel]} received by the richest 10% of the population.",
-                wid_welfare["description"][wel],
-                additional_description,
-            ]
+        df_tables_wid.append(
+            {
+                "name": f"{wid_welfare['welfare_type'][wel].capitalize()} share of the richest 10% {wid_welfare['title'][wel]} (World Inequality Database)",
+                "slug": f"p90p100_share_{wid_welfare['slug'][wel]}",
+                "description": join_paragraphs(
+                    [
+                        f"The share of {wid_welfare['welfare_type'][wel]} received by the richest 10% of the population.",
+                        wid_welfare["description"][wel],
+                        additional_description,
+                    ]
+                ),
+                "unit": "%",
+                "shortUnit": "%",
+                "type": "Numeric",
+                "colorScaleNumericBins": wid_welfare["scale_top10"][wel],
+                "colorScaleNumericMinValue": 100,
+                "colorScaleEqualSizeBins": "true",
+                "colorScaleScheme": "OrRd",
+            }
         )
-        df_tables_wid.loc[j, "unit"] = "%"
-        df_tables_wid.loc[j, "shortUnit"] = "%"
-        df_tables_wid.loc[j, "type"] = "Numeric"
-        df_tables_wid.loc[j, "colorScaleNumericBins"] = wid_welfare["scale_top10"][wel]
-        df_tables_wid.loc[j, "colorScaleNumericMinValue"] = 100
-        df_tables_wid.loc[j, "colorScaleEqualSizeBins"] = "true"
-        df_tables_wid.loc[j, "colorScaleScheme"] = "OrRd"
-        j += 1
 
         # Share of the top 1%
-        df_tables_wid.loc[j, "name"] = (
-            f"{wid_welfare['welfare_type'][wel].capitalize()} share of the richest 1% {wid_welfare['title'][wel]} (World Inequality Database)"
-        )
-        df_tables_wid.loc[j, "slug"] = f"p99p100_share_{wid_welfare['slug'][wel]}"
-        df_tables_wid.loc[j, "description"] = new_line.join(
-            [
-                f"The share of {wid_welfare['welfare_type'][wel]} received by the richest 1% of the population.",
-                wid_welfare["description"][wel],
-                additional_description,
-            ]
+        df_tables_wid.append(
+            {
+                "name": f"{wid_welfare['welfare_type'][wel].capitalize()} share of the richest 1% {wid_welfare['title'][wel]} (World Inequality Database)",
+                "slug": f"p99p100_share_{wid_welfare['slug'][wel]}",
+                "description": join_paragraphs(
+                    [
+                        f"The share of {wid_welfare['welfare_type'][wel]} received by the richest 1% of the population.",
+                        wid_welfare["description"][wel],
+                        additional_description,
+                    ]
+                ),
+                "unit": "%",
+                "shortUnit": "%",
+                "type": "Numeric",
+                "colorScaleNumericBins": wid_welfare["scale_top1"][wel],
+                "colorScaleNumericMinValue": 0,
+                "colorScaleEqualSizeBins": "true",
+                "colorScaleScheme": "OrRd",
+            }
         )
-        df_tables_wid.loc[j, "unit"] = "%"
-        df_tables_wid.loc[j, "shortUnit"] = "%"
-        df_tables_wid.loc[j, "type"] = "Numeric"
-        df_tables_wid.loc[j, "colorScaleNumericBins"] = wid_welfare["scale_top1"][wel]
-        df_tables_wid.loc[j, "colorScaleNumericMinValue"] = 0
-        df_tables_wid.loc[j, "colorScaleEqualSizeBins"] = "true"
-        df_tables_wid.loc[j, "colorScaleScheme"] = "OrRd"
-        j += 1
 
         # Share of the top 0.1%
-        df_tables_wid.loc[j, "name"] = (
-            f"{wid_welfare['welfare_type'][wel].capitalize()} share of the richest 0.1% {wid_welfare['title'][wel]} (World Inequality Database)"
+        df_tables_wid.append(
+            {
+                "name": f"{wid_welfare['welfare_type'][wel].capitalize()} share of the richest 0.1% {wid_welfare['title'][wel]} (World Inequality Database)",
+                "slug": f"p99_9p100_share_{wid_welfare['slug'][wel]}",
+                "description": join_paragraphs(
+                    [
+                        f"The share of {wid_welfare['welfare_type'][wel]} received by the richest 0.1% of the population.",
+                        wid_welfare["description"][wel],
+                        additional_description,
+                    ]
+                ),
+                "unit": "%",
+                "shortUnit": "%",
+                "type": "Numeric",
+                "colorScaleNumericBins": wid_welfare["scale_top01"][wel],
+                "colorScaleNumericMinValue": 0,
+                "colorScaleEqualSizeBins": "true",
+                "colorScaleScheme": "OrRd",
+            }
         )
-        df_tables_wid.loc[j, "slug"] = f"p99_9p100_share_{wid_welfare['slug'][wel]}"
-        df_tables_wid.loc[j, "description"] = new_line.join(
-            [
-                f"The share of {wid_welfare['welfare_type'][wel]} received by the richest 0.1% of the population.",
-                wid_welfare["description"][wel],
-                additional_description,
-            ]
-        )
-        df_tables_wid.loc[j, "unit"] = "%"
-        df_tables_wid.loc[j, "shortUnit"] = "%"
-        df_tables_wid.loc[j, "type"] = "Numeric"
-        df_tables_wid.loc[j, "colorScaleNumericBins"] = wid_welfare["scale_top01"][wel]
-        df_tables_wid.loc[j, "colorScaleNumericMinValue"] = 0
-        df_tables_wid.loc[j, "colorScaleEqualSizeBins"] = "true"
-        df_tables_wid.loc[j, "colorScaleScheme"] = "OrRd"
-        j += 1
 
         # Share of the bottom 50%
-        df_tables_wid.loc[j, "name"] = (
-            f"{wid_welfare['welfare_type'][wel].capitalize()} share of the poorest 50% {wid_welfare['title'][wel]} (World Inequality Database)"
-        )
-        df_tables_wid.loc[j, "slug"] = f"p0p50_share_{wid_welfare['slug'][wel]}"
-        df_tables_wid.loc[j, "description"] = new_line.join(
-            [
-                f"The share of {wid_welfare['welfare_type'][wel]} received by the poorest 50% of the population.",
-                wid_welfare["description"][wel],
-                additional_description,
-            ]
+        df_tables_wid.append(
+            {
+                "name": f"{wid_welfare['welfare_type'][wel].capitalize()} share of the poorest 50% {wid_welfare['title'][wel]} (World Inequality Database)",
+                "slug": f"p0p50_share_{wid_welfare['slug'][wel]}",
+                "description": join_paragraphs(
+                    [
+                        f"The share of {wid_welfare['welfare_type'][wel]} received by the poorest 50% of the population.",
+                        wid_welfare["description"][wel],
+                        additional_description,
+                    ]
+                ),
+                "unit": "%",
+                "shortUnit": "%",
+                "type": "Numeric",
+                "colorScaleNumericBins": wid_welfare["scale_bottom50"][wel],
+                "colorScaleNumericMinValue": 100,
+                "colorScaleEqualSizeBins": "true",
+                "colorScaleScheme": "Blues",
+            }
         )
-        df_tables_wid.loc[j, "unit"] = "%"
-        df_tables_wid.loc[j, "shortUnit"] = "%"
-        df_tables_wid.loc[j, "type"] = "Numeric"
-        df_tables_wid.loc[j, "colorScaleNumericBins"] = wid_welfare["scale_bottom50"][
-            wel
-        ]
-        df_tables_wid.loc[j, "colorScaleNumericMinValue"] = 100
-        df_tables_wid.loc[j, "colorScaleEqualSizeBins"] = "true"
-        df_tables_wid.loc[j, "colorScaleScheme"] = "Blues"
-        j += 1
 
         # Palma ratio
-        df_tables_wid.loc[j, "name"] = (
-            f"Palma ratio {wid_welfare['title'][wel]} (World Inequality Database)"
-        )
-        df_tables_wid.loc[j, "slug"] = f"palma_ratio_{wid_welfare['slug'][wel]}"
-        df_tables_wid.loc[j, "description"] = new_line.join(
-            [
-                "The Palma ratio is a measure of inequality that divides the share received by the richest 10% by the share of the poorest 40%. Higher values indicate higher inequality.",
-                wid_welfare["description"][wel],
-                additional_description,
-            ]
+        df_tables_wid.append(
+            {
+                "name": f"Palma ratio {wid_welfare['title'][wel]} (World Inequality Database)",
+                "slug": f"palma_ratio_{wid_welfare['slug'][wel]}",
+                "description": join_paragraphs(
+                    [
+                        "The Palma ratio is a measure of inequality that divides the share received by the richest 10% by the share of the poorest 40%. Higher values indicate higher inequality.",
+                        wid_welfare["description"][wel],
+                        additional_description,
+                    ]
+                ),
+                "unit": np.nan,
+                "shortUnit": np.nan,
+                "type": "Numeric",
+                "colorScaleNumericBins": wid_welfare["scale_palma_ratio"][wel],
+                "colorScaleNumericMinValue": 0,
+                "colorScaleEqualSizeBins": "true",
+                "colorScaleScheme": "YlOrBr",
+            }
         )
-        df_tables_wid.loc[j, "unit"] = np.nan
-        df_tables_wid.loc[j, "shortUnit"] = np.nan
-        df_tables_wid.loc[j, "type"] = "Numeric"
-        df_tables_wid.loc[j, "colorScaleNumericBins"] = wid_welfare[
-            "scale_palma_ratio"
-        ][wel]
-        df_tables_wid.loc[j, "colorScaleNumericMinValue"] = 0
-        df_tables_wid.loc[j, "colorScaleEqualSizeBins"] = "true"
-        df_tables_wid.loc[j, "colorScaleScheme"] = "YlOrBr"
-        j += 1
 
     df_tables_wid["tableSlug"] = wid_tables["name"][tab]
 
+df_tables_wid = df_tables_wid.to_frame()
+
 df_tables_wid["sourceName"] = sourceName
 df_tables_wid["dataPublishedBy"] = dataPublishedBy
 df_tables_wid["sourceLink"] = sourceLink
@@ -445,180 +466,158 @@ df_tables["tolerance"] = df_tables["tolerance"].astype("Int64")
 
 yAxisMin = Y_AXIS_MIN
 
-df_graphers_wid = pd.DataFrame()
+df_graphers_wid = TableBuilder()
 
-j = 0
 
 for tab in range(len(wid_tables)):
     for wel in range(len(wid_welfare)):
         # Gini coefficient
-        df_graphers_wid.loc[j, "title"] = f"Gini coefficient"
-        df_graphers_wid.loc[j, "ySlugs"] = f"p0p100_gini_{wid_welfare['slug'][wel]}"
-        df_graphers_wid.loc[j, "Data Radio"] = (
-            f"{wid_tables['source_name'][tab]} ({wid_welfare['radio_option'][wel]})"
-        )
-        df_graphers_wid.loc[j, "Indicator Dropdown"] = "Gini coefficient"
-        df_graphers_wid.loc[j, "subtitle"] = (
-            f"The Gini coefficient measures inequality on a scale from 0 to 1. Higher values indicate higher inequality. {wid_welfare['subtitle_ineq'][wel]}"
+        df_graphers_wid.append(
+            {
+                "title": f"Gini coefficient",
+                "ySlugs": f"p0p100_gini_{wid_welfare['slug'][wel]}",
+                "Data Radio": f"{wid_tables['source_name'][tab]} ({wid_welfare['radio_option'][wel]})",
+                "Indicator Dropdown": "Gini coefficient",
+                "subtitle": f"The Gini coefficient measures inequality on a scale from 0 to 1. Higher values indicate higher inequality. {wid_welfare['subtitle_ineq'][wel]}",
+                "note": wid_welfare["note"][wel],
+                "type": np.nan,
+                "selectedFacetStrategy": np.nan,
+                "hasMapTab": "true",
+                "tab": "map",
+            }
         )
-        df_graphers_wid.loc[j, "note"] = wid_welfare["note"][wel]
-        df_graphers_wid.loc[j, "type"] = np.nan
-        df_graphers_wid.loc[j, "selectedFacetStrategy"] = np.nan
-        df_graphers_wid.loc[j, "hasMapTab"] = "true"
-        df_graphers_wid.loc[j, "tab"] = "map"
-        j += 1
 
         # Share of the top 10%
-        df_graphers_wid.loc[j, "title"] = (
-            f"{wid_welfare['welfare_type'][wel].capitalize()} share of the richest 10%"
-        )
-        df_graphers_wid.loc[j, "ySlugs"] = f"p90p100_share_{wid_welfare['slug'][wel]}"
-        df_graphers_wid.loc[j, "Data Radio"] = (
-            f"{wid_tables['source_name'][tab]} ({wid_welfare['radio_option'][wel]})"
+        df_graphers_wid.append(
+            {
+                "title": f"{wid_welfare['welfare_type'][wel].capitalize()} share of the richest 10%",
+                "ySlugs": f"p90p100_share_{wid_welfare['slug'][wel]}",
+                "Data Radio": f"{wid_tables['source_name'][tab]} ({wid_welfare['radio_option'][wel]})",
+                "Indicator Dropdown": "Share of the richest 10%",
+                "subtitle": f"The share of income received by the richest 10% of the population. {wid_welfare['subtitle'][wel]}",
+                "note": wid_welfare["note"][wel],
+                "type": np.nan,
+                "selectedFacetStrategy": np.nan,
+                "hasMapTab": "true",
+                "tab": "map",
+            }
         )
-        df_graphers_wid.loc[j, "Indicator Dropdown"] = "Share of the richest 10%"
-        df_graphers_wid.loc[j, "subtitle"] = (
-            f"The share of income received by the richest 10% of the population. {wid_welfare['subtitle'][wel]}"
-        )
-        df_graphers_wid.loc[j, "note"] = wid_welfare["note"][wel]
-        df_graphers_wid.loc[j, "type"] = np.nan
-        df_graphers_wid.loc[j, "selectedFacetStrategy"] = np.nan
-        df_graphers_wid.loc[j, "hasMapTab"] = "true"
-        df_graphers_wid.loc[j, "tab"] = "map"
-        j += 1
 
         # Share of the top 1%
-        df_graphers_wid.loc[j, "title"] = (
-            f"{wid_welfare['welfare_type'][wel].capitalize()} share of the richest 1%"
-        )
-        df_graphers_wid.loc[j, "ySlugs"] = f"p99p100_share_{wid_welfare['slug'][wel]}"
-        df_graphers_wid.loc[j, "Data Radio"] = (
-            f"{wid_tables['source_name'][tab]} ({wid_welfare['radio_option'][wel]})"
-        )
-        df_graphers_wid.loc[j, "Indicator Dropdown"] = "Share of the richest 1%"
-        df_graphers_wid.loc[j, "subtitle"] = (
-            f"The share of income received by the richest 1% of the population. {wid_welfare['subtitle'][wel]}"
+        df_graphers_wid.append(
+            {
+                "title": f"{wid_welfare['welfare_type'][wel].capitalize()} share of the richest 1%",
+                "ySlugs": f"p99p100_share_{wid_welfare['slug'][wel]}",
+                "Data Radio": f"{wid_tables['source_name'][tab]} ({wid_welfare['radio_option'][wel]})",
+                "Indicator Dropdown": "Share of the richest 1%",
+                "subtitle": f"The share of income received by the richest 1% of the population. {wid_welfare['subtitle'][wel]}",
+                "note": wid_welfare["note"][wel],
+                "type": np.nan,
+                "selectedFacetStrategy": np.nan,
+                "hasMapTab": "true",
+                "tab": "map",
+            }
         )
-        df_graphers_wid.loc[j, "note"] = wid_welfare["note"][wel]
-        df_graphers_wid.loc[j, "type"] = np.nan
-        df_graphers_wid.loc[j, "selectedFacetStrategy"] = np.nan
-        df_graphers_wid.loc[j, "hasMapTab"] = "true"
-        df_graphers_wid.loc[j, "tab"] = "map"
-        j += 1
 
         # Share of the top 0.1%
-        df_graphers_wid.loc[j, "title"] = (
-            f"{wid_welfare['welfare_type'][wel].capitalize()} share of the richest 0.1%"
+        df_graphers_wid.append(
+            {
+                "title": f"{wid_welfare['welfare_type'][wel].capitalize()} share of the richest 0.1%",
+                "ySlugs": f"p99_9p100_share_{wid_welfare['slug'][wel]}",
+                "Data Radio": f"{wid_tables['source_name'][tab]} ({wid_welfare['radio_option'][wel]})",
+                "Indicator Dropdown": "Share of the richest 0.1%",
+                "subtitle": f"The share of income received by the richest 0.1% of the population. {wid_welfare['subtitle'][wel]}",
+                "note": wid_welfare["note"][wel],
+                "type": np.nan,
+                "selectedFacetStrategy": np.nan,
+                "hasMapTab": "true",
+                "tab": "map",
+            }
         )
-        df_graphers_wid.loc[j, "ySlugs"] = f"p99_9p100_share_{wid_welfare['slug'][wel]}"
-        df_graphers_wid.loc[j, "Data Radio"] = (
-            f"{wid_tables['source_name'][tab]} ({wid_welfare['radio_option'][wel]})"
-        )
-        df_graphers_wid.loc[j, "Indicator Dropdown"] = "Share of the richest 0.1%"
-        df_graphers_wid.loc[j, "subtitle"] = (
-            f"The share of income received by the richest 0.1% of the population. {wid_welfare['subtitle'][wel]}"
-        )
-        df_graphers_wid.loc[j, "note"] = wid_welfare["note"][wel]
-        df_graphers_wid.loc[j, "type"] = np.nan
-        df_graphers_wid.loc[j, "selectedFacetStrategy"] = np.nan
-        df_graphers_wid.loc[j, "hasMapTab"] = "true"
-        df_graphers_wid.loc[j, "tab"] = "map"
-        j += 1
 
         # Share of the bottom 50%
-        df_graphers_wid.loc[j, "title"] = (
-            f"{wid_welfare['welfare_type'][wel].capitalize()} share of the poorest 50%"
-        )
-        df_graphers_wid.loc[j, "ySlugs"] = f"p0p50_share_{wid_welfare['slug'][wel]}"
-        df_graphers_wid.loc[j, "Data Radio"] = (
-            f"{wid_tables['source_name'][tab]} ({wid_welfare['radio_option'][wel]})"
+        df_graphers_wid.append(
+            {
+                "title": f"{wid_welfare['welfare_type'][wel].capitalize()} share of the poorest 50%",
+                "ySlugs": f"p0p50_share_{wid_welfare['slug'][wel]}",
+                "Data Radio": f"{wid_tables['source_name'][tab]} ({wid_welfare['radio_option'][wel]})",
+                "Indicator Dropdown": "Share of the poorest 50%",
+                "subtitle": f"The share of income received by the poorest 50% of the population. {wid_welfare['subtitle'][wel]}",
+                "note": wid_welfare["note"][wel],
+                "selectedFacetStrategy": np.nan,
+                "hasMapTab": "true",
+                "tab": "map",
+            }
         )
-        df_graphers_wid.loc[j, "Indicator Dropdown"] = "Share of the poorest 50%"
-        df_graphers_wid.loc[j, "subtitle"] = (
-            f"The share of income received by the poorest 50% of the population. {wid_welfare['subtitle'][wel]}"
-        )
-        df_graphers_wid.loc[j, "note"] = wid_welfare["note"][wel]
-        df_graphers_wid.loc[j, "selectedFacetStrategy"] = np.nan
-        df_graphers_wid.loc[j, "hasMapTab"] = "true"
-        df_graphers_wid.loc[j, "tab"] = "map"
-        j += 1
 
         # # P90/P10
-        # df_graphers_wid.loc[
-        #     j, "title"
-        # ] = f"P90/P10 ratio"
-        # df_graphers_wid.loc[j, "ySlugs"] = f"p90_p10_ratio_{wid_welfare['slug'][wel]}"
-        # df_graphers_wid.loc[
-        #     j, "Data Radio"
-        # ] = f"{wid_tables['source_name'][tab]} ({wid_welfare['radio_option'][wel]})"
-        # df_graphers_wid.loc[j, "Indicator Dropdown"] = "P90/P10"
-        # df_graphers_wid.loc[
-        #     j, "subtitle"
-        # ] = f"P90 and P10 are the levels of {wid_welfare['welfare_type'][wel]} below which 90% and 10% of the population live, respectively. This variable gives the ratio of the two. It is a measure of inequality that indicates the gap between the richest and poorest tenth of the population. {wid_welfare['subtitle'][wel]}"
-        # df_graphers_wid.loc[j, "note"] = f"wid_welfare['note'][wel]"
-        # df_graphers_wid.loc[j, "type"] = np.nan
-        # df_graphers_wid.loc[j, "selectedFacetStrategy"] = np.nan
-        # df_graphers_wid.loc[j, "hasMapTab"] = "true"
-        # df_graphers_wid.loc[j, "tab"] = "map"
-        # j += 1
+        # df_graphers_wid.append(
+        #     {
+        #         "title": f"P90/P10 ratio",
+        #         "ySlugs": f"p90_p10_ratio_{wid_welfare['slug'][wel]}",
+        #         "Data Radio": f"{wid_tables['source_name'][tab]} ({wid_welfare['radio_option'][wel]})",
+        #         "Indicator Dropdown": "P90/P10",
+        #         "subtitle": f"P90 and P10 are the levels of {wid_welfare['welfare_type'][wel]} below which 90% and 10% of the population live, respectively. This variable gives the ratio of the two. It is a measure of inequality that indicates the gap between the richest and poorest tenth of the population. {wid_welfare['subtitle'][wel]}",
+        #         "note": f"wid_welfare['note'][wel]",
+        #         "type": np.nan,
+        #         "selectedFacetStrategy": np.nan,
+        #         "hasMapTab": "true",
+        #         "tab": "map",
+        #     }
+        # )
 
         # # P90/P50
-        # df_graphers_wid.loc[
-        #     j, "title"
-        # ] = f"P90/P50 ratio"
-        # df_graphers_wid.loc[j, "ySlugs"] = f"p90_p50_ratio_{wid_welfare['slug'][wel]}"
-        # df_graphers_wid.loc[
-        #     j, "Data Radio"
-        # ] = f"{wid_tables['source_name'][tab]} ({wid_welfare['radio_option'][wel]})"
-        # df_graphers_wid.loc[j, "Indicator Dropdown"] = "P90/P50"
-        # df_graphers_wid.loc[
-        #     j, "subtitle"
-        # ] = f"The P90/P50 ratio measures the degree of inequality within the richest half of the population. A ratio of 2 means that someone just falling in the richest tenth of the population has twice the median {wid_welfare['welfare_type'][wel]}. {wid_welfare['subtitle'][wel]}"
-        # df_graphers_wid.loc[j, "note"] = f"{wid_welfare['note'][wel]}"
-        # df_graphers_wid.loc[j, "type"] = np.nan
-        # df_graphers_wid.loc[j, "selectedFacetStrategy"] = np.nan
-        # df_graphers_wid.loc[j, "hasMapTab"] = "true"
-        # df_graphers_wid.loc[j, "tab"] = "map"
-        # j += 1
+        # df_graphers_wid.append(
+        #     {
+        #         "title": f"P90/P50 ratio",
+        #         "ySlugs": f"p90_p50_ratio_{wid_welfare['slug'][wel]}",
+        #         "Data Radio": f"{wid_tables['source_name'][tab]} ({wid_welfare['radio_option'][wel]})",
+        #         "Indicator Dropdown": "P90/P50",
+        #         "subtitle": f"The P90/P50 ratio measures the degree of inequality within the richest half of the population. A ratio of 2 means that someone just falling in the richest tenth of the population has twice the median {wid_welfare['welfare_type'][wel]}. {wid_welfare['subtitle'][wel]}",
+        #         "note": f"{wid_welfare['note'][wel]}",
+        #         "type": np.nan,
+        #         "selectedFacetStrategy": np.nan,
+        #         "hasMapTab": "true",
+        #         "tab": "map",
+        #     }
+        # )
 
         # # P50/P10
-        # df_graphers_wid.loc[
-        #     j, "title"
-        # ] = f"P50/P10 ratio"
-        # df_graphers_wid.loc[j, "ySlugs"] = f"p50_p10_ratio_{wid_welfare['slug'][wel]}"
-        # df_graphers_wid.loc[
-        #     j, "Data Radio"
-        # ] = f"{wid_tables['source_name'][tab]} ({wid_welfare['radio_option'][wel]})"
-        # df_graphers_wid.loc[j, "Indicator Dropdown"] = "P50/P10"
-        # df_graphers_wid.loc[
-        #     j, "subtitle"
-        # ] = f"The P50/P10 ratio measures the degree of inequality within the poorest half of the population. A ratio of 2 means that the median {wid_welfare['welfare_type'][wel]} is two times higher than that of someone just falling in the poorest tenth of the population. {wid_welfare['subtitle'][wel]}"
-        # df_graphers_wid.loc[j, "note"] = f"{wid_welfare['note'][wel]}"
-        # df_graphers_wid.loc[j, "type"] = np.nan
-        # df_graphers_wid.loc[j, "selectedFacetStrategy"] = np.nan
-        # df_graphers_wid.loc[j, "hasMapTab"] = "true"
-        # df_graphers_wid.loc[j, "tab"] = "map"
-        # j += 1
+        # df_graphers_wid.append(
+        #     {
+        #         "title": f"P50/P10 ratio",
+        #         "ySlugs": f"p50_p10_ratio_{wid_welfare['slug'][wel]}",
+        #         "Data Radio": f"{wid_tables['source_name'][tab]} ({wid_welfare['radio_option'][wel]})",
+        #         "Indicator Dropdown": "P50/P10",
+        #         "subtitle": f"The P50/P10 ratio measures the degree of inequality within the poorest half of the population. A ratio of 2 means that the median {wid_welfare['welfare_type'][wel]} is two times higher than that of someone just falling in the poorest tenth of the population. {wid_welfare['subtitle'][wel]}",
+        #         "note": f"{wid_welfare['note'][wel]}",
+        #         "type": np.nan,
+        #         "selectedFacetStrategy": np.nan,
+        #         "hasMapTab": "true",
+        #         "tab": "map",
+        #     }
+        # )
 
         # # Palma ratio
-        df_graphers_wid.loc[j, "title"] = f"Palma ratio"
-        df_graphers_wid.loc[j, "ySlugs"] = f"palma_ratio_{wid_welfare['slug'][wel]}"
-        df_graphers_wid.loc[j, "Data Radio"] = (
-            f"{wid_tables['source_name'][tab]} ({wid_welfare['radio_option'][wel]})"
-        )
-        df_graphers_wid.loc[j, "Indicator Dropdown"] = "Palma ratio"
-        df_graphers_wid.loc[j, "subtitle"] = (
-            f"The Palma ratio is a measure of inequality that divides the share received by the richest 10% by the share of the poorest 40%. Higher values indicate higher inequality. {wid_welfare['subtitle_ineq'][wel]}"
+        df_graphers_wid.append(
+            {
+                "title": f"Palma ratio",
+                "ySlugs": f"palma_ratio_{wid_welfare['slug'][wel]}",
+                "Data Radio": f"{wid_tables['source_name'][tab]} ({wid_welfare['radio_option'][wel]})",
+                "Indicator Dropdown": "Palma ratio",
+                "subtitle": f"The Palma ratio is a measure of inequality that divides the share received by the richest 10% by the share of the poorest 40%. Higher values indicate higher inequality. {wid_welfare['subtitle_ineq'][wel]}",
+                "note": wid_welfare["note"][wel],
+                "type": np.nan,
+                "selectedFacetStrategy": np.nan,
+                "hasMapTab": "true",
+                "tab": "map",
+            }
         )
-        df_graphers_wid.loc[j, "note"] = wid_welfare["note"][wel]
-        df_graphers_wid.loc[j, "type"] = np.nan
-        df_graphers_wid.loc[j, "selectedFacetStrategy"] = np.nan
-        df_graphers_wid.loc[j, "hasMapTab"] = "true"
-        df_graphers_wid.loc[j, "tab"] = "map"
-        j += 1
 
     df_graphers_wid["tableSlug"] = wid_tables["name"][tab]
 
+df_graphers_wid = df_graphers_wid.to_frame()
+
 # Keep only pretax national values for WID:
 df_graphers_wid = df_graphers_wid[
     df_graphers_wid["ySlugs"].str.contains("pretax")
@@ -633,170 +632,147 @@ df_graphers_wid["yAxisMin"] = yAxisMin
 ###########################################################################################
 yAxisMin = Y_AXIS_MIN
 
-df_graphers_pip = pd.DataFrame()
+df_graphers_pip = TableBuilder()
 
-j = 0
 
 for survey in range(len(pip_tables)):
     # Gini coefficient
-    df_graphers_pip.loc[j, "title"] = f"Gini coefficient"
-    df_graphers_pip.loc[j, "ySlugs"] = f"gini"
-    df_graphers_pip.loc[j, "Data Radio"] = (
-        f"{pip_tables['source_name'][tab]} ({pip_tables['dropdown_option'][survey]})"
+    df_graphers_pip.append(
+        {
+            "title": f"Gini coefficient",
+            "ySlugs": f"gini",
+            "Data Radio": f"{pip_tables['source_name'][tab]} ({pip_tables['dropdown_option'][survey]})",
+            "Indicator Dropdown": "Gini coefficient",
+            "tableSlug": f"{pip_tables.table_name[survey]}",
+            "subtitle": f"The Gini coefficient measures inequality on a scale from 0 to 1. Higher values indicate higher inequality. Depending on the country and year, the data relates to income measured after taxes and benefits, or to consumption, [per capita](#dod:per-capita).",
+            "note": "",
+            "type": np.nan,
+            "selectedFacetStrategy": np.nan,
+            "hasMapTab": "true",
+            "tab": "map",
+        }
     )
-    df_graphers_pip.loc[j, "Indicator Dropdown"] = "Gini coefficient"
-    df_graphers_pip.loc[j, "tableSlug"] = f"{pip_tables.table_name[survey]}"
-    df_graphers_pip.loc[j, "subtitle"] = (
-        f"The Gini coefficient measures inequality on a scale from 0 to 1. Higher values indicate higher inequality. Depending on the country and year, the data relates to income measured after taxes and benefits, or to consumption, [per capita](#dod:per-capita)."
-    )
-    df_graphers_pip.loc[j, "note"] = ""
-    df_graphers_pip.loc[j, "type"] = np.nan
-    df_graphers_pip.loc[j, "selectedFacetStrategy"] = np.nan
-    df_graphers_pip.loc[j, "hasMapTab"] = "true"
-    df_graphers_pip.loc[j, "tab"] = "map"
-    j += 1
 
     # Share of the top 10%
-    df_graphers_pip.loc[j, "title"] = (
-        f"{pip_tables.text[survey].capitalize()} share of the richest 10%"
-    )
-    df_graphers_pip.loc[j, "ySlugs"] = f"decile10_share"
-    df_graphers_pip.loc[j, "Data Radio"] = (
-        f"{pip_tables['source_name'][tab]} ({pip_tables['dropdown_option'][survey]})"
-    )
-    df_graphers_pip.loc[j, "Indicator Dropdown"] = "Share of the richest 10%"
-    df_graphers_pip.loc[j, "tableSlug"] = f"{pip_tables.table_name[survey]}"
-    df_graphers_pip.loc[j, "subtitle"] = (
-        f"The share of after tax income or consumption received by the richest 10% of the population."
+    df_graphers_pip.append(
+        {
+            "title": f"{pip_tables.text[survey].capitalize()} share of the richest 10%",
+            "ySlugs": f"decile10_share",
+            "Data Radio": f"{pip_tables['source_name'][tab]} ({pip_tables['dropdown_option'][survey]})",
+            "Indicator Dropdown": "Share of the richest 10%",
+            "tableSlug": f"{pip_tables.table_name[survey]}",
+            "subtitle": f"The share of after tax income or consumption received by the richest 10% of the population.",
+            "note": f"Depending on the country and year, the data relates to income measured after taxes and benefits, or to consumption, [per capita](#dod:per-capita).",
+            "type": np.nan,
+            "selectedFacetStrategy": np.nan,
+            "hasMapTab": "true",
+            "tab": "map",
+        }
     )
-    df_graphers_pip.loc[j, "note"] = (
-        f"Depending on the country and year, the data relates to income measured after taxes and benefits, or to consumption, [per capita](#dod:per-capita)."
-    )
-    df_graphers_pip.loc[j, "type"] = np.nan
-    df_graphers_pip.loc[j, "selectedFacetStrategy"] = np.nan
-    df_graphers_pip.loc[j, "hasMapTab"] = "true"
-    df_graphers_pip.loc[j, "tab"] = "map"
-    j += 1
 
     # Share of the bottom 50%
-    df_graphers_pip.loc[j, "title"] = (
-        f"{pip_tables.text[survey].capitalize()} share of the poorest 50%"
-    )
-    df_graphers_pip.loc[j, "ySlugs"] = f"bottom50_share"
-    df_graphers_pip.loc[j, "Data Radio"] = (
-        f"{pip_tables['source_name'][tab]} ({pip_tables['dropdown_option'][survey]})"
-    )
-    df_graphers_pip.loc[j, "Indicator Dropdown"] = "Share of the poorest 50%"
-    df_graphers_pip.loc[j, "tableSlug"] = f"{pip_tables.table_name[survey]}"
-    df_graphers_pip.loc[j, "subtitle"] = (
-        f"The share of after tax income or consumption received by the poorest 50% of the population."
+    df_graphers_pip.append(
+        {
+            "title": f"{pip_tables.text[survey].capitalize()} share of the poorest 50%",
+            "ySlugs": f"bottom50_share",
+            "Data Radio": f"{pip_tables['source_name'][tab]} ({pip_tables['dropdown_option'][survey]})",
+            "Indicator Dropdown": "Share of the poorest 50%",
+            "tableSlug": f"{pip_tables.table_name[survey]}",
+            "subtitle": f"The share of after tax income or consumption received by the poorest 50% of the population.",
+            "note": f"Depending on the country and year, the data relates to income measured after taxes and benefits, or to consumption, [per capita](#dod:per-capita).",
+            "type": np.nan,
+            "selectedFacetStrategy": np.nan,
+            "hasMapTab": "true",
+            "tab": "map",
+        }
     )
-    df_graphers_pip.loc[j, "note"] = (
-        f"Depending on the country and year, the data relates to income measured after taxes and benefits, or to consumption, [per capita](#dod:per-capita)."
-    )
-    df_graphers_pip.loc[j, "type"] = np.nan
-    df_graphers_pip.loc[j, "selectedFacetStrategy"] = np.nan
-    df_graphers_pip.loc[j, "hasMapTab"] = "true"
-    df_graphers_pip.loc[j, "tab"] = "map"
-    j += 1
 
     # # P90/P10
-    # df_graphers_pip.loc[j, "title"] = f"P90/P10 ratio"
-    # df_graphers_pip.loc[j, "ySlugs"] = f"p90_p10_ratio"
-    # df_graphers_pip.loc[
-    #     j, "Data Radio"
-    # ] = f"{pip_tables['source_name'][tab]} ({pip_tables['dropdown_option'][survey]})"
-    # df_graphers_pip.loc[j, "Indicator Dropdown"] = "P90/P10"
-    # df_graphers_pip.loc[j, "tableSlug"] = f"{pip_tables.table_name[survey]}"
-    # df_graphers_pip.loc[
-    #     j, "subtitle"
-    # ] = f"P90 and P10 are the levels of {pip_tables.text[survey]} below which 90% and 10% of the population live, respectively. This variable gives the ratio of the two. It is a measure of inequality that indicates the gap between the richest and poorest tenth of the population."
-    # df_graphers_pip.loc[
-    #     j, "note"
-    # ] = f"Depending on the country and year, the data relates to disposable {pip_tables.text[survey]} per capita."
-    # df_graphers_pip.loc[j, "type"] = np.nan
-    # df_graphers_pip.loc[j, "selectedFacetStrategy"] = np.nan
-    # df_graphers_pip.loc[j, "hasMapTab"] = "true"
-    # df_graphers_pip.loc[j, "tab"] = "map"
-    # j += 1
+    # df_graphers_pip.append(
+    #     {
+    #         "title": f"P90/P10 ratio",
+    #         "ySlugs": f"p90_p10_ratio",
+    #         "Data Radio": f"{pip_tables['source_name'][tab]} ({pip_tables['dropdown_option'][survey]})",
+    #         "Indicator Dropdown": "P90/P10",
+    #         "tableSlug": f"{pip_tables.table_name[survey]}",
+    #         "subtitle": f"P90 and P10 are the levels of {pip_tables.text[survey]} below which 90% and 10% of the population live, respectively. This variable gives the ratio of the two. It is a measure of inequality that indicates the gap between the richest and poorest tenth of the population.",
+    #         "note": f"Depending on the country and year, the data relates to disposable {pip_tables.text[survey]} per capita.",
+    #         "type": np.nan,
+    #         "selectedFacetStrategy": np.nan,
+    #         "hasMapTab": "true",
+    #         "tab": "map",
+    #     }
+    # )
 
     # # P90/P50
-    # df_graphers_pip.loc[j, "title"] = f"P90/P50 ratio"
-    # df_graphers_pip.loc[j, "ySlugs"] = f"p90_p50_ratio"
-    # df_graphers_pip.loc[
-    #     j, "Data Radio"
-    # ] = f"{pip_tables['source_name'][tab]} ({pip_tables['dropdown_option'][survey]})"
-    # df_graphers_pip.loc[j, "Indicator Dropdown"] = "P90/P50"
-    # df_graphers_pip.loc[j, "tableSlug"] = f"{pip_tables.table_name[survey]}"
-    # df_graphers_pip.loc[
-    #     j, "subtitle"
-    # ] = f"The P90/P50 ratio measures the degree of inequality within the richest half of the population. A ratio of 2 means that someone just falling in the richest tenth of the population has twice the median {pip_tables.text[survey]}."
-    # df_graphers_pip.loc[
-    #     j, "note"
-    # ] = f"Depending on the country and year, the data relates to disposable {pip_tables.text[survey]} per capita."
-    # df_graphers_pip.loc[j, "type"] = np.nan
-    # df_graphers_pip.loc[j, "selectedFacetStrategy"] = np.nan
-    # df_graphers_pip.loc[j, "hasMapTab"] = "true"
-    # df_graphers_pip.loc[j, "tab"] = "map"
-    # j += 1
+    # df_graphers_pip.append(
+    #     {
+    #         "title": f"P90/P50 ratio",
+    #         "ySlugs": f"p90_p50_ratio",
+    #         "Data Radio": f"{pip_tables['source_name'][tab]} ({pip_tables['dropdown_option'][survey]})",
+    #         "Indicator Dropdown": "P90/P50",
+    #         "tableSlug": f"{pip_tables.table_name[survey]}",
+    #         "subtitle": f"The P90/P50 ratio measures the degree of inequality within the richest half of the population. A ratio of 2 means that someone just falling in the richest tenth of the population has twice the median {pip_tables.text[survey]}.",
+    #         "note": f"Depending on the country and year, the data relates to disposable {pip_tables.text[survey]} per capita.",
+    #         "type": np.nan,
+    #         "selectedFacetStrategy": np.nan,
+    #         "hasMapTab": "true",
+    #         "tab": "map",
+    #     }
+    # )
 
     # # P50/P10
-    # df_graphers_pip.loc[j, "title"] = f"P50/P10 ratio"
-    # df_graphers_pip.loc[j, "ySlugs"] = f"p50_p10_ratio"
-    # df_graphers_pip.loc[
-    #     j, "Data Radio"
-    # ] = f"{pip_tables['source_name'][tab]} ({pip_tables['dropdown_option'][survey]})"
-    # df_graphers_pip.loc[j, "Indicator Dropdown"] = "P50/P10"
-    # df_graphers_pip.loc[j, "tableSlug"] = f"{pip_tables.table_name[survey]}"
-    # df_graphers_pip.loc[
-    #     j, "subtitle"
-    # ] = f"The P50/P10 ratio measures the degree of inequality within the poorest half of the population. A ratio of 2 means that the median {pip_tables.text[survey]} is two times higher than that of someone just falling in the poorest tenth of the population."
-    # df_graphers_pip.loc[
-    #     j, "note"
-    # ] = f"Depending on the country and year, the data relates to disposable {pip_tables.text[survey]} per capita."
-    # df_graphers_pip.loc[j, "type"] = np.nan
-    # df_graphers_pip.loc[j, "selectedFacetStrategy"] = np.nan
-    # df_graphers_pip.loc[j, "hasMapTab"] = "true"
-    # df_graphers_pip.loc[j, "tab"] = "map"
-    # j += 1
+    # df_graphers_pip.append(
+    #     {
+    #         "title": f"P50/P10 ratio",
+    #         "ySlugs": f"p50_p10_ratio",
+    #         "Data Radio": f"{pip_tables['source_name'][tab]} ({pip_tables['dropdown_option'][survey]})",
+    #         "Indicator Dropdown": "P50/P10",
+    #         "tableSlug": f"{pip_tables.table_name[survey]}",
+    #         "subtitle": f"The P50/P10 ratio measures the degree of inequality within the poorest half of the population. A ratio of 2 means that the median {pip_tables.text[survey]} is two times higher than that of someone just falling in the poorest tenth of the population.",
+    #         "note": f"Depending on the country and year, the data relates to disposable {pip_tables.text[survey]} per capita.",
+    #         "type": np.nan,
+    #         "selectedFacetStrategy": np.nan,
+    #         "hasMapTab": "true",
+    #         "tab": "map",
+    #     }
+    # )
 
     # Palma ratio
-    df_graphers_pip.loc[j, "title"] = f"Palma ratio"
-    df_graphers_pip.loc[j, "ySlugs"] = f"palma_ratio"
-    df_graphers_pip.loc[j, "Data Radio"] = (
-        f"{pip_tables['source_name'][tab]} ({pip_tables['dropdown_option'][survey]})"
-    )
-    df_graphers_pip.loc[j, "Indicator Dropdown"] = "Palma ratio"
-    df_graphers_pip.loc[j, "tableSlug"] = f"{pip_tables.table_name[survey]}"
-    df_graphers_pip.loc[j, "subtitle"] = (
-        f"The Palma ratio is a measure of inequality that divides the share received by the richest 10% by the share of the poorest 40%. Higher values indicate higher inequality. Depending on the country and year, the data relates to income measured after taxes and benefits, or to consumption, [per capita](#dod:per-capita)."
+    df_graphers_pip.append(
+        {
+            "title": f"Palma ratio",
+            "ySlugs": f"palma_ratio",
+            "Data Radio": f"{pip_tables['source_name'][tab]} ({pip_tables['dropdown_option'][survey]})",
+            "Indicator Dropdown": "Palma ratio",
+            "tableSlug": f"{pip_tables.table_name[survey]}",
+            "subtitle": f"The Palma ratio is a measure of inequality that divides the share received by the richest 10% by the share of the poorest 40%. Higher values indicate higher inequality. Depending on the country and year, the data relates to income measured after taxes and benefits, or to consumption, [per capita](#dod:per-capita).",
+            "note": "",
+            "type": np.nan,
+            "selectedFacetStrategy": np.nan,
+            "hasMapTab": "true",
+            "tab": "map",
+        }
     )
-    df_graphers_pip.loc[j, "note"] = ""
-    df_graphers_pip.loc[j, "type"] = np.nan
-    df_graphers_pip.loc[j, "selectedFacetStrategy"] = np.nan
-    df_graphers_pip.loc[j, "hasMapTab"] = "true"
-    df_graphers_pip.loc[j, "tab"] = "map"
-    j += 1
 
     # Headcount ratio (rel)
-    df_graphers_pip.loc[j, "title"] = "Share of people in relative poverty"
-    df_graphers_pip.loc[j, "ySlugs"] = f"headcount_ratio_50_median"
-    df_graphers_pip.loc[j, "Data Radio"] = (
-        f"{pip_tables['source_name'][tab]} ({pip_tables['dropdown_option'][survey]})"
-    )
-    df_graphers_pip.loc[j, "Indicator Dropdown"] = f"Share in relative poverty"
-    df_graphers_pip.loc[j, "tableSlug"] = f"{pip_tables.table_name[survey]}"
-    df_graphers_pip.loc[j, "subtitle"] = (
-        f"The share of population with after tax income or consumption below 50% of the median. Relative poverty reflects the extent of inequality within the bottom of the distribution."
+    df_graphers_pip.append(
+        {
+            "title": "Share of people in relative poverty",
+            "ySlugs": f"headcount_ratio_50_median",
+            "Data Radio": f"{pip_tables['source_name'][tab]} ({pip_tables['dropdown_option'][survey]})",
+            "Indicator Dropdown": f"Share in relative poverty",
+            "tableSlug": f"{pip_tables.table_name[survey]}",
+            "subtitle": f"The share of population with after tax income or consumption below 50% of the median. Relative poverty reflects the extent of inequality within the bottom of the distribution.",
+            "note": f"Depending on the country and year, the data relates to income measured after taxes and benefits, or to consumption, [per capita](#dod:per-capita).",
+            "type": np.nan,
+            "selectedFacetStrategy": np.nan,
+            "hasMapTab": "true",
+            "tab": "map",
+        }
     )
-    df_graphers_pip.loc[j, "note"] = (
-        f"Depending on the country and year, the data relates to income measured after taxes and benefits, or to consumption, [per capita](#dod:per-capita)."
-    )
-    df_graphers_pip.loc[j, "type"] = np.nan
-    df_graphers_pip.loc[j, "selectedFacetStrategy"] = np.nan
-    df_graphers_pip.loc[j, "hasMapTab"] = "true"
-    df_graphers_pip.loc[j, "tab"] = "map"
-    j += 1
+
+df_graphers_pip = df_graphers_pip.to_frame()
 
 # Add yAxisMin
 df_graphers_pip["yAxisMin"] = yAxisMin
@@ -828,32 +804,17 @@ df_graphers.loc[
 # Define list of variables to iterate: table names (from table dataframe)
 table_list = list(df_tables["tableSlug"].unique())
 
-# Header is converted into a tab-separated text
-header_tsv = df_header.to_csv(sep="\t", header=False)
-
-# Graphers table is converted into a tab-separated text
-graphers_tsv = df_graphers
-graphers_tsv = graphers_tsv.to_csv(sep="\t", index=False)
-
-# This table is indented, to follow explorers' format
-graphers_tsv_indented = textwrap.indent(graphers_tsv, "\t")
-
 # The dataframes are combined, including tables and links to the datasets
 with open(outfile, "w", newline="\n", encoding="utf-8") as f:
-    f.write(header_tsv)
-    f.write("\ngraphers\n" + graphers_tsv_indented)
+    explorer = ExplorerWriter(f)
+    explorer.write_header(df_header)
+    explorer.write_graphers(df_graphers)
 
-    for tab in table_list:
-        table_tsv = (
-            df_tables[df_tables["tableSlug"] == tab].copy().reset_index(drop=True)
-        )
-        table_tsv = table_tsv.drop(columns=["tableSlug"])
-        table_tsv = table_tsv.to_csv(sep="\t", index=False)
-        table_tsv_indented = textwrap.indent(table_tsv, "\t")
-        f.write(
-            "\ntable\t"
-            + all_the_tables.loc[all_the_tables["name"] == tab, "link"].item()
-            + "\t"
-            + tab
-        )
-        f.write("\ncolumns\t" + tab + "\n" + table_tsv_indented)
+    explorer.write_tables(
+        df_tables,
+        "tableSlug",
+        [
+            (tab, all_the_tables.loc[all_the_tables["name"] == tab, "link"].item())
+            for tab in table_list
+        ],
+    )
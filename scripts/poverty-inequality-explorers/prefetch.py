@@ -0,0 +1,93 @@
+####################################################################################################
+# PREFETCH GOOGLE SHEETS
+####################################################################################################
+"""
+Download every Google sheet read by the explorer generators at the same time.
+
+The generators read their sheets one after the other, and most tabs (`povlines_abs`,
+`povlines_rel`, `survey_type`, `tables`...) are read by several of them. This script finds all
+the (sheet_id, sheet_name) pairs in the source of the generators and downloads each one once, in
+parallel, into the cache of sheets.py. The generators run afterwards read them from the cache, so
+the time spent downloading is close to the time of the slowest sheet.
+
+python -m scripts.poverty-inequality-explorers.prefetch
+"""
+
+import ast
+import time
+from pathlib import Path
+
+from .sheets import prefetch_sheets
+
+# Explorer generators, as modules relative to this folder
+GENERATORS = [
+    "wbpip.pip_expanded_poverty_explorer",
+    "wbpip.pip_incomes_across_distribution_explorer",
+    "wbpip.pip_inequality_explorer",
+    "wbpip.pip_poverty_explorer",
+    "wbpip.pip_ppp_comparison_explorer",
+    "wid.wid_incomes_across_distribution_explorer",
+    "wid.wid_inequality_explorer",
+    "lis.lis_expanded_poverty_explorer",
+    "lis.lis_incomes_across_distribution_explorer",
+    "lis.lis_inequality_explorer",
+    "multisource.incomes_across_distribution_explorer_comparison",
+    "multisource.inequality_explorer_comparison",
+    "multisource.inequality_explorer",
+    "multisource.poverty_explorer_comparison",
+]
+
+
+def generator_path(generator):
+    """Path of the source file of a generator."""
+    return Path(__file__).parent.joinpath(*generator.split(".")).with_suffix(".py")
+
+
+def find_sheets(generators=GENERATORS):
+    """
+    Return the (sheet_id, sheet_name) pairs read by the generators, in the order they are read.
+    The arguments of each `read_sheet` call are resolved from the last `sheet_id = "..."` and
+    `sheet_name = "..."` assignments before it.
+    """
+    pairs = []
+    for generator in generators:
+        tree = ast.parse(generator_path(generator).read_text())
+        constants = {}
+        for statement in tree.body:
+            if (
+                isinstance(statement, ast.Assign)
+                and len(statement.targets) == 1
+                and isinstance(statement.targets[0], ast.Name)
+                and isinstance(statement.value, ast.Constant)
+            ):
+                constants[statement.targets[0].id] = statement.value.value
+
+            for node in ast.walk(statement):
+                if (
+                    isinstance(node, ast.Call)
+                    and isinstance(node.func, ast.Name)
+                    and node.func.id == "read_sheet"
+                ):
+                    pair = tuple(_resolve(arg, constants) for arg in node.args[:2])
+                    if None in pair:
+                        raise ValueError(
+                            f"Could not resolve the sheet read in {generator} at line {node.lineno}"
+                        )
+                    if pair not in pairs:
+                        pairs.append(pair)
+
+    return pairs
+
+
+def _resolve(node, constants):
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, ast.Name):
+        return constants.get(node.id)
+    return None
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    n_sheets = prefetch_sheets(find_sheets())
+    print(f"{n_sheets} sheets prefetched in {time.perf_counter() - start:.2f}s")
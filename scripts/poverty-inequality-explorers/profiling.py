@@ -0,0 +1,309 @@
+####################################################################################################
+# PROFILING
+####################################################################################################
+"""
+Optional instrumentation of the explorer generators, to see where the time of a run goes.
+
+Profiling is off unless the environment variable EXPLORER_PROFILE is set to the path of a trace
+file. Each span measured is then appended to it as a line of JSON, with the generator, the name and
+kind of the span, its stage, the seconds it took, the rows of the DataFrames it produced and its
+nesting depth. These variables add more detail to the spans of the `tables`, `graphers` and `write`
+stages:
+- EXPLORER_PROFILE_CPROFILE=1: the functions with the most cumulative time, from cProfile.
+- EXPLORER_PROFILE_TRACEMALLOC=1: the peak of memory allocated and the lines that allocated most,
+  from tracemalloc (this makes the generators several times slower).
+
+Spans come from:
+- `span(name)`, a context manager for any block of code.
+- `profiled`, a decorator for the helpers shared by the generators (TableBuilder.to_frame,
+  ExplorerWriter.write_tables, dimensions.expand...).
+- `run_script`, which runs a generator cell by cell (`# %%`) with a span for each cell, in the stage
+  given by the markdown heading above it (see STAGE_HEADINGS). build_all.py runs the generators
+  this way when profiling is on, as does this command:
+
+EXPLORER_PROFILE=trace.jsonl python -m scripts.poverty-inequality-explorers.profiling wbpip.pip_poverty_explorer
+
+Without EXPLORER_PROFILE, the command writes the trace to `<generator>.trace.jsonl` and prints a
+summary of the cells. The spans are free when profiling is off: `span` returns right away and
+`run_script` runs the cells as `python -m` would.
+"""
+
+import builtins
+import contextlib
+import cProfile
+import functools
+import io
+import json
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import pandas as pd
+
+TRACE_PATH = os.environ.get("EXPLORER_PROFILE") or None
+CPROFILE = os.environ.get("EXPLORER_PROFILE_CPROFILE", "") not in ("", "0")
+TRACEMALLOC = os.environ.get("EXPLORER_PROFILE_TRACEMALLOC", "") not in ("", "0")
+
+# Stages whose spans get cProfile and tracemalloc details, when they are enabled
+DETAIL_STAGES = {"tables", "graphers", "write"}
+
+# Stage of the cells after each markdown heading, by the first matching text of the heading.
+# Cells before the first heading (imports) are in the `setup` stage
+STAGE_HEADINGS = [
+    ("Explorer generation", "write"),
+    ("Grapher", "graphers"),
+    ("Final adjustments", "graphers"),
+    ("Google sheets", "sheets"),
+    ("Header", "tables"),
+    ("Table", "tables"),
+]
+
+# Number of functions and lines reported by cProfile and tracemalloc
+TOP = 15
+
+_state = {
+    "generator": Path(sys.argv[0]).stem,
+    "stage": None,
+    "depth": 0,
+    "detail": False,
+    "start": time.perf_counter(),
+}
+
+
+def enabled():
+    """Whether profiling is on."""
+    return TRACE_PATH is not None
+
+
+@contextlib.contextmanager
+def span(name, kind="span", stage=None):
+    """
+    Measure a block of code and write it to the trace. The block receives a dictionary where it can
+    add more fields to the record, like `record["rows"] = {"df_tables": len(df_tables)}`.
+    `stage` is inherited from the enclosing span when not given.
+    """
+    record = {}
+    if not enabled():
+        yield record
+        return
+
+    stage = stage or _state["stage"]
+    outer_stage, depth = _state["stage"], _state["depth"]
+    _state["stage"], _state["depth"] = stage, depth + 1
+
+    # Only the outermost span of a stage gets the details (cProfile cannot be nested)
+    detail = (
+        stage in DETAIL_STAGES and not _state["detail"] and (CPROFILE or TRACEMALLOC)
+    )
+    profiler = cProfile.Profile() if detail and CPROFILE else None
+    started_tracemalloc = detail and TRACEMALLOC and not tracemalloc.is_tracing()
+    if detail:
+        _state["detail"] = True
+        if started_tracemalloc:
+            tracemalloc.start()
+        if TRACEMALLOC:
+            tracemalloc.reset_peak()
+        if profiler is not None:
+            profiler.enable()
+
+    start = time.perf_counter()
+    try:
+        yield record
+    finally:
+        seconds = time.perf_counter() - start
+        if detail:
+            if profiler is not None:
+                profiler.disable()
+                record["cprofile"] = _top_functions(profiler)
+            if TRACEMALLOC:
+                record["tracemalloc"] = _top_allocations()
+                if started_tracemalloc:
+                    tracemalloc.stop()
+            _state["detail"] = False
+        _state["stage"], _state["depth"] = outer_stage, depth
+
+        _write(
+            {
+                "generator": _state["generator"],
+                "name": name,
+                "kind": kind,
+                "stage": stage,
+                "depth": depth,
+                "start": start - _state["start"],
+                "seconds": seconds,
+                **record,
+            }
+        )
+
+
+def profiled(function):
+    """Decorator that measures each call of `function` in a span, with the rows of the DataFrame it returns."""
+    name = function.__qualname__
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if not enabled():
+            return function(*args, **kwargs)
+        with span(name, kind="function") as record:
+            result = function(*args, **kwargs)
+            if isinstance(result, pd.DataFrame):
+                record["rows"] = {"result": len(result)}
+            return result
+
+    return wrapper
+
+
+def split_cells(source):
+    """
+    Split the source of a script into its `# %%` cells. Return a list of (line number, is markdown,
+    source) tuples, with the line number of the first line of each cell.
+    """
+    cells = []
+    lines = source.splitlines(keepends=True)
+    start = 0
+    for i, line in enumerate(lines + ["# %%"]):
+        if line.startswith("# %%"):
+            if i > start:
+                is_markdown = lines[start].startswith("# %% [markdown]")
+                cells.append((start + 1, is_markdown, "".join(lines[start:i])))
+            start = i
+
+    return cells
+
+
+def heading_stage(cell):
+    """Stage of the cells after a markdown cell, or None if its heading does not start a new one."""
+    for text, stage in STAGE_HEADINGS:
+        if text in cell:
+            return stage
+    return None
+
+
+def run_script(path, package, generator=None):
+    """
+    Run the script in `path` as `python -m` would with `package`, cell by cell, with a span for each
+    cell named after its first line of code or comment. Markdown cells are run too, since they can
+    have code, but cells with only comments are skipped. Return the namespace of the script.
+    """
+    _state["generator"] = generator or Path(path).stem
+    namespace = {
+        "__name__": "__main__",
+        "__file__": str(path),
+        "__package__": package,
+        "__builtins__": builtins,
+    }
+    stage = "setup"
+    for lineno, is_markdown, cell in split_cells(Path(path).read_text()):
+        if is_markdown:
+            stage = heading_stage(cell) or stage
+        if not _has_code(cell):
+            continue
+
+        code = compile("\n" * (lineno - 1) + cell, str(path), "exec")
+        if not enabled():
+            exec(code, namespace)
+            continue
+
+        frames = {name: id(value) for name, value in _frames(namespace)}
+        with span(_cell_name(cell, lineno), kind="cell", stage=stage) as record:
+            exec(code, namespace)
+            # Rows of the DataFrames created or replaced by the cell
+            record["rows"] = {
+                name: len(value)
+                for name, value in _frames(namespace)
+                if frames.get(name) != id(value)
+            }
+
+    return namespace
+
+
+def _has_code(cell):
+    return any(
+        line.strip() and not line.lstrip().startswith("#") for line in cell.splitlines()
+    )
+
+
+def _cell_name(cell, lineno):
+    for line in cell.splitlines()[1:]:
+        line = line.strip().lstrip("# ")
+        if line:
+            return f"{lineno}: {line[:80]}"
+    return str(lineno)
+
+
+def _frames(namespace):
+    return [
+        (name, value)
+        for name, value in namespace.items()
+        if isinstance(value, pd.DataFrame)
+    ]
+
+
+def _top_functions(profiler):
+    stats = pstats.Stats(profiler, stream=io.StringIO())
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)
+    return [
+        {
+            "function": f"{Path(filename).name}:{line}({function})",
+            "calls": calls,
+            "seconds": total,
+            "cumulative_seconds": cumulative,
+        }
+        for (filename, line, function), (_, calls, total, cumulative, _) in rows[:TOP]
+    ]
+
+
+def _top_allocations():
+    _, peak = tracemalloc.get_traced_memory()
+    statistics = tracemalloc.take_snapshot().statistics("lineno")
+    return {
+        "peak_bytes": peak,
+        "top": [
+            {
+                "line": f"{Path(stat.traceback[0].filename).name}:{stat.traceback[0].lineno}",
+                "bytes": stat.size,
+                "blocks": stat.count,
+            }
+            for stat in statistics[:TOP]
+        ],
+    }
+
+
+def _write(record):
+    # A single write of a whole line, so the workers of build_all can share the trace file
+    with open(TRACE_PATH, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, default=str) + "\n")
+
+
+if __name__ == "__main__":
+    # The helpers of the generators use the module imported normally, not this __main__ copy
+    from . import profiling
+    from .prefetch import GENERATORS, generator_path
+
+    generator = sys.argv[1] if len(sys.argv) > 1 else None
+    if generator not in GENERATORS:
+        sys.exit(f"Usage: python -m {__package__}.profiling GENERATOR [--offline]")
+
+    profiling.TRACE_PATH = TRACE_PATH or f"{generator.rsplit('.', 1)[-1]}.trace.jsonl"
+    start = time.perf_counter()
+    profiling.run_script(
+        generator_path(generator),
+        f"{__package__}.{generator.rsplit('.', 1)[0]}",
+        generator,
+    )
+
+    print(
+        f"{generator}: {time.perf_counter() - start:.2f}s, trace in {profiling.TRACE_PATH}"
+    )
+    with open(profiling.TRACE_PATH, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    for record in records:
+        if record["generator"] == generator and record["kind"] == "cell":
+            rows = ", ".join(f"{k} {v}" for k, v in record.get("rows", {}).items())
+            print(
+                f"{record['seconds']:8.2f}s  {record['stage']:<8}  {record['name']}"
+                + (f"  ({rows})" if rows else "")
+            )
@@ -0,0 +1,29 @@
+####################################################################################################
+# REWRITES
+####################################################################################################
+"""
+Literal substitutions in the texts of the views, like the notes rewritten with NOTE_REWRITES_PIP
+(in common_parameters.py).
+
+All the rules of a table are compiled into a single regular expression that matches any of them,
+so each column is scanned once, instead of once per rule with `str.replace`. The longest texts are
+tried first, so a rule is not hidden by another one that is a prefix of it.
+"""
+
+import re
+from functools import lru_cache
+
+
+def rewrite_texts(texts, rules):
+    """Return the Series `texts` with every occurrence of each key of `rules` replaced by its value."""
+    if not rules:
+        return texts
+    pattern = _compile(tuple(rules))
+    return texts.str.replace(pattern, lambda match: rules[match.group(0)], regex=True)
+
+
+@lru_cache()
+def _compile(texts):
+    return re.compile(
+        "|".join(re.escape(text) for text in sorted(texts, key=len, reverse=True))
+    )
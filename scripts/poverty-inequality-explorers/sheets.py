@@ -0,0 +1,150 @@
+####################################################################################################
+# GOOGLE SHEETS CACHE
+####################################################################################################
+"""
+Local on-disk cache for the Google sheets read by the explorer generators.
+
+Each sheet is stored as a CSV snapshot in `.sheet_cache/<sheet_id>/<sheet_name>.csv`, next to a
+small JSON file with the time it was downloaded and the validators sent by Google (`ETag` and
+`Last-Modified`). Snapshots younger than the TTL are read without touching the network. Older
+snapshots are revalidated with a conditional request, so an unchanged sheet is not downloaded
+again.
+
+The behaviour can be changed with these environment variables:
+- EXPLORER_SHEETS_CACHE: directory of the cache (default: `.sheet_cache` in this folder).
+- EXPLORER_SHEETS_TTL: seconds during which a snapshot is used without revalidation (default: 3600).
+- EXPLORER_SHEETS_OFFLINE: if set to 1, only the snapshots are used and the network is never
+  accessed. The same happens when a generator is run with the `--offline` argument:
+
+python -m scripts.poverty-inequality-explorers.wbpip.pip_poverty_explorer --offline
+
+Sheets downloaded with `prefetch_sheets` are also kept in memory, so the generators run in the same
+process read them without going through the cache again.
+"""
+
+import io
+import json
+import os
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+SHEET_URL = "https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
+
+CACHE_DIR = Path(
+    os.environ.get("EXPLORER_SHEETS_CACHE", Path(__file__).parent / ".sheet_cache")
+)
+CACHE_TTL = float(os.environ.get("EXPLORER_SHEETS_TTL", 3600))
+OFFLINE = "--offline" in sys.argv[1:] or os.environ.get(
+    "EXPLORER_SHEETS_OFFLINE", ""
+) not in ("", "0")
+
+# Content of the sheets downloaded by prefetch_sheets, by (sheet_id, sheet_name)
+_prefetched = {}
+
+
+def sheet_url(sheet_id, sheet_name):
+    """URL of the CSV export of a Google sheet tab."""
+    return SHEET_URL.format(sheet_id=sheet_id, sheet_name=sheet_name)
+
+
+def read_sheet(sheet_id, sheet_name, **kwargs):
+    """
+    Read a Google sheet tab into a DataFrame, going through the local cache.
+    Keyword arguments are passed to `pd.read_csv`.
+    """
+    content = _prefetched.get((sheet_id, sheet_name))
+    if content is None:
+        content = fetch_sheet(sheet_id, sheet_name)
+    return pd.read_csv(io.BytesIO(content), **kwargs)
+
+
+def prefetch_sheets(pairs, max_workers=16):
+    """
+    Download a list of (sheet_id, sheet_name) pairs concurrently and keep them in memory.
+    Repeated pairs are downloaded only once. Returns the number of different sheets.
+    """
+    pairs = sorted(set(pairs))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        contents = executor.map(lambda pair: fetch_sheet(*pair), pairs)
+        _prefetched.update(zip(pairs, contents))
+    return len(pairs)
+
+
+def fetch_sheet(sheet_id, sheet_name):
+    """Return the CSV export of a Google sheet tab, from the cache when it is fresh enough."""
+    csv_path, meta_path = _cache_paths(sheet_id, sheet_name)
+    meta = json.loads(meta_path.read_text()) if meta_path.exists() else None
+    if meta is not None and not csv_path.exists():
+        meta = None
+
+    if OFFLINE:
+        if meta is None:
+            raise FileNotFoundError(
+                f"Sheet {sheet_name} of {sheet_id} is not cached in {CACHE_DIR}. Run once without --offline to download it."
+            )
+        return csv_path.read_bytes()
+
+    if meta is not None and time.time() - meta["fetched_at"] < CACHE_TTL:
+        return csv_path.read_bytes()
+
+    request = urllib.request.Request(sheet_url(sheet_id, sheet_name))
+    if meta is not None:
+        if meta.get("etag"):
+            request.add_header("If-None-Match", meta["etag"])
+        if meta.get("last_modified"):
+            request.add_header("If-Modified-Since", meta["last_modified"])
+
+    try:
+        with urllib.request.urlopen(request) as response:
+            content = response.read()
+            headers = response.headers
+    except urllib.error.HTTPError as e:
+        if e.code != 304 or meta is None:
+            raise
+        # Not modified: the snapshot is still valid
+        meta["fetched_at"] = time.time()
+        _write_atomic(meta_path, json.dumps(meta, indent=2).encode())
+        return csv_path.read_bytes()
+    except urllib.error.URLError as e:
+        if meta is None:
+            raise
+        print(
+            f"WARNING: could not download sheet {sheet_name} ({e.reason}), using the snapshot from {time.ctime(meta['fetched_at'])}"
+        )
+        return csv_path.read_bytes()
+
+    _write_atomic(csv_path, content)
+    _write_atomic(
+        meta_path,
+        json.dumps(
+            {
+                "sheet_id": sheet_id,
+                "sheet_name": sheet_name,
+                "fetched_at": time.time(),
+                "etag": headers.get("ETag"),
+                "last_modified": headers.get("Last-Modified"),
+            },
+            indent=2,
+        ).encode(),
+    )
+    return content
+
+
+def _cache_paths(sheet_id, sheet_name):
+    sheet_dir = CACHE_DIR / sheet_id
+    return sheet_dir / f"{sheet_name}.csv", sheet_dir / f"{sheet_name}.json"
+
+
+def _write_atomic(path, content):
+    """Write through a temporary file, so an interrupted run never leaves a truncated snapshot."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(content)
+    os.replace(tmp_path, path)
@@ -0,0 +1,154 @@
+####################################################################################################
+# SPELLS
+####################################################################################################
+"""
+Tables and views that show the breaks between less comparable surveys in the PIP explorers.
+
+Each variable of `df_tables` has its own spell table, with one column for each consumption and
+income spell (`consumption_spell_1`, ..., `income_spell_1`, ...), and each view of `df_graphers`
+has a copy that shows the spells. Both are built here for all the rows at once, by repeating the
+rows of `df_tables` and `df_graphers` with numpy indexing, instead of appending the rows one by one.
+The result is the same as with the loops used before, including the dtypes.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .common_parameters import CONSUMPTION_SPELLS_PIP, INCOME_SPELLS_PIP
+from .explorer_writer import split_table
+from .profiling import profiled
+from .table_builder import infer_column
+
+# Columns of the spell tables copied from the variable in df_tables, in order
+SPELL_COLUMNS = [
+    "sourceName",
+    "description",
+    "sourceLink",
+    "dataPublishedBy",
+    "unit",
+    "shortUnit",
+    "tolerance",
+    "type",
+    "colorScaleNumericMinValue",
+    "colorScaleNumericBins",
+    "colorScaleEqualSizeBins",
+    "colorScaleScheme",
+]
+
+SPELLS_SUBTITLE = "The chart shows breaks in the comparability of the underlying household survey data over time within each country individually."
+
+
+def spell_slugs():
+    """Slugs of the columns of the consumption spells and then the income spells."""
+    return [
+        f"consumption_spell_{c_spell}"
+        for c_spell in range(1, CONSUMPTION_SPELLS_PIP + 1)
+    ] + [f"income_spell_{i_spell}" for i_spell in range(1, INCOME_SPELLS_PIP + 1)]
+
+
+@profiled
+def spells_table(df_tables):
+    """
+    Master table of the spell tables: for each row of df_tables (`master_var`), the country and year
+    columns and one column per spell, with the metadata of the variable.
+    """
+    slugs = spell_slugs()
+    names = ["Consumption surveys"] * CONSUMPTION_SPELLS_PIP + [
+        "Income surveys"
+    ] * INCOME_SPELLS_PIP
+    block = pd.DataFrame(
+        {
+            "name": ["Country", "Year"] + names,
+            "slug": ["country", "year"] + slugs,
+            "type": ["EntityName", "Year"] + [np.nan] * len(slugs),
+        }
+    )
+    is_spell = np.array([False, False] + [True] * len(slugs))
+
+    # Row i of df_tables is repeated for each row of the block
+    master = np.repeat(np.arange(len(df_tables)), len(block))
+    row = np.tile(np.arange(len(block)), len(df_tables))
+    spell_rows = is_spell[row]
+
+    def from_tables(column):
+        values = df_tables[column].to_numpy(dtype=object)[master]
+        values[~spell_rows] = np.nan
+        return values
+
+    data = {
+        "master_var": df_tables["slug"].to_numpy(dtype=object)[master],
+        "name": block["name"].to_numpy(dtype=object)[row],
+        "slug": block["slug"].to_numpy(dtype=object)[row],
+        "type": np.where(
+            spell_rows,
+            df_tables["type"].to_numpy(dtype=object)[master],
+            block["type"].to_numpy(dtype=object)[row],
+        ),
+        "survey_type": df_tables["survey_type"].to_numpy(dtype=object)[master],
+    }
+    data.update(
+        {column: from_tables(column) for column in SPELL_COLUMNS if column not in data}
+    )
+
+    return _to_frame(data)
+
+
+@profiled
+def spell_views(df_graphers, controls):
+    """
+    Copy of each view of df_graphers that shows the spells of its variable. `controls` are the
+    columns of the dropdowns and radio buttons copied from the views, in order.
+    """
+    data = {
+        "title": df_graphers["title"],
+        "ySlugs": " ".join(spell_slugs()),
+    }
+    for control in controls:
+        data[control] = df_graphers[control]
+    data.update(
+        {
+            "tableSlug": df_graphers["survey_type"] + "_" + df_graphers["ySlugs"],
+            "subtitle": df_graphers["subtitle"] + " " + SPELLS_SUBTITLE,
+            "note": df_graphers["note"],
+            "type": df_graphers["type"],
+            "yAxisMin": df_graphers["yAxisMin"],
+            "selectedFacetStrategy": "entity",
+            "hasMapTab": "false",
+            "tab": np.nan,
+            "Show breaks between less comparable surveys Checkbox": "true",
+        }
+    )
+    data = {
+        column: (
+            np.full(len(df_graphers), values, dtype=object)
+            if np.isscalar(values)
+            else values.to_numpy(dtype=object)
+        )
+        for column, values in data.items()
+    }
+    return _to_frame(data)
+
+
+def split_spells(df_spells, survey_list):
+    """
+    Yield the survey type, the variable and the spell table of each variable and survey type, with
+    the variables in the order of df_spells. The table is split with a single groupby.
+    """
+    keys = [
+        (var, survey)
+        for var in df_spells["master_var"].unique()
+        for survey in survey_list
+    ]
+    tables = split_table(df_spells, ["master_var", "survey_type"], keys)
+    for (var, survey), table in zip(keys, tables):
+        yield survey, var, table
+
+
+def _to_frame(data):
+    # Same dtypes as TableBuilder.to_frame
+    n_rows = len(next(iter(data.values()))) if data else 0
+    return pd.DataFrame(
+        {column: infer_column(list(values)) for column, values in data.items()},
+        index=pd.RangeIndex(n_rows),
+        columns=list(data),
+    )
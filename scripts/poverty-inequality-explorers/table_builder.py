@@ -0,0 +1,77 @@
+####################################################################################################
+# TABLE BUILDER
+####################################################################################################
+"""
+Row buffer used by the explorer generators to build `df_tables`, `df_spells` and `df_graphers`.
+
+Growing a DataFrame one cell at a time with `df.loc[j, col] = value` reallocates the frame on
+every new row, so building the tables gets close to quadratic with the number of poverty lines,
+welfare types and equivalence scales. Rows are collected here as plain records instead, and the
+DataFrame is created once at the end with `to_frame`.
+
+The dtypes of the resulting DataFrame reproduce the ones obtained by growing the frame cell by
+cell, to keep the explorer files identical: a column keeps a float dtype while it only receives
+numbers (so `0` is written as `0.0`), and it becomes an object column from the first value that
+is not a number.
+"""
+
+import numbers
+
+import numpy as np
+import pandas as pd
+
+from .profiling import profiled
+
+
+class TableBuilder:
+    """Collect explorer rows as records and convert them into a DataFrame once."""
+
+    def __init__(self):
+        self._rows = []
+        self._columns = {}
+
+    def __len__(self):
+        return len(self._rows)
+
+    def append(self, row):
+        """Add a row, given as a dictionary of column names and values."""
+        self._rows.append(row)
+        for column in row:
+            self._columns.setdefault(column, None)
+
+    def __setitem__(self, column, value):
+        """Assign `value` to `column` in all the rows added so far, like `df[column] = value`."""
+        self._columns.setdefault(column, None)
+        for row in self._rows:
+            row[column] = value
+
+    @profiled
+    def to_frame(self):
+        """Create the DataFrame, with the columns in the order they first appeared."""
+        data = {column: _column_values(self._rows, column) for column in self._columns}
+        return pd.DataFrame(
+            data, index=pd.RangeIndex(len(self._rows)), columns=list(data)
+        )
+
+
+def _is_number(value):
+    return isinstance(value, numbers.Number) and not isinstance(value, (bool, np.bool_))
+
+
+def infer_column(values):
+    """
+    Return an array of the values with the dtype pandas would have inferred when growing the table.
+    Numbers are stored as floats until the first non-numeric value turns the column into objects.
+    """
+    for i, value in enumerate(values):
+        if not _is_number(value) and not pd.isna(value):
+            column_values = np.empty(len(values), dtype=object)
+            column_values[:i] = [float(v) if _is_number(v) else v for v in values[:i]]
+            column_values[i:] = values[i:]
+            return column_values
+
+    return np.array(values, dtype=float)
+
+
+def _column_values(rows, column):
+    return infer_column([row.get(column, np.nan) for row in rows])
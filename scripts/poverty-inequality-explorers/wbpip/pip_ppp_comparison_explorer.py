@@ -2,7 +2,6 @@
 # # Poverty Data Explorer of World Bank data: 2011 vs 2017 prices
 # This code creates the tsv file for the PPP comparison explorer from the World Bank PIP data, available [here](https://ourworldindata.org/explorers/poverty-explorer-2011-vs-2017-ppp)
 
-import textwrap
 from pathlib import Path
 
 import numpy as np
@@ -11,6 +10,11 @@ import numpy as np
 import pandas as pd
 
 from ..common_parameters import *
+from ..descriptions import join_paragraphs
+from ..explorer_writer import ExplorerWriter
+from ..rewrites import rewrite_texts
+from ..sheets import read_sheet
+from ..table_builder import TableBuilder
 
 PARENT_DIR = Path(__file__).parent.parent.parent.parent.absolute()
 outfile = PARENT_DIR / "explorers" / "poverty-explorer-2011-vs-2017-ppp.explorer.tsv"
@@ -25,30 +29,25 @@ sheet_id = "1mR0LPEGlY-wCp1q9lNTlDbVIG65JazKvHL16my9tH8Y"
 
 # Poverty lines in 2011 prices sheet
 sheet_name = "povlines_ppp2011"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-povlines_ppp2011 = pd.read_csv(url, dtype={"dollars_text": "str"})
+povlines_ppp2011 = read_sheet(sheet_id, sheet_name, dtype={"dollars_text": "str"})
 
 # Poverty lines in 2017 prices sheet
 sheet_name = "povlines_ppp2017"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-povlines_ppp2017 = pd.read_csv(url, dtype={"dollars_text": "str"})
+povlines_ppp2017 = read_sheet(sheet_id, sheet_name, dtype={"dollars_text": "str"})
 
 # Poverty lines in both 2011 and 2017 prices sheet
 sheet_name = "povlines_both"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-povlines_both = pd.read_csv(
-    url, dtype={"dollars_2011_text": "str", "dollars_2017_text": "str"}
+povlines_both = read_sheet(
+    sheet_id, sheet_name, dtype={"dollars_2011_text": "str", "dollars_2017_text": "str"}
 )
 
 # Relative poverty lines sheet
 sheet_name = "povlines_rel"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-povlines_rel = pd.read_csv(url)
+povlines_rel = read_sheet(sheet_id, sheet_name)
 
 # Survey type sheet
 sheet_name = "survey_type"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-survey_type = pd.read_csv(url)
+survey_type = read_sheet(sheet_id, sheet_name)
 
 # %% [markdown]
 # ## Header
@@ -82,7 +81,6 @@ sourceLink = SOURCE_LINK_PIP
 colorScaleNumericMinValue = COLOR_SCALE_NUMERIC_MIN_VALUE
 tolerance = TOLERANCE
 colorScaleEqualSizeBins = COLOR_SCALE_EQUAL_SIZEBINS
-new_line = NEW_LINE
 
 yAxisMin = Y_AXIS_MIN
 
@@ -96,404 +94,422 @@ ppp_description_2011 = PPP_DESCRIPTION_PIP_2011
 relative_poverty_description = RELATIVE_POVERTY_DESCRIPTION_PIP
 
 # Table generation
-df_tables = pd.DataFrame()
-j = 0
+df_tables = TableBuilder()
 
 for survey in range(len(survey_type)):
     # Define country as entityName
-    df_tables.loc[j, "name"] = "Country"
-    df_tables.loc[j, "slug"] = "country"
-    df_tables.loc[j, "type"] = "EntityName"
-    df_tables.loc[j, "survey_type"] = survey_type["table_name"][survey]
-    j += 1
+    df_tables.append(
+        {
+            "name": "Country",
+            "slug": "country",
+            "type": "EntityName",
+            "survey_type": survey_type["table_name"][survey],
+        }
+    )
 
     # Define year as Year
-    df_tables.loc[j, "name"] = "Year"
-    df_tables.loc[j, "slug"] = "year"
-    df_tables.loc[j, "type"] = "Year"
-    df_tables.loc[j, "survey_type"] = survey_type["table_name"][survey]
-    j += 1
+    df_tables.append(
+        {
+            "name": "Year",
+            "slug": "year",
+            "type": "Year",
+            "survey_type": survey_type["table_name"][survey],
+        }
+    )
 
     # Shares (2011)
     for p_2011 in range(len(povlines_ppp2011)):
-        df_tables.loc[j, "name"] = (
-            f"Share of population below ${povlines_ppp2011.dollars_text[p_2011]} a day (2011 prices)"
-        )
-
-        df_tables.loc[j, "slug"] = (
-            f"headcount_ratio_{povlines_ppp2011.cents[p_2011]}_ppp2011"
+        df_tables.append(
+            {
+                "name": f"Share of population below ${povlines_ppp2011.dollars_text[p_2011]} a day (2011 prices)",
+                "slug": f"headcount_ratio_{povlines_ppp2011.cents[p_2011]}_ppp2011",
+                "description": join_paragraphs(
+                    [
+                        f"% of population living in households with an {survey_type.text[survey]} per person below ${povlines_ppp2011.dollars_text[p_2011]} a day (2011 prices).",
+                        ppp_description_2011,
+                        survey_type.description[survey],
+                        additional_description,
+                        notes_title,
+                        processing_description,
+                    ]
+                ),
+                "unit": "%",
+                "shortUnit": "%",
+                "type": "Numeric",
+                "colorScaleNumericBins": "3;10;20;30;40;50;60;70;80;90;100",
+                "colorScaleScheme": "OrRd",
+                "survey_type": survey_type["table_name"][survey],
+            }
         )
-        df_tables.loc[j, "description"] = new_line.join(
-            [
-                f"% of population living in households with an {survey_type.text[survey]} per person below ${povlines_ppp2011.dollars_text[p_2011]} a day (2011 prices).",
-                ppp_description_2011,
-                survey_type.description[survey],
-                additional_description,
-                notes_title,
-                processing_description,
-            ]
-        )
-        df_tables.loc[j, "unit"] = "%"
-        df_tables.loc[j, "shortUnit"] = "%"
-        df_tables.loc[j, "type"] = "Numeric"
-        df_tables.loc[j, "colorScaleNumericBins"] = "3;10;20;30;40;50;60;70;80;90;100"
-        df_tables.loc[j, "colorScaleScheme"] = "OrRd"
-        df_tables.loc[j, "survey_type"] = survey_type["table_name"][survey]
-        j += 1
 
     # Shares (2017)
     for p_2017 in range(len(povlines_ppp2017)):
-        df_tables.loc[j, "name"] = (
-            f"Share of population below ${povlines_ppp2017.dollars_text[p_2017]} a day (2017 prices)"
-        )
-        df_tables.loc[j, "slug"] = (
-            f"headcount_ratio_{povlines_ppp2017.cents[p_2017]}_ppp2017"
+        df_tables.append(
+            {
+                "name": f"Share of population below ${povlines_ppp2017.dollars_text[p_2017]} a day (2017 prices)",
+                "slug": f"headcount_ratio_{povlines_ppp2017.cents[p_2017]}_ppp2017",
+                "description": join_paragraphs(
+                    [
+                        f"% of population living in households with an {survey_type.text[survey]} per person below ${povlines_ppp2017.dollars_text[p_2017]} a day (2017 prices).",
+                        ppp_description_2017,
+                        survey_type.description[survey],
+                        additional_description,
+                        notes_title,
+                        processing_description,
+                    ]
+                ),
+                "unit": "%",
+                "shortUnit": "%",
+                "type": "Numeric",
+                "colorScaleNumericBins": "3;10;20;30;40;50;60;70;80;90;100",
+                "colorScaleScheme": "OrRd",
+                "survey_type": survey_type["table_name"][survey],
+            }
         )
-        df_tables.loc[j, "description"] = new_line.join(
-            [
-                f"% of population living in households with an {survey_type.text[survey]} per person below ${povlines_ppp2017.dollars_text[p_2017]} a day (2017 prices).",
-                ppp_description_2017,
-                survey_type.description[survey],
-                additional_description,
-                notes_title,
-                processing_description,
-            ]
-        )
-        df_tables.loc[j, "unit"] = "%"
-        df_tables.loc[j, "shortUnit"] = "%"
-        df_tables.loc[j, "type"] = "Numeric"
-        df_tables.loc[j, "colorScaleNumericBins"] = "3;10;20;30;40;50;60;70;80;90;100"
-        df_tables.loc[j, "colorScaleScheme"] = "OrRd"
-        df_tables.loc[j, "survey_type"] = survey_type["table_name"][survey]
-        j += 1
 
     # Number (2011)
     for p_2011 in range(len(povlines_ppp2011)):
-        df_tables.loc[j, "name"] = (
-            f"Number of people below ${povlines_ppp2011.dollars_text[p_2011]} a day (2011 prices)"
-        )
-        df_tables.loc[j, "slug"] = f"headcount_{povlines_ppp2011.cents[p_2011]}_ppp2011"
-        df_tables.loc[j, "description"] = new_line.join(
-            [
-                f"Number of people living in households with an {survey_type.text[survey]} per person below ${povlines_ppp2011.dollars_text[p_2011]} a day (2011 prices).",
-                ppp_description_2011,
-                survey_type.description[survey],
-                additional_description,
-                notes_title,
-                processing_description,
-            ]
+        df_tables.append(
+            {
+                "name": f"Number of people below ${povlines_ppp2011.dollars_text[p_2011]} a day (2011 prices)",
+                "slug": f"headcount_{povlines_ppp2011.cents[p_2011]}_ppp2011",
+                "description": join_paragraphs(
+                    [
+                        f"Number of people living in households with an {survey_type.text[survey]} per person below ${povlines_ppp2011.dollars_text[p_2011]} a day (2011 prices).",
+                        ppp_description_2011,
+                        survey_type.description[survey],
+                        additional_description,
+                        notes_title,
+                        processing_description,
+                    ]
+                ),
+                "unit": np.nan,
+                "shortUnit": np.nan,
+                "type": "Numeric",
+                "colorScaleNumericBins": "100000;300000;1000000;3000000;10000000;30000000;100000000;300000000;1000000000;1000000001",
+                "colorScaleScheme": "Reds",
+                "survey_type": survey_type["table_name"][survey],
+            }
         )
-        df_tables.loc[j, "unit"] = np.nan
-        df_tables.loc[j, "shortUnit"] = np.nan
-        df_tables.loc[j, "type"] = "Numeric"
-        df_tables.loc[j, "colorScaleNumericBins"] = (
-            "100000;300000;1000000;3000000;10000000;30000000;100000000;300000000;1000000000;1000000001"
-        )
-        df_tables.loc[j, "colorScaleScheme"] = "Reds"
-        df_tables.loc[j, "survey_type"] = survey_type["table_name"][survey]
-        j += 1
 
     # Number (2017)
     for p_2017 in range(len(povlines_ppp2017)):
-        df_tables.loc[j, "name"] = (
-            f"Number of people below ${povlines_ppp2017.dollars_text[p_2017]} a day (2017 prices)"
-        )
-        df_tables.loc[j, "slug"] = f"headcount_{povlines_ppp2017.cents[p_2017]}_ppp2017"
-        df_tables.loc[j, "description"] = new_line.join(
-            [
-                f"Number of people living in households with an {survey_type.text[survey]} per person below ${povlines_ppp2017.dollars_text[p_2017]} a day (2017 prices).",
-                ppp_description_2017,
-                survey_type.description[survey],
-                additional_description,
-                notes_title,
-                processing_description,
-            ]
+        df_tables.append(
+            {
+                "name": f"Number of people below ${povlines_ppp2017.dollars_text[p_2017]} a day (2017 prices)",
+                "slug": f"headcount_{povlines_ppp2017.cents[p_2017]}_ppp2017",
+                "description": join_paragraphs(
+                    [
+                        f"Number of people living in households with an {survey_type.text[survey]} per person below ${povlines_ppp2017.dollars_text[p_2017]} a day (2017 prices).",
+                        ppp_description_2017,
+                        survey_type.description[survey],
+                        additional_description,
+                        notes_title,
+                        processing_description,
+                    ]
+                ),
+                "unit": np.nan,
+                "shortUnit": np.nan,
+                "type": "Numeric",
+                "colorScaleNumericBins": "100000;300000;1000000;3000000;10000000;30000000;100000000;300000000;1000000000;1000000001",
+                "colorScaleScheme": "Reds",
+                "survey_type": survey_type["table_name"][survey],
+            }
         )
-        df_tables.loc[j, "unit"] = np.nan
-        df_tables.loc[j, "shortUnit"] = np.nan
-        df_tables.loc[j, "type"] = "Numeric"
-        df_tables.loc[j, "colorScaleNumericBins"] = (
-            "100000;300000;1000000;3000000;10000000;30000000;100000000;300000000;1000000000;1000000001"
-        )
-        df_tables.loc[j, "colorScaleScheme"] = "Reds"
-        df_tables.loc[j, "survey_type"] = survey_type["table_name"][survey]
-        j += 1
 
     # Share (relative, 2011)
     for pct in range(len(povlines_rel)):
-        df_tables.loc[j, "name"] = (
-            f"{povlines_rel.percent[pct]} of median - share of population below poverty line (2011 prices)"
-        )
-        df_tables.loc[j, "slug"] = (
-            f"headcount_ratio_{povlines_rel.slug_suffix[pct]}_ppp2011"
+        df_tables.append(
+            {
+                "name": f"{povlines_rel.percent[pct]} of median - share of population below poverty line (2011 prices)",
+                "slug": f"headcount_ratio_{povlines_rel.slug_suffix[pct]}_ppp2011",
+                "description": join_paragraphs(
+                    [
+                        f"% of population living in households with an {survey_type.text[survey]} per person below {povlines_rel.percent[pct]} of the median (2011 prices).",
+                        relative_poverty_description,
+                        survey_type.description[survey],
+                        additional_description,
+                        notes_title,
+                        processing_description,
+                    ]
+                ),
+                "unit": "%",
+                "shortUnit": "%",
+                "type": "Numeric",
+                "colorScaleNumericBins": "5;10;15;20;25;30;30.0001",
+                "colorScaleScheme": "YlOrBr",
+                "survey_type": survey_type["table_name"][survey],
+            }
         )
-        df_tables.loc[j, "description"] = new_line.join(
-            [
-                f"% of population living in households with an {survey_type.text[survey]} per person below {povlines_rel.percent[pct]} of the median (2011 prices).",
-                relative_poverty_description,
-                survey_type.description[survey],
-                additional_description,
-                notes_title,
-                processing_description,
-            ]
-        )
-        df_tables.loc[j, "unit"] = "%"
-        df_tables.loc[j, "shortUnit"] = "%"
-        df_tables.loc[j, "type"] = "Numeric"
-        df_tables.loc[j, "colorScaleNumericBins"] = "5;10;15;20;25;30;30.0001"
-        df_tables.loc[j, "colorScaleScheme"] = "YlOrBr"
-        df_tables.loc[j, "survey_type"] = survey_type["table_name"][survey]
-        j += 1
 
     # Share (relative, 2017)
     for pct in range(len(povlines_rel)):
-        df_tables.loc[j, "name"] = (
-            f"{povlines_rel.percent[pct]} of median - share of population below poverty line (2017 prices)"
-        )
-        df_tables.loc[j, "slug"] = (
-            f"headcount_ratio_{povlines_rel.slug_suffix[pct]}_ppp2017"
-        )
-        df_tables.loc[j, "description"] = new_line.join(
-            [
-                f"% of population living in households with an {survey_type.text[survey]} per person below {povlines_rel.percent[pct]} of the median (2017 prices).",
-                relative_poverty_description,
-                survey_type.description[survey],
-                additional_description,
-                notes_title,
-                processing_description,
-            ]
+        df_tables.append(
+            {
+                "name": f"{povlines_rel.percent[pct]} of median - share of population below poverty line (2017 prices)",
+                "slug": f"headcount_ratio_{povlines_rel.slug_suffix[pct]}_ppp2017",
+                "description": join_paragraphs(
+                    [
+                        f"% of population living in households with an {survey_type.text[survey]} per person below {povlines_rel.percent[pct]} of the median (2017 prices).",
+                        relative_poverty_description,
+                        survey_type.description[survey],
+                        additional_description,
+                        notes_title,
+                        processing_description,
+                    ]
+                ),
+                "unit": "%",
+                "shortUnit": "%",
+                "type": "Numeric",
+                "colorScaleNumericBins": "5;10;15;20;25;30;30.0001",
+                "colorScaleScheme": "YlOrBr",
+                "survey_type": survey_type["table_name"][survey],
+            }
         )
-        df_tables.loc[j, "unit"] = "%"
-        df_tables.loc[j, "shortUnit"] = "%"
-        df_tables.loc[j, "type"] = "Numeric"
-        df_tables.loc[j, "colorScaleNumericBins"] = "5;10;15;20;25;30;30.0001"
-        df_tables.loc[j, "colorScaleScheme"] = "YlOrBr"
-        df_tables.loc[j, "survey_type"] = survey_type["table_name"][survey]
-        j += 1
 
     # Number (relative, 2011)
     for pct in range(len(povlines_rel)):
-        df_tables.loc[j, "name"] = (
-            f"{povlines_rel.percent[pct]} of median - total number of people below poverty line (2011 prices)"
+        df_tables.append(
+            {
+                "name": f"{povlines_rel.percent[pct]} of median - total number of people below poverty line (2011 prices)",
+                "slug": f"headcount_{povlines_rel.slug_suffix[pct]}_ppp2011",
+                "description": join_paragraphs(
+                    [
+                        f"Number of people living in households with an {survey_type.text[survey]} per person below {povlines_rel.percent[pct]} of the median (2011 prices).",
+                        relative_poverty_description,
+                        survey_type.description[survey],
+                        additional_description,
+                        notes_title,
+                        processing_description,
+                    ]
+                ),
+                "unit": np.nan,
+                "shortUnit": np.nan,
+                "type": "Numeric",
+                "colorScaleNumericBins": "100000;300000;1000000;3000000;10000000;30000000;100000000;300000000;1000000000;1000000001",
+                "colorScaleScheme": "YlOrRd",
+                "survey_type": survey_type["table_name"][survey],
+            }
         )
-        df_tables.loc[j, "slug"] = f"headcount_{povlines_rel.slug_suffix[pct]}_ppp2011"
-        df_tables.loc[j, "description"] = new_line.join(
-            [
-                f"Number of people living in households with an {survey_type.text[survey]} per person below {povlines_rel.percent[pct]} of the median (2011 prices).",
-                relative_poverty_description,
-                survey_type.description[survey],
-                additional_description,
-                notes_title,
-                processing_description,
-            ]
-        )
-        df_tables.loc[j, "unit"] = np.nan
-        df_tables.loc[j, "shortUnit"] = np.nan
-        df_tables.loc[j, "type"] = "Numeric"
-        df_tables.loc[j, "colorScaleNumericBins"] = (
-            "100000;300000;1000000;3000000;10000000;30000000;100000000;300000000;1000000000;1000000001"
-        )
-        df_tables.loc[j, "colorScaleScheme"] = "YlOrRd"
-        df_tables.loc[j, "survey_type"] = survey_type["table_name"][survey]
-        j += 1
 
     # Number (relative, 2017)
     for pct in range(len(povlines_rel)):
-        df_tables.loc[j, "name"] = (
-            f"{povlines_rel.percent[pct]} of median - total number of people below poverty line (2017 prices)"
-        )
-        df_tables.loc[j, "slug"] = f"headcount_{povlines_rel.slug_suffix[pct]}_ppp2017"
-        df_tables.loc[j, "description"] = new_line.join(
-            [
-                f"Number of people living in households with an {survey_type.text[survey]} per person below {povlines_rel.percent[pct]} of the median (2017 prices).",
-                relative_poverty_description,
-                survey_type.description[survey],
-                additional_description,
-                notes_title,
-                processing_description,
-            ]
-        )
-        df_tables.loc[j, "unit"] = np.nan
-        df_tables.loc[j, "shortUnit"] = np.nan
-        df_tables.loc[j, "type"] = "Numeric"
-        df_tables.loc[j, "colorScaleNumericBins"] = (
-            "100000;300000;1000000;3000000;10000000;30000000;100000000;300000000;1000000000;1000000001"
+        df_tables.append(
+            {
+                "name": f"{povlines_rel.percent[pct]} of median - total number of people below poverty line (2017 prices)",
+                "slug": f"headcount_{povlines_rel.slug_suffix[pct]}_ppp2017",
+                "description": join_paragraphs(
+                    [
+                        f"Number of people living in households with an {survey_type.text[survey]} per person below {povlines_rel.percent[pct]} of the median (2017 prices).",
+                        relative_poverty_description,
+                        survey_type.description[survey],
+                        additional_description,
+                        notes_title,
+                        processing_description,
+                    ]
+                ),
+                "unit": np.nan,
+                "shortUnit": np.nan,
+                "type": "Numeric",
+                "colorScaleNumericBins": "100000;300000;1000000;3000000;10000000;30000000;100000000;300000000;1000000000;1000000001",
+                "colorScaleScheme": "YlOrRd",
+                "survey_type": survey_type["table_name"][survey],
+            }
         )
-        df_tables.loc[j, "colorScaleScheme"] = "YlOrRd"
-        df_tables.loc[j, "survey_type"] = survey_type["table_name"][survey]
-        j += 1
 
     # Mean (2011)
-    df_tables.loc[j, "name"] = f"Mean {survey_type.text[survey]} per day (2011 prices)"
-    df_tables.loc[j, "slug"] = "mean_ppp2011"
-    df_tables.loc[j, "description"] = new_line.join(
-        [
-            f"The mean level of {survey_type.text[survey]} per day (2011 prices).",
-            ppp_description_2011,
-            survey_type.description[survey],
-            additional_description,
-            notes_title,
-            processing_description,
-        ]
+    df_tables.append(
+        {
+            "name": f"Mean {survey_type.text[survey]} per day (2011 prices)",
+            "slug": "mean_ppp2011",
+            "description": join_paragraphs(
+                [
+                    f"The mean level of {survey_type.text[survey]} per day (2011 prices).",
+                    ppp_description_2011,
+                    survey_type.description[survey],
+                    additional_description,
+                    notes_title,
+                    processing_description,
+                ]
+            ),
+            "unit": "international-$ in 2011 prices",
+            "shortUnit": "$",
+            "type": "Numeric",
+            "colorScaleNumericBins": "1;2;5;10;20;50;50.0001",
+            "colorScaleScheme": "BuGn",
+            "survey_type": survey_type["table_name"][survey],
+        }
     )
-    df_tables.loc[j, "unit"] = "international-$ in 2011 prices"
-    df_tables.loc[j, "shortUnit"] = "$"
-    df_tables.loc[j, "type"] = "Numeric"
-    df_tables.loc[j, "colorScaleNumericBins"] = "1;2;5;10;20;50;50.0001"
-    df_tables.loc[j, "colorScaleScheme"] = "BuGn"
-    df_tables.loc[j, "survey_type"] = survey_type["table_name"][survey]
-    j += 1
 
     # Mean (2017)
-    df_tables.loc[j, "name"] = f"Mean {survey_type.text[survey]} per day (2017 prices)"
-    df_tables.loc[j, "slug"] = "mean_ppp2017"
-    df_tables.loc[j, "description"] = new_line.join(
-        [
-            f"The mean level of {survey_type.text[survey]} per day (2017 prices).",
-            ppp_description_2017,
-            survey_type.description[survey],
-            additional_description,
-            notes_title,
-            processing_description,
-        ]
+    df_tables.append(
+        {
+            "name": f"Mean {survey_type.text[survey]} per day (2017 prices)",
+            "slug": "mean_ppp2017",
+            "description": join_paragraphs(
+                [
+                    f"The mean level of {survey_type.text[survey]} per day (2017 prices).",
+                    ppp_description_2017,
+                    survey_type.description[survey],
+                    additional_description,
+                    notes_title,
+                    processing_description,
+                ]
+            ),
+            "unit": "international-$ in 2017 prices",
+            "shortUnit": "$",
+            "type": "Numeric",
+            "colorScaleNumericBins": "1;2;5;10;20;50;50.0001",
+            "colorScaleScheme": "BuGn",
+            "survey_type": survey_type["table_name"][survey],
+        }
     )
-    df_tables.loc[j, "unit"] = "international-$ in 2017 prices"
-    df_tables.loc[j, "shortUnit"] = "$"
-    df_tables.loc[j, "type"] = "Numeric"
-    df_tables.loc[j, "colorScaleNumericBins"] = "1;2;5;10;20;50;50.0001"
-    df_tables.loc[j, "colorScaleScheme"] = "BuGn"
-    df_tables.loc[j, "survey_type"] = survey_type["table_name"][survey]
-    j += 1
 
     # Median (2011)
-    df_tables.loc[j, "name"] = (
-        f"Median {survey_type.text[survey]} per day (2011 prices)"
-    )
-    df_tables.loc[j, "slug"] = "median_ppp2011"
-    df_tables.loc[j, "description"] = new_line.join(
-        [
-            f"The level of {survey_type.text[survey]} per day below which half of the population live (2011 prices).",
-            ppp_description_2011,
-            survey_type.description[survey],
-            additional_description,
-            notes_title,
-            processing_description,
-        ]
+    df_tables.append(
+        {
+            "name": f"Median {survey_type.text[survey]} per day (2011 prices)",
+            "slug": "median_ppp2011",
+            "description": join_paragraphs(
+                [
+                    f"The level of {survey_type.text[survey]} per day below which half of the population live (2011 prices).",
+                    ppp_description_2011,
+                    survey_type.description[survey],
+                    additional_description,
+                    notes_title,
+                    processing_description,
+                ]
+            ),
+            "unit": "international-$ in 2011 prices",
+            "shortUnit": "$",
+            "type": "Numeric",
+            "colorScaleNumericBins": "1;2;5;10;20;50;50.0001",
+            "colorScaleScheme": "BuGn",
+            "survey_type": survey_type["table_name"][survey],
+        }
     )
-    df_tables.loc[j, "unit"] = "international-$ in 2011 prices"
-    df_tables.loc[j, "shortUnit"] = "$"
-    df_tables.loc[j, "type"] = "Numeric"
-    df_tables.loc[j, "colorScaleNumericBins"] = "1;2;5;10;20;50;50.0001"
-    df_tables.loc[j, "colorScaleScheme"] = "BuGn"
-    df_tables.loc[j, "survey_type"] = survey_type["table_name"][survey]
-    j += 1
 
     # Median (2017)
-    df_tables.loc[j, "name"] = (
-        f"Median {survey_type.text[survey]} per day (2017 prices)"
+    df_tables.append(
+        {
+            "name": f"Median {survey_type.text[survey]} per day (2017 prices)",
+            "slug": "median_ppp2017",
+            "description": join_paragraphs(
+                [
+                    f"The level of {survey_type.text[survey]} per day below which half of the population live (2017 prices).",
+                    ppp_description_2017,
+                    survey_type.description[survey],
+                    additional_description,
+                    notes_title,
+                    processing_description,
+                ]
+            ),
+            "unit": "international-$ in 2017 prices",
+            "shortUnit": "$",
+            "type": "Numeric",
+            "colorScaleNumericBins": "1;2;5;10;20;50;50.0001",
+            "colorScaleScheme": "BuGn",
+            "survey_type": survey_type["table_name"][survey],
+        }
     )
-    df_tables.loc[j, "slug"] = "median_ppp2017"
-    df_tables.loc[j, "description"] = new_line.join(
-        [
-            f"The level of {survey_type.text[survey]} per day below which half of the population live (2017 prices).",
-            ppp_description_2017,
-            survey_type.description[survey],
-            additional_description,
-            notes_title,
-            processing_description,
-        ]
-    )
-    df_tables.loc[j, "unit"] = "international-$ in 2017 prices"
-    df_tables.loc[j, "shortUnit"] = "$"
-    df_tables.loc[j, "type"] = "Numeric"
-    df_tables.loc[j, "colorScaleNumericBins"] = "1;2;5;10;20;50;50.0001"
-    df_tables.loc[j, "colorScaleScheme"] = "BuGn"
-    df_tables.loc[j, "survey_type"] = survey_type["table_name"][survey]
-    j += 1
 
     # P10 (2011)
-    df_tables.loc[j, "name"] = "P10 (2011 prices)"
-    df_tables.loc[j, "slug"] = "decile1_thr_ppp2011"
-    df_tables.loc[j, "description"] = new_line.join(
-        [
-            f"The level of {survey_type.text[survey]} per day below which 10% of the population falls (2011 prices).",
-            ppp_description_2011,
-            survey_type.description[survey],
-            additional_description,
-            notes_title,
-            processing_description,
-        ]
+    df_tables.append(
+        {
+            "name": "P10 (2011 prices)",
+            "slug": "decile1_thr_ppp2011",
+            "description": join_paragraphs(
+                [
+                    f"The level of {survey_type.text[survey]} per day below which 10% of the population falls (2011 prices).",
+                    ppp_description_2011,
+                    survey_type.description[survey],
+                    additional_description,
+                    notes_title,
+                    processing_description,
+                ]
+            ),
+            "unit": "international-$ in 2011 prices",
+            "shortUnit": "$",
+            "type": "Numeric",
+            "colorScaleNumericBins": "1;2;5;10;20;20.0001",
+            "colorScaleScheme": "Greens",
+            "survey_type": survey_type["table_name"][survey],
+        }
     )
-    df_tables.loc[j, "unit"] = "international-$ in 2011 prices"
-    df_tables.loc[j, "shortUnit"] = "$"
-    df_tables.loc[j, "type"] = "Numeric"
-    df_tables.loc[j, "colorScaleNumericBins"] = "1;2;5;10;20;20.0001"
-    df_tables.loc[j, "colorScaleScheme"] = "Greens"
-    df_tables.loc[j, "survey_type"] = survey_type["table_name"][survey]
-    j += 1
 
     # P10 (2017)
-    df_tables.loc[j, "name"] = "P10 (2017 prices)"
-    df_tables.loc[j, "slug"] = "decile1_thr_ppp2017"
-    df_tables.loc[j, "description"] = new_line.join(
-        [
-            f"The level of {survey_type.text[survey]} per day below which 10% of the population falls (2017 prices).",
-            ppp_description_2017,
-            survey_type.description[survey],
-            additional_description,
-            notes_title,
-            processing_description,
-        ]
+    df_tables.append(
+        {
+            "name": "P10 (2017 prices)",
+            "slug": "decile1_thr_ppp2017",
+            "description": join_paragraphs(
+                [
+                    f"The level of {survey_type.text[survey]} per day below which 10% of the population falls (2017 prices).",
+                    ppp_description_2017,
+                    survey_type.description[survey],
+                    additional_description,
+                    notes_title,
+                    processing_description,
+                ]
+            ),
+            "unit": "international-$ in 2017 prices",
+            "shortUnit": "$",
+            "type": "Numeric",
+            "colorScaleNumericBins": "1;2;5;10;20;20.0001",
+            "colorScaleScheme": "Greens",
+            "survey_type": survey_type["table_name"][survey],
+        }
     )
-    df_tables.loc[j, "unit"] = "international-$ in 2017 prices"
-    df_tables.loc[j, "shortUnit"] = "$"
-    df_tables.loc[j, "type"] = "Numeric"
-    df_tables.loc[j, "colorScaleNumericBins"] = "1;2;5;10;20;20.0001"
-    df_tables.loc[j, "colorScaleScheme"] = "Greens"
-    df_tables.loc[j, "survey_type"] = survey_type["table_name"][survey]
-    j += 1
 
     # P90 (2011)
-    df_tables.loc[j, "name"] = "P90 (2011 prices)"
-    df_tables.loc[j, "slug"] = "decile9_thr_ppp2011"
-    df_tables.loc[j, "description"] = new_line.join(
-        [
-            f"The level of {survey_type.text[survey]} per day below which 90% of the population falls (2011 prices).",
-            ppp_description_2011,
-            survey_type.description[survey],
-            additional_description,
-            notes_title,
-            processing_description,
-        ]
+    df_tables.append(
+        {
+            "name": "P90 (2011 prices)",
+            "slug": "decile9_thr_ppp2011",
+            "description": join_paragraphs(
+                [
+                    f"The level of {survey_type.text[survey]} per day below which 90% of the population falls (2011 prices).",
+                    ppp_description_2011,
+                    survey_type.description[survey],
+                    additional_description,
+                    notes_title,
+                    processing_description,
+                ]
+            ),
+            "unit": "international-$ in 2011 prices",
+            "shortUnit": "$",
+            "type": "Numeric",
+            "colorScaleNumericBins": "5;10;20;50;100;100.0001",
+            "colorScaleScheme": "Blues",
+            "survey_type": survey_type["table_name"][survey],
+        }
     )
-    df_tables.loc[j, "unit"] = "international-$ in 2011 prices"
-    df_tables.loc[j, "shortUnit"] = "$"
-    df_tables.loc[j, "type"] = "Numeric"
-    df_tables.loc[j, "colorScaleNumericBins"] = "5;10;20;50;100;100.0001"
-    df_tables.loc[j, "colorScaleScheme"] = "Blues"
-    df_tables.loc[j, "survey_type"] = survey_type["table_name"][survey]
-    j += 1
 
     # P90 (2017)
-    df_tables.loc[j, "name"] = "P90 (2017 prices)"
-    df_tables.loc[j, "slug"] = "decile9_thr_ppp2017"
-    df_tables.loc[j, "description"] = new_line.join(
-        [
-            f"The level of {survey_type.text[survey]} per day below which 90% of the population falls (2017 prices).",
-            ppp_description_2017,
-            survey_type.description[survey],
-            additional_description,
-            notes_title,
-            processing_description,
-        ]
-    )
-    df_tables.loc[j, "unit"] = "international-$ in 2017 prices"
-    df_tables.loc[j, "shortUnit"] = "$"
-    df_tables.loc[j, "type"] = "Numeric"
-    df_tables.loc[j, "colorScaleNumericBins"] = "5;10;20;50;100;100.0001"
-    df_tables.loc[j, "colorScaleScheme"] = "Blues"
-    df_tables.loc[j, "survey_type"] = survey_type["table_name"][survey]
-    j += 1
+    df_tables.append(
+        {
+            "name": "P90 (2017 prices)",
+            "slug": "decile9_thr_ppp2017",
+            "description": join_paragraphs(
+                [
+                    f"The level of {survey_type.text[survey]} per day below which 90% of the population falls (2017 prices).",
+                    ppp_description_2017,
+                    survey_type.description[survey],
+                    additional_description,
+                    notes_title,
+                    processing_description,
+                ]
+            ),
+            "unit": "international-$ in 2017 prices",
+            "shortUnit": "$",
+            "type": "Numeric",
+            "colorScaleNumericBins": "5;10;20;50;100;100.0001",
+            "colorScaleScheme": "Blues",
+            "survey_type": survey_type["table_name"][survey],
+        }
+    )
+
+df_tables = df_tables.to_frame()
 
 df_tables["sourceName"] = sourceName
 df_tables["dataPublishedBy"] = dataPublishedBy
@@ -512,660 +528,537 @@ df_tables["tolerance"] = df_tables["tolerance"].astype("Int64")
 # %%
 # Grapher table generation
 
-df_graphers = pd.DataFrame()
+df_graphers = TableBuilder()
 
-j = 0
 
 for survey in range(len(survey_type)):
     # Share (2011)
     for p_2011 in range(len(povlines_ppp2011)):
-        df_graphers.loc[j, "title"] = f"{povlines_ppp2011.title_share[p_2011]}"
-        df_graphers.loc[j, "ySlugs"] = (
-            f"headcount_ratio_{povlines_ppp2011.cents[p_2011]}_ppp2011"
+        df_graphers.append(
+            {
+                "title": f"{povlines_ppp2011.title_share[p_2011]}",
+                "ySlugs": f"headcount_ratio_{povlines_ppp2011.cents[p_2011]}_ppp2011",
+                "Indicator Dropdown": "Share in poverty",
+                "International-$ Dropdown": "2011 prices",
+                "Poverty line Dropdown": f"{povlines_ppp2011.povline_dropdown[p_2011]}",
+                "Household survey data type Dropdown": f"{survey_type.dropdown_option[survey]}",
+                "tableSlug": f"{survey_type.table_name[survey]}",
+                "subtitle": f"{povlines_ppp2011.subtitle[p_2011]}",
+                "note": f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2011 prices. Depending on the country and year, it relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita).",
+                "type": np.nan,
+                "yAxisMin": yAxisMin,
+                "selectedFacetStrategy": np.nan,
+                "hasMapTab": "true",
+                "tab": "map",
+                "survey_type": survey_type["table_name"][survey],
+            }
         )
-        df_graphers.loc[j, "Indicator Dropdown"] = "Share in poverty"
-        df_graphers.loc[j, "International-$ Dropdown"] = "2011 prices"
-        df_graphers.loc[j, "Poverty line Dropdown"] = (
-            f"{povlines_ppp2011.povline_dropdown[p_2011]}"
-        )
-        df_graphers.loc[j, "Household survey data type Dropdown"] = (
-            f"{survey_type.dropdown_option[survey]}"
-        )
-        df_graphers.loc[j, "tableSlug"] = f"{survey_type.table_name[survey]}"
-        df_graphers.loc[j, "subtitle"] = f"{povlines_ppp2011.subtitle[p_2011]}"
-        df_graphers.loc[j, "note"] = (
-            f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2011 prices. Depending on the country and year, it relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita)."
-        )
-        df_graphers.loc[j, "type"] = np.nan
-        df_graphers.loc[j, "yAxisMin"] = yAxisMin
-        df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-        df_graphers.loc[j, "hasMapTab"] = "true"
-        df_graphers.loc[j, "tab"] = "map"
-        df_graphers.loc[j, "survey_type"] = survey_type["table_name"][survey]
-        j += 1
 
     # Share (2017)
     for p_2017 in range(len(povlines_ppp2017)):
-        df_graphers.loc[j, "title"] = f"{povlines_ppp2017.title_share[p_2017]}"
-        df_graphers.loc[j, "ySlugs"] = (
-            f"headcount_ratio_{povlines_ppp2017.cents[p_2017]}_ppp2017"
-        )
-        df_graphers.loc[j, "Indicator Dropdown"] = "Share in poverty"
-        df_graphers.loc[j, "International-$ Dropdown"] = "2017 prices"
-        df_graphers.loc[j, "Poverty line Dropdown"] = (
-            f"{povlines_ppp2017.povline_dropdown[p_2017]}"
+        df_graphers.append(
+            {
+                "title": f"{povlines_ppp2017.title_share[p_2017]}",
+                "ySlugs": f"headcount_ratio_{povlines_ppp2017.cents[p_2017]}_ppp2017",
+                "Indicator Dropdown": "Share in poverty",
+                "International-$ Dropdown": "2017 prices",
+                "Poverty line Dropdown": f"{povlines_ppp2017.povline_dropdown[p_2017]}",
+                "Household survey data type Dropdown": f"{survey_type.dropdown_option[survey]}",
+                "tableSlug": f"{survey_type.table_name[survey]}",
+                "subtitle": f"{povlines_ppp2017.subtitle[p_2017]}",
+                "note": f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices. Depending on the country and year, it relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita).",
+                "type": np.nan,
+                "yAxisMin": yAxisMin,
+                "selectedFacetStrategy": np.nan,
+                "hasMapTab": "true",
+                "tab": "map",
+                "survey_type": survey_type["table_name"][survey],
+            }
         )
-        df_graphers.loc[j, "Household survey data type Dropdown"] = (
-            f"{survey_type.dropdown_option[survey]}"
-        )
-        df_graphers.loc[j, "tableSlug"] = f"{survey_type.table_name[survey]}"
-        df_graphers.loc[j, "subtitle"] = f"{povlines_ppp2017.subtitle[p_2017]}"
-        df_graphers.loc[j, "note"] = (
-            f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices. Depending on the country and year, it relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita)."
-        )
-        df_graphers.loc[j, "type"] = np.nan
-        df_graphers.loc[j, "yAxisMin"] = yAxisMin
-        df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-        df_graphers.loc[j, "hasMapTab"] = "true"
-        df_graphers.loc[j, "tab"] = "map"
-        df_graphers.loc[j, "survey_type"] = survey_type["table_name"][survey]
-        j += 1
 
     # Number (2011)
     for p_2011 in range(len(povlines_ppp2011)):
-        df_graphers.loc[j, "title"] = f"{povlines_ppp2011.title_number[p_2011]}"
-        df_graphers.loc[j, "ySlugs"] = (
-            f"headcount_{povlines_ppp2011.cents[p_2011]}_ppp2011"
-        )
-        df_graphers.loc[j, "Indicator Dropdown"] = "Number in poverty"
-        df_graphers.loc[j, "International-$ Dropdown"] = "2011 prices"
-        df_graphers.loc[j, "Poverty line Dropdown"] = (
-            f"{povlines_ppp2011.povline_dropdown[p_2011]}"
-        )
-        df_graphers.loc[j, "Household survey data type Dropdown"] = (
-            f"{survey_type.dropdown_option[survey]}"
+        df_graphers.append(
+            {
+                "title": f"{povlines_ppp2011.title_number[p_2011]}",
+                "ySlugs": f"headcount_{povlines_ppp2011.cents[p_2011]}_ppp2011",
+                "Indicator Dropdown": "Number in poverty",
+                "International-$ Dropdown": "2011 prices",
+                "Poverty line Dropdown": f"{povlines_ppp2011.povline_dropdown[p_2011]}",
+                "Household survey data type Dropdown": f"{survey_type.dropdown_option[survey]}",
+                "tableSlug": f"{survey_type.table_name[survey]}",
+                "subtitle": f"{povlines_ppp2011.subtitle[p_2011]}",
+                "note": f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2011 prices. Depending on the country and year, it relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita).",
+                "type": np.nan,
+                "yAxisMin": yAxisMin,
+                "selectedFacetStrategy": np.nan,
+                "hasMapTab": "true",
+                "tab": "map",
+                "survey_type": survey_type["table_name"][survey],
+            }
         )
-        df_graphers.loc[j, "tableSlug"] = f"{survey_type.table_name[survey]}"
-        df_graphers.loc[j, "subtitle"] = f"{povlines_ppp2011.subtitle[p_2011]}"
-        df_graphers.loc[j, "note"] = (
-            f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2011 prices. Depending on the country and year, it relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita)."
-        )
-        df_graphers.loc[j, "type"] = np.nan
-        df_graphers.loc[j, "yAxisMin"] = yAxisMin
-        df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-        df_graphers.loc[j, "hasMapTab"] = "true"
-        df_graphers.loc[j, "tab"] = "map"
-        df_graphers.loc[j, "survey_type"] = survey_type["table_name"][survey]
-        j += 1
 
     # Number (2017)
     for p_2017 in range(len(povlines_ppp2017)):
-        df_graphers.loc[j, "title"] = f"{povlines_ppp2017.title_number[p_2017]}"
-        df_graphers.loc[j, "ySlugs"] = (
-            f"headcount_{povlines_ppp2017.cents[p_2017]}_ppp2017"
-        )
-        df_graphers.loc[j, "Indicator Dropdown"] = "Number in poverty"
-        df_graphers.loc[j, "International-$ Dropdown"] = "2017 prices"
-        df_graphers.loc[j, "Poverty line Dropdown"] = (
-            f"{povlines_ppp2017.povline_dropdown[p_2017]}"
-        )
-        df_graphers.loc[j, "Household survey data type Dropdown"] = (
-            f"{survey_type.dropdown_option[survey]}"
-        )
-        df_graphers.loc[j, "tableSlug"] = f"{survey_type.table_name[survey]}"
-        df_graphers.loc[j, "subtitle"] = f"{povlines_ppp2017.subtitle[p_2017]}"
-        df_graphers.loc[j, "note"] = (
-            f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices. Depending on the country and year, it relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita)."
+        df_graphers.append(
+            {
+                "title": f"{povlines_ppp2017.title_number[p_2017]}",
+                "ySlugs": f"headcount_{povlines_ppp2017.cents[p_2017]}_ppp2017",
+                "Indicator Dropdown": "Number in poverty",
+                "International-$ Dropdown": "2017 prices",
+                "Poverty line Dropdown": f"{povlines_ppp2017.povline_dropdown[p_2017]}",
+                "Household survey data type Dropdown": f"{survey_type.dropdown_option[survey]}",
+                "tableSlug": f"{survey_type.table_name[survey]}",
+                "subtitle": f"{povlines_ppp2017.subtitle[p_2017]}",
+                "note": f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices. Depending on the country and year, it relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita).",
+                "type": np.nan,
+                "yAxisMin": yAxisMin,
+                "selectedFacetStrategy": np.nan,
+                "hasMapTab": "true",
+                "tab": "map",
+                "survey_type": survey_type["table_name"][survey],
+            }
         )
-        df_graphers.loc[j, "type"] = np.nan
-        df_graphers.loc[j, "yAxisMin"] = yAxisMin
-        df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-        df_graphers.loc[j, "hasMapTab"] = "true"
-        df_graphers.loc[j, "tab"] = "map"
-        df_graphers.loc[j, "survey_type"] = survey_type["table_name"][survey]
-        j += 1
 
     # Share (2011 and 2017)
     for p in range(len(povlines_both)):
-        df_graphers.loc[j, "title"] = f"{povlines_both.title_share[p]}"
-        df_graphers.loc[j, "ySlugs"] = (
-            f"headcount_ratio_{povlines_both.cents_2011[p]}_ppp2011 headcount_ratio_{povlines_both.cents_2017[p]}_ppp2017"
-        )
-        df_graphers.loc[j, "Indicator Dropdown"] = "Share in poverty"
-        df_graphers.loc[j, "International-$ Dropdown"] = "Compare 2017 and 2011 prices"
-        df_graphers.loc[j, "Poverty line Dropdown"] = (
-            f"{povlines_both.povline_dropdown[p]}"
-        )
-        df_graphers.loc[j, "Household survey data type Dropdown"] = (
-            f"{survey_type.dropdown_option[survey]}"
-        )
-        df_graphers.loc[j, "tableSlug"] = f"{survey_type.table_name[survey]}"
-        df_graphers.loc[j, "subtitle"] = f"{povlines_both.subtitle[p]}"
-        df_graphers.loc[j, "note"] = (
-            f"Depending on the country and year, the data relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita)."
+        df_graphers.append(
+            {
+                "title": f"{povlines_both.title_share[p]}",
+                "ySlugs": f"headcount_ratio_{povlines_both.cents_2011[p]}_ppp2011 headcount_ratio_{povlines_both.cents_2017[p]}_ppp2017",
+                "Indicator Dropdown": "Share in poverty",
+                "International-$ Dropdown": "Compare 2017 and 2011 prices",
+                "Poverty line Dropdown": f"{povlines_both.povline_dropdown[p]}",
+                "Household survey data type Dropdown": f"{survey_type.dropdown_option[survey]}",
+                "tableSlug": f"{survey_type.table_name[survey]}",
+                "subtitle": f"{povlines_both.subtitle[p]}",
+                "note": f"Depending on the country and year, the data relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita).",
+                "type": np.nan,
+                "yAxisMin": yAxisMin,
+                "selectedFacetStrategy": "entity",
+                "hasMapTab": np.nan,
+                "tab": np.nan,
+                "survey_type": survey_type["table_name"][survey],
+            }
         )
-        df_graphers.loc[j, "type"] = np.nan
-        df_graphers.loc[j, "yAxisMin"] = yAxisMin
-        df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-        df_graphers.loc[j, "hasMapTab"] = np.nan
-        df_graphers.loc[j, "tab"] = np.nan
-        df_graphers.loc[j, "survey_type"] = survey_type["table_name"][survey]
-        j += 1
 
     # Number (2011 and 2017)
     for p in range(len(povlines_both)):
-        df_graphers.loc[j, "title"] = f"{povlines_both.title_number[p]}"
-        df_graphers.loc[j, "ySlugs"] = (
-            f"headcount_{povlines_both.cents_2011[p]}_ppp2011 headcount_{povlines_both.cents_2017[p]}_ppp2017"
+        df_graphers.append(
+            {
+                "title": f"{povlines_both.title_number[p]}",
+                "ySlugs": f"headcount_{povlines_both.cents_2011[p]}_ppp2011 headcount_{povlines_both.cents_2017[p]}_ppp2017",
+                "Indicator Dropdown": "Number in poverty",
+                "International-$ Dropdown": "Compare 2017 and 2011 prices",
+                "Poverty line Dropdown": f"{povlines_both.povline_dropdown[p]}",
+                "Household survey data type Dropdown": f"{survey_type.dropdown_option[survey]}",
+                "tableSlug": f"{survey_type.table_name[survey]}",
+                "subtitle": f"{povlines_both.subtitle[p]}",
+                "note": f"Depending on the country and year, the data relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita).",
+                "type": np.nan,
+                "yAxisMin": yAxisMin,
+                "selectedFacetStrategy": "entity",
+                "hasMapTab": np.nan,
+                "tab": np.nan,
+                "survey_type": survey_type["table_name"][survey],
+            }
         )
-        df_graphers.loc[j, "Indicator Dropdown"] = "Number in poverty"
-        df_graphers.loc[j, "International-$ Dropdown"] = "Compare 2017 and 2011 prices"
-        df_graphers.loc[j, "Poverty line Dropdown"] = (
-            f"{povlines_both.povline_dropdown[p]}"
-        )
-        df_graphers.loc[j, "Household survey data type Dropdown"] = (
-            f"{survey_type.dropdown_option[survey]}"
-        )
-        df_graphers.loc[j, "tableSlug"] = f"{survey_type.table_name[survey]}"
-        df_graphers.loc[j, "subtitle"] = f"{povlines_both.subtitle[p]}"
-        df_graphers.loc[j, "note"] = (
-            f"Depending on the country and year, the data relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita)."
-        )
-        df_graphers.loc[j, "type"] = np.nan
-        df_graphers.loc[j, "yAxisMin"] = yAxisMin
-        df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-        df_graphers.loc[j, "hasMapTab"] = np.nan
-        df_graphers.loc[j, "tab"] = np.nan
-        df_graphers.loc[j, "survey_type"] = survey_type["table_name"][survey]
-        j += 1
 
     # Share (relative, 2011)
     for pct in range(len(povlines_rel)):
-        df_graphers.loc[j, "title"] = f"{povlines_rel.title_share[pct]} (2011 prices)"
-        df_graphers.loc[j, "ySlugs"] = (
-            f"headcount_ratio_{povlines_rel.slug_suffix[pct]}_ppp2011"
-        )
-        df_graphers.loc[j, "Indicator Dropdown"] = "Share in poverty"
-        df_graphers.loc[j, "International-$ Dropdown"] = "2011 prices"
-        df_graphers.loc[j, "Poverty line Dropdown"] = f"{povlines_rel.dropdown[pct]}"
-        df_graphers.loc[j, "Household survey data type Dropdown"] = (
-            f"{survey_type.dropdown_option[survey]}"
+        df_graphers.append(
+            {
+                "title": f"{povlines_rel.title_share[pct]} (2011 prices)",
+                "ySlugs": f"headcount_ratio_{povlines_rel.slug_suffix[pct]}_ppp2011",
+                "Indicator Dropdown": "Share in poverty",
+                "International-$ Dropdown": "2011 prices",
+                "Poverty line Dropdown": f"{povlines_rel.dropdown[pct]}",
+                "Household survey data type Dropdown": f"{survey_type.dropdown_option[survey]}",
+                "tableSlug": f"{survey_type.table_name[survey]}",
+                "subtitle": f"Relative poverty is measured in terms of a poverty line that rises and falls over time with average incomes – in this case set at {povlines_rel.text[pct]} {survey_type.text[survey]}.",
+                "note": f"Depending on the country and year, the data relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita).",
+                "type": np.nan,
+                "yAxisMin": yAxisMin,
+                "selectedFacetStrategy": np.nan,
+                "hasMapTab": "true",
+                "tab": "map",
+                "survey_type": survey_type["table_name"][survey],
+            }
         )
-        df_graphers.loc[j, "tableSlug"] = f"{survey_type.table_name[survey]}"
-        df_graphers.loc[j, "subtitle"] = (
-            f"Relative poverty is measured in terms of a poverty line that rises and falls over time with average incomes – in this case set at {povlines_rel.text[pct]} {survey_type.text[survey]}."
-        )
-        df_graphers.loc[j, "note"] = (
-            f"Depending on the country and year, the data relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita)."
-        )
-        df_graphers.loc[j, "type"] = np.nan
-        df_graphers.loc[j, "yAxisMin"] = yAxisMin
-        df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-        df_graphers.loc[j, "hasMapTab"] = "true"
-        df_graphers.loc[j, "tab"] = "map"
-        df_graphers.loc[j, "survey_type"] = survey_type["table_name"][survey]
-        j += 1
 
     # Share (relative, 2017)
     for pct in range(len(povlines_rel)):
-        df_graphers.loc[j, "title"] = f"{povlines_rel.title_share[pct]} (2017 prices)"
-        df_graphers.loc[j, "ySlugs"] = (
-            f"headcount_ratio_{povlines_rel.slug_suffix[pct]}_ppp2017"
-        )
-        df_graphers.loc[j, "Indicator Dropdown"] = "Share in poverty"
-        df_graphers.loc[j, "International-$ Dropdown"] = "2017 prices"
-        df_graphers.loc[j, "Poverty line Dropdown"] = f"{povlines_rel.dropdown[pct]}"
-        df_graphers.loc[j, "Household survey data type Dropdown"] = (
-            f"{survey_type.dropdown_option[survey]}"
+        df_graphers.append(
+            {
+                "title": f"{povlines_rel.title_share[pct]} (2017 prices)",
+                "ySlugs": f"headcount_ratio_{povlines_rel.slug_suffix[pct]}_ppp2017",
+                "Indicator Dropdown": "Share in poverty",
+                "International-$ Dropdown": "2017 prices",
+                "Poverty line Dropdown": f"{povlines_rel.dropdown[pct]}",
+                "Household survey data type Dropdown": f"{survey_type.dropdown_option[survey]}",
+                "tableSlug": f"{survey_type.table_name[survey]}",
+                "subtitle": f"Relative poverty is measured in terms of a poverty line that rises and falls over time with average incomes – in this case set at {povlines_rel.text[pct]} {survey_type.text[survey]}.",
+                "note": f"Depending on the country and year, the data relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita).",
+                "type": np.nan,
+                "yAxisMin": yAxisMin,
+                "selectedFacetStrategy": np.nan,
+                "hasMapTab": "true",
+                "tab": "map",
+                "survey_type": survey_type["table_name"][survey],
+            }
         )
-        df_graphers.loc[j, "tableSlug"] = f"{survey_type.table_name[survey]}"
-        df_graphers.loc[j, "subtitle"] = (
-            f"Relative poverty is measured in terms of a poverty line that rises and falls over time with average incomes – in this case set at {povlines_rel.text[pct]} {survey_type.text[survey]}."
-        )
-        df_graphers.loc[j, "note"] = (
-            f"Depending on the country and year, the data relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita)."
-        )
-        df_graphers.loc[j, "type"] = np.nan
-        df_graphers.loc[j, "yAxisMin"] = yAxisMin
-        df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-        df_graphers.loc[j, "hasMapTab"] = "true"
-        df_graphers.loc[j, "tab"] = "map"
-        df_graphers.loc[j, "survey_type"] = survey_type["table_name"][survey]
-        j += 1
 
     # Number (relative, 2011)
     for pct in range(len(povlines_rel)):
-        df_graphers.loc[j, "title"] = f"{povlines_rel.title_number[pct]} (2011 prices)"
-        df_graphers.loc[j, "ySlugs"] = (
-            f"headcount_{povlines_rel.slug_suffix[pct]}_ppp2011"
-        )
-        df_graphers.loc[j, "Indicator Dropdown"] = "Number in poverty"
-        df_graphers.loc[j, "International-$ Dropdown"] = "2011 prices"
-        df_graphers.loc[j, "Poverty line Dropdown"] = f"{povlines_rel.dropdown[pct]}"
-        df_graphers.loc[j, "Household survey data type Dropdown"] = (
-            f"{survey_type.dropdown_option[survey]}"
-        )
-        df_graphers.loc[j, "tableSlug"] = f"{survey_type.table_name[survey]}"
-        df_graphers.loc[j, "subtitle"] = (
-            f"Relative poverty is measured in terms of a poverty line that rises and falls over time with average incomes – in this case set at {povlines_rel.text[pct]} {survey_type.text[survey]}."
+        df_graphers.append(
+            {
+                "title": f"{povlines_rel.title_number[pct]} (2011 prices)",
+                "ySlugs": f"headcount_{povlines_rel.slug_suffix[pct]}_ppp2011",
+                "Indicator Dropdown": "Number in poverty",
+                "International-$ Dropdown": "2011 prices",
+                "Poverty line Dropdown": f"{povlines_rel.dropdown[pct]}",
+                "Household survey data type Dropdown": f"{survey_type.dropdown_option[survey]}",
+                "tableSlug": f"{survey_type.table_name[survey]}",
+                "subtitle": f"Relative poverty is measured in terms of a poverty line that rises and falls over time with average incomes – in this case set at {povlines_rel.text[pct]} {survey_type.text[survey]}.",
+                "note": f"Depending on the country and year, the data relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita).",
+                "type": np.nan,
+                "yAxisMin": yAxisMin,
+                "selectedFacetStrategy": np.nan,
+                "hasMapTab": "true",
+                "tab": "map",
+                "survey_type": survey_type["table_name"][survey],
+            }
         )
-        df_graphers.loc[j, "note"] = (
-            f"Depending on the country and year, the data relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita)."
-        )
-        df_graphers.loc[j, "type"] = np.nan
-        df_graphers.loc[j, "yAxisMin"] = yAxisMin
-        df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-        df_graphers.loc[j, "hasMapTab"] = "true"
-        df_graphers.loc[j, "tab"] = "map"
-        df_graphers.loc[j, "survey_type"] = survey_type["table_name"][survey]
-        j += 1
 
     # Number (relative, 2017)
     for pct in range(len(povlines_rel)):
-        df_graphers.loc[j, "title"] = f"{povlines_rel.title_number[pct]} (2017 prices)"
-        df_graphers.loc[j, "ySlugs"] = (
-            f"headcount_{povlines_rel.slug_suffix[pct]}_ppp2017"
-        )
-        df_graphers.loc[j, "Indicator Dropdown"] = "Number in poverty"
-        df_graphers.loc[j, "International-$ Dropdown"] = "2017 prices"
-        df_graphers.loc[j, "Poverty line Dropdown"] = f"{povlines_rel.dropdown[pct]}"
-        df_graphers.loc[j, "Household survey data type Dropdown"] = (
-            f"{survey_type.dropdown_option[survey]}"
-        )
-        df_graphers.loc[j, "tableSlug"] = f"{survey_type.table_name[survey]}"
-        df_graphers.loc[j, "subtitle"] = (
-            f"Relative poverty is measured in terms of a poverty line that rises and falls over time with average incomes – in this case set at {povlines_rel.text[pct]} {survey_type.text[survey]}."
+        df_graphers.append(
+            {
+                "title": f"{povlines_rel.title_number[pct]} (2017 prices)",
+                "ySlugs": f"headcount_{povlines_rel.slug_suffix[pct]}_ppp2017",
+                "Indicator Dropdown": "Number in poverty",
+                "International-$ Dropdown": "2017 prices",
+                "Poverty line Dropdown": f"{povlines_rel.dropdown[pct]}",
+                "Household survey data type Dropdown": f"{survey_type.dropdown_option[survey]}",
+                "tableSlug": f"{survey_type.table_name[survey]}",
+                "subtitle": f"Relative poverty is measured in terms of a poverty line that rises and falls over time with average incomes – in this case set at {povlines_rel.text[pct]} {survey_type.text[survey]}.",
+                "note": f"Depending on the country and year, the data relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita).",
+                "type": np.nan,
+                "yAxisMin": yAxisMin,
+                "selectedFacetStrategy": np.nan,
+                "hasMapTab": "true",
+                "tab": "map",
+                "survey_type": survey_type["table_name"][survey],
+            }
         )
-        df_graphers.loc[j, "note"] = (
-            f"Depending on the country and year, the data relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita)."
-        )
-        df_graphers.loc[j, "type"] = np.nan
-        df_graphers.loc[j, "yAxisMin"] = yAxisMin
-        df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-        df_graphers.loc[j, "hasMapTab"] = "true"
-        df_graphers.loc[j, "tab"] = "map"
-        df_graphers.loc[j, "survey_type"] = survey_type["table_name"][survey]
-        j += 1
 
     # Share (relative, 2011 vs 2017)
-    df_graphers.loc[j, "title"] = (
-        f"Relative poverty: Share of people below 60% of the median (2011 vs. 2017 prices)"
-    )
-    df_graphers.loc[j, "ySlugs"] = (
-        f"headcount_ratio_60_median_ppp2011 headcount_ratio_60_median_ppp2017"
-    )
-    df_graphers.loc[j, "Indicator Dropdown"] = "Share in poverty"
-    df_graphers.loc[j, "International-$ Dropdown"] = "Compare 2017 and 2011 prices"
-    df_graphers.loc[j, "Poverty line Dropdown"] = f"Relative poverty: 60% of median"
-    df_graphers.loc[j, "Household survey data type Dropdown"] = (
-        f"{survey_type.dropdown_option[survey]}"
-    )
-    df_graphers.loc[j, "tableSlug"] = f"{survey_type.table_name[survey]}"
-    df_graphers.loc[j, "subtitle"] = (
-        f"Relative poverty is measured in terms of a poverty line that rises and falls over time with average incomes – in this case set at 60% of the median {survey_type.text[survey]}."
+    df_graphers.append(
+        {
+            "title": f"Relative poverty: Share of people below 60% of the median (2011 vs. 2017 prices)",
+            "ySlugs": f"headcount_ratio_60_median_ppp2011 headcount_ratio_60_median_ppp2017",
+            "Indicator Dropdown": "Share in poverty",
+            "International-$ Dropdown": "Compare 2017 and 2011 prices",
+            "Poverty line Dropdown": f"Relative poverty: 60% of median",
+            "Household survey data type Dropdown": f"{survey_type.dropdown_option[survey]}",
+            "tableSlug": f"{survey_type.table_name[survey]}",
+            "subtitle": f"Relative poverty is measured in terms of a poverty line that rises and falls over time with average incomes – in this case set at 60% of the median {survey_type.text[survey]}.",
+            "note": f"Depending on the country and year, the data relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita).",
+            "type": np.nan,
+            "yAxisMin": yAxisMin,
+            "selectedFacetStrategy": "entity",
+            "hasMapTab": np.nan,
+            "tab": np.nan,
+            "survey_type": survey_type["table_name"][survey],
+        }
     )
-    df_graphers.loc[j, "note"] = (
-        f"Depending on the country and year, the data relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita)."
-    )
-    df_graphers.loc[j, "type"] = np.nan
-    df_graphers.loc[j, "yAxisMin"] = yAxisMin
-    df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-    df_graphers.loc[j, "hasMapTab"] = np.nan
-    df_graphers.loc[j, "tab"] = np.nan
-    df_graphers.loc[j, "survey_type"] = survey_type["table_name"][survey]
-    j += 1
 
     # Number (relative, 2011 vs 2017)
-    df_graphers.loc[j, "title"] = (
-        f"Relative poverty: Number of people below 60% of the median (2011 vs. 2017 prices)"
-    )
-    df_graphers.loc[j, "ySlugs"] = (
-        f"headcount_60_median_ppp2011 headcount_60_median_ppp2017"
-    )
-    df_graphers.loc[j, "Indicator Dropdown"] = "Number in poverty"
-    df_graphers.loc[j, "International-$ Dropdown"] = "Compare 2017 and 2011 prices"
-    df_graphers.loc[j, "Poverty line Dropdown"] = f"Relative poverty: 60% of median"
-    df_graphers.loc[j, "Household survey data type Dropdown"] = (
-        f"{survey_type.dropdown_option[survey]}"
-    )
-    df_graphers.loc[j, "tableSlug"] = f"{survey_type.table_name[survey]}"
-    df_graphers.loc[j, "subtitle"] = (
-        f"Relative poverty is measured in terms of a poverty line that rises and falls over time with average incomes – in this case set at 60% of the median {survey_type.text[survey]}."
+    df_graphers.append(
+        {
+            "title": f"Relative poverty: Number of people below 60% of the median (2011 vs. 2017 prices)",
+            "ySlugs": f"headcount_60_median_ppp2011 headcount_60_median_ppp2017",
+            "Indicator Dropdown": "Number in poverty",
+            "International-$ Dropdown": "Compare 2017 and 2011 prices",
+            "Poverty line Dropdown": f"Relative poverty: 60% of median",
+            "Household survey data type Dropdown": f"{survey_type.dropdown_option[survey]}",
+            "tableSlug": f"{survey_type.table_name[survey]}",
+            "subtitle": f"Relative poverty is measured in terms of a poverty line that rises and falls over time with average incomes – in this case set at 60% of the median {survey_type.text[survey]}.",
+            "note": f"Depending on the country and year, the data relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita).",
+            "type": np.nan,
+            "yAxisMin": yAxisMin,
+            "selectedFacetStrategy": "entity",
+            "hasMapTab": np.nan,
+            "tab": np.nan,
+            "survey_type": survey_type["table_name"][survey],
+        }
     )
-    df_graphers.loc[j, "note"] = (
-        f"Depending on the country and year, the data relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita)."
-    )
-    df_graphers.loc[j, "type"] = np.nan
-    df_graphers.loc[j, "yAxisMin"] = yAxisMin
-    df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-    df_graphers.loc[j, "hasMapTab"] = np.nan
-    df_graphers.loc[j, "tab"] = np.nan
-    df_graphers.loc[j, "survey_type"] = survey_type["table_name"][survey]
-    j += 1
 
     # Mean (2011)
-    df_graphers.loc[j, "title"] = (
-        f"Mean {survey_type.text[survey]} per day (2011 prices)"
-    )
-    df_graphers.loc[j, "ySlugs"] = "mean_ppp2011"
-    df_graphers.loc[j, "Indicator Dropdown"] = "Mean income or consumption"
-    df_graphers.loc[j, "International-$ Dropdown"] = "2011 prices"
-    df_graphers.loc[j, "Poverty line Dropdown"] = np.nan
-    df_graphers.loc[j, "Household survey data type Dropdown"] = (
-        f"{survey_type.dropdown_option[survey]}"
-    )
-    df_graphers.loc[j, "tableSlug"] = f"{survey_type.table_name[survey]}"
-    df_graphers.loc[j, "subtitle"] = (
-        "This data is adjusted for inflation and for differences in living costs between countries."
-    )
-    df_graphers.loc[j, "note"] = (
-        f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2011 prices. Depending on the country and year, it relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita)."
+    df_graphers.append(
+        {
+            "title": f"Mean {survey_type.text[survey]} per day (2011 prices)",
+            "ySlugs": "mean_ppp2011",
+            "Indicator Dropdown": "Mean income or consumption",
+            "International-$ Dropdown": "2011 prices",
+            "Poverty line Dropdown": np.nan,
+            "Household survey data type Dropdown": f"{survey_type.dropdown_option[survey]}",
+            "tableSlug": f"{survey_type.table_name[survey]}",
+            "subtitle": "This data is adjusted for inflation and for differences in living costs between countries.",
+            "note": f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2011 prices. Depending on the country and year, it relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita).",
+            "type": np.nan,
+            "yAxisMin": yAxisMin,
+            "selectedFacetStrategy": np.nan,
+            "hasMapTab": "true",
+            "tab": "map",
+            "yScaleToggle": "true",
+            "survey_type": survey_type["table_name"][survey],
+        }
     )
-    df_graphers.loc[j, "type"] = np.nan
-    df_graphers.loc[j, "yAxisMin"] = yAxisMin
-    df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-    df_graphers.loc[j, "hasMapTab"] = "true"
-    df_graphers.loc[j, "tab"] = "map"
-    df_graphers.loc[j, "yScaleToggle"] = "true"
-    df_graphers.loc[j, "survey_type"] = survey_type["table_name"][survey]
-    j += 1
 
     # Mean (2017)
-    df_graphers.loc[j, "title"] = (
-        f"Mean {survey_type.text[survey]} per day (2017 prices)"
-    )
-    df_graphers.loc[j, "ySlugs"] = "mean_ppp2017"
-    df_graphers.loc[j, "Indicator Dropdown"] = "Mean income or consumption"
-    df_graphers.loc[j, "International-$ Dropdown"] = "2017 prices"
-    df_graphers.loc[j, "Poverty line Dropdown"] = np.nan
-    df_graphers.loc[j, "Household survey data type Dropdown"] = (
-        f"{survey_type.dropdown_option[survey]}"
-    )
-    df_graphers.loc[j, "tableSlug"] = f"{survey_type.table_name[survey]}"
-    df_graphers.loc[j, "subtitle"] = (
-        "This data is adjusted for inflation and for differences in living costs between countries."
-    )
-    df_graphers.loc[j, "note"] = (
-        f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices. Depending on the country and year, it relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita)."
+    df_graphers.append(
+        {
+            "title": f"Mean {survey_type.text[survey]} per day (2017 prices)",
+            "ySlugs": "mean_ppp2017",
+            "Indicator Dropdown": "Mean income or consumption",
+            "International-$ Dropdown": "2017 prices",
+            "Poverty line Dropdown": np.nan,
+            "Household survey data type Dropdown": f"{survey_type.dropdown_option[survey]}",
+            "tableSlug": f"{survey_type.table_name[survey]}",
+            "subtitle": "This data is adjusted for inflation and for differences in living costs between countries.",
+            "note": f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices. Depending on the country and year, it relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita).",
+            "type": np.nan,
+            "yAxisMin": yAxisMin,
+            "selectedFacetStrategy": np.nan,
+            "hasMapTab": "true",
+            "tab": "map",
+            "yScaleToggle": "true",
+            "survey_type": survey_type["table_name"][survey],
+        }
     )
-    df_graphers.loc[j, "type"] = np.nan
-    df_graphers.loc[j, "yAxisMin"] = yAxisMin
-    df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-    df_graphers.loc[j, "hasMapTab"] = "true"
-    df_graphers.loc[j, "tab"] = "map"
-    df_graphers.loc[j, "yScaleToggle"] = "true"
-    df_graphers.loc[j, "survey_type"] = survey_type["table_name"][survey]
-    j += 1
 
     # Mean (2011, 2017)
-    df_graphers.loc[j, "title"] = (
-        f"Mean {survey_type.text[survey]} per day: 2011 vs. 2017 prices"
+    df_graphers.append(
+        {
+            "title": f"Mean {survey_type.text[survey]} per day: 2011 vs. 2017 prices",
+            "ySlugs": "mean_ppp2011 mean_ppp2017",
+            "Indicator Dropdown": "Mean income or consumption",
+            "International-$ Dropdown": "Compare 2017 and 2011 prices",
+            "Poverty line Dropdown": np.nan,
+            "Household survey data type Dropdown": f"{survey_type.dropdown_option[survey]}",
+            "tableSlug": f"{survey_type.table_name[survey]}",
+            "subtitle": "This data is adjusted for inflation and for differences in living costs between countries.",
+            "note": f"Depending on the country and year, the data relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita).",
+            "type": np.nan,
+            "yAxisMin": yAxisMin,
+            "selectedFacetStrategy": "entity",
+            "hasMapTab": np.nan,
+            "tab": np.nan,
+            "yScaleToggle": "true",
+            "survey_type": survey_type["table_name"][survey],
+        }
     )
-    df_graphers.loc[j, "ySlugs"] = "mean_ppp2011 mean_ppp2017"
-    df_graphers.loc[j, "Indicator Dropdown"] = "Mean income or consumption"
-    df_graphers.loc[j, "International-$ Dropdown"] = "Compare 2017 and 2011 prices"
-    df_graphers.loc[j, "Poverty line Dropdown"] = np.nan
-    df_graphers.loc[j, "Household survey data type Dropdown"] = (
-        f"{survey_type.dropdown_option[survey]}"
-    )
-    df_graphers.loc[j, "tableSlug"] = f"{survey_type.table_name[survey]}"
-    df_graphers.loc[j, "subtitle"] = (
-        "This data is adjusted for inflation and for differences in living costs between countries."
-    )
-    df_graphers.loc[j, "note"] = (
-        f"Depending on the country and year, the data relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita)."
-    )
-    df_graphers.loc[j, "type"] = np.nan
-    df_graphers.loc[j, "yAxisMin"] = yAxisMin
-    df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-    df_graphers.loc[j, "hasMapTab"] = np.nan
-    df_graphers.loc[j, "tab"] = np.nan
-    df_graphers.loc[j, "yScaleToggle"] = "true"
-    df_graphers.loc[j, "survey_type"] = survey_type["table_name"][survey]
-    j += 1
 
     # Median (2011)
-    df_graphers.loc[j, "title"] = (
-        f"Median {survey_type.text[survey]} per day (2011 prices)"
-    )
-    df_graphers.loc[j, "ySlugs"] = "median_ppp2011"
-    df_graphers.loc[j, "Indicator Dropdown"] = "Median income or consumption"
-    df_graphers.loc[j, "International-$ Dropdown"] = "2011 prices"
-    df_graphers.loc[j, "Poverty line Dropdown"] = np.nan
-    df_graphers.loc[j, "Household survey data type Dropdown"] = (
-        f"{survey_type.dropdown_option[survey]}"
+    df_graphers.append(
+        {
+            "title": f"Median {survey_type.text[survey]} per day (2011 prices)",
+            "ySlugs": "median_ppp2011",
+            "Indicator Dropdown": "Median income or consumption",
+            "International-$ Dropdown": "2011 prices",
+            "Poverty line Dropdown": np.nan,
+            "Household survey data type Dropdown": f"{survey_type.dropdown_option[survey]}",
+            "tableSlug": f"{survey_type.table_name[survey]}",
+            "subtitle": "This data is adjusted for inflation and for differences in living costs between countries.",
+            "note": f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2011 prices. Depending on the country and year, it relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita).",
+            "type": np.nan,
+            "yAxisMin": yAxisMin,
+            "selectedFacetStrategy": np.nan,
+            "hasMapTab": "true",
+            "tab": "map",
+            "yScaleToggle": "true",
+            "survey_type": survey_type["table_name"][survey],
+        }
     )
-    df_graphers.loc[j, "tableSlug"] = f"{survey_type.table_name[survey]}"
-    df_graphers.loc[j, "subtitle"] = (
-        "This data is adjusted for inflation and for differences in living costs between countries."
-    )
-    df_graphers.loc[j, "note"] = (
-        f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2011 prices. Depending on the country and year, it relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita)."
-    )
-    df_graphers.loc[j, "type"] = np.nan
-    df_graphers.loc[j, "yAxisMin"] = yAxisMin
-    df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-    df_graphers.loc[j, "hasMapTab"] = "true"
-    df_graphers.loc[j, "tab"] = "map"
-    df_graphers.loc[j, "yScaleToggle"] = "true"
-    df_graphers.loc[j, "survey_type"] = survey_type["table_name"][survey]
-    j += 1
 
     # Median (2017)
-    df_graphers.loc[j, "title"] = (
-        f"Median {survey_type.text[survey]} per day (2017 prices)"
-    )
-    df_graphers.loc[j, "ySlugs"] = "median_ppp2017"
-    df_graphers.loc[j, "Indicator Dropdown"] = "Median income or consumption"
-    df_graphers.loc[j, "International-$ Dropdown"] = "2017 prices"
-    df_graphers.loc[j, "Poverty line Dropdown"] = np.nan
-    df_graphers.loc[j, "Household survey data type Dropdown"] = (
-        f"{survey_type.dropdown_option[survey]}"
+    df_graphers.append(
+        {
+            "title": f"Median {survey_type.text[survey]} per day (2017 prices)",
+            "ySlugs": "median_ppp2017",
+            "Indicator Dropdown": "Median income or consumption",
+            "International-$ Dropdown": "2017 prices",
+            "Poverty line Dropdown": np.nan,
+            "Household survey data type Dropdown": f"{survey_type.dropdown_option[survey]}",
+            "tableSlug": f"{survey_type.table_name[survey]}",
+            "subtitle": "This data is adjusted for inflation and for differences in living costs between countries.",
+            "note": f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices. Depending on the country and year, it relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita).",
+            "type": np.nan,
+            "yAxisMin": yAxisMin,
+            "selectedFacetStrategy": np.nan,
+            "hasMapTab": "true",
+            "tab": "map",
+            "yScaleToggle": "true",
+            "survey_type": survey_type["table_name"][survey],
+        }
     )
-    df_graphers.loc[j, "tableSlug"] = f"{survey_type.table_name[survey]}"
-    df_graphers.loc[j, "subtitle"] = (
-        "This data is adjusted for inflation and for differences in living costs between countries."
-    )
-    df_graphers.loc[j, "note"] = (
-        f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at 2017 prices. Depending on the country and year, it relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita)."
-    )
-    df_graphers.loc[j, "type"] = np.nan
-    df_graphers.loc[j, "yAxisMin"] = yAxisMin
-    df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-    df_graphers.loc[j, "hasMapTab"] = "true"
-    df_graphers.loc[j, "tab"] = "map"
-    df_graphers.loc[j, "yScaleToggle"] = "true"
-    df_graphers.loc[j, "survey_type"] = survey_type["table_name"][survey]
-    j += 1
 
     # Median (2011, 2017)
-    df_graphers.loc[j, "title"] = (
-        f"Median {survey_type.text[survey]} per day: 2011 vs. 2017 prices"
-    )
-    df_graphers.loc[j, "ySlugs"] = "median_ppp2011 median_ppp2017"
-    df_graphers.loc[j, "Indicator Dropdown"] = "Median income or consumption"
-    df_graphers.loc[j, "International-$ Dropdown"] = "Compare 2017 and 2011 prices"
-    df_graphers.loc[j, "Poverty line Dropdown"] = np.nan
-    df_graphers.loc[j, "Household survey data type Dropdown"] = (
-        f"{survey_type.dropdown_option[survey]}"
-    )
-    df_graphers.loc[j, "tableSlug"] = f"{survey_type.table_name[survey]}"
-    df_graphers.loc[j, "subtitle"] = (
-        "This data is adjusted for inflation and for differences in living costs between countries."
+    df_graphers.append(
+        {
+            "title": f"Median {survey_type.text[survey]} per day: 2011 vs. 2017 prices",
+            "ySlugs": "median_ppp2011 median_ppp2017",
+            "Indicator Dropdown": "Median income or consumption",
+            "International-$ Dropdown": "Compare 2017 and 2011 prices",
+            "Poverty line Dropdown": np.nan,
+            "Household survey data type Dropdown": f"{survey_type.dropdown_option[survey]}",
+            "tableSlug": f"{survey_type.table_name[survey]}",
+            "subtitle": "This data is adjusted for inflation and for differences in living costs between countries.",
+            "note": f"Depending on the country and year, the data relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita).",
+            "type": np.nan,
+            "yAxisMin": yAxisMin,
+            "selectedFacetStrategy": "entity",
+            "hasMapTab": np.nan,
+            "tab": np.nan,
+            "yScaleToggle": "true",
+            "survey_type": survey_type["table_name"][survey],
+        }
     )
-    df_graphers.loc[j, "note"] = (
-        f"Depending on the country and year, the data relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita)."
-    )
-    df_graphers.loc[j, "type"] = np.nan
-    df_graphers.loc[j, "yAxisMin"] = yAxisMin
-    df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-    df_graphers.loc[j, "hasMapTab"] = np.nan
-    df_graphers.loc[j, "tab"] = np.nan
-    df_graphers.loc[j, "yScaleToggle"] = "true"
-    df_graphers.loc[j, "survey_type"] = survey_type["table_name"][survey]
-    j += 1
 
     # P10 (2011)
-    df_graphers.loc[j, "title"] = (
-        f"P10: The {survey_type.text[survey]} of the poorest tenth (2011 prices)"
-    )
-    df_graphers.loc[j, "ySlugs"] = "decile1_thr_ppp2011"
-    df_graphers.loc[j, "Indicator Dropdown"] = "P10 (poorest tenth)"
-    df_graphers.loc[j, "International-$ Dropdown"] = "2011 prices"
-    df_graphers.loc[j, "Poverty line Dropdown"] = np.nan
-    df_graphers.loc[j, "Household survey data type Dropdown"] = (
-        f"{survey_type.dropdown_option[survey]}"
-    )
-    df_graphers.loc[j, "tableSlug"] = f"{survey_type.table_name[survey]}"
-    df_graphers.loc[j, "subtitle"] = (
-        f"P10 is the level of {survey_type.text[survey]} per day below which 10% of the population falls."
+    df_graphers.append(
+        {
+            "title": f"P10: The {survey_type.text[survey]} of the poorest tenth (2011 prices)",
+            "ySlugs": "decile1_thr_ppp2011",
+            "Indicator Dropdown": "P10 (poorest tenth)",
+            "International-$ Dropdown": "2011 prices",
+            "Poverty line Dropdown": np.nan,
+            "Household survey data type Dropdown": f"{survey_type.dropdown_option[survey]}",
+            "tableSlug": f"{survey_type.table_name[survey]}",
+            "subtitle": f"P10 is the level of {survey_type.text[survey]} per day below which 10% of the population falls.",
+            "note": f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2011 prices to account for inflation and differences in living costs between countries. Depending on the country and year, it relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita).",
+            "type": np.nan,
+            "yAxisMin": yAxisMin,
+            "selectedFacetStrategy": np.nan,
+            "hasMapTab": "true",
+            "tab": "map",
+            "yScaleToggle": "true",
+            "survey_type": survey_type["table_name"][survey],
+        }
     )
-    df_graphers.loc[j, "note"] = (
-        f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2011 prices to account for inflation and differences in living costs between countries. Depending on the country and year, it relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita)."
-    )
-    df_graphers.loc[j, "type"] = np.nan
-    df_graphers.loc[j, "yAxisMin"] = yAxisMin
-    df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-    df_graphers.loc[j, "hasMapTab"] = "true"
-    df_graphers.loc[j, "tab"] = "map"
-    df_graphers.loc[j, "yScaleToggle"] = "true"
-    df_graphers.loc[j, "survey_type"] = survey_type["table_name"][survey]
-    j += 1
 
     # P10 (2017)
-    df_graphers.loc[j, "title"] = (
-        f"P10: The {survey_type.text[survey]} of the poorest tenth (2017 prices)"
-    )
-    df_graphers.loc[j, "ySlugs"] = "decile1_thr_ppp2017"
-    df_graphers.loc[j, "Indicator Dropdown"] = "P10 (poorest tenth)"
-    df_graphers.loc[j, "International-$ Dropdown"] = "2017 prices"
-    df_graphers.loc[j, "Poverty line Dropdown"] = np.nan
-    df_graphers.loc[j, "Household survey data type Dropdown"] = (
-        f"{survey_type.dropdown_option[survey]}"
-    )
-    df_graphers.loc[j, "tableSlug"] = f"{survey_type.table_name[survey]}"
-    df_graphers.loc[j, "subtitle"] = (
-        f"P10 is the level of {survey_type.text[survey]} per day below which 10% of the population falls."
-    )
-    df_graphers.loc[j, "note"] = (
-        f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries. Depending on the country and year, it relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita)."
+    df_graphers.append(
+        {
+            "title": f"P10: The {survey_type.text[survey]} of the poorest tenth (2017 prices)",
+            "ySlugs": "decile1_thr_ppp2017",
+            "Indicator Dropdown": "P10 (poorest tenth)",
+            "International-$ Dropdown": "2017 prices",
+            "Poverty line Dropdown": np.nan,
+            "Household survey data type Dropdown": f"{survey_type.dropdown_option[survey]}",
+            "tableSlug": f"{survey_type.table_name[survey]}",
+            "subtitle": f"P10 is the level of {survey_type.text[survey]} per day below which 10% of the population falls.",
+            "note": f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries. Depending on the country and year, it relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita).",
+            "type": np.nan,
+            "yAxisMin": yAxisMin,
+            "selectedFacetStrategy": np.nan,
+            "hasMapTab": "true",
+            "tab": "map",
+            "yScaleToggle": "true",
+            "survey_type": survey_type["table_name"][survey],
+        }
     )
-    df_graphers.loc[j, "type"] = np.nan
-    df_graphers.loc[j, "yAxisMin"] = yAxisMin
-    df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-    df_graphers.loc[j, "hasMapTab"] = "true"
-    df_graphers.loc[j, "tab"] = "map"
-    df_graphers.loc[j, "yScaleToggle"] = "true"
-    df_graphers.loc[j, "survey_type"] = survey_type["table_name"][survey]
-    j += 1
 
     # P10 (2011, 2017)
-    df_graphers.loc[j, "title"] = (
-        f"P10: The {survey_type.text[survey]} of the poorest tenth (2011 vs. 2017 prices)"
+    df_graphers.append(
+        {
+            "title": f"P10: The {survey_type.text[survey]} of the poorest tenth (2011 vs. 2017 prices)",
+            "ySlugs": "decile1_thr_ppp2011 decile1_thr_ppp2017",
+            "Indicator Dropdown": "P10 (poorest tenth)",
+            "International-$ Dropdown": "Compare 2017 and 2011 prices",
+            "Poverty line Dropdown": np.nan,
+            "Household survey data type Dropdown": f"{survey_type.dropdown_option[survey]}",
+            "tableSlug": f"{survey_type.table_name[survey]}",
+            "subtitle": f"P10 is the level of {survey_type.text[survey]} per day below which 10% of the population falls.",
+            "note": f"This data is adjusted for inflation and for differences in living costs between countries. Depending on the country and year, it relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita).",
+            "type": np.nan,
+            "yAxisMin": yAxisMin,
+            "selectedFacetStrategy": "entity",
+            "hasMapTab": np.nan,
+            "tab": np.nan,
+            "yScaleToggle": "true",
+            "survey_type": survey_type["table_name"][survey],
+        }
     )
-    df_graphers.loc[j, "ySlugs"] = "decile1_thr_ppp2011 decile1_thr_ppp2017"
-    df_graphers.loc[j, "Indicator Dropdown"] = "P10 (poorest tenth)"
-    df_graphers.loc[j, "International-$ Dropdown"] = "Compare 2017 and 2011 prices"
-    df_graphers.loc[j, "Poverty line Dropdown"] = np.nan
-    df_graphers.loc[j, "Household survey data type Dropdown"] = (
-        f"{survey_type.dropdown_option[survey]}"
-    )
-    df_graphers.loc[j, "tableSlug"] = f"{survey_type.table_name[survey]}"
-    df_graphers.loc[j, "subtitle"] = (
-        f"P10 is the level of {survey_type.text[survey]} per day below which 10% of the population falls."
-    )
-    df_graphers.loc[j, "note"] = (
-        f"This data is adjusted for inflation and for differences in living costs between countries. Depending on the country and year, it relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita)."
-    )
-    df_graphers.loc[j, "type"] = np.nan
-    df_graphers.loc[j, "yAxisMin"] = yAxisMin
-    df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-    df_graphers.loc[j, "hasMapTab"] = np.nan
-    df_graphers.loc[j, "tab"] = np.nan
-    df_graphers.loc[j, "yScaleToggle"] = "true"
-    df_graphers.loc[j, "survey_type"] = survey_type["table_name"][survey]
-    j += 1
 
     # P90 (2011)
-    df_graphers.loc[j, "title"] = (
-        f"P90: The {survey_type.text[survey]} of the richest tenth (2011 prices)"
-    )
-    df_graphers.loc[j, "ySlugs"] = "decile9_thr_ppp2011"
-    df_graphers.loc[j, "Indicator Dropdown"] = "P90 (richest tenth)"
-    df_graphers.loc[j, "International-$ Dropdown"] = "2011 prices"
-    df_graphers.loc[j, "Poverty line Dropdown"] = np.nan
-    df_graphers.loc[j, "Household survey data type Dropdown"] = (
-        f"{survey_type.dropdown_option[survey]}"
+    df_graphers.append(
+        {
+            "title": f"P90: The {survey_type.text[survey]} of the richest tenth (2011 prices)",
+            "ySlugs": "decile9_thr_ppp2011",
+            "Indicator Dropdown": "P90 (richest tenth)",
+            "International-$ Dropdown": "2011 prices",
+            "Poverty line Dropdown": np.nan,
+            "Household survey data type Dropdown": f"{survey_type.dropdown_option[survey]}",
+            "tableSlug": f"{survey_type.table_name[survey]}",
+            "subtitle": f"P90 is the level of {survey_type.text[survey]} per day above which 10% of the population falls.",
+            "note": f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2011 prices to account for inflation and differences in living costs between countries. Depending on the country and year, it relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita).",
+            "type": np.nan,
+            "yAxisMin": yAxisMin,
+            "selectedFacetStrategy": np.nan,
+            "hasMapTab": "true",
+            "tab": "map",
+            "yScaleToggle": "true",
+            "survey_type": survey_type["table_name"][survey],
+        }
     )
-    df_graphers.loc[j, "tableSlug"] = f"{survey_type.table_name[survey]}"
-    df_graphers.loc[j, "subtitle"] = (
-        f"P90 is the level of {survey_type.text[survey]} per day above which 10% of the population falls."
-    )
-    df_graphers.loc[j, "note"] = (
-        f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2011 prices to account for inflation and differences in living costs between countries. Depending on the country and year, it relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita)."
-    )
-    df_graphers.loc[j, "type"] = np.nan
-    df_graphers.loc[j, "yAxisMin"] = yAxisMin
-    df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-    df_graphers.loc[j, "hasMapTab"] = "true"
-    df_graphers.loc[j, "tab"] = "map"
-    df_graphers.loc[j, "yScaleToggle"] = "true"
-    df_graphers.loc[j, "survey_type"] = survey_type["table_name"][survey]
-    j += 1
 
     # P90 (2017)
-    df_graphers.loc[j, "title"] = (
-        f"P90: The {survey_type.text[survey]} of the richest tenth (2017 prices)"
-    )
-    df_graphers.loc[j, "ySlugs"] = "decile9_thr_ppp2017"
-    df_graphers.loc[j, "Indicator Dropdown"] = "P90 (richest tenth)"
-    df_graphers.loc[j, "International-$ Dropdown"] = "2017 prices"
-    df_graphers.loc[j, "Poverty line Dropdown"] = np.nan
-    df_graphers.loc[j, "Household survey data type Dropdown"] = (
-        f"{survey_type.dropdown_option[survey]}"
-    )
-    df_graphers.loc[j, "tableSlug"] = f"{survey_type.table_name[survey]}"
-    df_graphers.loc[j, "subtitle"] = (
-        f"P90 is the level of {survey_type.text[survey]} per day above which 10% of the population falls."
+    df_graphers.append(
+        {
+            "title": f"P90: The {survey_type.text[survey]} of the richest tenth (2017 prices)",
+            "ySlugs": "decile9_thr_ppp2017",
+            "Indicator Dropdown": "P90 (richest tenth)",
+            "International-$ Dropdown": "2017 prices",
+            "Poverty line Dropdown": np.nan,
+            "Household survey data type Dropdown": f"{survey_type.dropdown_option[survey]}",
+            "tableSlug": f"{survey_type.table_name[survey]}",
+            "subtitle": f"P90 is the level of {survey_type.text[survey]} per day above which 10% of the population falls.",
+            "note": f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries. Depending on the country and year, it relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita).",
+            "type": np.nan,
+            "yAxisMin": yAxisMin,
+            "selectedFacetStrategy": np.nan,
+            "hasMapTab": "true",
+            "tab": "map",
+            "yScaleToggle": "true",
+            "survey_type": survey_type["table_name"][survey],
+        }
     )
-    df_graphers.loc[j, "note"] = (
-        f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at 2017 prices to account for inflation and differences in living costs between countries. Depending on the country and year, it relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita)."
-    )
-    df_graphers.loc[j, "type"] = np.nan
-    df_graphers.loc[j, "yAxisMin"] = yAxisMin
-    df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-    df_graphers.loc[j, "hasMapTab"] = "true"
-    df_graphers.loc[j, "tab"] = "map"
-    df_graphers.loc[j, "yScaleToggle"] = "true"
-    df_graphers.loc[j, "survey_type"] = survey_type["table_name"][survey]
-    j += 1
 
     # P90 (2011, 2017)
-    df_graphers.loc[j, "title"] = (
-        f"P90: The {survey_type.text[survey]} of the richest tenth (2011 vs. 2017 prices)"
-    )
-    df_graphers.loc[j, "ySlugs"] = "decile9_thr_ppp2011 decile9_thr_ppp2017"
-    df_graphers.loc[j, "Indicator Dropdown"] = "P90 (richest tenth)"
-    df_graphers.loc[j, "International-$ Dropdown"] = "Compare 2017 and 2011 prices"
-    df_graphers.loc[j, "Poverty line Dropdown"] = np.nan
-    df_graphers.loc[j, "Household survey data type Dropdown"] = (
-        f"{survey_type.dropdown_option[survey]}"
-    )
-    df_graphers.loc[j, "tableSlug"] = f"{survey_type.table_name[survey]}"
-    df_graphers.loc[j, "subtitle"] = (
-        f"P90 is the level of {survey_type.text[survey]} per day above which 10% of the population falls."
-    )
-    df_graphers.loc[j, "note"] = (
-        f"This data is adjusted for inflation and for differences in living costs between countries. Depending on the country and year, it relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita)."
-    )
-    df_graphers.loc[j, "type"] = np.nan
-    df_graphers.loc[j, "yAxisMin"] = yAxisMin
-    df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-    df_graphers.loc[j, "hasMapTab"] = np.nan
-    df_graphers.loc[j, "tab"] = np.nan
-    df_graphers.loc[j, "yScaleToggle"] = "true"
-    df_graphers.loc[j, "survey_type"] = survey_type["table_name"][survey]
-    j += 1
+    df_graphers.append(
+        {
+            "title": f"P90: The {survey_type.text[survey]} of the richest tenth (2011 vs. 2017 prices)",
+            "ySlugs": "decile9_thr_ppp2011 decile9_thr_ppp2017",
+            "Indicator Dropdown": "P90 (richest tenth)",
+            "International-$ Dropdown": "Compare 2017 and 2011 prices",
+            "Poverty line Dropdown": np.nan,
+            "Household survey data type Dropdown": f"{survey_type.dropdown_option[survey]}",
+            "tableSlug": f"{survey_type.table_name[survey]}",
+            "subtitle": f"P90 is the level of {survey_type.text[survey]} per day above which 10% of the population falls.",
+            "note": f"This data is adjusted for inflation and for differences in living costs between countries. Depending on the country and year, it relates to {survey_type.detailed_text[survey]} [per capita](#dod:per-capita).",
+            "type": np.nan,
+            "yAxisMin": yAxisMin,
+            "selectedFacetStrategy": "entity",
+            "hasMapTab": np.nan,
+            "tab": np.nan,
+            "yScaleToggle": "true",
+            "survey_type": survey_type["table_name"][survey],
+        }
+    )
+
+df_graphers = df_graphers.to_frame()
 
 # %% [markdown]
 # Final adjustments to the graphers table:
@@ -1190,29 +1083,7 @@ df_graphers.loc[
 # "Depending on the country and year, the data relates to income measured after taxes and benefits [per capita](#dod:per-capita)."
 # "Depending on the country and year, the data relates to consumption [per capita](#dod:per-capita)."
 
-# When int-$ are not included
-df_graphers["note"] = df_graphers["note"].str.replace(
-    "Depending on the country and year, the data relates to income measured after taxes and benefits [per capita](#dod:per-capita).",
-    "The data relates to income measured after taxes and benefits [per capita](#dod:per-capita).",
-    regex=False,
-)
-df_graphers["note"] = df_graphers["note"].str.replace(
-    "Depending on the country and year, the data relates to consumption [per capita](#dod:per-capita).",
-    "The data relates to consumption [per capita](#dod:per-capita).",
-    regex=False,
-)
-
-# When int-$ are included
-df_graphers["note"] = df_graphers["note"].str.replace(
-    "Depending on the country and year, it relates to income measured after taxes and benefits [per capita](#dod:per-capita).",
-    "It relates to income measured after taxes and benefits [per capita](#dod:per-capita).",
-    regex=False,
-)
-df_graphers["note"] = df_graphers["note"].str.replace(
-    "Depending on the country and year, it relates to consumption [per capita](#dod:per-capita).",
-    "It relates to consumption [per capita](#dod:per-capita).",
-    regex=False,
-)
+df_graphers["note"] = rewrite_texts(df_graphers["note"], NOTE_REWRITES_PIP)
 
 # Reorder dropdown menus
 povline_dropdown_list = [
@@ -1257,33 +1128,20 @@ df_graphers = df_graphers.drop(columns=["povline_dropdown_aux"])
 # Define list of variables to iterate: survey types
 survey_list = list(survey_type["table_name"].unique())
 
-# Header is converted into a tab-separated text
-header_tsv = df_header.to_csv(sep="\t", header=False)
-
-# Auxiliar variable `survey_type` is dropped and graphers table is converted into a tab-separated text
-graphers_tsv = df_graphers.drop(columns=["survey_type"])
-graphers_tsv = graphers_tsv.to_csv(sep="\t", index=False)
-
-# This table is indented, to follow explorers' format
-graphers_tsv_indented = textwrap.indent(graphers_tsv, "\t")
-
 # The dataframes are combined, including tables which are filtered by survey type and variable
 with open(outfile, "w", newline="\n", encoding="utf-8") as f:
-    f.write(header_tsv)
-    f.write("\ngraphers\n" + graphers_tsv_indented)
+    explorer = ExplorerWriter(f)
+    explorer.write_header(df_header)
+    explorer.write_graphers(df_graphers.drop(columns=["survey_type"]))
 
-    for i in survey_list:
-        table_tsv = (
-            df_tables[df_tables["survey_type"] == i].copy().reset_index(drop=True)
-        )
-        table_tsv = table_tsv.drop(columns=["survey_type"])
-        table_tsv = table_tsv.to_csv(sep="\t", index=False)
-        table_tsv_indented = textwrap.indent(table_tsv, "\t")
-        f.write(
-            "\ntable\t"
-            + "https://catalog.ourworldindata.org/explorers/wb/latest/world_bank_pip/"
-            + i
-            + ".csv\t"
-            + i
-        )
-        f.write("\ncolumns\t" + i + "\n" + table_tsv_indented)
+    explorer.write_tables(
+        df_tables,
+        "survey_type",
+        [
+            (
+                i,
+                f"https://catalog.ourworldindata.org/explorers/wb/latest/world_bank_pip/{i}.csv",
+            )
+            for i in survey_list
+        ],
+    )
@@ -2,7 +2,6 @@
 # # Incomes Across the Distribution Explorer of the World Inequality Database
 # This code creates the tsv file for the incomes across the distribution explorer from the WID data, available [here](https://owid.cloud/admin/explorers/preview/wid-keymetrics)
 
-import textwrap
 from pathlib import Path
 
 import numpy as np
@@ -11,6 +10,10 @@ import numpy as np
 import pandas as pd
 
 from ..common_parameters import *
+from ..descriptions import join_paragraphs
+from ..explorer_writer import ExplorerWriter
+from ..sheets import read_sheet
+from ..table_builder import TableBuilder
 
 PARENT_DIR = Path(__file__).parent.parent.parent.parent.absolute()
 outfile = PARENT_DIR / "explorers" / "incomes-across-distribution-wid.explorer.tsv"
@@ -25,34 +28,30 @@ sheet_id = "18T5IGnpyJwb8KL9USYvME6IaLEcYIo26ioHCpkDnwRQ"
 
 # Welfare type sheet
 sheet_name = "welfare"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-welfare = pd.read_csv(url, keep_default_na=False)
+welfare = read_sheet(sheet_id, sheet_name, keep_default_na=False)
 
 # Tables sheet
 sheet_name = "tables"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-tables = pd.read_csv(url, keep_default_na=False)
+tables = read_sheet(sheet_id, sheet_name, keep_default_na=False)
 
 # Deciles9 sheet (needed to handle thresholds data)
 sheet_name = "deciles9"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-deciles9 = pd.read_csv(url, keep_default_na=False)
+deciles9 = read_sheet(sheet_id, sheet_name, keep_default_na=False)
 
 # Deciles10 sheet (needed to handle average and share data)
 sheet_name = "deciles10"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-deciles10 = pd.read_csv(url, keep_default_na=False)
+deciles10 = read_sheet(sheet_id, sheet_name, keep_default_na=False)
 
 # Top sheet (needed to handle data at the top of the distribution)
 sheet_name = "top_pct"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-top_pct = pd.read_csv(url, keep_default_na=False, dtype={"percentage": "str"})
+top_pct = read_sheet(
+    sheet_id, sheet_name, keep_default_na=False, dtype={"percentage": "str"}
+)
 
 # Income aggregation sheet (day, month, year)
 sheet_name = "income_aggregation"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-income_aggregation = pd.read_csv(
-    url, keep_default_na=False, dtype={"multiplier": "str"}
+income_aggregation = read_sheet(
+    sheet_id, sheet_name, keep_default_na=False, dtype={"multiplier": "str"}
 )
 
 # %% [markdown]
@@ -98,28 +97,32 @@ dataPublishedBy = DATA_PUBLISHED_BY_WID
 sourceLink = SOURCE_LINK_WID
 colorScaleNumericMinValue = COLOR_SCALE_NUMERIC_MIN_VALUE
 tolerance = TOLERANCE
-new_line = NEW_LINE
 
 yAxisMin = Y_AXIS_MIN
 
 additional_description = ADDITIONAL_DESCRIPTION_WID
 ppp_description = PPP_DESCRIPTION_WID
 
-df_tables = pd.DataFrame()
-j = 0
+df_tables = TableBuilder()
 
 for tab in range(len(tables)):
     # Define country as entityName
-    df_tables.loc[j, "name"] = "Country"
-    df_tables.loc[j, "slug"] = "country"
-    df_tables.loc[j, "type"] = "EntityName"
-    j += 1
+    df_tables.append(
+        {
+            "name": "Country",
+            "slug": "country",
+            "type": "EntityName",
+        }
+    )
 
     # Define year as Year
-    df_tables.loc[j, "name"] = "Year"
-    df_tables.loc[j, "slug"] = "year"
-    df_tables.loc[j, "type"] = "Year"
-    j += 1
+    df_tables.append(
+        {
+            "name": "Year",
+            "slug": "year",
+            "type": "Year",
+        }
+    )
 
     # Define original variables to not break income aggregations
     for wel in range(len(welfare)):
@@ -130,370 +133,350 @@ for tab in range(len(tables)):
             additional_description = ADDITIONAL_DESCRIPTION_WID
 
         # Mean
-        df_tables.loc[j, "name"] = (
-            f"Mean {welfare['welfare_type'][wel]} {welfare['title'][wel]}"
-        )
-        df_tables.loc[j, "slug"] = f"p0p100_avg_{welfare['slug'][wel]}"
-        df_tables.loc[j, "description"] = new_line.join(
-            [
-                f"Mean {welfare['welfare_type'][wel]}",
-                welfare["description"][wel],
-                ppp_description,
-                additional_description,
-            ]
+        df_tables.append(
+            {
+                "name": f"Mean {welfare['welfare_type'][wel]} {welfare['title'][wel]}",
+                "slug": f"p0p100_avg_{welfare['slug'][wel]}",
+                "description": join_paragraphs(
+                    [
+                        f"Mean {welfare['welfare_type'][wel]}",
+                        welfare["description"][wel],
+                        ppp_description,
+                        additional_description,
+                    ]
+                ),
+                "unit": f"international-$ in {PPP_YEAR_WID} prices",
+                "shortUnit": "$",
+                "type": "Numeric",
+                "colorScaleNumericBins": welfare["scale_mean"][wel],
+                "colorScaleEqualSizeBins": "true",
+                "colorScaleScheme": "BuGn",
+            }
         )
-        df_tables.loc[j, "unit"] = f"international-$ in {PPP_YEAR_WID} prices"
-        df_tables.loc[j, "shortUnit"] = "$"
-        df_tables.loc[j, "type"] = "Numeric"
-        df_tables.loc[j, "colorScaleNumericBins"] = welfare["scale_mean"][wel]
-        df_tables.loc[j, "colorScaleEqualSizeBins"] = "true"
-        df_tables.loc[j, "colorScaleScheme"] = "BuGn"
-        j += 1
 
         # Median
-        df_tables.loc[j, "name"] = (
-            f"Median {welfare['welfare_type'][wel]} {welfare['title'][wel]}"
-        )
-        df_tables.loc[j, "slug"] = f"median_{welfare['slug'][wel]}"
-        df_tables.loc[j, "description"] = new_line.join(
-            [
-                f"The level of {welfare['welfare_type'][wel]} below which half of the population falls.",
-                welfare["description"][wel],
-                ppp_description,
-                additional_description,
-            ]
+        df_tables.append(
+            {
+                "name": f"Median {welfare['welfare_type'][wel]} {welfare['title'][wel]}",
+                "slug": f"median_{welfare['slug'][wel]}",
+                "description": join_paragraphs(
+                    [
+                        f"The level of {welfare['welfare_type'][wel]} below which half of the population falls.",
+                        welfare["description"][wel],
+                        ppp_description,
+                        additional_description,
+                    ]
+                ),
+                "unit": f"international-$ in {PPP_YEAR_WID} prices",
+                "shortUnit": "$",
+                "type": "Numeric",
+                # "colorScaleNumericBins": welfare['scale_median'][wel],
+                "colorScaleEqualSizeBins": "true",
+                "colorScaleScheme": "Blues",
+            }
         )
-        df_tables.loc[j, "unit"] = f"international-$ in {PPP_YEAR_WID} prices"
-        df_tables.loc[j, "shortUnit"] = "$"
-        df_tables.loc[j, "type"] = "Numeric"
-        # df_tables.loc[j, "colorScaleNumericBins"] = welfare["scale_median"][wel]
-        df_tables.loc[j, "colorScaleEqualSizeBins"] = "true"
-        df_tables.loc[j, "colorScaleScheme"] = "Blues"
-        j += 1
 
         # Thresholds - Deciles
         for dec9 in range(len(deciles9)):
-            df_tables.loc[j, "name"] = (
-                f"{deciles9['ordinal'][dec9].capitalize()} {welfare['title'][wel]}"
-            )
-            df_tables.loc[j, "slug"] = (
-                f"{deciles9['wid_notation'][dec9]}_thr_{welfare['slug'][wel]}"
-            )
-            df_tables.loc[j, "description"] = new_line.join(
-                [
-                    f"The level of {welfare['welfare_type'][wel]} below which {deciles9['decile'][dec9]}0% of the population falls.",
-                    welfare["description"][wel],
-                    ppp_description,
-                    additional_description,
-                ]
+            df_tables.append(
+                {
+                    "name": f"{deciles9['ordinal'][dec9].capitalize()} {welfare['title'][wel]}",
+                    "slug": f"{deciles9['wid_notation'][dec9]}_thr_{welfare['slug'][wel]}",
+                    "description": join_paragraphs(
+                        [
+                            f"The level of {welfare['welfare_type'][wel]} below which {deciles9['decile'][dec9]}0% of the population falls.",
+                            welfare["description"][wel],
+                            ppp_description,
+                            additional_description,
+                        ]
+                    ),
+                    "unit": f"international-$ in {PPP_YEAR_WID} prices",
+                    "shortUnit": "$",
+                    "type": "Numeric",
+                    # "colorScaleNumericBins": deciles9['scale_thr'][dec9],
+                    "colorScaleEqualSizeBins": "true",
+                    "colorScaleScheme": "Purples",
+                }
             )
-            df_tables.loc[j, "unit"] = f"international-$ in {PPP_YEAR_WID} prices"
-            df_tables.loc[j, "shortUnit"] = "$"
-            df_tables.loc[j, "type"] = "Numeric"
-            # df_tables.loc[j, "colorScaleNumericBins"] = deciles9["scale_thr"][dec9]
-            df_tables.loc[j, "colorScaleEqualSizeBins"] = "true"
-            df_tables.loc[j, "colorScaleScheme"] = "Purples"
-            j += 1
 
         # Averages - Deciles
         for dec10 in range(len(deciles10)):
-            df_tables.loc[j, "name"] = (
-                f"{deciles10['ordinal'][dec10].capitalize()} {welfare['title'][wel]}"
+            df_tables.append(
+                {
+                    "name": f"{deciles10['ordinal'][dec10].capitalize()} {welfare['title'][wel]}",
+                    "slug": f"{deciles10['wid_notation'][dec10]}_avg_{welfare['slug'][wel]}",
+                    "description": join_paragraphs(
+                        [
+                            f"The mean {welfare['welfare_type'][wel]} within the {deciles10['ordinal'][dec10]} (tenth of the population).",
+                            welfare["description"][wel],
+                            ppp_description,
+                            additional_description,
+                        ]
+                    ),
+                    "unit": f"international-$ in {PPP_YEAR_WID} prices",
+                    "shortUnit": "$",
+                    "type": "Numeric",
+                    # "colorScaleNumericBins": deciles10['scale_avg'][dec10],
+                    "colorScaleEqualSizeBins": "true",
+                    "colorScaleScheme": "Greens",
+                }
             )
-            df_tables.loc[j, "slug"] = (
-                f"{deciles10['wid_notation'][dec10]}_avg_{welfare['slug'][wel]}"
-            )
-            df_tables.loc[j, "description"] = new_line.join(
-                [
-                    f"The mean {welfare['welfare_type'][wel]} within the {deciles10['ordinal'][dec10]} (tenth of the population).",
-                    welfare["description"][wel],
-                    ppp_description,
-                    additional_description,
-                ]
-            )
-            df_tables.loc[j, "unit"] = f"international-$ in {PPP_YEAR_WID} prices"
-            df_tables.loc[j, "shortUnit"] = "$"
-            df_tables.loc[j, "type"] = "Numeric"
-            # df_tables.loc[j, "colorScaleNumericBins"] = deciles10["scale_avg"][dec10]
-            df_tables.loc[j, "colorScaleEqualSizeBins"] = "true"
-            df_tables.loc[j, "colorScaleScheme"] = "Greens"
-            j += 1
 
         # Shares - Deciles
         for dec10 in range(len(deciles10)):
-            df_tables.loc[j, "name"] = (
-                f"{deciles10['ordinal'][dec10].capitalize()} {welfare['title'][wel]}"
-            )
-            df_tables.loc[j, "slug"] = (
-                f"{deciles10['wid_notation'][dec10]}_share_{welfare['slug'][wel]}"
+            df_tables.append(
+                {
+                    "name": f"{deciles10['ordinal'][dec10].capitalize()} {welfare['title'][wel]}",
+                    "slug": f"{deciles10['wid_notation'][dec10]}_share_{welfare['slug'][wel]}",
+                    "description": join_paragraphs(
+                        [
+                            f"The share of {welfare['welfare_type'][wel]} received by the {deciles10['ordinal'][dec10]} (tenth of the population).",
+                            welfare["description"][wel],
+                            additional_description,
+                        ]
+                    ),
+                    "unit": "%",
+                    "shortUnit": "%",
+                    "type": "Numeric",
+                    "colorScaleNumericBins": deciles10[
+                        f"scale_share_{welfare['slug'][wel]}"
+                    ][dec10],
+                    "colorScaleNumericMinValue": 100,
+                    "colorScaleEqualSizeBins": "true",
+                    "colorScaleScheme": "OrRd",
+                }
             )
-            df_tables.loc[j, "description"] = new_line.join(
-                [
-                    f"The share of {welfare['welfare_type'][wel]} received by the {deciles10['ordinal'][dec10]} (tenth of the population).",
-                    welfare["description"][wel],
-                    additional_description,
-                ]
-            )
-            df_tables.loc[j, "unit"] = "%"
-            df_tables.loc[j, "shortUnit"] = "%"
-            df_tables.loc[j, "type"] = "Numeric"
-            df_tables.loc[j, "colorScaleNumericBins"] = deciles10[
-                f"scale_share_{welfare['slug'][wel]}"
-            ][dec10]
-            df_tables.loc[j, "colorScaleNumericMinValue"] = 100
-            df_tables.loc[j, "colorScaleEqualSizeBins"] = "true"
-            df_tables.loc[j, "colorScaleScheme"] = "OrRd"
-            j += 1
 
         # Thresholds - Top percentiles
         for top in range(len(top_pct)):
-            df_tables.loc[j, "name"] = (
-                f"{top_pct['name'][top].capitalize()} {welfare['title'][wel]}"
-            )
-            df_tables.loc[j, "slug"] = (
-                f"{top_pct['wid_notation'][top]}_thr_{welfare['slug'][wel]}"
+            df_tables.append(
+                {
+                    "name": f"{top_pct['name'][top].capitalize()} {welfare['title'][wel]}",
+                    "slug": f"{top_pct['wid_notation'][top]}_thr_{welfare['slug'][wel]}",
+                    "description": join_paragraphs(
+                        [
+                            f"The level of {welfare['welfare_type'][wel]} marking the richest {top_pct['percentage'][top]}",
+                            welfare["description"][wel],
+                            ppp_description,
+                            additional_description,
+                        ]
+                    ),
+                    "unit": f"international-$ in {PPP_YEAR_WID} prices",
+                    "shortUnit": "$",
+                    "type": "Numeric",
+                    # "colorScaleNumericBins": top_pct['scale_thr'][top],
+                    "colorScaleEqualSizeBins": "true",
+                    "colorScaleScheme": "Purples",
+                }
             )
-            df_tables.loc[j, "description"] = new_line.join(
-                [
-                    f"The level of {welfare['welfare_type'][wel]} marking the richest {top_pct['percentage'][top]}",
-                    welfare["description"][wel],
-                    ppp_description,
-                    additional_description,
-                ]
-            )
-            df_tables.loc[j, "unit"] = f"international-$ in {PPP_YEAR_WID} prices"
-            df_tables.loc[j, "shortUnit"] = "$"
-            df_tables.loc[j, "type"] = "Numeric"
-            # df_tables.loc[j, "colorScaleNumericBins"] = top_pct["scale_thr"][top]
-            df_tables.loc[j, "colorScaleEqualSizeBins"] = "true"
-            df_tables.loc[j, "colorScaleScheme"] = "Purples"
-            j += 1
 
         # Averages - Top percentiles
         for top in range(len(top_pct)):
-            df_tables.loc[j, "name"] = (
-                f"{top_pct['name'][top].capitalize()} {welfare['title'][wel]}"
-            )
-            df_tables.loc[j, "slug"] = (
-                f"{top_pct['wid_notation'][top]}_avg_{welfare['slug'][wel]}"
-            )
-            df_tables.loc[j, "description"] = new_line.join(
-                [
-                    f"The mean {welfare['welfare_type'][wel]} within the richest {top_pct['percentage'][top]}.",
-                    welfare["description"][wel],
-                    ppp_description,
-                    additional_description,
-                ]
+            df_tables.append(
+                {
+                    "name": f"{top_pct['name'][top].capitalize()} {welfare['title'][wel]}",
+                    "slug": f"{top_pct['wid_notation'][top]}_avg_{welfare['slug'][wel]}",
+                    "description": join_paragraphs(
+                        [
+                            f"The mean {welfare['welfare_type'][wel]} within the richest {top_pct['percentage'][top]}.",
+                            welfare["description"][wel],
+                            ppp_description,
+                            additional_description,
+                        ]
+                    ),
+                    "unit": f"international-$ in {PPP_YEAR_WID} prices",
+                    "shortUnit": "$",
+                    "type": "Numeric",
+                    # "colorScaleNumericBins": top_pct['scale_avg'][top],
+                    "colorScaleEqualSizeBins": "true",
+                    "colorScaleScheme": "Greens",
+                }
             )
-            df_tables.loc[j, "unit"] = f"international-$ in {PPP_YEAR_WID} prices"
-            df_tables.loc[j, "shortUnit"] = "$"
-            df_tables.loc[j, "type"] = "Numeric"
-            # df_tables.loc[j, "colorScaleNumericBins"] = top_pct["scale_avg"][top]
-            df_tables.loc[j, "colorScaleEqualSizeBins"] = "true"
-            df_tables.loc[j, "colorScaleScheme"] = "Greens"
-            j += 1
 
         # Shares - Top percentiles
         for top in range(len(top_pct)):
-            df_tables.loc[j, "name"] = (
-                f"{top_pct['name'][top].capitalize()} {welfare['title'][wel]}"
-            )
-            df_tables.loc[j, "slug"] = (
-                f"{top_pct['wid_notation'][top]}_share_{welfare['slug'][wel]}"
-            )
-            df_tables.loc[j, "description"] = new_line.join(
-                [
-                    f"The share of {welfare['welfare_type'][wel]} received by the richest {top_pct['percentage'][top]} of the population.",
-                    welfare["description"][wel],
-                    additional_description,
-                ]
+            df_tables.append(
+                {
+                    "name": f"{top_pct['name'][top].capitalize()} {welfare['title'][wel]}",
+                    "slug": f"{top_pct['wid_notation'][top]}_share_{welfare['slug'][wel]}",
+                    "description": join_paragraphs(
+                        [
+                            f"The share of {welfare['welfare_type'][wel]} received by the richest {top_pct['percentage'][top]} of the population.",
+                            welfare["description"][wel],
+                            additional_description,
+                        ]
+                    ),
+                    "unit": "%",
+                    "shortUnit": "%",
+                    "type": "Numeric",
+                    "colorScaleNumericBins": top_pct[
+                        f"scale_share_{welfare['slug'][wel]}"
+                    ][top],
+                    "colorScaleEqualSizeBins": "true",
+                    "colorScaleScheme": "OrRd",
+                }
             )
-            df_tables.loc[j, "unit"] = "%"
-            df_tables.loc[j, "shortUnit"] = "%"
-            df_tables.loc[j, "type"] = "Numeric"
-            df_tables.loc[j, "colorScaleNumericBins"] = top_pct[
-                f"scale_share_{welfare['slug'][wel]}"
-            ][top]
-            df_tables.loc[j, "colorScaleEqualSizeBins"] = "true"
-            df_tables.loc[j, "colorScaleScheme"] = "OrRd"
-            j += 1
 
         # Income aggregations
         for agg in range(len(income_aggregation)):
             # Mean
-            df_tables.loc[j, "name"] = (
-                f"Mean {welfare['welfare_type'][wel]} {welfare['title'][wel]}"
+            df_tables.append(
+                {
+                    "name": f"Mean {welfare['welfare_type'][wel]} {welfare['title'][wel]}",
+                    "slug": f"p0p100_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]}",
+                    "description": join_paragraphs(
+                        [
+                            f"Mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]}.",
+                            welfare["description"][wel],
+                            ppp_description,
+                            additional_description,
+                        ]
+                    ),
+                    "unit": f"international-$ in {PPP_YEAR_WID} prices",
+                    "shortUnit": "$",
+                    "type": "Numeric",
+                    "colorScaleNumericBins": income_aggregation[
+                        f"scale_{welfare['slug'][wel]}"
+                    ][agg],
+                    "colorScaleEqualSizeBins": "true",
+                    "colorScaleScheme": "BuGn",
+                    "transform": f"multiplyBy p0p100_avg_{welfare['slug'][wel]} {income_aggregation['multiplier'][agg]}",
+                }
             )
-            df_tables.loc[j, "slug"] = (
-                f"p0p100_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]}"
-            )
-            df_tables.loc[j, "description"] = new_line.join(
-                [
-                    f"Mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]}.",
-                    welfare["description"][wel],
-                    ppp_description,
-                    additional_description,
-                ]
-            )
-            df_tables.loc[j, "unit"] = f"international-$ in {PPP_YEAR_WID} prices"
-            df_tables.loc[j, "shortUnit"] = "$"
-            df_tables.loc[j, "type"] = "Numeric"
-            df_tables.loc[j, "colorScaleNumericBins"] = income_aggregation[
-                f"scale_{welfare['slug'][wel]}"
-            ][agg]
-            df_tables.loc[j, "colorScaleEqualSizeBins"] = "true"
-            df_tables.loc[j, "colorScaleScheme"] = "BuGn"
-            df_tables.loc[j, "transform"] = (
-                f"multiplyBy p0p100_avg_{welfare['slug'][wel]} {income_aggregation['multiplier'][agg]}"
-            )
-            j += 1
 
             # Median
-            df_tables.loc[j, "name"] = (
-                f"Median {welfare['welfare_type'][wel]} {welfare['title'][wel]}"
-            )
-            df_tables.loc[j, "slug"] = (
-                f"median_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]}"
-            )
-            df_tables.loc[j, "description"] = new_line.join(
-                [
-                    f"The level of {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} below which hald of the population falls.",
-                    welfare["description"][wel],
-                    ppp_description,
-                    additional_description,
-                ]
+            df_tables.append(
+                {
+                    "name": f"Median {welfare['welfare_type'][wel]} {welfare['title'][wel]}",
+                    "slug": f"median_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]}",
+                    "description": join_paragraphs(
+                        [
+                            f"The level of {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} below which hald of the population falls.",
+                            welfare["description"][wel],
+                            ppp_description,
+                            additional_description,
+                        ]
+                    ),
+                    "unit": f"international-$ in {PPP_YEAR_WID} prices",
+                    "shortUnit": "$",
+                    "type": "Numeric",
+                    "colorScaleNumericBins": income_aggregation[
+                        f"scale_{welfare['slug'][wel]}"
+                    ][agg],
+                    "colorScaleEqualSizeBins": "true",
+                    "colorScaleScheme": "Blues",
+                    "transform": f"multiplyBy median_{welfare['slug'][wel]} {income_aggregation['multiplier'][agg]}",
+                }
             )
-            df_tables.loc[j, "unit"] = f"international-$ in {PPP_YEAR_WID} prices"
-            df_tables.loc[j, "shortUnit"] = "$"
-            df_tables.loc[j, "type"] = "Numeric"
-            df_tables.loc[j, "colorScaleNumericBins"] = income_aggregation[
-                f"scale_{welfare['slug'][wel]}"
-            ][agg]
-            df_tables.loc[j, "colorScaleEqualSizeBins"] = "true"
-            df_tables.loc[j, "colorScaleScheme"] = "Blues"
-            df_tables.loc[j, "transform"] = (
-                f"multiplyBy median_{welfare['slug'][wel]} {income_aggregation['multiplier'][agg]}"
-            )
-            j += 1
 
             # Thresholds - Deciles
             for dec9 in range(len(deciles9)):
-                df_tables.loc[j, "name"] = (
-                    f"{deciles9['ordinal'][dec9].capitalize()} {welfare['title'][wel]}"
-                )
-                df_tables.loc[j, "slug"] = (
-                    f"{deciles9['wid_notation'][dec9]}_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]}"
-                )
-                df_tables.loc[j, "description"] = new_line.join(
-                    [
-                        f"The level of {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} below which {deciles9['decile'][dec9]}0% of the population falls.",
-                        welfare["description"][wel],
-                        ppp_description,
-                        additional_description,
-                    ]
+                df_tables.append(
+                    {
+                        "name": f"{deciles9['ordinal'][dec9].capitalize()} {welfare['title'][wel]}",
+                        "slug": f"{deciles9['wid_notation'][dec9]}_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]}",
+                        "description": join_paragraphs(
+                            [
+                                f"The level of {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} below which {deciles9['decile'][dec9]}0% of the population falls.",
+                                welfare["description"][wel],
+                                ppp_description,
+                                additional_description,
+                            ]
+                        ),
+                        "unit": f"international-$ in {PPP_YEAR_WID} prices",
+                        "shortUnit": "$",
+                        "type": "Numeric",
+                        "colorScaleNumericBins": deciles9[
+                            f"scale_thr_{welfare['slug'][wel]}_{income_aggregation['aggregation'][agg]}"
+                        ][dec9],
+                        "colorScaleEqualSizeBins": "true",
+                        "colorScaleScheme": "Purples",
+                        "transform": f"multiplyBy {deciles9['wid_notation'][dec9]}_thr_{welfare['slug'][wel]} {income_aggregation['multiplier'][agg]}",
+                    }
                 )
-                df_tables.loc[j, "unit"] = f"international-$ in {PPP_YEAR_WID} prices"
-                df_tables.loc[j, "shortUnit"] = "$"
-                df_tables.loc[j, "type"] = "Numeric"
-                df_tables.loc[j, "colorScaleNumericBins"] = deciles9[
-                    f"scale_thr_{welfare['slug'][wel]}_{income_aggregation['aggregation'][agg]}"
-                ][dec9]
-                df_tables.loc[j, "colorScaleEqualSizeBins"] = "true"
-                df_tables.loc[j, "colorScaleScheme"] = "Purples"
-                df_tables.loc[j, "transform"] = (
-                    f"multiplyBy {deciles9['wid_notation'][dec9]}_thr_{welfare['slug'][wel]} {income_aggregation['multiplier'][agg]}"
-                )
-                j += 1
 
             # Averages - Deciles
             for dec10 in range(len(deciles10)):
-                df_tables.loc[j, "name"] = (
-                    f"{deciles10['ordinal'][dec10].capitalize()} {welfare['title'][wel]}"
-                )
-                df_tables.loc[j, "slug"] = (
-                    f"{deciles10['wid_notation'][dec10]}_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]}"
+                df_tables.append(
+                    {
+                        "name": f"{deciles10['ordinal'][dec10].capitalize()} {welfare['title'][wel]}",
+                        "slug": f"{deciles10['wid_notation'][dec10]}_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]}",
+                        "description": join_paragraphs(
+                            [
+                                f"The mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} within the {deciles10['ordinal'][dec10]} (tenth of the population).",
+                                welfare["description"][wel],
+                                ppp_description,
+                                additional_description,
+                            ]
+                        ),
+                        "unit": f"international-$ in {PPP_YEAR_WID} prices",
+                        "shortUnit": "$",
+                        "type": "Numeric",
+                        "colorScaleNumericBins": deciles10[
+                            f"scale_avg_{welfare['slug'][wel]}_{income_aggregation['aggregation'][agg]}"
+                        ][dec10],
+                        "colorScaleEqualSizeBins": "true",
+                        "colorScaleScheme": "Greens",
+                        "transform": f"multiplyBy {deciles10['wid_notation'][dec10]}_avg_{welfare['slug'][wel]} {income_aggregation['multiplier'][agg]}",
+                    }
                 )
-                df_tables.loc[j, "description"] = new_line.join(
-                    [
-                        f"The mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} within the {deciles10['ordinal'][dec10]} (tenth of the population).",
-                        welfare["description"][wel],
-                        ppp_description,
-                        additional_description,
-                    ]
-                )
-                df_tables.loc[j, "unit"] = f"international-$ in {PPP_YEAR_WID} prices"
-                df_tables.loc[j, "shortUnit"] = "$"
-                df_tables.loc[j, "type"] = "Numeric"
-                df_tables.loc[j, "colorScaleNumericBins"] = deciles10[
-                    f"scale_avg_{welfare['slug'][wel]}_{income_aggregation['aggregation'][agg]}"
-                ][dec10]
-                df_tables.loc[j, "colorScaleEqualSizeBins"] = "true"
-                df_tables.loc[j, "colorScaleScheme"] = "Greens"
-                df_tables.loc[j, "transform"] = (
-                    f"multiplyBy {deciles10['wid_notation'][dec10]}_avg_{welfare['slug'][wel]} {income_aggregation['multiplier'][agg]}"
-                )
-                j += 1
 
             # Thresholds - Top percentiles
             for top in range(len(top_pct)):
-                df_tables.loc[j, "name"] = (
-                    f"{top_pct['name'][top].capitalize()} {welfare['title'][wel]}"
-                )
-                df_tables.loc[j, "slug"] = (
-                    f"{top_pct['wid_notation'][top]}_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]}"
-                )
-                df_tables.loc[j, "description"] = new_line.join(
-                    [
-                        f"The level of {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} marking the richest {top_pct['percentage'][top]}",
-                        welfare["description"][wel],
-                        ppp_description,
-                        additional_description,
-                    ]
-                )
-                df_tables.loc[j, "unit"] = f"international-$ in {PPP_YEAR_WID} prices"
-                df_tables.loc[j, "shortUnit"] = "$"
-                df_tables.loc[j, "type"] = "Numeric"
-                df_tables.loc[j, "colorScaleNumericBins"] = top_pct[
-                    f"scale_thr_{welfare['slug'][wel]}_{income_aggregation['aggregation'][agg]}"
-                ][top]
-                df_tables.loc[j, "colorScaleEqualSizeBins"] = "true"
-                df_tables.loc[j, "colorScaleScheme"] = "Purples"
-                df_tables.loc[j, "transform"] = (
-                    f"multiplyBy {top_pct['wid_notation'][top]}_thr_{welfare['slug'][wel]} {income_aggregation['multiplier'][agg]}"
+                df_tables.append(
+                    {
+                        "name": f"{top_pct['name'][top].capitalize()} {welfare['title'][wel]}",
+                        "slug": f"{top_pct['wid_notation'][top]}_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]}",
+                        "description": join_paragraphs(
+                            [
+                                f"The level of {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} marking the richest {top_pct['percentage'][top]}",
+                                welfare["description"][wel],
+                                ppp_description,
+                                additional_description,
+                            ]
+                        ),
+                        "unit": f"international-$ in {PPP_YEAR_WID} prices",
+                        "shortUnit": "$",
+                        "type": "Numeric",
+                        "colorScaleNumericBins": top_pct[
+                            f"scale_thr_{welfare['slug'][wel]}_{income_aggregation['aggregation'][agg]}"
+                        ][top],
+                        "colorScaleEqualSizeBins": "true",
+                        "colorScaleScheme": "Purples",
+                        "transform": f"multiplyBy {top_pct['wid_notation'][top]}_thr_{welfare['slug'][wel]} {income_aggregation['multiplier'][agg]}",
+                    }
                 )
-                j += 1
 
             # Averages - Top percentiles
             for top in range(len(top_pct)):
-                df_tables.loc[j, "name"] = (
-                    f"{top_pct['name'][top].capitalize()} {welfare['title'][wel]}"
+                df_tables.append(
+                    {
+                        "name": f"{top_pct['name'][top].capitalize()} {welfare['title'][wel]}",
+                        "slug": f"{top_pct['wid_notation'][top]}_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]}",
+                        "description": join_paragraphs(
+                            [
+                                f"The mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} within the richest {top_pct['percentage'][top]}.",
+                                welfare["description"][wel],
+                                ppp_description,
+                                additional_description,
+                            ]
+                        ),
+                        "unit": f"international-$ in {PPP_YEAR_WID} prices",
+                        "shortUnit": "$",
+                        "type": "Numeric",
+                        "colorScaleNumericBins": top_pct[
+                            f"scale_avg_{welfare['slug'][wel]}_{income_aggregation['aggregation'][agg]}"
+                        ][top],
+                        "colorScaleEqualSizeBins": "true",
+                        "colorScaleScheme": "Greens",
+                        "transform": f"multiplyBy {top_pct['wid_notation'][top]}_avg_{welfare['slug'][wel]} {income_aggregation['multiplier'][agg]}",
+                    }
                 )
-                df_tables.loc[j, "slug"] = (
-                    f"{top_pct['wid_notation'][top]}_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]}"
-                )
-                df_tables.loc[j, "description"] = new_line.join(
-                    [
-                        f"The mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} within the richest {top_pct['percentage'][top]}.",
-                        welfare["description"][wel],
-                        ppp_description,
-                        additional_description,
-                    ]
-                )
-                df_tables.loc[j, "unit"] = f"international-$ in {PPP_YEAR_WID} prices"
-                df_tables.loc[j, "shortUnit"] = "$"
-                df_tables.loc[j, "type"] = "Numeric"
-                df_tables.loc[j, "colorScaleNumericBins"] = top_pct[
-                    f"scale_avg_{welfare['slug'][wel]}_{income_aggregation['aggregation'][agg]}"
-                ][top]
-                df_tables.loc[j, "colorScaleEqualSizeBins"] = "true"
-                df_tables.loc[j, "colorScaleScheme"] = "Greens"
-                df_tables.loc[j, "transform"] = (
-                    f"multiplyBy {top_pct['wid_notation'][top]}_avg_{welfare['slug'][wel]} {income_aggregation['multiplier'][agg]}"
-                )
-                j += 1
 
     df_tables["tableSlug"] = tables["name"][tab]
 
+df_tables = df_tables.to_frame()
+
 df_tables.loc[
     df_tables["colorScaleNumericMinValue"].isnull(), "colorScaleNumericMinValue"
 ] = colorScaleNumericMinValue
@@ -518,599 +501,426 @@ df_tables["colorScaleNumericMinValue"] = df_tables["colorScaleNumericMinValue"].
 # %%
 # Grapher table generation
 
-df_graphers = pd.DataFrame()
+df_graphers = TableBuilder()
 
-j = 0
 
 for tab in range(len(tables)):
     for agg in range(len(income_aggregation)):
         for wel in range(len(welfare)):
             # Mean
-            df_graphers.loc[j, "title"] = (
-                f"Mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} {welfare['title'][wel].capitalize()}"
-            )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"p0p100_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]}"
+            df_graphers.append(
+                {
+                    "title": f"Mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} {welfare['title'][wel].capitalize()}",
+                    "ySlugs": f"p0p100_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]}",
+                    "Indicator Dropdown": "Mean income",
+                    "Decile/quantile Dropdown": np.nan,
+                    "Income measure Dropdown": f"{welfare['dropdown_option'][wel]}",
+                    "Period Radio": f"{income_aggregation['aggregation'][agg].capitalize()}",
+                    "subtitle": f"This data is adjusted for inflation and for differences in the cost of living between countries. {welfare['subtitle'][wel]}",
+                    "note": f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at {PPP_YEAR_WID} prices. {welfare['note'][wel]}",
+                    "selectedFacetStrategy": np.nan,
+                    "hasMapTab": "true",
+                    "tab": "map",
+                    "yScaleToggle": "true",
+                }
             )
-            df_graphers.loc[j, "Indicator Dropdown"] = "Mean income"
-            df_graphers.loc[j, "Decile/quantile Dropdown"] = np.nan
-            df_graphers.loc[j, "Income measure Dropdown"] = (
-                f"{welfare['dropdown_option'][wel]}"
-            )
-            df_graphers.loc[j, "Period Radio"] = (
-                f"{income_aggregation['aggregation'][agg].capitalize()}"
-            )
-            df_graphers.loc[j, "subtitle"] = (
-                f"This data is adjusted for inflation and for differences in the cost of living between countries. {welfare['subtitle'][wel]}"
-            )
-            df_graphers.loc[j, "note"] = (
-                f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at {PPP_YEAR_WID} prices. {welfare['note'][wel]}"
-            )
-            df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-            df_graphers.loc[j, "hasMapTab"] = "true"
-            df_graphers.loc[j, "tab"] = "map"
-            df_graphers.loc[j, "yScaleToggle"] = "true"
-            j += 1
 
             # Median
-            df_graphers.loc[j, "title"] = (
-                f"Median {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} {welfare['title'][wel].capitalize()}"
-            )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"median_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]}"
+            df_graphers.append(
+                {
+                    "title": f"Median {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} {welfare['title'][wel].capitalize()}",
+                    "ySlugs": f"median_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]}",
+                    "Indicator Dropdown": "Median income",
+                    "Decile/quantile Dropdown": np.nan,
+                    "Income measure Dropdown": f"{welfare['dropdown_option'][wel]}",
+                    "Period Radio": f"{income_aggregation['aggregation'][agg].capitalize()}",
+                    "subtitle": f"This data is adjusted for inflation and for differences in the cost of living between countries. {welfare['subtitle'][wel]}",
+                    "note": f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at {PPP_YEAR_WID} prices. {welfare['note'][wel]}",
+                    "selectedFacetStrategy": np.nan,
+                    "hasMapTab": "true",
+                    "tab": "map",
+                    "yScaleToggle": "true",
+                }
             )
-            df_graphers.loc[j, "Indicator Dropdown"] = "Median income"
-            df_graphers.loc[j, "Decile/quantile Dropdown"] = np.nan
-            df_graphers.loc[j, "Income measure Dropdown"] = (
-                f"{welfare['dropdown_option'][wel]}"
-            )
-            df_graphers.loc[j, "Period Radio"] = (
-                f"{income_aggregation['aggregation'][agg].capitalize()}"
-            )
-            df_graphers.loc[j, "subtitle"] = (
-                f"This data is adjusted for inflation and for differences in the cost of living between countries. {welfare['subtitle'][wel]}"
-            )
-            df_graphers.loc[j, "note"] = (
-                f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at {PPP_YEAR_WID} prices. {welfare['note'][wel]}"
-            )
-            df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-            df_graphers.loc[j, "hasMapTab"] = "true"
-            df_graphers.loc[j, "tab"] = "map"
-            df_graphers.loc[j, "yScaleToggle"] = "true"
-            j += 1
 
             # Thresholds - Deciles
             for dec9 in range(len(deciles9)):
-                df_graphers.loc[j, "title"] = (
-                    f"Threshold {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} marking the {deciles9['ordinal'][dec9]} {welfare['title'][wel].capitalize()}"
-                )
-                df_graphers.loc[j, "ySlugs"] = (
-                    f"{deciles9['wid_notation'][dec9]}_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]}"
-                )
-                df_graphers.loc[j, "Indicator Dropdown"] = "Decile thresholds"
-                df_graphers.loc[j, "Decile/quantile Dropdown"] = deciles9["dropdown"][
-                    dec9
-                ]
-                df_graphers.loc[j, "Income measure Dropdown"] = (
-                    f"{welfare['dropdown_option'][wel]}"
-                )
-                df_graphers.loc[j, "Period Radio"] = (
-                    f"{income_aggregation['aggregation'][agg].capitalize()}"
-                )
-                df_graphers.loc[j, "subtitle"] = (
-                    f"The level of {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} below which {deciles9['decile'][dec9]}0% of the population falls. {welfare['subtitle'][wel]}"
-                )
-                df_graphers.loc[j, "note"] = (
-                    f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at {PPP_YEAR_WID} prices to account for inflation and differences in the cost of living between countries. {welfare['note'][wel]}"
+                df_graphers.append(
+                    {
+                        "title": f"Threshold {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} marking the {deciles9['ordinal'][dec9]} {welfare['title'][wel].capitalize()}",
+                        "ySlugs": f"{deciles9['wid_notation'][dec9]}_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]}",
+                        "Indicator Dropdown": "Decile thresholds",
+                        "Decile/quantile Dropdown": deciles9["dropdown"][dec9],
+                        "Income measure Dropdown": f"{welfare['dropdown_option'][wel]}",
+                        "Period Radio": f"{income_aggregation['aggregation'][agg].capitalize()}",
+                        "subtitle": f"The level of {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} below which {deciles9['decile'][dec9]}0% of the population falls. {welfare['subtitle'][wel]}",
+                        "note": f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at {PPP_YEAR_WID} prices to account for inflation and differences in the cost of living between countries. {welfare['note'][wel]}",
+                        "selectedFacetStrategy": np.nan,
+                        "hasMapTab": "true",
+                        "tab": "map",
+                        "yScaleToggle": "true",
+                    }
                 )
-                df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-                df_graphers.loc[j, "hasMapTab"] = "true"
-                df_graphers.loc[j, "tab"] = "map"
-                df_graphers.loc[j, "yScaleToggle"] = "true"
-                j += 1
 
             # Averages - Deciles
             for dec10 in range(len(deciles10)):
-                df_graphers.loc[j, "title"] = (
-                    f"Mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} within the {deciles10['ordinal'][dec10]} {welfare['title'][wel].capitalize()}"
+                df_graphers.append(
+                    {
+                        "title": f"Mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} within the {deciles10['ordinal'][dec10]} {welfare['title'][wel].capitalize()}",
+                        "ySlugs": f"{deciles10['wid_notation'][dec10]}_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]}",
+                        "Indicator Dropdown": "Mean income, by decile",
+                        "Decile/quantile Dropdown": deciles10["dropdown"][dec10],
+                        "Income measure Dropdown": f"{welfare['dropdown_option'][wel]}",
+                        "Period Radio": f"{income_aggregation['aggregation'][agg].capitalize()}",
+                        "subtitle": f"The mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} within the {deciles10['ordinal'][dec10]} (tenth of the population). {welfare['subtitle'][wel]}",
+                        "note": f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at {PPP_YEAR_WID} prices to account for inflation and differences in the cost of living between countries. {welfare['note'][wel]}",
+                        "selectedFacetStrategy": np.nan,
+                        "hasMapTab": "true",
+                        "tab": "map",
+                        "yScaleToggle": "true",
+                    }
                 )
-                df_graphers.loc[j, "ySlugs"] = (
-                    f"{deciles10['wid_notation'][dec10]}_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]}"
-                )
-                df_graphers.loc[j, "Indicator Dropdown"] = "Mean income, by decile"
-                df_graphers.loc[j, "Decile/quantile Dropdown"] = deciles10["dropdown"][
-                    dec10
-                ]
-                df_graphers.loc[j, "Income measure Dropdown"] = (
-                    f"{welfare['dropdown_option'][wel]}"
-                )
-                df_graphers.loc[j, "Period Radio"] = (
-                    f"{income_aggregation['aggregation'][agg].capitalize()}"
-                )
-                df_graphers.loc[j, "subtitle"] = (
-                    f"The mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} within the {deciles10['ordinal'][dec10]} (tenth of the population). {welfare['subtitle'][wel]}"
-                )
-                df_graphers.loc[j, "note"] = (
-                    f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at {PPP_YEAR_WID} prices to account for inflation and differences in the cost of living between countries. {welfare['note'][wel]}"
-                )
-                df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-                df_graphers.loc[j, "hasMapTab"] = "true"
-                df_graphers.loc[j, "tab"] = "map"
-                df_graphers.loc[j, "yScaleToggle"] = "true"
-                j += 1
 
             # Thresholds - Top
             for top in range(len(top_pct)):
-                df_graphers.loc[j, "title"] = (
-                    f"Threshold {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} marking the richest {top_pct['percentage'][top]} {welfare['title'][wel].capitalize()}"
+                df_graphers.append(
+                    {
+                        "title": f"Threshold {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} marking the richest {top_pct['percentage'][top]} {welfare['title'][wel].capitalize()}",
+                        "ySlugs": f"{top_pct['wid_notation'][top]}_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]}",
+                        "Indicator Dropdown": "Decile thresholds",
+                        "Decile/quantile Dropdown": top_pct["name"][top].capitalize(),
+                        "Income measure Dropdown": f"{welfare['dropdown_option'][wel]}",
+                        "Period Radio": f"{income_aggregation['aggregation'][agg].capitalize()}",
+                        "subtitle": f"{welfare['subtitle'][wel]}",
+                        "note": f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at {PPP_YEAR_WID} prices to account for inflation and differences in the cost of living between countries. {welfare['note'][wel]}",
+                        "selectedFacetStrategy": np.nan,
+                        "hasMapTab": "true",
+                        "tab": "map",
+                        "yScaleToggle": "true",
+                    }
                 )
-                df_graphers.loc[j, "ySlugs"] = (
-                    f"{top_pct['wid_notation'][top]}_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]}"
-                )
-                df_graphers.loc[j, "Indicator Dropdown"] = "Decile thresholds"
-                df_graphers.loc[j, "Decile/quantile Dropdown"] = top_pct["name"][
-                    top
-                ].capitalize()
-                df_graphers.loc[j, "Income measure Dropdown"] = (
-                    f"{welfare['dropdown_option'][wel]}"
-                )
-                df_graphers.loc[j, "Period Radio"] = (
-                    f"{income_aggregation['aggregation'][agg].capitalize()}"
-                )
-                df_graphers.loc[j, "subtitle"] = f"{welfare['subtitle'][wel]}"
-                df_graphers.loc[j, "note"] = (
-                    f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at {PPP_YEAR_WID} prices to account for inflation and differences in the cost of living between countries. {welfare['note'][wel]}"
-                )
-                df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-                df_graphers.loc[j, "hasMapTab"] = "true"
-                df_graphers.loc[j, "tab"] = "map"
-                df_graphers.loc[j, "yScaleToggle"] = "true"
-                j += 1
 
             # Averages - Top
             for top in range(len(top_pct)):
-                df_graphers.loc[j, "title"] = (
-                    f"Mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} within the richest {top_pct['percentage'][top]} {welfare['title'][wel].capitalize()}"
-                )
-                df_graphers.loc[j, "ySlugs"] = (
-                    f"{top_pct['wid_notation'][top]}_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]}"
+                df_graphers.append(
+                    {
+                        "title": f"Mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} within the richest {top_pct['percentage'][top]} {welfare['title'][wel].capitalize()}",
+                        "ySlugs": f"{top_pct['wid_notation'][top]}_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]}",
+                        "Indicator Dropdown": "Mean income, by decile",
+                        "Decile/quantile Dropdown": top_pct["name"][top].capitalize(),
+                        "Income measure Dropdown": f"{welfare['dropdown_option'][wel]}",
+                        "Period Radio": f"{income_aggregation['aggregation'][agg].capitalize()}",
+                        "subtitle": f"The mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} within the richest {top_pct['percentage'][top]} of the population. {welfare['subtitle'][wel]}",
+                        "note": f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at {PPP_YEAR_WID} prices to account for inflation and differences in the cost of living between countries. {welfare['note'][wel]}",
+                        "selectedFacetStrategy": np.nan,
+                        "hasMapTab": "true",
+                        "tab": "map",
+                        "yScaleToggle": "true",
+                    }
                 )
-                df_graphers.loc[j, "Indicator Dropdown"] = "Mean income, by decile"
-                df_graphers.loc[j, "Decile/quantile Dropdown"] = top_pct["name"][
-                    top
-                ].capitalize()
-                df_graphers.loc[j, "Income measure Dropdown"] = (
-                    f"{welfare['dropdown_option'][wel]}"
-                )
-                df_graphers.loc[j, "Period Radio"] = (
-                    f"{income_aggregation['aggregation'][agg].capitalize()}"
-                )
-                df_graphers.loc[j, "subtitle"] = (
-                    f"The mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} within the richest {top_pct['percentage'][top]} of the population. {welfare['subtitle'][wel]}"
-                )
-                df_graphers.loc[j, "note"] = (
-                    f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at {PPP_YEAR_WID} prices to account for inflation and differences in the cost of living between countries. {welfare['note'][wel]}"
-                )
-                df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-                df_graphers.loc[j, "hasMapTab"] = "true"
-                df_graphers.loc[j, "tab"] = "map"
-                df_graphers.loc[j, "yScaleToggle"] = "true"
-                j += 1
 
             # Thresholds - Multiple deciles
-            df_graphers.loc[j, "title"] = (
-                f"Threshold {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} for each decile {welfare['title'][wel].capitalize()}"
-            )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"p10p20_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p20p30_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p30p40_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p40p50_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p50p60_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p60p70_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p70p80_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p80p90_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p90p100_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]}"
+            df_graphers.append(
+                {
+                    "title": f"Threshold {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} for each decile {welfare['title'][wel].capitalize()}",
+                    "ySlugs": f"p10p20_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p20p30_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p30p40_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p40p50_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p50p60_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p60p70_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p70p80_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p80p90_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p90p100_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]}",
+                    "Indicator Dropdown": "Decile thresholds",
+                    "Decile/quantile Dropdown": "All deciles",
+                    "Income measure Dropdown": f"{welfare['dropdown_option'][wel]}",
+                    "Period Radio": f"{income_aggregation['aggregation'][agg].capitalize()}",
+                    "hideRelativeToggle": "false",
+                    "subtitle": f"The level of income per {income_aggregation['aggregation'][agg]} below which 10%, 20%, 30%, etc. of the population falls. {welfare['subtitle'][wel]}",
+                    "note": f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at {PPP_YEAR_WID} prices to account for inflation and differences in the cost of living between countries. {welfare['note'][wel]}",
+                    "selectedFacetStrategy": "entity",
+                    "hasMapTab": "false",
+                    "tab": "chart",
+                    "yScaleToggle": "true",
+                }
             )
-            df_graphers.loc[j, "Indicator Dropdown"] = "Decile thresholds"
-            df_graphers.loc[j, "Decile/quantile Dropdown"] = "All deciles"
-            df_graphers.loc[j, "Income measure Dropdown"] = (
-                f"{welfare['dropdown_option'][wel]}"
-            )
-            df_graphers.loc[j, "Period Radio"] = (
-                f"{income_aggregation['aggregation'][agg].capitalize()}"
-            )
-            df_graphers.loc[j, "hideRelativeToggle"] = "false"
-            df_graphers.loc[j, "subtitle"] = (
-                f"The level of income per {income_aggregation['aggregation'][agg]} below which 10%, 20%, 30%, etc. of the population falls. {welfare['subtitle'][wel]}"
-            )
-            df_graphers.loc[j, "note"] = (
-                f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at {PPP_YEAR_WID} prices to account for inflation and differences in the cost of living between countries. {welfare['note'][wel]}"
-            )
-            df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-            df_graphers.loc[j, "hasMapTab"] = "false"
-            df_graphers.loc[j, "tab"] = "chart"
-            df_graphers.loc[j, "yScaleToggle"] = "true"
-            j += 1
 
             # Averages - Multiple deciles
-            df_graphers.loc[j, "title"] = (
-                f"Mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} within each decile {welfare['title'][wel].capitalize()}"
-            )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"p0p10_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p10p20_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p20p30_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p30p40_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p40p50_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p50p60_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p60p70_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p70p80_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p80p90_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p90p100_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]}"
+            df_graphers.append(
+                {
+                    "title": f"Mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} within each decile {welfare['title'][wel].capitalize()}",
+                    "ySlugs": f"p0p10_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p10p20_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p20p30_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p30p40_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p40p50_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p50p60_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p60p70_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p70p80_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p80p90_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p90p100_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]}",
+                    "Indicator Dropdown": "Mean income, by decile",
+                    "Decile/quantile Dropdown": "All deciles",
+                    "Income measure Dropdown": f"{welfare['dropdown_option'][wel]}",
+                    "Period Radio": f"{income_aggregation['aggregation'][agg].capitalize()}",
+                    "hideRelativeToggle": "false",
+                    "subtitle": f"The mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} within each decile (tenth of the population). {welfare['subtitle'][wel]}",
+                    "note": f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at {PPP_YEAR_WID} prices to account for inflation and differences in the cost of living between countries. {welfare['note'][wel]}",
+                    "selectedFacetStrategy": "entity",
+                    "hasMapTab": "false",
+                    "tab": "chart",
+                    "yScaleToggle": "true",
+                }
             )
-            df_graphers.loc[j, "Indicator Dropdown"] = "Mean income, by decile"
-            df_graphers.loc[j, "Decile/quantile Dropdown"] = "All deciles"
-            df_graphers.loc[j, "Income measure Dropdown"] = (
-                f"{welfare['dropdown_option'][wel]}"
-            )
-            df_graphers.loc[j, "Period Radio"] = (
-                f"{income_aggregation['aggregation'][agg].capitalize()}"
-            )
-            df_graphers.loc[j, "hideRelativeToggle"] = "false"
-            df_graphers.loc[j, "subtitle"] = (
-                f"The mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} within each decile (tenth of the population). {welfare['subtitle'][wel]}"
-            )
-            df_graphers.loc[j, "note"] = (
-                f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at {PPP_YEAR_WID} prices to account for inflation and differences in the cost of living between countries. {welfare['note'][wel]}"
-            )
-            df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-            df_graphers.loc[j, "hasMapTab"] = "false"
-            df_graphers.loc[j, "tab"] = "chart"
-            df_graphers.loc[j, "yScaleToggle"] = "true"
-            j += 1
 
             # Thresholds - Multiple deciles (including top)
-            df_graphers.loc[j, "title"] = (
-                f"Threshold {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} for each decile {welfare['title'][wel].capitalize()}"
-            )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"p10p20_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p20p30_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p30p40_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p40p50_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p50p60_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p60p70_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p70p80_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p80p90_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p90p100_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p99p100_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p99_9p100_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]}"
+            df_graphers.append(
+                {
+                    "title": f"Threshold {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} for each decile {welfare['title'][wel].capitalize()}",
+                    "ySlugs": f"p10p20_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p20p30_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p30p40_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p40p50_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p50p60_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p60p70_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p70p80_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p80p90_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p90p100_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p99p100_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p99_9p100_thr_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]}",
+                    "Indicator Dropdown": "Decile thresholds",
+                    "Decile/quantile Dropdown": "All deciles + top",
+                    "Income measure Dropdown": f"{welfare['dropdown_option'][wel]}",
+                    "Period Radio": f"{income_aggregation['aggregation'][agg].capitalize()}",
+                    "hideRelativeToggle": "false",
+                    "subtitle": f"The level of income per {income_aggregation['aggregation'][agg]} below which 10%, 20%, 30%, etc. of the population falls. {welfare['subtitle'][wel]}",
+                    "note": f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at {PPP_YEAR_WID} prices to account for inflation and differences in the cost of living between countries. {welfare['note'][wel]}",
+                    "selectedFacetStrategy": "entity",
+                    "hasMapTab": "false",
+                    "tab": "chart",
+                    "yScaleToggle": "true",
+                }
             )
-            df_graphers.loc[j, "Indicator Dropdown"] = "Decile thresholds"
-            df_graphers.loc[j, "Decile/quantile Dropdown"] = "All deciles + top"
-            df_graphers.loc[j, "Income measure Dropdown"] = (
-                f"{welfare['dropdown_option'][wel]}"
-            )
-            df_graphers.loc[j, "Period Radio"] = (
-                f"{income_aggregation['aggregation'][agg].capitalize()}"
-            )
-            df_graphers.loc[j, "hideRelativeToggle"] = "false"
-            df_graphers.loc[j, "subtitle"] = (
-                f"The level of income per {income_aggregation['aggregation'][agg]} below which 10%, 20%, 30%, etc. of the population falls. {welfare['subtitle'][wel]}"
-            )
-            df_graphers.loc[j, "note"] = (
-                f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at {PPP_YEAR_WID} prices to account for inflation and differences in the cost of living between countries. {welfare['note'][wel]}"
-            )
-            df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-            df_graphers.loc[j, "hasMapTab"] = "false"
-            df_graphers.loc[j, "tab"] = "chart"
-            df_graphers.loc[j, "yScaleToggle"] = "true"
-            j += 1
 
             # Averages - Multiple deciles (including top)
-            df_graphers.loc[j, "title"] = (
-                f"Mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} within each decile {welfare['title'][wel].capitalize()}"
-            )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"p0p10_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p10p20_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p20p30_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p30p40_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p40p50_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p50p60_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p60p70_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p70p80_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p80p90_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p90p100_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p99p100_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p99_9p100_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]}"
+            df_graphers.append(
+                {
+                    "title": f"Mean {welfare['welfare_type'][wel]} per {income_aggregation['aggregation'][agg]} within each decile {welfare['title'][wel].capitalize()}",
+                    "ySlugs": f"p0p10_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p10p20_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p20p30_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p30p40_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p40p50_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p50p60_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p60p70_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p70p80_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p80p90_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p90p100_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p99p100_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]} p99_9p100_avg_{welfare['slug'][wel]}{income_aggregation['slug_suffix'][agg]}",
+                    "Indicator Dropdown": "Mean income, by decile",
+                    "Decile/quantile Dropdown": "All deciles + top",
+                    "Income measure Dropdown": f"{welfare['dropdown_option'][wel]}",
+                    "Period Radio": f"{income_aggregation['aggregation'][agg].capitalize()}",
+                    "hideRelativeToggle": "false",
+                    "subtitle": f"This data is adjusted for inflation and for differences in the cost of living between countries. {welfare['subtitle'][wel]}",
+                    "note": f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at {PPP_YEAR_WID} prices. {welfare['note'][wel]}",
+                    "selectedFacetStrategy": "entity",
+                    "hasMapTab": "false",
+                    "tab": "chart",
+                    "yScaleToggle": "true",
+                }
             )
-            df_graphers.loc[j, "Indicator Dropdown"] = "Mean income, by decile"
-            df_graphers.loc[j, "Decile/quantile Dropdown"] = "All deciles + top"
-            df_graphers.loc[j, "Income measure Dropdown"] = (
-                f"{welfare['dropdown_option'][wel]}"
-            )
-            df_graphers.loc[j, "Period Radio"] = (
-                f"{income_aggregation['aggregation'][agg].capitalize()}"
-            )
-            df_graphers.loc[j, "hideRelativeToggle"] = "false"
-            df_graphers.loc[j, "subtitle"] = (
-                f"This data is adjusted for inflation and for differences in the cost of living between countries. {welfare['subtitle'][wel]}"
-            )
-            df_graphers.loc[j, "note"] = (
-                f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at {PPP_YEAR_WID} prices. {welfare['note'][wel]}"
-            )
-            df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-            df_graphers.loc[j, "hasMapTab"] = "false"
-            df_graphers.loc[j, "tab"] = "chart"
-            df_graphers.loc[j, "yScaleToggle"] = "true"
-            j += 1
 
         # BEFORE VS. AFTER TAX
         # Mean
-        df_graphers.loc[j, "title"] = (
-            f"Mean income per {income_aggregation['aggregation'][agg]} (after tax vs. before tax)"
-        )
-        df_graphers.loc[j, "ySlugs"] = (
-            f"p0p100_avg_pretax{income_aggregation['slug_suffix'][agg]} p0p100_avg_posttax_nat{income_aggregation['slug_suffix'][agg]}"
+        df_graphers.append(
+            {
+                "title": f"Mean income per {income_aggregation['aggregation'][agg]} (after tax vs. before tax)",
+                "ySlugs": f"p0p100_avg_pretax{income_aggregation['slug_suffix'][agg]} p0p100_avg_posttax_nat{income_aggregation['slug_suffix'][agg]}",
+                "Indicator Dropdown": "Mean income",
+                "Decile/quantile Dropdown": np.nan,
+                "Income measure Dropdown": "After tax vs. before tax",
+                "Period Radio": f"{income_aggregation['aggregation'][agg].capitalize()}",
+                "subtitle": f"This data is adjusted for inflation and for differences in the cost of living between countries.",
+                "note": f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at {PPP_YEAR_WID} prices.",
+                "selectedFacetStrategy": "entity",
+                "hasMapTab": "false",
+                "tab": "chart",
+                "yScaleToggle": "true",
+            }
         )
-        df_graphers.loc[j, "Indicator Dropdown"] = "Mean income"
-        df_graphers.loc[j, "Decile/quantile Dropdown"] = np.nan
-        df_graphers.loc[j, "Income measure Dropdown"] = "After tax vs. before tax"
-        df_graphers.loc[j, "Period Radio"] = (
-            f"{income_aggregation['aggregation'][agg].capitalize()}"
-        )
-        df_graphers.loc[j, "subtitle"] = (
-            f"This data is adjusted for inflation and for differences in the cost of living between countries."
-        )
-        df_graphers.loc[j, "note"] = (
-            f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at {PPP_YEAR_WID} prices."
-        )
-        df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-        df_graphers.loc[j, "hasMapTab"] = "false"
-        df_graphers.loc[j, "tab"] = "chart"
-        df_graphers.loc[j, "yScaleToggle"] = "true"
-        j += 1
 
         # Median
-        df_graphers.loc[j, "title"] = (
-            f"Median income per {income_aggregation['aggregation'][agg]} (after tax vs. before tax)"
-        )
-        df_graphers.loc[j, "ySlugs"] = (
-            f"median_pretax{income_aggregation['slug_suffix'][agg]} median_posttax_nat{income_aggregation['slug_suffix'][agg]}"
-        )
-        df_graphers.loc[j, "Indicator Dropdown"] = "Median income"
-        df_graphers.loc[j, "Decile/quantile Dropdown"] = np.nan
-        df_graphers.loc[j, "Income measure Dropdown"] = "After tax vs. before tax"
-        df_graphers.loc[j, "Period Radio"] = (
-            f"{income_aggregation['aggregation'][agg].capitalize()}"
+        df_graphers.append(
+            {
+                "title": f"Median income per {income_aggregation['aggregation'][agg]} (after tax vs. before tax)",
+                "ySlugs": f"median_pretax{income_aggregation['slug_suffix'][agg]} median_posttax_nat{income_aggregation['slug_suffix'][agg]}",
+                "Indicator Dropdown": "Median income",
+                "Decile/quantile Dropdown": np.nan,
+                "Income measure Dropdown": "After tax vs. before tax",
+                "Period Radio": f"{income_aggregation['aggregation'][agg].capitalize()}",
+                "subtitle": f"This data is adjusted for inflation and for differences in the cost of living between countries.",
+                "note": f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at {PPP_YEAR_WID} prices.",
+                "selectedFacetStrategy": "entity",
+                "hasMapTab": "false",
+                "tab": "chart",
+                "yScaleToggle": "true",
+            }
         )
-        df_graphers.loc[j, "subtitle"] = (
-            f"This data is adjusted for inflation and for differences in the cost of living between countries."
-        )
-        df_graphers.loc[j, "note"] = (
-            f"This data is expressed in [international-$](#dod:int_dollar_abbreviation) at {PPP_YEAR_WID} prices."
-        )
-        df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-        df_graphers.loc[j, "hasMapTab"] = "false"
-        df_graphers.loc[j, "tab"] = "chart"
-        df_graphers.loc[j, "yScaleToggle"] = "true"
-        j += 1
 
         # Thresholds - Deciles
         for dec9 in range(len(deciles9)):
-            df_graphers.loc[j, "title"] = (
-                f"Threshold income per {income_aggregation['aggregation'][agg]} marking the {deciles9['ordinal'][dec9]} (after tax vs. before tax)"
-            )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"{deciles9['wid_notation'][dec9]}_thr_pretax{income_aggregation['slug_suffix'][agg]} {deciles9['wid_notation'][dec9]}_thr_posttax_nat{income_aggregation['slug_suffix'][agg]}"
-            )
-            df_graphers.loc[j, "Indicator Dropdown"] = "Decile thresholds"
-            df_graphers.loc[j, "Decile/quantile Dropdown"] = deciles9["dropdown"][dec9]
-            df_graphers.loc[j, "Income measure Dropdown"] = "After tax vs. before tax"
-            df_graphers.loc[j, "Period Radio"] = (
-                f"{income_aggregation['aggregation'][agg].capitalize()}"
-            )
-            df_graphers.loc[j, "subtitle"] = (
-                f"The level of income per {income_aggregation['aggregation'][agg]} below which {deciles9['decile'][dec9]}0% of the population falls."
+            df_graphers.append(
+                {
+                    "title": f"Threshold income per {income_aggregation['aggregation'][agg]} marking the {deciles9['ordinal'][dec9]} (after tax vs. before tax)",
+                    "ySlugs": f"{deciles9['wid_notation'][dec9]}_thr_pretax{income_aggregation['slug_suffix'][agg]} {deciles9['wid_notation'][dec9]}_thr_posttax_nat{income_aggregation['slug_suffix'][agg]}",
+                    "Indicator Dropdown": "Decile thresholds",
+                    "Decile/quantile Dropdown": deciles9["dropdown"][dec9],
+                    "Income measure Dropdown": "After tax vs. before tax",
+                    "Period Radio": f"{income_aggregation['aggregation'][agg].capitalize()}",
+                    "subtitle": f"The level of income per {income_aggregation['aggregation'][agg]} below which {deciles9['decile'][dec9]}0% of the population falls.",
+                    "note": f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at {PPP_YEAR_WID} prices to account for inflation and differences in the cost of living between countries.",
+                    "selectedFacetStrategy": "entity",
+                    "hasMapTab": "false",
+                    "tab": "chart",
+                    "yScaleToggle": "true",
+                }
             )
-            df_graphers.loc[j, "note"] = (
-                f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at {PPP_YEAR_WID} prices to account for inflation and differences in the cost of living between countries."
-            )
-            df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-            df_graphers.loc[j, "hasMapTab"] = "false"
-            df_graphers.loc[j, "tab"] = "chart"
-            df_graphers.loc[j, "yScaleToggle"] = "true"
-            j += 1
 
         # Averages - Deciles
         for dec10 in range(len(deciles10)):
-            df_graphers.loc[j, "title"] = (
-                f"Mean income per {income_aggregation['aggregation'][agg]} within the {deciles10['ordinal'][dec10]} (after tax vs. before tax)"
-            )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"{deciles10['wid_notation'][dec10]}_avg_pretax{income_aggregation['slug_suffix'][agg]} {deciles10['wid_notation'][dec10]}_avg_posttax_nat{income_aggregation['slug_suffix'][agg]}"
-            )
-            df_graphers.loc[j, "Indicator Dropdown"] = "Mean income, by decile"
-            df_graphers.loc[j, "Decile/quantile Dropdown"] = deciles10["dropdown"][
-                dec10
-            ]
-            df_graphers.loc[j, "Income measure Dropdown"] = "After tax vs. before tax"
-            df_graphers.loc[j, "Period Radio"] = (
-                f"{income_aggregation['aggregation'][agg].capitalize()}"
-            )
-            df_graphers.loc[j, "subtitle"] = (
-                f"The mean income per {income_aggregation['aggregation'][agg]} within the {deciles10['ordinal'][dec10]} (tenth of the population)."
-            )
-            df_graphers.loc[j, "note"] = (
-                f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at {PPP_YEAR_WID} prices to account for inflation and differences in the cost of living between countries."
+            df_graphers.append(
+                {
+                    "title": f"Mean income per {income_aggregation['aggregation'][agg]} within the {deciles10['ordinal'][dec10]} (after tax vs. before tax)",
+                    "ySlugs": f"{deciles10['wid_notation'][dec10]}_avg_pretax{income_aggregation['slug_suffix'][agg]} {deciles10['wid_notation'][dec10]}_avg_posttax_nat{income_aggregation['slug_suffix'][agg]}",
+                    "Indicator Dropdown": "Mean income, by decile",
+                    "Decile/quantile Dropdown": deciles10["dropdown"][dec10],
+                    "Income measure Dropdown": "After tax vs. before tax",
+                    "Period Radio": f"{income_aggregation['aggregation'][agg].capitalize()}",
+                    "subtitle": f"The mean income per {income_aggregation['aggregation'][agg]} within the {deciles10['ordinal'][dec10]} (tenth of the population).",
+                    "note": f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at {PPP_YEAR_WID} prices to account for inflation and differences in the cost of living between countries.",
+                    "selectedFacetStrategy": "entity",
+                    "hasMapTab": "false",
+                    "tab": "chart",
+                    "yScaleToggle": "true",
+                }
             )
-            df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-            df_graphers.loc[j, "hasMapTab"] = "false"
-            df_graphers.loc[j, "tab"] = "chart"
-            df_graphers.loc[j, "yScaleToggle"] = "true"
-            j += 1
 
         # Thresholds - Top
         for top in range(len(top_pct)):
-            df_graphers.loc[j, "title"] = (
-                f"Threshold income per {income_aggregation['aggregation'][agg]} marking the richest {top_pct['percentage'][top]} (after tax vs. before tax)"
+            df_graphers.append(
+                {
+                    "title": f"Threshold income per {income_aggregation['aggregation'][agg]} marking the richest {top_pct['percentage'][top]} (after tax vs. before tax)",
+                    "ySlugs": f"{top_pct['wid_notation'][top]}_thr_pretax{income_aggregation['slug_suffix'][agg]} {top_pct['wid_notation'][top]}_thr_posttax_nat{income_aggregation['slug_suffix'][agg]}",
+                    "Indicator Dropdown": "Decile thresholds",
+                    "Decile/quantile Dropdown": top_pct["name"][top].capitalize(),
+                    "Income measure Dropdown": "After tax vs. before tax",
+                    "Period Radio": f"{income_aggregation['aggregation'][agg].capitalize()}",
+                    "subtitle": "",
+                    "note": f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at {PPP_YEAR_WID} prices to account for inflation and differences in the cost of living between countries.",
+                    "selectedFacetStrategy": "entity",
+                    "hasMapTab": "false",
+                    "tab": "chart",
+                    "yScaleToggle": "true",
+                }
             )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"{top_pct['wid_notation'][top]}_thr_pretax{income_aggregation['slug_suffix'][agg]} {top_pct['wid_notation'][top]}_thr_posttax_nat{income_aggregation['slug_suffix'][agg]}"
-            )
-            df_graphers.loc[j, "Indicator Dropdown"] = "Decile thresholds"
-            df_graphers.loc[j, "Decile/quantile Dropdown"] = top_pct["name"][
-                top
-            ].capitalize()
-            df_graphers.loc[j, "Income measure Dropdown"] = "After tax vs. before tax"
-            df_graphers.loc[j, "Period Radio"] = (
-                f"{income_aggregation['aggregation'][agg].capitalize()}"
-            )
-            df_graphers.loc[j, "subtitle"] = ""
-            df_graphers.loc[j, "note"] = (
-                f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at {PPP_YEAR_WID} prices to account for inflation and differences in the cost of living between countries."
-            )
-            df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-            df_graphers.loc[j, "hasMapTab"] = "false"
-            df_graphers.loc[j, "tab"] = "chart"
-            df_graphers.loc[j, "yScaleToggle"] = "true"
-            j += 1
 
         # Averages - Top
         for top in range(len(top_pct)):
-            df_graphers.loc[j, "title"] = (
-                f"Mean income per {income_aggregation['aggregation'][agg]} within the richest {top_pct['percentage'][top]} (after tax vs. before tax)"
-            )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"{top_pct['wid_notation'][top]}_avg_pretax{income_aggregation['slug_suffix'][agg]} {top_pct['wid_notation'][top]}_avg_posttax_nat{income_aggregation['slug_suffix'][agg]}"
-            )
-            df_graphers.loc[j, "Indicator Dropdown"] = "Mean income, by decile"
-            df_graphers.loc[j, "Decile/quantile Dropdown"] = top_pct["name"][
-                top
-            ].capitalize()
-            df_graphers.loc[j, "Income measure Dropdown"] = "After tax vs. before tax"
-            df_graphers.loc[j, "Period Radio"] = (
-                f"{income_aggregation['aggregation'][agg].capitalize()}"
+            df_graphers.append(
+                {
+                    "title": f"Mean income per {income_aggregation['aggregation'][agg]} within the richest {top_pct['percentage'][top]} (after tax vs. before tax)",
+                    "ySlugs": f"{top_pct['wid_notation'][top]}_avg_pretax{income_aggregation['slug_suffix'][agg]} {top_pct['wid_notation'][top]}_avg_posttax_nat{income_aggregation['slug_suffix'][agg]}",
+                    "Indicator Dropdown": "Mean income, by decile",
+                    "Decile/quantile Dropdown": top_pct["name"][top].capitalize(),
+                    "Income measure Dropdown": "After tax vs. before tax",
+                    "Period Radio": f"{income_aggregation['aggregation'][agg].capitalize()}",
+                    "subtitle": f"This is the mean income per {income_aggregation['aggregation'][agg]} within the richest {top_pct['percentage'][top]} of the population.",
+                    "note": f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at {PPP_YEAR_WID} prices to account for inflation and differences in the cost of living between countries.",
+                    "selectedFacetStrategy": "entity",
+                    "hasMapTab": "false",
+                    "tab": "chart",
+                    "yScaleToggle": "true",
+                }
             )
-            df_graphers.loc[j, "subtitle"] = (
-                f"This is the mean income per {income_aggregation['aggregation'][agg]} within the richest {top_pct['percentage'][top]} of the population."
-            )
-            df_graphers.loc[j, "note"] = (
-                f"This data is measured in [international-$](#dod:int_dollar_abbreviation) at {PPP_YEAR_WID} prices to account for inflation and differences in the cost of living between countries."
-            )
-            df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-            df_graphers.loc[j, "hasMapTab"] = "false"
-            df_graphers.loc[j, "tab"] = "chart"
-            df_graphers.loc[j, "yScaleToggle"] = "true"
-            j += 1
 
     # This is an adaptation of the code to make both before and after tax graphs and share graphs
     for wel in range(len(welfare)):
         # Shares - Deciles
         for dec10 in range(len(deciles10)):
-            df_graphers.loc[j, "title"] = (
-                f"{welfare['welfare_type'][wel].capitalize()} share of the {deciles10['ordinal'][dec10]} {welfare['title'][wel].capitalize()}"
-            )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"{deciles10['wid_notation'][dec10]}_share_{welfare['slug'][wel]}"
-            )
-            df_graphers.loc[j, "Indicator Dropdown"] = "Decile shares"
-            df_graphers.loc[j, "Decile/quantile Dropdown"] = deciles10["dropdown"][
-                dec10
-            ]
-            df_graphers.loc[j, "Income measure Dropdown"] = (
-                f"{welfare['dropdown_option'][wel]}"
-            )
-            df_graphers.loc[j, "Period Radio"] = np.nan
-            df_graphers.loc[j, "subtitle"] = (
-                f"The share of {welfare['welfare_type'][wel]} received by the {deciles10['ordinal'][dec10]} (tenth of the population). {welfare['subtitle'][wel]}"
+            df_graphers.append(
+                {
+                    "title": f"{welfare['welfare_type'][wel].capitalize()} share of the {deciles10['ordinal'][dec10]} {welfare['title'][wel].capitalize()}",
+                    "ySlugs": f"{deciles10['wid_notation'][dec10]}_share_{welfare['slug'][wel]}",
+                    "Indicator Dropdown": "Decile shares",
+                    "Decile/quantile Dropdown": deciles10["dropdown"][dec10],
+                    "Income measure Dropdown": f"{welfare['dropdown_option'][wel]}",
+                    "Period Radio": np.nan,
+                    "subtitle": f"The share of {welfare['welfare_type'][wel]} received by the {deciles10['ordinal'][dec10]} (tenth of the population). {welfare['subtitle'][wel]}",
+                    "note": f"{welfare['note'][wel]}",
+                    "selectedFacetStrategy": np.nan,
+                    "hasMapTab": "true",
+                    "tab": "map",
+                }
             )
-            df_graphers.loc[j, "note"] = f"{welfare['note'][wel]}"
-            df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-            df_graphers.loc[j, "hasMapTab"] = "true"
-            df_graphers.loc[j, "tab"] = "map"
-            j += 1
 
         # Shares - Top
         for top in range(len(top_pct)):
-            df_graphers.loc[j, "title"] = (
-                f"{welfare['welfare_type'][wel].capitalize()} share of the richest {top_pct['percentage'][top]} {welfare['title'][wel].capitalize()}"
+            df_graphers.append(
+                {
+                    "title": f"{welfare['welfare_type'][wel].capitalize()} share of the richest {top_pct['percentage'][top]} {welfare['title'][wel].capitalize()}",
+                    "ySlugs": f"{top_pct['wid_notation'][top]}_share_{welfare['slug'][wel]}",
+                    "Indicator Dropdown": "Decile shares",
+                    "Decile/quantile Dropdown": top_pct["name"][top].capitalize(),
+                    "Income measure Dropdown": f"{welfare['dropdown_option'][wel]}",
+                    "Period Radio": np.nan,
+                    "subtitle": f"The share of {welfare['welfare_type'][wel]} received by the richest {top_pct['percentage'][top]} of the population. {welfare['subtitle'][wel]}",
+                    "note": f"{welfare['note'][wel]}",
+                    "selectedFacetStrategy": np.nan,
+                    "hasMapTab": "true",
+                    "tab": "map",
+                }
             )
-            df_graphers.loc[j, "ySlugs"] = (
-                f"{top_pct['wid_notation'][top]}_share_{welfare['slug'][wel]}"
-            )
-            df_graphers.loc[j, "Indicator Dropdown"] = "Decile shares"
-            df_graphers.loc[j, "Decile/quantile Dropdown"] = top_pct["name"][
-                top
-            ].capitalize()
-            df_graphers.loc[j, "Income measure Dropdown"] = (
-                f"{welfare['dropdown_option'][wel]}"
-            )
-            df_graphers.loc[j, "Period Radio"] = np.nan
-            df_graphers.loc[j, "subtitle"] = (
-                f"The share of {welfare['welfare_type'][wel]} received by the richest {top_pct['percentage'][top]} of the population. {welfare['subtitle'][wel]}"
-            )
-            df_graphers.loc[j, "note"] = f"{welfare['note'][wel]}"
-            df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-            df_graphers.loc[j, "hasMapTab"] = "true"
-            df_graphers.loc[j, "tab"] = "map"
-            j += 1
 
         # Shares - Multiple deciles
-        df_graphers.loc[j, "title"] = (
-            f"{welfare['welfare_type'][wel].capitalize()} share for each decile {welfare['title'][wel].capitalize()}"
-        )
-        df_graphers.loc[j, "ySlugs"] = (
-            f"p0p10_share_{welfare['slug'][wel]} p10p20_share_{welfare['slug'][wel]} p20p30_share_{welfare['slug'][wel]} p30p40_share_{welfare['slug'][wel]} p40p50_share_{welfare['slug'][wel]} p50p60_share_{welfare['slug'][wel]} p60p70_share_{welfare['slug'][wel]} p70p80_share_{welfare['slug'][wel]} p80p90_share_{welfare['slug'][wel]} p90p100_share_{welfare['slug'][wel]}"
-        )
-        df_graphers.loc[j, "Indicator Dropdown"] = "Decile shares"
-        df_graphers.loc[j, "Decile/quantile Dropdown"] = "All deciles"
-        df_graphers.loc[j, "Income measure Dropdown"] = (
-            f"{welfare['dropdown_option'][wel]}"
+        df_graphers.append(
+            {
+                "title": f"{welfare['welfare_type'][wel].capitalize()} share for each decile {welfare['title'][wel].capitalize()}",
+                "ySlugs": f"p0p10_share_{welfare['slug'][wel]} p10p20_share_{welfare['slug'][wel]} p20p30_share_{welfare['slug'][wel]} p30p40_share_{welfare['slug'][wel]} p40p50_share_{welfare['slug'][wel]} p50p60_share_{welfare['slug'][wel]} p60p70_share_{welfare['slug'][wel]} p70p80_share_{welfare['slug'][wel]} p80p90_share_{welfare['slug'][wel]} p90p100_share_{welfare['slug'][wel]}",
+                "Indicator Dropdown": "Decile shares",
+                "Decile/quantile Dropdown": "All deciles",
+                "Income measure Dropdown": f"{welfare['dropdown_option'][wel]}",
+                "Period Radio": np.nan,
+                "subtitle": f"The share of {welfare['welfare_type'][wel]} received by each decile (tenth of the population). {welfare['subtitle'][wel]}",
+                "note": f"{welfare['note'][wel]}",
+                "selectedFacetStrategy": "entity",
+                "hasMapTab": "false",
+                "tab": "chart",
+            }
         )
-        df_graphers.loc[j, "Period Radio"] = np.nan
-        df_graphers.loc[j, "subtitle"] = (
-            f"The share of {welfare['welfare_type'][wel]} received by each decile (tenth of the population). {welfare['subtitle'][wel]}"
-        )
-        df_graphers.loc[j, "note"] = f"{welfare['note'][wel]}"
-        df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-        df_graphers.loc[j, "hasMapTab"] = "false"
-        df_graphers.loc[j, "tab"] = "chart"
-        j += 1
 
         # Shares - Multiple deciles (including top)
-        df_graphers.loc[j, "title"] = (
-            f"{welfare['welfare_type'][wel].capitalize()} share for each decile {welfare['title'][wel].capitalize()}"
-        )
-        df_graphers.loc[j, "ySlugs"] = (
-            f"p0p10_share_{welfare['slug'][wel]} p10p20_share_{welfare['slug'][wel]} p20p30_share_{welfare['slug'][wel]} p30p40_share_{welfare['slug'][wel]} p40p50_share_{welfare['slug'][wel]} p50p60_share_{welfare['slug'][wel]} p60p70_share_{welfare['slug'][wel]} p70p80_share_{welfare['slug'][wel]} p80p90_share_{welfare['slug'][wel]} p90p100_share_{welfare['slug'][wel]} p99p100_share_{welfare['slug'][wel]} p99_9p100_share_{welfare['slug'][wel]}"
-        )
-        df_graphers.loc[j, "Indicator Dropdown"] = "Decile shares"
-        df_graphers.loc[j, "Decile/quantile Dropdown"] = "All deciles + top"
-        df_graphers.loc[j, "Income measure Dropdown"] = (
-            f"{welfare['dropdown_option'][wel]}"
+        df_graphers.append(
+            {
+                "title": f"{welfare['welfare_type'][wel].capitalize()} share for each decile {welfare['title'][wel].capitalize()}",
+                "ySlugs": f"p0p10_share_{welfare['slug'][wel]} p10p20_share_{welfare['slug'][wel]} p20p30_share_{welfare['slug'][wel]} p30p40_share_{welfare['slug'][wel]} p40p50_share_{welfare['slug'][wel]} p50p60_share_{welfare['slug'][wel]} p60p70_share_{welfare['slug'][wel]} p70p80_share_{welfare['slug'][wel]} p80p90_share_{welfare['slug'][wel]} p90p100_share_{welfare['slug'][wel]} p99p100_share_{welfare['slug'][wel]} p99_9p100_share_{welfare['slug'][wel]}",
+                "Indicator Dropdown": "Decile shares",
+                "Decile/quantile Dropdown": "All deciles + top",
+                "Income measure Dropdown": f"{welfare['dropdown_option'][wel]}",
+                "Period Radio": np.nan,
+                "subtitle": f"The share of {welfare['welfare_type'][wel]} received by each decile (tenth of the population). {welfare['subtitle'][wel]}",
+                "note": f"{welfare['note'][wel]}",
+                "selectedFacetStrategy": "entity",
+                "hasMapTab": "false",
+                "tab": "chart",
+            }
         )
-        df_graphers.loc[j, "Period Radio"] = np.nan
-        df_graphers.loc[j, "subtitle"] = (
-            f"The share of {welfare['welfare_type'][wel]} received by each decile (tenth of the population). {welfare['subtitle'][wel]}"
-        )
-        df_graphers.loc[j, "note"] = f"{welfare['note'][wel]}"
-        df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-        df_graphers.loc[j, "hasMapTab"] = "false"
-        df_graphers.loc[j, "tab"] = "chart"
-        j += 1
 
     # BEFORE VS. AFTER TAX
     # Shares - Deciles
     for dec10 in range(len(deciles10)):
-        df_graphers.loc[j, "title"] = (
-            f"Income share of the {deciles10['ordinal'][dec10]} (after tax vs. before tax)"
-        )
-        df_graphers.loc[j, "ySlugs"] = (
-            f"{deciles10['wid_notation'][dec10]}_share_pretax {deciles10['wid_notation'][dec10]}_share_posttax_nat"
+        df_graphers.append(
+            {
+                "title": f"Income share of the {deciles10['ordinal'][dec10]} (after tax vs. before tax)",
+                "ySlugs": f"{deciles10['wid_notation'][dec10]}_share_pretax {deciles10['wid_notation'][dec10]}_share_posttax_nat",
+                "Indicator Dropdown": "Decile shares",
+                "Decile/quantile Dropdown": deciles10["dropdown"][dec10],
+                "Income measure Dropdown": "After tax vs. before tax",
+                "Period Radio": np.nan,
+                "subtitle": f"The share of income received by the {deciles10['ordinal'][dec10]} (tenth of the population).",
+                "note": "",
+                "selectedFacetStrategy": "entity",
+                "hasMapTab": "false",
+                "tab": "chart",
+            }
         )
-        df_graphers.loc[j, "Indicator Dropdown"] = "Decile shares"
-        df_graphers.loc[j, "Decile/quantile Dropdown"] = deciles10["dropdown"][dec10]
-        df_graphers.loc[j, "Income measure Dropdown"] = "After tax vs. before tax"
-        df_graphers.loc[j, "Period Radio"] = np.nan
-        df_graphers.loc[j, "subtitle"] = (
-            f"The share of income received by the {deciles10['ordinal'][dec10]} (tenth of the population)."
-        )
-        df_graphers.loc[j, "note"] = ""
-        df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-        df_graphers.loc[j, "hasMapTab"] = "false"
-        df_graphers.loc[j, "tab"] = "chart"
-        j += 1
 
     # Shares - Top
     for top in range(len(top_pct)):
-        df_graphers.loc[j, "title"] = (
-            f"Income share of the richest {top_pct['percentage'][top]} (after tax vs. before tax)"
-        )
-        df_graphers.loc[j, "ySlugs"] = (
-            f"{top_pct['wid_notation'][top]}_share_pretax {top_pct['wid_notation'][top]}_share_posttax_nat"
-        )
-        df_graphers.loc[j, "Indicator Dropdown"] = "Decile shares"
-        df_graphers.loc[j, "Decile/quantile Dropdown"] = top_pct["name"][
-            top
-        ].capitalize()
-        df_graphers.loc[j, "Income measure Dropdown"] = "After tax vs. before tax"
-        df_graphers.loc[j, "Period Radio"] = np.nan
-        df_graphers.loc[j, "subtitle"] = (
-            f"The share of income received by the richest {top_pct['percentage'][top]} of the population."
+        df_graphers.append(
+            {
+                "title": f"Income share of the richest {top_pct['percentage'][top]} (after tax vs. before tax)",
+                "ySlugs": f"{top_pct['wid_notation'][top]}_share_pretax {top_pct['wid_notation'][top]}_share_posttax_nat",
+                "Indicator Dropdown": "Decile shares",
+                "Decile/quantile Dropdown": top_pct["name"][top].capitalize(),
+                "Income measure Dropdown": "After tax vs. before tax",
+                "Period Radio": np.nan,
+                "subtitle": f"The share of income received by the richest {top_pct['percentage'][top]} of the population.",
+                "note": "",
+                "selectedFacetStrategy": "entity",
+                "hasMapTab": "false",
+                "tab": "chart",
+            }
         )
-        df_graphers.loc[j, "note"] = ""
-        df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-        df_graphers.loc[j, "hasMapTab"] = "false"
-        df_graphers.loc[j, "tab"] = "chart"
-        j += 1
 
     df_graphers["tableSlug"] = tables["name"][tab]
 
+df_graphers = df_graphers.to_frame()
+
 # %% [markdown]
 # Final adjustments to the graphers table: add `relatedQuestion` link and `defaultView`:
 
@@ -1197,29 +1007,10 @@ df_graphers = df_graphers.drop(columns=["metric_dropdown_aux", "decile_dropdown_
 # Define list of variables to iterate: table names
 table_list = list(tables["name"].unique())
 
-# Header is converted into a tab-separated text
-header_tsv = df_header.to_csv(sep="\t", header=False)
-
-# Graphers table is converted into a tab-separated text
-graphers_tsv = df_graphers
-graphers_tsv = graphers_tsv.to_csv(sep="\t", index=False)
-
-# This table is indented, to follow explorers' format
-graphers_tsv_indented = textwrap.indent(graphers_tsv, "\t")
-
 # The dataframes are combined, including tables and links to the datasets
 with open(outfile, "w", newline="\n", encoding="utf-8") as f:
-    f.write(header_tsv)
-    f.write("\ngraphers\n" + graphers_tsv_indented)
-
-    for tab in range(len(tables)):
-        table_tsv = (
-            df_tables[df_tables["tableSlug"] == tables["name"][tab]]
-            .copy()
-            .reset_index(drop=True)
-        )
-        table_tsv = table_tsv.drop(columns=["tableSlug"])
-        table_tsv = table_tsv.to_csv(sep="\t", index=False)
-        table_tsv_indented = textwrap.indent(table_tsv, "\t")
-        f.write("\ntable\t" + tables["link"][tab] + "\t" + tables["name"][tab])
-        f.write("\ncolumns\t" + tables["name"][tab] + "\n" + table_tsv_indented)
+    explorer = ExplorerWriter(f)
+    explorer.write_header(df_header)
+    explorer.write_graphers(df_graphers)
+
+    explorer.write_tables(df_tables, "tableSlug", zip(tables["name"], tables["link"]))
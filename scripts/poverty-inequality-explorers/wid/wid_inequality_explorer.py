@@ -2,7 +2,6 @@
 # # Inequality Data Explorer of the World Inequality Database
 # This code creates the tsv file for the inequality explorer from the WID data, available [here](https://owid.cloud/admin/explorers/preview/wid-inequality)
 
-import textwrap
 from pathlib import Path
 
 import numpy as np
@@ -11,6 +10,10 @@ import numpy as np
 import pandas as pd
 
 from ..common_parameters import *
+from ..descriptions import join_paragraphs
+from ..explorer_writer import ExplorerWriter
+from ..sheets import read_sheet
+from ..table_builder import TableBuilder
 
 PARENT_DIR = Path(__file__).parent.parent.parent.parent.absolute()
 outfile = PARENT_DIR / "explorers" / "inequality-wid.explorer.tsv"
@@ -25,13 +28,11 @@ sheet_id = "18T5IGnpyJwb8KL9USYvME6IaLEcYIo26ioHCpkDnwRQ"
 
 # Welfare type sheet
 sheet_name = "welfare"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-welfare = pd.read_csv(url, keep_default_na=False)
+welfare = read_sheet(sheet_id, sheet_name, keep_default_na=False)
 
 # Tables sheet
 sheet_name = "tables"
-url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/gviz/tq?tqx=out:csv&sheet={sheet_name}"
-tables = pd.read_csv(url, keep_default_na=False)
+tables = read_sheet(sheet_id, sheet_name, keep_default_na=False)
 
 # %% [markdown]
 # ## Header
@@ -75,28 +76,32 @@ sourceName = SOURCE_NAME_WID
 dataPublishedBy = DATA_PUBLISHED_BY_WID
 sourceLink = SOURCE_LINK_WID
 tolerance = TOLERANCE
-new_line = NEW_LINE
 
 yAxisMin = Y_AXIS_MIN
 
 additional_description = ADDITIONAL_DESCRIPTION_WID
 ppp_description = PPP_DESCRIPTION_WID
 
-df_tables = pd.DataFrame()
-j = 0
+df_tables = TableBuilder()
 
 for tab in range(len(tables)):
     # Define country as entityName
-    df_tables.loc[j, "name"] = "Country"
-    df_tables.loc[j, "slug"] = "country"
-    df_tables.loc[j, "type"] = "EntityName"
-    j += 1
+    df_tables.append(
+        {
+            "name": "Country",
+            "slug": "country",
+            "type": "EntityName",
+        }
+    )
 
     # Define year as Year
-    df_tables.loc[j, "name"] = "Year"
-    df_tables.loc[j, "slug"] = "year"
-    df_tables.loc[j, "type"] = "Year"
-    j += 1
+    df_tables.append(
+        {
+            "name": "Year",
+            "slug": "year",
+            "type": "Year",
+        }
+    )
 
     for wel in range(len(welfare)):
         # Define additional description depending on the welfare type
@@ -106,129 +111,141 @@ for tab in range(len(tables)):
             additional_description = ADDITIONAL_DESCRIPTION_WID
 
         # Gini coefficient
-        df_tables.loc[j, "name"] = f"Gini coefficient {welfare['title'][wel]}"
-        df_tables.loc[j, "slug"] = f"p0p100_gini_{welfare['slug'][wel]}"
-        df_tables.loc[j, "description"] = new_line.join(
-            [
-                "The Gini coefficient measures inequality on a scale from 0 to 1. Higher values indicate higher inequality.",
-                welfare["description"][wel],
-                additional_description,
-            ]
+        df_tables.append(
+            {
+                "name": f"Gini coefficient {welfare['title'][wel]}",
+                "slug": f"p0p100_gini_{welfare['slug'][wel]}",
+                "description": join_paragraphs(
+                    [
+                        "The Gini coefficient measures inequality on a scale from 0 to 1. Higher values indicate higher inequality.",
+                        welfare["description"][wel],
+                        additional_description,
+                    ]
+                ),
+                "unit": np.nan,
+                "shortUnit": np.nan,
+                "type": "Numeric",
+                "colorScaleNumericBins": welfare["scale_gini"][wel],
+                "colorScaleNumericMinValue": 1,
+                "colorScaleEqualSizeBins": "true",
+                "colorScaleScheme": "Oranges",
+            }
         )
-        df_tables.loc[j, "unit"] = np.nan
-        df_tables.loc[j, "shortUnit"] = np.nan
-        df_tables.loc[j, "type"] = "Numeric"
-        df_tables.loc[j, "colorScaleNumericBins"] = welfare["scale_gini"][wel]
-        df_tables.loc[j, "colorScaleNumericMinValue"] = 1
-        df_tables.loc[j, "colorScaleEqualSizeBins"] = "true"
-        df_tables.loc[j, "colorScaleScheme"] = "Oranges"
-        j += 1
 
         # Share of the top 10%
-        df_tables.loc[j, "name"] = (
-            f"{welfare['welfare_type'][wel].capitalize()} share of the richest 10% {welfare['title'][wel]}"
+        df_tables.append(
+            {
+                "name": f"{welfare['welfare_type'][wel].capitalize()} share of the richest 10% {welfare['title'][wel]}",
+                "slug": f"p90p100_share_{welfare['slug'][wel]}",
+                "description": join_paragraphs(
+                    [
+                        f"The share of {welfare['welfare_type'][wel]} received by the richest 10% of the population.",
+                        welfare["description"][wel],
+                        additional_description,
+                    ]
+                ),
+                "unit": "%",
+                "shortUnit": "%",
+                "type": "Numeric",
+                "colorScaleNumericBins": welfare["scale_top10"][wel],
+                "colorScaleNumericMinValue": 100,
+                "colorScaleEqualSizeBins": "true",
+                "colorScaleScheme": "OrRd",
+            }
         )
-        df_tables.loc[j, "slug"] = f"p90p100_share_{welfare['slug'][wel]}"
-        df_tables.loc[j, "description"] = new_line.join(
-            [
-                f"The share of {welfare['welfare_type'][wel]} received by the richest 10% of the population.",
-                welfare["description"][wel],
-                additional_description,
-            ]
-        )
-        df_tables.loc[j, "unit"] = "%"
-        df_tables.loc[j, "shortUnit"] = "%"
-        df_tables.loc[j, "type"] = "Numeric"
-        df_tables.loc[j, "colorScaleNumericBins"] = welfare["scale_top10"][wel]
-        df_tables.loc[j, "colorScaleNumericMinValue"] = 100
-        df_tables.loc[j, "colorScaleEqualSizeBins"] = "true"
-        df_tables.loc[j, "colorScaleScheme"] = "OrRd"
-        j += 1
 
         # Share of the top 1%
-        df_tables.loc[j, "name"] = (
-            f"{welfare['welfare_type'][wel].capitalize()} share of the richest 1% {welfare['title'][wel]}"
-        )
-        df_tables.loc[j, "slug"] = f"p99p100_share_{welfare['slug'][wel]}"
-        df_tables.loc[j, "description"] = new_line.join(
-            [
-                f"The share of {welfare['welfare_type'][wel]} received by the richest 1% of the population.",
-                welfare["description"][wel],
-                additional_description,
-            ]
+        df_tables.append(
+            {
+                "name": f"{welfare['welfare_type'][wel].capitalize()} share of the richest 1% {welfare['title'][wel]}",
+                "slug": f"p99p100_share_{welfare['slug'][wel]}",
+                "description": join_paragraphs(
+                    [
+                        f"The share of {welfare['welfare_type'][wel]} received by the richest 1% of the population.",
+                        welfare["description"][wel],
+                        additional_description,
+                    ]
+                ),
+                "unit": "%",
+                "shortUnit": "%",
+                "type": "Numeric",
+                "colorScaleNumericBins": welfare["scale_top1"][wel],
+                "colorScaleNumericMinValue": 0,
+                "colorScaleEqualSizeBins": "true",
+                "colorScaleScheme": "OrRd",
+            }
         )
-        df_tables.loc[j, "unit"] = "%"
-        df_tables.loc[j, "shortUnit"] = "%"
-        df_tables.loc[j, "type"] = "Numeric"
-        df_tables.loc[j, "colorScaleNumericBins"] = welfare["scale_top1"][wel]
-        df_tables.loc[j, "colorScaleNumericMinValue"] = 0
-        df_tables.loc[j, "colorScaleEqualSizeBins"] = "true"
-        df_tables.loc[j, "colorScaleScheme"] = "OrRd"
-        j += 1
 
         # Share of the top 0.1%
-        df_tables.loc[j, "name"] = (
-            f"{welfare['welfare_type'][wel].capitalize()} share of the richest 0.1% {welfare['title'][wel]}"
+        df_tables.append(
+            {
+                "name": f"{welfare['welfare_type'][wel].capitalize()} share of the richest 0.1% {welfare['title'][wel]}",
+                "slug": f"p99_9p100_share_{welfare['slug'][wel]}",
+                "description": join_paragraphs(
+                    [
+                        f"The share of {welfare['welfare_type'][wel]} received by the richest 0.1% of the population.",
+                        welfare["description"][wel],
+                        additional_description,
+                    ]
+                ),
+                "unit": "%",
+                "shortUnit": "%",
+                "type": "Numeric",
+                "colorScaleNumericBins": welfare["scale_top01"][wel],
+                "colorScaleNumericMinValue": 0,
+                "colorScaleEqualSizeBins": "true",
+                "colorScaleScheme": "OrRd",
+            }
         )
-        df_tables.loc[j, "slug"] = f"p99_9p100_share_{welfare['slug'][wel]}"
-        df_tables.loc[j, "description"] = new_line.join(
-            [
-                f"The share of {welfare['welfare_type'][wel]} received by the richest 0.1% of the population.",
-                welfare["description"][wel],
-                additional_description,
-            ]
-        )
-        df_tables.loc[j, "unit"] = "%"
-        df_tables.loc[j, "shortUnit"] = "%"
-        df_tables.loc[j, "type"] = "Numeric"
-        df_tables.loc[j, "colorScaleNumericBins"] = welfare["scale_top01"][wel]
-        df_tables.loc[j, "colorScaleNumericMinValue"] = 0
-        df_tables.loc[j, "colorScaleEqualSizeBins"] = "true"
-        df_tables.loc[j, "colorScaleScheme"] = "OrRd"
-        j += 1
 
         # Share of the bottom 50%
-        df_tables.loc[j, "name"] = (
-            f"{welfare['welfare_type'][wel].capitalize()} share of the poorest 50% {welfare['title'][wel]}"
-        )
-        df_tables.loc[j, "slug"] = f"p0p50_share_{welfare['slug'][wel]}"
-        df_tables.loc[j, "description"] = new_line.join(
-            [
-                f"The share of {welfare['welfare_type'][wel]} received by the poorest 50% of the population.",
-                welfare["description"][wel],
-                additional_description,
-            ]
+        df_tables.append(
+            {
+                "name": f"{welfare['welfare_type'][wel].capitalize()} share of the poorest 50% {welfare['title'][wel]}",
+                "slug": f"p0p50_share_{welfare['slug'][wel]}",
+                "description": join_paragraphs(
+                    [
+                        f"The share of {welfare['welfare_type'][wel]} received by the poorest 50% of the population.",
+                        welfare["description"][wel],
+                        additional_description,
+                    ]
+                ),
+                "unit": "%",
+                "shortUnit": "%",
+                "type": "Numeric",
+                "colorScaleNumericBins": welfare["scale_bottom50"][wel],
+                "colorScaleNumericMinValue": 100,
+                "colorScaleEqualSizeBins": "true",
+                "colorScaleScheme": "Blues",
+            }
         )
-        df_tables.loc[j, "unit"] = "%"
-        df_tables.loc[j, "shortUnit"] = "%"
-        df_tables.loc[j, "type"] = "Numeric"
-        df_tables.loc[j, "colorScaleNumericBins"] = welfare["scale_bottom50"][wel]
-        df_tables.loc[j, "colorScaleNumericMinValue"] = 100
-        df_tables.loc[j, "colorScaleEqualSizeBins"] = "true"
-        df_tables.loc[j, "colorScaleScheme"] = "Blues"
-        j += 1
 
         # Palma ratio
-        df_tables.loc[j, "name"] = f"Palma ratio {welfare['title'][wel]}"
-        df_tables.loc[j, "slug"] = f"palma_ratio_{welfare['slug'][wel]}"
-        df_tables.loc[j, "description"] = new_line.join(
-            [
-                "The Palma ratio is a measure of inequality that divides the share received by the richest 10% by the share of the poorest 40%. Higher values indicate higher inequality.",
-                welfare["description"][wel],
-                additional_description,
-            ]
+        df_tables.append(
+            {
+                "name": f"Palma ratio {welfare['title'][wel]}",
+                "slug": f"palma_ratio_{welfare['slug'][wel]}",
+                "description": join_paragraphs(
+                    [
+                        "The Palma ratio is a measure of inequality that divides the share received by the richest 10% by the share of the poorest 40%. Higher values indicate higher inequality.",
+                        welfare["description"][wel],
+                        additional_description,
+                    ]
+                ),
+                "unit": np.nan,
+                "shortUnit": np.nan,
+                "type": "Numeric",
+                "colorScaleNumericBins": welfare["scale_palma_ratio"][wel],
+                "colorScaleNumericMinValue": 0,
+                "colorScaleEqualSizeBins": "true",
+                "colorScaleScheme": "YlOrBr",
+            }
         )
-        df_tables.loc[j, "unit"] = np.nan
-        df_tables.loc[j, "shortUnit"] = np.nan
-        df_tables.loc[j, "type"] = "Numeric"
-        df_tables.loc[j, "colorScaleNumericBins"] = welfare["scale_palma_ratio"][wel]
-        df_tables.loc[j, "colorScaleNumericMinValue"] = 0
-        df_tables.loc[j, "colorScaleEqualSizeBins"] = "true"
-        df_tables.loc[j, "colorScaleScheme"] = "YlOrBr"
-        j += 1
 
     df_tables["tableSlug"] = tables["name"][tab]
 
+df_tables = df_tables.to_frame()
+
 df_tables["sourceName"] = sourceName
 df_tables["dataPublishedBy"] = dataPublishedBy
 df_tables["sourceLink"] = sourceLink
@@ -244,223 +261,208 @@ df_tables["tolerance"] = df_tables["tolerance"].astype("Int64")
 # %%
 # Grapher table generation
 
-df_graphers = pd.DataFrame()
+df_graphers = TableBuilder()
 
-j = 0
 
 for tab in range(len(tables)):
     for wel in range(len(welfare)):
         # Gini coefficient
-        df_graphers.loc[j, "title"] = f"Gini coefficient {welfare['title'][wel]}"
-        df_graphers.loc[j, "ySlugs"] = f"p0p100_gini_{welfare['slug'][wel]}"
-        df_graphers.loc[j, "Indicator Dropdown"] = "Gini coefficient"
-        df_graphers.loc[j, "Income measure Dropdown"] = (
-            f"{welfare['dropdown_option'][wel]}"
+        df_graphers.append(
+            {
+                "title": f"Gini coefficient {welfare['title'][wel]}",
+                "ySlugs": f"p0p100_gini_{welfare['slug'][wel]}",
+                "Indicator Dropdown": "Gini coefficient",
+                "Income measure Dropdown": f"{welfare['dropdown_option'][wel]}",
+                "subtitle": f"The Gini coefficient measures inequality on a scale from 0 to 1. Higher values indicate higher inequality. {welfare['subtitle_ineq'][wel]}",
+                "note": f"{welfare['note'][wel]}",
+                "type": np.nan,
+                "selectedFacetStrategy": np.nan,
+                "hasMapTab": "true",
+                "tab": "map",
+            }
         )
-        df_graphers.loc[j, "subtitle"] = (
-            f"The Gini coefficient measures inequality on a scale from 0 to 1. Higher values indicate higher inequality. {welfare['subtitle_ineq'][wel]}"
-        )
-        df_graphers.loc[j, "note"] = f"{welfare['note'][wel]}"
-        df_graphers.loc[j, "type"] = np.nan
-        df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-        df_graphers.loc[j, "hasMapTab"] = "true"
-        df_graphers.loc[j, "tab"] = "map"
-        j += 1
 
         # Share of the top 10%
-        df_graphers.loc[j, "title"] = (
-            f"{welfare['welfare_type'][wel].capitalize()} share of the richest 10% {welfare['title'][wel]}"
-        )
-        df_graphers.loc[j, "ySlugs"] = f"p90p100_share_{welfare['slug'][wel]}"
-        df_graphers.loc[j, "Indicator Dropdown"] = "Share of the richest 10%"
-        df_graphers.loc[j, "Income measure Dropdown"] = (
-            f"{welfare['dropdown_option'][wel]}"
+        df_graphers.append(
+            {
+                "title": f"{welfare['welfare_type'][wel].capitalize()} share of the richest 10% {welfare['title'][wel]}",
+                "ySlugs": f"p90p100_share_{welfare['slug'][wel]}",
+                "Indicator Dropdown": "Share of the richest 10%",
+                "Income measure Dropdown": f"{welfare['dropdown_option'][wel]}",
+                "subtitle": f"The share of {welfare['welfare_type'][wel]} received by the richest 10% of the population. {welfare['subtitle'][wel]}",
+                "note": f"{welfare['note'][wel]}",
+                "type": np.nan,
+                "selectedFacetStrategy": np.nan,
+                "hasMapTab": "true",
+                "tab": "map",
+            }
         )
-        df_graphers.loc[j, "subtitle"] = (
-            f"The share of {welfare['welfare_type'][wel]} received by the richest 10% of the population. {welfare['subtitle'][wel]}"
-        )
-        df_graphers.loc[j, "note"] = f"{welfare['note'][wel]}"
-        df_graphers.loc[j, "type"] = np.nan
-        df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-        df_graphers.loc[j, "hasMapTab"] = "true"
-        df_graphers.loc[j, "tab"] = "map"
-        j += 1
 
         # Share of the top 1%
-        df_graphers.loc[j, "title"] = (
-            f"{welfare['welfare_type'][wel].capitalize()} share of the richest 1% {welfare['title'][wel]}"
-        )
-        df_graphers.loc[j, "ySlugs"] = f"p99p100_share_{welfare['slug'][wel]}"
-        df_graphers.loc[j, "Indicator Dropdown"] = "Share of the richest 1%"
-        df_graphers.loc[j, "Income measure Dropdown"] = (
-            f"{welfare['dropdown_option'][wel]}"
+        df_graphers.append(
+            {
+                "title": f"{welfare['welfare_type'][wel].capitalize()} share of the richest 1% {welfare['title'][wel]}",
+                "ySlugs": f"p99p100_share_{welfare['slug'][wel]}",
+                "Indicator Dropdown": "Share of the richest 1%",
+                "Income measure Dropdown": f"{welfare['dropdown_option'][wel]}",
+                "subtitle": f"The share of {welfare['welfare_type'][wel]} received by the richest 1% of the population. {welfare['subtitle'][wel]}",
+                "note": f"{welfare['note'][wel]}",
+                "type": np.nan,
+                "selectedFacetStrategy": np.nan,
+                "hasMapTab": "true",
+                "tab": "map",
+            }
         )
-        df_graphers.loc[j, "subtitle"] = (
-            f"The share of {welfare['welfare_type'][wel]} received by the richest 1% of the population. {welfare['subtitle'][wel]}"
-        )
-        df_graphers.loc[j, "note"] = f"{welfare['note'][wel]}"
-        df_graphers.loc[j, "type"] = np.nan
-        df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-        df_graphers.loc[j, "hasMapTab"] = "true"
-        df_graphers.loc[j, "tab"] = "map"
-        j += 1
 
         # Share of the top 0.1%
-        df_graphers.loc[j, "title"] = (
-            f"{welfare['welfare_type'][wel].capitalize()} share of the richest 0.1% {welfare['title'][wel]}"
-        )
-        df_graphers.loc[j, "ySlugs"] = f"p99_9p100_share_{welfare['slug'][wel]}"
-        df_graphers.loc[j, "Indicator Dropdown"] = "Share of the richest 0.1%"
-        df_graphers.loc[j, "Income measure Dropdown"] = (
-            f"{welfare['dropdown_option'][wel]}"
-        )
-        df_graphers.loc[j, "subtitle"] = (
-            f"The share of {welfare['welfare_type'][wel]} received by the richest 0.1% of the population. {welfare['subtitle'][wel]}"
+        df_graphers.append(
+            {
+                "title": f"{welfare['welfare_type'][wel].capitalize()} share of the richest 0.1% {welfare['title'][wel]}",
+                "ySlugs": f"p99_9p100_share_{welfare['slug'][wel]}",
+                "Indicator Dropdown": "Share of the richest 0.1%",
+                "Income measure Dropdown": f"{welfare['dropdown_option'][wel]}",
+                "subtitle": f"The share of {welfare['welfare_type'][wel]} received by the richest 0.1% of the population. {welfare['subtitle'][wel]}",
+                "note": f"{welfare['note'][wel]}",
+                "type": np.nan,
+                "selectedFacetStrategy": np.nan,
+                "hasMapTab": "true",
+                "tab": "map",
+            }
         )
-        df_graphers.loc[j, "note"] = f"{welfare['note'][wel]}"
-        df_graphers.loc[j, "type"] = np.nan
-        df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-        df_graphers.loc[j, "hasMapTab"] = "true"
-        df_graphers.loc[j, "tab"] = "map"
-        j += 1
 
         # Share of the bottom 50%
-        df_graphers.loc[j, "title"] = (
-            f"{welfare['welfare_type'][wel].capitalize()} share of the poorest 50% {welfare['title'][wel]}"
+        df_graphers.append(
+            {
+                "title": f"{welfare['welfare_type'][wel].capitalize()} share of the poorest 50% {welfare['title'][wel]}",
+                "ySlugs": f"p0p50_share_{welfare['slug'][wel]}",
+                "Indicator Dropdown": "Share of the poorest 50%",
+                "Income measure Dropdown": f"{welfare['dropdown_option'][wel]}",
+                "subtitle": f"The share of {welfare['welfare_type'][wel]} received by the poorest 50% of the population. {welfare['subtitle'][wel]}",
+                "note": f"{welfare['note'][wel]}",
+                "type": np.nan,
+                "selectedFacetStrategy": np.nan,
+                "hasMapTab": "true",
+                "tab": "map",
+            }
         )
-        df_graphers.loc[j, "ySlugs"] = f"p0p50_share_{welfare['slug'][wel]}"
-        df_graphers.loc[j, "Indicator Dropdown"] = "Share of the poorest 50%"
-        df_graphers.loc[j, "Income measure Dropdown"] = (
-            f"{welfare['dropdown_option'][wel]}"
-        )
-        df_graphers.loc[j, "subtitle"] = (
-            f"The share of {welfare['welfare_type'][wel]} received by the poorest 50% of the population. {welfare['subtitle'][wel]}"
-        )
-        df_graphers.loc[j, "note"] = f"{welfare['note'][wel]}"
-        df_graphers.loc[j, "type"] = np.nan
-        df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-        df_graphers.loc[j, "hasMapTab"] = "true"
-        df_graphers.loc[j, "tab"] = "map"
-        j += 1
 
         # # Palma ratio
-        df_graphers.loc[j, "title"] = f"Palma ratio {welfare['title'][wel]}"
-        df_graphers.loc[j, "ySlugs"] = f"palma_ratio_{welfare['slug'][wel]}"
-        df_graphers.loc[j, "Indicator Dropdown"] = "Palma ratio"
-        df_graphers.loc[j, "Income measure Dropdown"] = (
-            f"{welfare['dropdown_option'][wel]}"
+        df_graphers.append(
+            {
+                "title": f"Palma ratio {welfare['title'][wel]}",
+                "ySlugs": f"palma_ratio_{welfare['slug'][wel]}",
+                "Indicator Dropdown": "Palma ratio",
+                "Income measure Dropdown": f"{welfare['dropdown_option'][wel]}",
+                "subtitle": f"The Palma ratio is a measure of inequality that divides the share received by the richest 10% by the share of the poorest 40%. Higher values indicate higher inequality. {welfare['subtitle_ineq'][wel]}",
+                "note": f"{welfare['note'][wel]}",
+                "type": np.nan,
+                "selectedFacetStrategy": np.nan,
+                "hasMapTab": "true",
+                "tab": "map",
+            }
         )
-        df_graphers.loc[j, "subtitle"] = (
-            f"The Palma ratio is a measure of inequality that divides the share received by the richest 10% by the share of the poorest 40%. Higher values indicate higher inequality. {welfare['subtitle_ineq'][wel]}"
-        )
-        df_graphers.loc[j, "note"] = f"{welfare['note'][wel]}"
-        df_graphers.loc[j, "type"] = np.nan
-        df_graphers.loc[j, "selectedFacetStrategy"] = np.nan
-        df_graphers.loc[j, "hasMapTab"] = "true"
-        df_graphers.loc[j, "tab"] = "map"
-        j += 1
 
     # BEFORE VS. AFTER TAX
     # Gini coefficient
-    df_graphers.loc[j, "title"] = f"Gini coefficient (after tax vs. before tax)"
-    df_graphers.loc[j, "ySlugs"] = f"p0p100_gini_pretax p0p100_gini_posttax_nat"
-    df_graphers.loc[j, "Indicator Dropdown"] = "Gini coefficient"
-    df_graphers.loc[j, "Income measure Dropdown"] = "After tax vs. before tax"
-    df_graphers.loc[j, "subtitle"] = (
-        f"The Gini coefficient measures inequality on a scale from 0 to 1. Higher values indicate higher inequality."
+    df_graphers.append(
+        {
+            "title": f"Gini coefficient (after tax vs. before tax)",
+            "ySlugs": f"p0p100_gini_pretax p0p100_gini_posttax_nat",
+            "Indicator Dropdown": "Gini coefficient",
+            "Income measure Dropdown": "After tax vs. before tax",
+            "subtitle": f"The Gini coefficient measures inequality on a scale from 0 to 1. Higher values indicate higher inequality.",
+            "note": "",
+            "type": np.nan,
+            "selectedFacetStrategy": "entity",
+            "hasMapTab": "false",
+            "tab": "chart",
+        }
     )
-    df_graphers.loc[j, "note"] = ""
-    df_graphers.loc[j, "type"] = np.nan
-    df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-    df_graphers.loc[j, "hasMapTab"] = "false"
-    df_graphers.loc[j, "tab"] = "chart"
-    j += 1
 
     # Share of the top 10%
-    df_graphers.loc[j, "title"] = (
-        f"Income share of the richest 10% (after tax vs. before tax)"
-    )
-    df_graphers.loc[j, "ySlugs"] = f"p90p100_share_pretax p90p100_share_posttax_nat"
-    df_graphers.loc[j, "Indicator Dropdown"] = "Share of the richest 10%"
-    df_graphers.loc[j, "Income measure Dropdown"] = "After tax vs. before tax"
-    df_graphers.loc[j, "subtitle"] = (
-        f"The share of income received by the richest 10% of the population."
+    df_graphers.append(
+        {
+            "title": f"Income share of the richest 10% (after tax vs. before tax)",
+            "ySlugs": f"p90p100_share_pretax p90p100_share_posttax_nat",
+            "Indicator Dropdown": "Share of the richest 10%",
+            "Income measure Dropdown": "After tax vs. before tax",
+            "subtitle": f"The share of income received by the richest 10% of the population.",
+            "note": "",
+            "type": np.nan,
+            "selectedFacetStrategy": "entity",
+            "hasMapTab": "false",
+            "tab": "chart",
+        }
     )
-    df_graphers.loc[j, "note"] = ""
-    df_graphers.loc[j, "type"] = np.nan
-    df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-    df_graphers.loc[j, "hasMapTab"] = "false"
-    df_graphers.loc[j, "tab"] = "chart"
-    j += 1
 
     # Share of the top 1%
-    df_graphers.loc[j, "title"] = (
-        f"Income share of the richest 1% (after tax vs. before tax)"
+    df_graphers.append(
+        {
+            "title": f"Income share of the richest 1% (after tax vs. before tax)",
+            "ySlugs": f"p99p100_share_pretax p99p100_share_posttax_nat",
+            "Indicator Dropdown": "Share of the richest 1%",
+            "Income measure Dropdown": "After tax vs. before tax",
+            "subtitle": f"The share of income received by the richest 1% of the population.",
+            "note": "",
+            "type": np.nan,
+            "selectedFacetStrategy": "entity",
+            "hasMapTab": "false",
+            "tab": "chart",
+        }
     )
-    df_graphers.loc[j, "ySlugs"] = f"p99p100_share_pretax p99p100_share_posttax_nat"
-    df_graphers.loc[j, "Indicator Dropdown"] = "Share of the richest 1%"
-    df_graphers.loc[j, "Income measure Dropdown"] = "After tax vs. before tax"
-    df_graphers.loc[j, "subtitle"] = (
-        f"The share of income received by the richest 1% of the population."
-    )
-    df_graphers.loc[j, "note"] = ""
-    df_graphers.loc[j, "type"] = np.nan
-    df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-    df_graphers.loc[j, "hasMapTab"] = "false"
-    df_graphers.loc[j, "tab"] = "chart"
-    j += 1
 
     # Share of the top 0.1%
-    df_graphers.loc[j, "title"] = (
-        f"Income share of the richest 0.1% (after tax vs. before tax)"
-    )
-    df_graphers.loc[j, "ySlugs"] = f"p99_9p100_share_pretax p99_9p100_share_posttax_nat"
-    df_graphers.loc[j, "Indicator Dropdown"] = "Share of the richest 0.1%"
-    df_graphers.loc[j, "Income measure Dropdown"] = "After tax vs. before tax"
-    df_graphers.loc[j, "subtitle"] = (
-        f"The share of income received by the richest 0.1% of the population."
+    df_graphers.append(
+        {
+            "title": f"Income share of the richest 0.1% (after tax vs. before tax)",
+            "ySlugs": f"p99_9p100_share_pretax p99_9p100_share_posttax_nat",
+            "Indicator Dropdown": "Share of the richest 0.1%",
+            "Income measure Dropdown": "After tax vs. before tax",
+            "subtitle": f"The share of income received by the richest 0.1% of the population.",
+            "note": "",
+            "type": np.nan,
+            "selectedFacetStrategy": "entity",
+            "hasMapTab": "false",
+            "tab": "chart",
+        }
     )
-    df_graphers.loc[j, "note"] = ""
-    df_graphers.loc[j, "type"] = np.nan
-    df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-    df_graphers.loc[j, "hasMapTab"] = "false"
-    df_graphers.loc[j, "tab"] = "chart"
-    j += 1
 
     # Share of the bottom 50%
-    df_graphers.loc[j, "title"] = (
-        f"Income share of the poorest 50% (after tax vs. before tax)"
-    )
-    df_graphers.loc[j, "ySlugs"] = f"p0p50_share_pretax p0p50_share_posttax_nat"
-    df_graphers.loc[j, "Indicator Dropdown"] = "Share of the poorest 50%"
-    df_graphers.loc[j, "Income measure Dropdown"] = "After tax vs. before tax"
-    df_graphers.loc[j, "subtitle"] = (
-        f"The share of income received by the poorest 50% of the population."
+    df_graphers.append(
+        {
+            "title": f"Income share of the poorest 50% (after tax vs. before tax)",
+            "ySlugs": f"p0p50_share_pretax p0p50_share_posttax_nat",
+            "Indicator Dropdown": "Share of the poorest 50%",
+            "Income measure Dropdown": "After tax vs. before tax",
+            "subtitle": f"The share of income received by the poorest 50% of the population.",
+            "note": "",
+            "type": np.nan,
+            "selectedFacetStrategy": "entity",
+            "hasMapTab": "false",
+            "tab": "chart",
+        }
     )
-    df_graphers.loc[j, "note"] = ""
-    df_graphers.loc[j, "type"] = np.nan
-    df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-    df_graphers.loc[j, "hasMapTab"] = "false"
-    df_graphers.loc[j, "tab"] = "chart"
-    j += 1
 
     # # Palma ratio
-    df_graphers.loc[j, "title"] = f"Palma ratio (after tax vs. before tax)"
-    df_graphers.loc[j, "ySlugs"] = f"palma_ratio_pretax palma_ratio_posttax_nat"
-    df_graphers.loc[j, "Indicator Dropdown"] = "Palma ratio"
-    df_graphers.loc[j, "Income measure Dropdown"] = "After tax vs. before tax"
-    df_graphers.loc[j, "subtitle"] = (
-        f"The Palma ratio is a measure of inequality that divides the share received by the richest 10% by the share of the poorest 40%. Higher values indicate higher inequality."
+    df_graphers.append(
+        {
+            "title": f"Palma ratio (after tax vs. before tax)",
+            "ySlugs": f"palma_ratio_pretax palma_ratio_posttax_nat",
+            "Indicator Dropdown": "Palma ratio",
+            "Income measure Dropdown": "After tax vs. before tax",
+            "subtitle": f"The Palma ratio is a measure of inequality that divides the share received by the richest 10% by the share of the poorest 40%. Higher values indicate higher inequality.",
+            "note": "",
+            "type": np.nan,
+            "selectedFacetStrategy": "entity",
+            "hasMapTab": "false",
+            "tab": "chart",
+        }
     )
-    df_graphers.loc[j, "note"] = ""
-    df_graphers.loc[j, "type"] = np.nan
-    df_graphers.loc[j, "selectedFacetStrategy"] = "entity"
-    df_graphers.loc[j, "hasMapTab"] = "false"
-    df_graphers.loc[j, "tab"] = "chart"
-    j += 1
 
     df_graphers["tableSlug"] = tables["name"][tab]
 
+df_graphers = df_graphers.to_frame()
+
 # %% [markdown]
 # Final adjustments to the graphers table: add `relatedQuestion` link and `defaultView`:
 
@@ -488,29 +490,10 @@ df_graphers.loc[
 # Define list of variables to iterate: table names
 table_list = list(tables["name"].unique())
 
-# Header is converted into a tab-separated text
-header_tsv = df_header.to_csv(sep="\t", header=False)
-
-# Graphers table is converted into a tab-separated text
-graphers_tsv = df_graphers
-graphers_tsv = graphers_tsv.to_csv(sep="\t", index=False)
-
-# This table is indented, to follow explorers' format
-graphers_tsv_indented = textwrap.indent(graphers_tsv, "\t")
-
 # The dataframes are combined, including tables and links to the datasets
 with open(outfile, "w", newline="\n", encoding="utf-8") as f:
-    f.write(header_tsv)
-    f.write("\ngraphers\n" + graphers_tsv_indented)
-
-    for tab in range(len(tables)):
-        table_tsv = (
-            df_tables[df_tables["tableSlug"] == tables["name"][tab]]
-            .copy()
-            .reset_index(drop=True)
-        )
-        table_tsv = table_tsv.drop(columns=["tableSlug"])
-        table_tsv = table_tsv.to_csv(sep="\t", index=False)
-        table_tsv_indented = textwrap.indent(table_tsv, "\t")
-        f.write("\ntable\t" + tables["link"][tab] + "\t" + tables["name"][tab])
-        f.write("\ncolumns\t" + tables["name"][tab] + "\n" + table_tsv_indented)
+    explorer = ExplorerWriter(f)
+    explorer.write_header(df_header)
+    explorer.write_graphers(df_graphers)
+
+    explorer.write_tables(df_tables, "tableSlug", zip(tables["name"], tables["link"]))